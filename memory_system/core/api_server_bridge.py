@@ -1112,6 +1112,18 @@ async def websocket_endpoint(websocket: WebSocket):
                         "type": "chat_response",
                         "response": result
                     })
+
+                elif message_data["type"] == "yarn_board_changes":
+                    # Incremental board refresh: only what changed since the client's version
+                    result = orchestrator.get_yarn_board_changes(
+                        context_id=message_data["context_id"],
+                        since=str(message_data.get("since", "")),
+                        expanded=bool(message_data.get("expanded", False))
+                    )
+                    await websocket.send_json({
+                        "type": "yarn_board_changes",
+                        **result
+                    })
                     
             except WebSocketDisconnect:
                 break
@@ -3203,6 +3215,29 @@ async def render_yarn_board(sidebar_id: str, request: RenderYarnBoardRequest | N
         return {"error": str(e), "success": False}
 
 
+@app.get("/sidebars/{sidebar_id}/yarn-board/changes")
+async def get_yarn_board_changes(sidebar_id: str, since: str, expanded: bool = False):
+    """
+    Points and connections changed since a version from an earlier render.
+
+    Changed items come back whole (upsert by id), removed ones by key
+    (removed_points, removed_connections). Pass the returned version token
+    as `since` next time. If `since` is too old or from before a server
+    restart the response is a full render with full=True.
+
+    Also available over /ws as {"type": "yarn_board_changes", ...}.
+    """
+    try:
+        return orchestrator.get_yarn_board_changes(
+            context_id=sidebar_id,
+            since=since,
+            expanded=expanded
+        )
+    except Exception as e:
+        track_error(f"Yarn board changes failed: {str(e)}", f"yarn-changes:{sidebar_id}", "orchestrator", "warning", original_exception=e)
+        return {"error": str(e), "success": False}
+
+
 # Startup event
 @app.get("/redis/health")
 async def redis_health():
@@ -3440,7 +3475,7 @@ async def startup_event():
     print("🚨 Errors endpoint: GET /errors")
     print("🌿 Sidebar endpoints: GET/POST /sidebars/*")
     print("🔗 Reparent/Cross-ref: POST /sidebars/{id}/reparent, /cross-ref, GET /cross-refs/clustered")
-    print("🧶 Yarn Board: GET/PUT /sidebars/{id}/yarn-board, /yarn-board/state, /yarn-board/points/{id}, /yarn-board/render")
+    print("🧶 Yarn Board: GET/PUT /sidebars/{id}/yarn-board, /yarn-board/state, /yarn-board/points/{id}, /yarn-board/render, /yarn-board/changes")
     print("🔴 Redis: GET /redis/health")
     print("📬 Queue: POST /queue/route, /queue/approve, GET /queue/{agent_id}, /queue/agents/status")
 
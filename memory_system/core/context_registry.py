@@ -16,8 +16,11 @@ Created: 2025-12-03
 Source: UNIFIED_SIDEBAR_ARCHITECTURE.md Section 2 (Identification System)
 """
 
+import queue
 import threading
+import time
 from abc import ABC, abstractmethod
+from bisect import bisect_left
 from datetime import datetime
 from typing import Optional, List, Dict, Tuple
 from dataclasses import dataclass, field
@@ -28,6 +31,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Sorts after any display ID, so path + (_PATH_END,) bounds a subtree range
+_PATH_END = "\U0010ffff"
+
 
 # =============================================================================
 # STORAGE BACKEND ABSTRACTION
@@ -69,6 +75,23 @@ class StorageBackend(ABC):
         """Check if this backend is available/configured."""
         pass
 
+    def save_changes(self, counters: Dict, changed: Dict[str, Dict], get_state) -> bool:
+        """
+        Save only the contexts that changed.
+
+        Backends that store one record per context override this to write
+        just those records. The default falls back to a full save().
+
+        Args:
+            counters: Current counters (always small, always written)
+            changed: display_id -> serialized context, for changed contexts
+            get_state: Callable returning the full state dict
+
+        Returns:
+            True if save succeeded, False otherwise
+        """
+        return self.save(get_state())
+
     def get_name(self) -> str:
         """Human-readable backend name."""
         return self.__class__.__name__
@@ -169,7 +192,35 @@ class SQLiteBackend(StorageBackend):
     - Atomic transactions
     - Better for large datasets
 
-    TODO: Implement when JSON becomes a bottleneck
+    One row per registered ID, so save_changes() upserts only the rows
+    that changed instead of rewriting the whole registry. Runs in WAL mode.
+    List fields (children_ids, tags) are stored as JSON blobs, matching
+    sidebar_persistence.
+    """
+
+    _UPSERT_CONTEXT = """
+        INSERT INTO contexts (
+            display_id, uuid, context_type, parent_id, children_json,
+            created_at, created_by, created_in, description, tags_json
+        ) VALUES (
+            :display_id, :uuid, :context_type, :parent_id, :children_json,
+            :created_at, :created_by, :created_in, :description, :tags_json
+        )
+        ON CONFLICT(display_id) DO UPDATE SET
+            uuid = excluded.uuid,
+            context_type = excluded.context_type,
+            parent_id = excluded.parent_id,
+            children_json = excluded.children_json,
+            created_at = excluded.created_at,
+            created_by = excluded.created_by,
+            created_in = excluded.created_in,
+            description = excluded.description,
+            tags_json = excluded.tags_json
+    """
+
+    _UPSERT_COUNTER = """
+        INSERT INTO counters (context_type, next_value) VALUES (?, ?)
+        ON CONFLICT(context_type) DO UPDATE SET next_value = excluded.next_value
     """
 
     def __init__(self, db_path: Optional[str] = None):
@@ -179,62 +230,174 @@ class SQLiteBackend(StorageBackend):
             )
         self.db_path = db_path
         self._connection = None
+        self._conn_lock = threading.RLock()
 
     def save(self, state: Dict) -> bool:
-        # TODO: Implement SQLite save
-        # Schema:
-        #   CREATE TABLE contexts (
-        #       display_id TEXT PRIMARY KEY,
-        #       uuid TEXT UNIQUE,
-        #       context_type TEXT,
-        #       parent_id TEXT,
-        #       created_at TEXT,
-        #       created_by TEXT,
-        #       created_in TEXT,
-        #       description TEXT,
-        #       FOREIGN KEY (parent_id) REFERENCES contexts(display_id)
-        #   );
-        #   CREATE TABLE context_children (
-        #       parent_id TEXT,
-        #       child_id TEXT,
-        #       PRIMARY KEY (parent_id, child_id)
-        #   );
-        #   CREATE TABLE context_tags (
-        #       display_id TEXT,
-        #       tag TEXT,
-        #       PRIMARY KEY (display_id, tag)
-        #   );
-        #   CREATE TABLE counters (
-        #       context_type TEXT PRIMARY KEY,
-        #       next_value INTEGER
-        #   );
-        logger.debug("SQLiteBackend.save() called but not yet implemented")
-        return False
+        """Replace the stored registry with this state (one transaction)."""
+        try:
+            with self._conn_lock:
+                conn = self._get_connection()
+                with conn:
+                    conn.execute("DELETE FROM contexts")
+                    conn.execute("DELETE FROM counters")
+                    self._write_rows(conn, state.get("counters", {}), state.get("contexts", {}))
+            return True
+        except Exception as e:
+            logger.warning(f"SQLiteBackend save failed: {e}")
+            return False
+
+    def save_changes(self, counters: Dict, changed: Dict[str, Dict], get_state) -> bool:
+        """Upsert only the changed context rows, plus the counters."""
+        try:
+            with self._conn_lock:
+                conn = self._get_connection()
+                with conn:
+                    self._write_rows(conn, counters, changed)
+            return True
+        except Exception as e:
+            logger.warning(f"SQLiteBackend save_changes failed: {e}")
+            return False
 
     def load(self) -> Optional[Dict]:
-        # TODO: Implement SQLite load
-        logger.debug("SQLiteBackend.load() called but not yet implemented")
-        return None
+        try:
+            with self._conn_lock:
+                conn = self._get_connection()
+                rows = conn.execute("SELECT * FROM contexts").fetchall()
+                counter_rows = conn.execute("SELECT context_type, next_value FROM counters").fetchall()
+        except Exception as e:
+            logger.warning(f"SQLiteBackend load failed: {e}")
+            return None
+
+        if not rows and not counter_rows:
+            return None
+
+        return {
+            "counters": {row["context_type"]: row["next_value"] for row in counter_rows},
+            "contexts": {row["display_id"]: self._row_to_dict(row) for row in rows},
+        }
 
     def is_available(self) -> bool:
-        # Check if SQLite is configured and database exists
-        # For now, always return False until implemented
-        return False
+        try:
+            with self._conn_lock:
+                self._get_connection()
+            return True
+        except Exception as e:
+            logger.debug(f"SQLiteBackend not available: {e}")
+            return False
+
+    def migrate_from_json(self, json_path: Optional[str] = None) -> int:
+        """
+        One-shot import of a JSONFileBackend state file.
+
+        Only runs against an empty database, so it is safe to call on every
+        startup. The JSON file is left in place.
+
+        Args:
+            json_path: JSON state file. Defaults to JSONFileBackend's default.
+
+        Returns:
+            Number of contexts migrated (0 if nothing to do)
+        """
+        json_backend = JSONFileBackend(file_path=json_path)
+        try:
+            with self._conn_lock:
+                conn = self._get_connection()
+                existing = conn.execute("SELECT COUNT(*) FROM contexts").fetchone()[0]
+        except Exception as e:
+            logger.warning(f"SQLiteBackend migration skipped: {e}")
+            return 0
+        if existing:
+            return 0
+
+        state = json_backend.load()
+        if not state or not state.get("contexts"):
+            return 0
+
+        if not self.save(state):
+            return 0
+        count = len(state["contexts"])
+        logger.info(f"Migrated {count} contexts from {json_backend.file_path} to {self.db_path}")
+        return count
+
+    def close(self):
+        """Close the database connection."""
+        with self._conn_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
 
     def _get_connection(self):
         """Get or create database connection."""
-        # TODO: Implement connection management
-        # import sqlite3
-        # if self._connection is None:
-        #     self._connection = sqlite3.connect(self.db_path)
-        #     self._init_schema()
-        # return self._connection
-        pass
+        if self._connection is None:
+            import sqlite3
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            # One shared connection; _conn_lock serializes access to it
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode = WAL')
+            conn.execute('PRAGMA synchronous = NORMAL')
+            self._connection = conn
+            self._init_schema()
+        return self._connection
 
     def _init_schema(self):
         """Create tables if they don't exist."""
-        # TODO: Implement schema creation
-        pass
+        with self._connection as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS contexts (
+                    display_id TEXT PRIMARY KEY,
+                    uuid TEXT,
+                    context_type TEXT,
+                    parent_id TEXT,
+                    children_json TEXT,
+                    created_at TEXT,
+                    created_by TEXT,
+                    created_in TEXT,
+                    description TEXT,
+                    tags_json TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS counters (
+                    context_type TEXT PRIMARY KEY,
+                    next_value INTEGER
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_contexts_parent ON contexts(parent_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_contexts_type ON contexts(context_type)")
+
+    def _write_rows(self, conn, counters: Dict, contexts: Dict[str, Dict]):
+        conn.executemany(self._UPSERT_CONTEXT, [
+            {
+                "display_id": display_id,
+                "uuid": data.get("uuid"),
+                "context_type": data.get("context_type"),
+                "parent_id": data.get("parent_id"),
+                "children_json": json.dumps(data.get("children_ids", [])),
+                "created_at": data.get("created_at"),
+                "created_by": data.get("created_by", ""),
+                "created_in": data.get("created_in"),
+                "description": data.get("description"),
+                "tags_json": json.dumps(data.get("tags", [])),
+            }
+            for display_id, data in contexts.items()
+        ])
+        conn.executemany(self._UPSERT_COUNTER, list(counters.items()))
+
+    @staticmethod
+    def _row_to_dict(row) -> Dict:
+        return {
+            "display_id": row["display_id"],
+            "uuid": row["uuid"],
+            "context_type": row["context_type"],
+            "parent_id": row["parent_id"],
+            "children_ids": json.loads(row["children_json"]) if row["children_json"] else [],
+            "created_at": row["created_at"],
+            "created_by": row["created_by"] or "",
+            "created_in": row["created_in"],
+            "description": row["description"],
+            "tags": json.loads(row["tags_json"]) if row["tags_json"] else [],
+        }
 
 
 class RedisBackend(StorageBackend):
@@ -247,48 +410,111 @@ class RedisBackend(StorageBackend):
     - Very fast reads (in-memory)
     - Can broadcast context changes to other services
 
-    TODO: Implement when we need distributed access
+    Each context is its own hash (context_registry:ctx:<display_id>), with
+    every field JSON-encoded so None and lists round-trip. Counters live in
+    one hash. save_changes() sends the changed hashes, the counters and the
+    change notification as a single pipelined MULTI/EXEC.
     """
 
-    def __init__(self, redis_url: Optional[str] = None):
+    SCAN_COUNT = 1000
+
+    def __init__(self, redis_url: Optional[str] = None, client=None):
+        """
+        Args:
+            redis_url: Redis URL. Defaults to $REDIS_URL or localhost.
+            client: Ready-made redis client (e.g. fakeredis in tests).
+                    Must use decode_responses=True.
+        """
         if redis_url is None:
             redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
         self.redis_url = redis_url
-        self._client = None
+        self._client = client
 
         # Redis key prefixes
         self.KEY_PREFIX = "context_registry:"
         self.COUNTERS_KEY = f"{self.KEY_PREFIX}counters"
-        self.CONTEXTS_KEY = f"{self.KEY_PREFIX}contexts"
+        self.CONTEXT_KEY_PREFIX = f"{self.KEY_PREFIX}ctx:"
+        self.CHANGES_CHANNEL = f"{self.KEY_PREFIX}changes"
 
     def save(self, state: Dict) -> bool:
-        # TODO: Implement Redis save
-        # Use Redis hash for contexts: HSET context_registry:contexts SB-1 {json}
-        # Use Redis hash for counters: HSET context_registry:counters SB 42
-        # Publish change notification: PUBLISH context_registry:changes {event}
-        logger.debug("RedisBackend.save() called but not yet implemented")
-        return False
+        """Replace the stored registry with this state (one MULTI/EXEC)."""
+        try:
+            client = self._get_client()
+            contexts = state.get("contexts", {})
+            stale = [
+                key for key in self._scan_context_keys(client)
+                if key[len(self.CONTEXT_KEY_PREFIX):] not in contexts
+            ]
+
+            pipe = client.pipeline(transaction=True)
+            if stale:
+                pipe.delete(*stale)
+            pipe.delete(self.COUNTERS_KEY)
+            self._queue_writes(pipe, state.get("counters", {}), contexts)
+            pipe.publish(self.CHANGES_CHANNEL, json.dumps({"type": "reloaded", "ids": []}))
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"RedisBackend save failed: {e}")
+            self._client = None
+            return False
+
+    def save_changes(self, counters: Dict, changed: Dict[str, Dict], get_state) -> bool:
+        """Write changed hashes, counters and one notification in one MULTI/EXEC."""
+        try:
+            pipe = self._get_client().pipeline(transaction=True)
+            self._queue_writes(pipe, counters, changed)
+            pipe.publish(self.CHANGES_CHANNEL, json.dumps({"type": "updated", "ids": list(changed)}))
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"RedisBackend save_changes failed: {e}")
+            self._client = None
+            return False
 
     def load(self) -> Optional[Dict]:
-        # TODO: Implement Redis load
-        # HGETALL context_registry:contexts
-        # HGETALL context_registry:counters
-        logger.debug("RedisBackend.load() called but not yet implemented")
-        return None
+        """Read every context hash: SCAN for keys, pipelined HSCANs per page."""
+        try:
+            client = self._get_client()
+            contexts = {}
+            keys = []
+            for key in self._scan_context_keys(client):
+                keys.append(key)
+                if len(keys) >= self.SCAN_COUNT:
+                    self._read_hashes(client, keys, contexts)
+                    keys = []
+            if keys:
+                self._read_hashes(client, keys, contexts)
+
+            counters = {
+                context_type: int(value)
+                for context_type, value in client.hgetall(self.COUNTERS_KEY).items()
+            }
+        except Exception as e:
+            logger.warning(f"RedisBackend load failed: {e}")
+            self._client = None
+            return None
+
+        if not contexts and not counters:
+            return None
+        return {"counters": counters, "contexts": contexts}
 
     def is_available(self) -> bool:
-        # Check if Redis is reachable
-        # For now, always return False until implemented
-        return False
+        try:
+            return self._get_client() is not None
+        except Exception as e:
+            logger.debug(f"RedisBackend not available: {e}")
+            return False
 
     def _get_client(self):
-        """Get or create Redis client."""
-        # TODO: Implement client management
-        # import redis
-        # if self._client is None:
-        #     self._client = redis.from_url(self.redis_url)
-        # return self._client
-        pass
+        """Get or create Redis client (pings once on connect)."""
+        if self._client is None:
+            import redis
+            client = redis.from_url(self.redis_url, decode_responses=True,
+                                    socket_connect_timeout=5, socket_timeout=5)
+            client.ping()
+            self._client = client
+        return self._client
 
     def publish_change(self, event_type: str, display_id: str, data: Dict):
         """
@@ -296,11 +522,192 @@ class RedisBackend(StorageBackend):
 
         Event types: 'created', 'updated', 'deleted'
         """
-        # TODO: Implement pub/sub
-        # client = self._get_client()
-        # event = {"type": event_type, "id": display_id, "data": data}
-        # client.publish(f"{self.KEY_PREFIX}changes", json.dumps(event))
-        pass
+        try:
+            event = {"type": event_type, "id": display_id, "data": data}
+            self._get_client().publish(self.CHANGES_CHANNEL, json.dumps(event))
+        except Exception as e:
+            logger.debug(f"RedisBackend publish failed: {e}")
+
+    def _queue_writes(self, pipe, counters: Dict, contexts: Dict[str, Dict]):
+        for display_id, data in contexts.items():
+            pipe.hset(
+                self.CONTEXT_KEY_PREFIX + display_id,
+                mapping={field_name: json.dumps(value) for field_name, value in data.items()},
+            )
+        if counters:
+            pipe.hset(self.COUNTERS_KEY, mapping=counters)
+
+    def _scan_context_keys(self, client):
+        return client.scan_iter(match=self.CONTEXT_KEY_PREFIX + "*", count=self.SCAN_COUNT)
+
+    def _read_hashes(self, client, keys: List[str], contexts: Dict[str, Dict]):
+        """HSCAN a page of context hashes in one round trip."""
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.hscan(key, 0, count=64)
+
+        for key, (cursor, fields) in zip(keys, pipe.execute()):
+            fields = dict(fields)
+            while cursor:
+                # Only for unusually large hashes
+                cursor, more = client.hscan(key, cursor, count=64)
+                fields.update(more)
+            if fields:
+                contexts[key[len(self.CONTEXT_KEY_PREFIX):]] = {
+                    field_name: json.loads(value) for field_name, value in fields.items()
+                }
+
+
+class _TierWriter:
+    """
+    Feeds one secondary tier from a bounded queue on a background thread.
+
+    Each wake-up drains everything queued and writes it as one merged
+    batch. If the queue overflows, or a write fails, the tier is marked
+    for a full resync from the registry's current state instead.
+    """
+
+    RETRY_INTERVAL = 1.0
+    _STOP = object()
+
+    def __init__(self, backend: StorageBackend, max_queue: int):
+        self.backend = backend
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._cond = threading.Condition()
+        self._resync = None          # get_state to resync from, when set
+        self._busy = False
+        self._oldest_pending: Optional[float] = None
+
+        self.written = 0
+        self.failures = 0
+        self.overflows = 0
+        self.last_success_at: Optional[datetime] = None
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"tier-writer-{backend.get_name()}", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, item: Tuple, get_state):
+        """Queue ("save", state) or ("changes", counters, changed); never blocks."""
+        with self._cond:
+            if self._oldest_pending is None:
+                self._oldest_pending = time.monotonic()
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                self.overflows += 1
+                self._resync = get_state
+                self._cond.notify_all()
+
+    def stats(self) -> Dict:
+        with self._cond:
+            lag = time.monotonic() - self._oldest_pending if self._oldest_pending else 0.0
+            return {
+                "backend": self.backend.get_name(),
+                "mode": "async",
+                "queued": self._queue.qsize(),
+                "lag_seconds": round(lag, 3),
+                "resync_pending": self._resync is not None,
+                "written": self.written,
+                "failures": self.failures,
+                "overflows": self.overflows,
+                "last_success_at": self.last_success_at.isoformat() if self.last_success_at else None,
+            }
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything submitted so far is written."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._busy or self._resync is not None or not self._queue.empty():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def stop(self):
+        self._queue.put(self._STOP)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            batch = []
+            try:
+                batch.append(self._queue.get(timeout=self.RETRY_INTERVAL))
+            except queue.Empty:
+                with self._cond:
+                    if self._resync is None:
+                        continue    # Idle; wake again only to retry a resync
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stopping = any(item is self._STOP for item in batch)
+            batch = [item for item in batch if item is not self._STOP]
+            with self._cond:
+                self._busy = True
+                resync = self._resync
+                self._resync = None
+
+            ok = self._write(batch, resync)
+
+            with self._cond:
+                self._busy = False
+                if ok:
+                    self.written += len(batch)
+                    self.last_success_at = datetime.now()
+                    if self._queue.empty() and self._resync is None:
+                        self._oldest_pending = None
+                else:
+                    self.failures += 1
+                    if self._resync is None:
+                        self._resync = resync or self._state_getter(batch)
+                self._cond.notify_all()
+
+            if stopping:
+                return
+
+    def _write(self, batch: List[Tuple], resync) -> bool:
+        """Write one merged batch (or a full resync)."""
+        if not batch and resync is None:
+            return True
+        try:
+            if not self.backend.is_available():
+                return False
+            if resync is not None:
+                return self.backend.save(resync())
+
+            state = None
+            counters: Dict = {}
+            changed: Dict[str, Dict] = {}
+            get_state = None
+            for item in batch:
+                if item[0] == "save":
+                    state, counters, changed = item[1], dict(item[1].get("counters", {})), {}
+                else:
+                    _, counters, item_changed, get_state = item
+                    changed.update(item_changed)
+
+            if state is not None:
+                merged = dict(state, counters=counters,
+                              contexts={**state.get("contexts", {}), **changed})
+                return self.backend.save(merged)
+            return self.backend.save_changes(counters, changed, get_state)
+        except Exception as e:
+            logger.warning(f"Background write to {self.backend.get_name()} failed: {e}")
+            return False
+
+    @staticmethod
+    def _state_getter(batch: List[Tuple]):
+        """Best source for a full resync after a failed batch."""
+        for item in reversed(batch):
+            if item[0] == "changes":
+                return item[3]
+            return lambda state=item[1]: state
+        return None
 
 
 class MultiLayerBackend(StorageBackend):
@@ -310,19 +717,49 @@ class MultiLayerBackend(StorageBackend):
     Write order: All backends (for redundancy)
     Read order: First available (fastest first)
 
+    With async_secondaries=True only the first (primary) backend is written
+    on the caller's thread. Every other tier is fed from its own bounded
+    queue by a background worker (see _TierWriter), and load() reconciles
+    tiers that fell behind the primary. get_tier_stats() reports per-tier
+    lag.
+
     Example:
         backend = MultiLayerBackend([
             RedisBackend(),    # Try Redis first (fastest)
             SQLiteBackend(),   # Fall back to SQLite
             JSONFileBackend(), # Last resort: JSON file
         ])
+
+        # SQLite on the caller's thread, JSON behind it
+        backend = MultiLayerBackend([SQLiteBackend(), JSONFileBackend()],
+                                    async_secondaries=True)
     """
 
-    def __init__(self, backends: List[StorageBackend]):
+    def __init__(
+        self,
+        backends: List[StorageBackend],
+        async_secondaries: bool = False,
+        max_queue: int = 1024
+    ):
         self.backends = backends
+        self.async_secondaries = async_secondaries
+        self._writers: List[_TierWriter] = []
+        if async_secondaries:
+            self._writers = [_TierWriter(backend, max_queue) for backend in backends[1:]]
+        # Outcome of the last startup reconciliation, in tier order
+        self.last_reconcile: List[Dict] = []
 
     def save(self, state: Dict) -> bool:
         """Save to all available backends."""
+        if self._writers and self.backends[0].is_available():
+            primary = self.backends[0]
+            success = primary.save(state)
+            if not success:
+                logger.warning(f"Failed to save to {primary.get_name()}")
+            for writer in self._writers:
+                writer.submit(("save", state), lambda state=state: state)
+            return success
+
         success = False
         for backend in self.backends:
             if backend.is_available():
@@ -333,16 +770,113 @@ class MultiLayerBackend(StorageBackend):
                     logger.warning(f"Failed to save to {backend.get_name()}")
         return success
 
+    def save_changes(self, counters: Dict, changed: Dict[str, Dict], get_state) -> bool:
+        """
+        Save changes to all available backends, serializing full state at most once.
+
+        In async mode get_state may be called later from a worker thread,
+        so it must be safe to call without the caller's locks held.
+        """
+        if self._writers and self.backends[0].is_available():
+            primary = self.backends[0]
+            success = primary.save_changes(counters, changed, get_state)
+            if not success:
+                logger.warning(f"Failed to save changes to {primary.get_name()}")
+            for writer in self._writers:
+                writer.submit(("changes", counters, changed, get_state), get_state)
+            return success
+
+        full_state = []
+
+        def cached_state():
+            if not full_state:
+                full_state.append(get_state())
+            return full_state[0]
+
+        success = False
+        for backend in self.backends:
+            if backend.is_available():
+                if backend.save_changes(counters, changed, cached_state):
+                    success = True
+                    logger.debug(f"Saved changes to {backend.get_name()}")
+                else:
+                    logger.warning(f"Failed to save changes to {backend.get_name()}")
+        return success
+
     def load(self) -> Optional[Dict]:
-        """Load from first available backend."""
+        """
+        Load from first available backend.
+
+        Faster backends that came up empty are warmed with the loaded state,
+        so a hot tier (e.g. Redis after a restart) never serves only the
+        rows written since. In async mode every tier is reconciled instead.
+        """
+        if self.async_secondaries:
+            return self._load_and_reconcile()
+
+        empty = []
         for backend in self.backends:
             if backend.is_available():
                 state = backend.load()
                 if state is not None:
                     logger.debug(f"Loaded from {backend.get_name()}")
+                    for cold in empty:
+                        if cold.save(state):
+                            logger.debug(f"Warmed {cold.get_name()} from {backend.get_name()}")
                     return state
+                empty.append(backend)
         return None
 
+    def _load_and_reconcile(self) -> Optional[Dict]:
+        """
+        Load every tier and repair any that differ from the authoritative one.
+
+        The primary is authoritative (it is written synchronously); if it
+        has nothing, the first tier that does takes its place.
+        """
+        loaded = [
+            (backend, backend.load())
+            for backend in self.backends if backend.is_available()
+        ]
+        source = next(((b, state) for b, state in loaded if state is not None), None)
+        self.last_reconcile = []
+        if source is None:
+            return None
+
+        source_backend, state = source
+        for backend, tier_state in loaded:
+            if backend is source_backend:
+                status = "source"
+            elif tier_state == state:
+                status = "in_sync"
+            elif backend.save(state):
+                logger.info(f"Reconciled {backend.get_name()} from {source_backend.get_name()}")
+                status = "repaired"
+            else:
+                logger.warning(f"Could not reconcile {backend.get_name()}")
+                status = "failed"
+            self.last_reconcile.append({"backend": backend.get_name(), "status": status})
+        return state
+
+    def get_tier_stats(self) -> List[Dict]:
+        """Per-tier write mode and lag (primary first)."""
+        if not self._writers:
+            return [{"backend": b.get_name(), "mode": "sync"} for b in self.backends]
+        primary = {"backend": self.backends[0].get_name(), "mode": "sync"}
+        return [primary] + [writer.stats() for writer in self._writers]
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for every async tier to catch up. True if all did in time."""
+        return all(writer.flush(timeout) for writer in self._writers)
+
+    def close(self, timeout: float = 5.0):
+        """Drain (up to timeout per tier) and stop the async tier workers."""
+        for writer in self._writers:
+            if not writer.flush(timeout):
+                logger.warning(f"{writer.backend.get_name()} still behind at close; reconciled on next load")
+            writer.stop()
+        self._writers = []
+
     def is_available(self) -> bool:
         """Available if any backend is available."""
         return any(b.is_available() for b in self.backends)
@@ -399,6 +933,82 @@ class ContextEntry:
     tags: List[str] = field(default_factory=list)
 
 
+class _SortedPaths:
+    """
+    Sorted collection of path tuples, stored as a list of sorted blocks.
+
+    A single sorted list costs a memmove of everything after the insertion
+    point per insert, which dominates once there are ~1M EXCH entries.
+    Blocks keep inserts and removals O(log n + BLOCK_SIZE).
+    """
+
+    BLOCK_SIZE = 1000
+
+    def __init__(self, items: Optional[List[Tuple[str, ...]]] = None):
+        items = sorted(items) if items else []
+        self._blocks: List[List[Tuple[str, ...]]] = [
+            items[i:i + self.BLOCK_SIZE] for i in range(0, len(items), self.BLOCK_SIZE)
+        ]
+        self._maxes: List[Tuple[str, ...]] = [block[-1] for block in self._blocks]
+
+    def add(self, item: Tuple[str, ...]):
+        if not self._blocks:
+            self._blocks.append([item])
+            self._maxes.append(item)
+            return
+        i = bisect_left(self._maxes, item)
+        if i == len(self._maxes):
+            i -= 1
+        block = self._blocks[i]
+        block.insert(bisect_left(block, item), item)
+        self._maxes[i] = block[-1]
+        if len(block) > 2 * self.BLOCK_SIZE:
+            self._blocks[i:i + 1] = [block[:self.BLOCK_SIZE], block[self.BLOCK_SIZE:]]
+            self._maxes[i:i + 1] = [block[self.BLOCK_SIZE - 1], block[-1]]
+
+    def discard(self, item: Tuple[str, ...]):
+        i = bisect_left(self._maxes, item)
+        if i == len(self._maxes):
+            return
+        block = self._blocks[i]
+        j = bisect_left(block, item)
+        if j < len(block) and block[j] == item:
+            del block[j]
+            self._drop_or_refresh(i)
+
+    def range(self, lo: Tuple[str, ...], hi: Tuple[str, ...]) -> List[Tuple[str, ...]]:
+        """Items with lo <= item < hi, in order."""
+        result = []
+        i = bisect_left(self._maxes, lo)
+        while i < len(self._blocks):
+            block = self._blocks[i]
+            start = bisect_left(block, lo) if block[0] < lo else 0
+            if block[-1] < hi:
+                result.extend(block[start:])
+            else:
+                result.extend(block[start:bisect_left(block, hi)])
+                break
+            i += 1
+        return result
+
+    def remove_range(self, lo: Tuple[str, ...], hi: Tuple[str, ...]) -> List[Tuple[str, ...]]:
+        """Remove and return items with lo <= item < hi."""
+        removed = self.range(lo, hi)
+        for item in removed:
+            self.discard(item)
+        return removed
+
+    def _drop_or_refresh(self, i: int):
+        if self._blocks[i]:
+            self._maxes[i] = self._blocks[i][-1]
+        else:
+            del self._blocks[i]
+            del self._maxes[i]
+
+    def __len__(self) -> int:
+        return sum(len(block) for block in self._blocks)
+
+
 class ContextRegistry:
     """
     Centralized registry for all context IDs and relationships.
@@ -430,7 +1040,11 @@ class ContextRegistry:
     def __init__(
         self,
         backend: Optional[StorageBackend] = None,
-        persistence_path: Optional[str] = None  # Legacy param, prefer backend
+        persistence_path: Optional[str] = None,  # Legacy param, prefer backend
+        write_behind: bool = False,
+        journal_path: Optional[str] = None,
+        snapshot_debounce: float = 2.0,
+        snapshot_every: int = 256
     ):
         """
         Initialize registry with storage backend.
@@ -440,6 +1054,16 @@ class ContextRegistry:
                      For multi-layer storage, pass MultiLayerBackend.
             persistence_path: Legacy param for JSON file path. Ignored if
                               backend is provided.
+            write_behind: If True, mutations are appended to an fsync'd
+                          operation journal and a background thread writes
+                          full snapshots to the backend, so callers never
+                          wait on a backend save.
+            journal_path: Operation journal for write-behind mode. Defaults
+                          to the backend's file/db path + ".journal".
+            snapshot_debounce: Write-behind: seconds without new mutations
+                               before a snapshot is written.
+            snapshot_every: Write-behind: snapshot after this many journaled
+                            mutations even if they keep coming.
 
         Examples:
             # Simple JSON (default)
@@ -454,6 +1078,9 @@ class ContextRegistry:
                 SQLiteBackend(),
                 JSONFileBackend(),
             ]))
+
+            # Journal now, snapshot in the background
+            registry = ContextRegistry(write_behind=True)
         """
         self._lock = threading.RLock()
 
@@ -466,6 +1093,20 @@ class ContextRegistry:
         # Reverse lookup: uuid -> display_id
         self._uuid_to_display: Dict[str, str] = {}
 
+        # Materialized paths: display_id -> (root, ..., display_id), plus all
+        # paths kept sorted so a subtree is one contiguous range.
+        # An entry whose parent isn't registered gets (parent_id, display_id),
+        # the same lineage the parent-pointer walk used to give.
+        self._paths: Dict[str, Tuple[str, ...]] = {}
+        self._path_index = _SortedPaths()
+
+        # Secondary indexes (dicts used as insertion-ordered sets):
+        #   display-ID prefix ("SB", "EXCH") -> IDs, for get_all_of_type
+        #   all roots, and ContextType value -> roots, for get_roots
+        self._ids_by_type: Dict[str, Dict[str, None]] = {}
+        self._roots: Dict[str, None] = {}
+        self._roots_by_type: Dict[str, Dict[str, None]] = {}
+
         # Set up storage backend
         if backend is not None:
             self._backend = backend
@@ -479,9 +1120,36 @@ class ContextRegistry:
         else:
             self._persistence_path = None
 
+        # Write-behind journal (see WRITE-BEHIND JOURNAL below)
+        self._write_behind = write_behind
+        self._journal_file = None
+        self._snapshot_debounce = snapshot_debounce
+        self._snapshot_every = snapshot_every
+        self._snapshot_lock = threading.Lock()   # One snapshot at a time
+        self._snapshot_cond = threading.Condition()
+        self._pending_ops = 0
+        self._last_op_at = 0.0
+        self._snapshot_thread = None
+        self._closed = False
+        if write_behind:
+            if journal_path is None:
+                base = (getattr(self._backend, 'file_path', None) or
+                        getattr(self._backend, 'db_path', None) or
+                        os.path.expanduser("~/.local/share/memory_system/context_registry"))
+                journal_path = base + ".journal"
+            self._journal_path = journal_path
+        else:
+            self._journal_path = None
+
         # Load existing state if available
         self._load_state()
 
+        if write_behind:
+            self._snapshot_thread = threading.Thread(
+                target=self._snapshot_loop, name="context-registry-snapshot", daemon=True
+            )
+            self._snapshot_thread.start()
+
     # =========================================================================
     # REGISTRATION
     # =========================================================================
@@ -494,7 +1162,8 @@ class ContextRegistry:
         created_by: str = "",
         created_in: Optional[str] = None,
         description: Optional[str] = None,
-        tags: Optional[List[str]] = None
+        tags: Optional[List[str]] = None,
+        persist: bool = True
     ) -> str:
         """
         Register a new context and get its display ID.
@@ -507,6 +1176,8 @@ class ContextRegistry:
             created_in: Which context this was created in.
             description: Brief description.
             tags: Optional tags for searchability.
+            persist: If False, the entry is only held in memory - the caller
+                     saves it later with save_entries() (batched writes).
 
         Returns:
             Display ID (e.g., "SB-89", "MSG-4521")
@@ -550,12 +1221,47 @@ class ContextRegistry:
             # Update parent's children list
             if parent_id is not None:
                 self._contexts[parent_id].children_ids.append(display_id)
-
-            # Persist state
-            self._save_state()
+            self._add_path(display_id)
+            self._index_entry(entry)
+
+            # Persist just the new entry and the parent whose children changed
+            if persist:
+                changed = [display_id] if parent_id is None else [display_id, parent_id]
+                if self._write_behind:
+                    self._journal_put(changed)
+                else:
+                    self._save_changes(changed)
 
             return display_id
 
+    def save_entries(self, display_ids: List[str]) -> bool:
+        """
+        Persist a batch of entries in one backend write.
+
+        Pairs with register(persist=False). Parents of the given entries are
+        saved too, since registering a child changes its parent's children.
+
+        Returns:
+            True if the write succeeded (or was journaled, in write-behind mode)
+        """
+        with self._lock:
+            changed = []
+            for display_id in display_ids:
+                entry = self._contexts.get(display_id)
+                if entry is None:
+                    continue
+                changed.append(display_id)
+                if entry.parent_id is not None and entry.parent_id in self._contexts:
+                    changed.append(entry.parent_id)
+            changed = list(dict.fromkeys(changed))
+            if not changed:
+                return True
+
+            if self._write_behind:
+                self._journal_put(changed)
+                return True
+            return self._save_changes(changed)
+
     def import_context(
         self,
         display_id: str,
@@ -638,16 +1344,74 @@ class ContextRegistry:
             self._uuid_to_display[uuid] = display_id
 
             # Update parent's children list if parent exists
+            changed = [display_id]
             if parent_id is not None and parent_id in self._contexts:
                 if display_id not in self._contexts[parent_id].children_ids:
                     self._contexts[parent_id].children_ids.append(display_id)
-
-            # Don't persist here - caller should call save after batch import
+                    changed.append(parent_id)
+            self._add_path(display_id)
+            self._index_entry(entry)
+
+            # Don't save here - caller should call save after batch import.
+            # Journaling is cheap though, and keeps the import crash-safe.
+            if self._write_behind:
+                self._journal_put(changed)
             return True
 
     def save(self):
         """Explicitly save registry state. Call after batch imports."""
-        self._save_state()
+        if self._write_behind:
+            self.flush()
+        else:
+            self._save_state()
+
+    def reparent(self, display_id: str, new_parent_id: Optional[str]) -> None:
+        """
+        Move a context (and its subtree) under a new parent.
+
+        Args:
+            display_id: Context to move
+            new_parent_id: New parent's display ID, or None to make it a root
+
+        Raises:
+            ValueError: If either context is missing, or the move would
+                        create a cycle
+        """
+        with self._lock:
+            entry = self._contexts.get(display_id)
+            if entry is None:
+                raise ValueError(f"Context '{display_id}' not found in registry")
+            if new_parent_id is not None:
+                if new_parent_id not in self._contexts:
+                    raise ValueError(f"Parent context '{new_parent_id}' not found in registry")
+                if display_id in self._paths[new_parent_id]:
+                    raise ValueError(f"Cannot reparent '{display_id}' under its own descendant '{new_parent_id}'")
+
+            old_parent_id = entry.parent_id
+            if old_parent_id == new_parent_id:
+                return
+
+            changed = [display_id]
+            old_parent = self._contexts.get(old_parent_id) if old_parent_id else None
+            if old_parent is not None and display_id in old_parent.children_ids:
+                old_parent.children_ids.remove(display_id)
+                changed.append(old_parent_id)
+
+            self._unindex_entry(entry)
+            entry.parent_id = new_parent_id
+            self._index_entry(entry)
+            if new_parent_id is not None:
+                new_parent = self._contexts[new_parent_id]
+                if display_id not in new_parent.children_ids:
+                    new_parent.children_ids.append(display_id)
+                changed.append(new_parent_id)
+
+            self._rebase_paths(self._paths[display_id], self._path_for(display_id))
+
+            if self._write_behind:
+                self._journal_put(changed)
+            else:
+                self._save_changes(changed)
 
     def clear_type(self, context_type: str) -> int:
         """
@@ -664,26 +1428,35 @@ class ContextRegistry:
             Number of entries cleared
         """
         with self._lock:
-            to_remove = [
-                display_id for display_id in self._contexts
-                if display_id.startswith(f"{context_type}-")
-            ]
-
-            for display_id in to_remove:
-                entry = self._contexts.pop(display_id)
-                # Also remove from uuid lookup
-                if entry.uuid in self._uuid_to_display:
-                    del self._uuid_to_display[entry.uuid]
-                # Remove from parent's children list
-                if entry.parent_id and entry.parent_id in self._contexts:
-                    parent = self._contexts[entry.parent_id]
-                    if display_id in parent.children_ids:
-                        parent.children_ids.remove(display_id)
-
-            if to_remove:
-                logger.info(f"Cleared {len(to_remove)} {context_type}-type entries from registry (will rebuild from SQLite)")
-
-            return len(to_remove)
+            cleared = self._remove_type(context_type)
+            if cleared:
+                self._rebuild_paths()
+                self._ids_by_type.pop(context_type, None)
+
+            if cleared:
+                logger.info(f"Cleared {cleared} {context_type}-type entries from registry (will rebuild from SQLite)")
+                if self._write_behind:
+                    self._journal_append({"op": "clear_type", "context_type": context_type})
+
+            return cleared
+
+    def _remove_type(self, context_type: str) -> int:
+        """Drop all entries of a type (caller holds the lock)."""
+        to_remove = list(self._ids_by_type.get(context_type, ()))
+
+        for display_id in to_remove:
+            entry = self._contexts.pop(display_id)
+            self._unindex_entry(entry)
+            # Also remove from uuid lookup
+            if entry.uuid in self._uuid_to_display:
+                del self._uuid_to_display[entry.uuid]
+            # Remove from parent's children list
+            if entry.parent_id and entry.parent_id in self._contexts:
+                parent = self._contexts[entry.parent_id]
+                if display_id in parent.children_ids:
+                    parent.children_ids.remove(display_id)
+
+        return len(to_remove)
 
     # =========================================================================
     # RELATIONSHIP QUERIES
@@ -710,15 +1483,8 @@ class ContextRegistry:
             e.g., ["SB-1", "SB-5", "SB-12"] for a grandchild.
         """
         with self._lock:
-            lineage = []
-            current = display_id
-
-            while current is not None:
-                lineage.insert(0, current)
-                entry = self._contexts.get(current)
-                current = entry.parent_id if entry else None
-
-            return lineage
+            path = self._paths.get(display_id)
+            return list(path) if path is not None else [display_id]
 
     def get_root(self, display_id: str) -> Optional[str]:
         """Get the root ancestor of this context."""
@@ -739,17 +1505,95 @@ class ContextRegistry:
             return [c for c in parent.children_ids if c != display_id]
 
     def get_descendants(self, display_id: str) -> List[str]:
-        """Get all descendants (children, grandchildren, etc.)."""
+        """
+        Get all descendants (children, grandchildren, etc.).
+
+        Parents always come before their own descendants.
+        """
         with self._lock:
-            descendants = []
-            to_visit = list(self.get_children(display_id))
+            path = self._paths.get(display_id)
+            if path is None:
+                return []
+            return [p[-1] for p in self._subtree(path)[1:]]
 
-            while to_visit:
-                child = to_visit.pop(0)
-                descendants.append(child)
-                to_visit.extend(self.get_children(child))
+    # =========================================================================
+    # PATH INDEX
+    # =========================================================================
 
-            return descendants
+    def _path_for(self, display_id: str) -> Tuple[str, ...]:
+        """Path implied by the entry's current parent (caller holds the lock)."""
+        parent_id = self._contexts[display_id].parent_id
+        if parent_id is None:
+            return (display_id,)
+        parent_path = self._paths.get(parent_id)
+        if parent_path is None:
+            return (parent_id, display_id)
+        return parent_path + (display_id,)
+
+    def _subtree(self, path: Tuple[str, ...]) -> List[Tuple[str, ...]]:
+        """Indexed paths at or under path, parents first (caller holds the lock)."""
+        return self._path_index.range(path, path + (_PATH_END,))
+
+    def _add_path(self, display_id: str):
+        """Index a newly stored entry (caller holds the lock)."""
+        old = self._paths.get(display_id)
+        if old is not None:
+            # Re-imported: drop the stale path first
+            self._path_index.discard(old)
+        path = self._path_for(display_id)
+        self._paths[display_id] = path
+        self._path_index.add(path)
+
+        # Entries imported before this one, with this one as their missing parent
+        self._rebase_paths((display_id,), path, include_self=False)
+
+    def _rebase_paths(self, old_prefix: Tuple[str, ...], new_prefix: Tuple[str, ...],
+                      include_self: bool = True):
+        """Move every indexed path under old_prefix to new_prefix (caller holds the lock)."""
+        if old_prefix == new_prefix:
+            return
+        removed = self._path_index.remove_range(old_prefix, old_prefix + (_PATH_END,))
+        if not include_self and removed and removed[0] == old_prefix:
+            self._path_index.add(removed.pop(0))
+
+        cut = len(old_prefix)
+        for p in removed:
+            moved = new_prefix + p[cut:]
+            self._path_index.add(moved)
+            self._paths[moved[-1]] = moved
+
+    def _rebuild_paths(self):
+        """Recompute every path from parent pointers (caller holds the lock)."""
+        paths: Dict[str, Tuple[str, ...]] = {}
+
+        def resolve(display_id: str) -> Tuple[str, ...]:
+            chain = []
+            on_chain = set()
+            current = display_id
+            while current not in paths:
+                entry = self._contexts.get(current)
+                if entry is None:
+                    # Missing parent - lineage stops here, as in _path_for
+                    base = (current,)
+                    break
+                chain.append(current)
+                on_chain.add(current)
+                if entry.parent_id is None or entry.parent_id in on_chain:
+                    base = ()  # Root (or a corrupt cycle - cut it here)
+                    break
+                current = entry.parent_id
+            else:
+                base = paths[current]
+            for node in reversed(chain):
+                base = base + (node,)
+                paths[node] = base
+            return paths[display_id]
+
+        for display_id in self._contexts:
+            resolve(display_id)
+
+        self._paths = paths
+        self._path_index = _SortedPaths(list(paths.values()))
 
     # =========================================================================
     # LOOKUP
@@ -791,11 +1635,7 @@ class ContextRegistry:
     def get_all_of_type(self, context_type: str) -> List[str]:
         """Get all display IDs of a given type."""
         with self._lock:
-            return [
-                entry.display_id
-                for entry in self._contexts.values()
-                if entry.display_id.startswith(f"{context_type}-")
-            ]
+            return list(self._ids_by_type.get(context_type, ()))
 
     def get_roots(self, context_type: Optional[str] = None) -> List[str]:
         """
@@ -806,17 +1646,45 @@ class ContextRegistry:
                          e.g., "SB" for sidebars only
         """
         with self._lock:
-            results = []
-            for entry in self._contexts.values():
-                if entry.parent_id is not None:
-                    continue
-                # Filter by type if specified
-                if context_type is not None:
-                    entry_type = entry.context_type.value if isinstance(entry.context_type, ContextType) else str(entry.context_type)
-                    if entry_type != context_type:
-                        continue
-                results.append(entry.display_id)
-            return results
+            if context_type is None:
+                return list(self._roots)
+            return list(self._roots_by_type.get(context_type, ()))
+
+    # =========================================================================
+    # TYPE AND ROOT INDEXES
+    # =========================================================================
+
+    @staticmethod
+    def _type_prefix(display_id: str) -> str:
+        """Type prefix of a display ID ("EXCH-12" -> "EXCH")."""
+        return display_id.rsplit("-", 1)[0]
+
+    @staticmethod
+    def _type_value(entry: ContextEntry) -> str:
+        return entry.context_type.value if isinstance(entry.context_type, ContextType) else str(entry.context_type)
+
+    def _index_entry(self, entry: ContextEntry):
+        """Add an entry to the type/root indexes (caller holds the lock)."""
+        self._ids_by_type.setdefault(self._type_prefix(entry.display_id), {})[entry.display_id] = None
+        if entry.parent_id is None:
+            self._roots[entry.display_id] = None
+            self._roots_by_type.setdefault(self._type_value(entry), {})[entry.display_id] = None
+
+    def _unindex_entry(self, entry: ContextEntry):
+        """Remove an entry from the type/root indexes (caller holds the lock)."""
+        self._ids_by_type.get(self._type_prefix(entry.display_id), {}).pop(entry.display_id, None)
+        if entry.parent_id is None:
+            self._roots.pop(entry.display_id, None)
+            self._roots_by_type.get(self._type_value(entry), {}).pop(entry.display_id, None)
+
+    def _rebuild_indexes(self):
+        """Rebuild every derived index after a bulk load (caller holds the lock)."""
+        self._ids_by_type = {}
+        self._roots = {}
+        self._roots_by_type = {}
+        for entry in self._contexts.values():
+            self._index_entry(entry)
+        self._rebuild_paths()
 
     # =========================================================================
     # TREE VISUALIZATION
@@ -835,34 +1703,47 @@ class ContextRegistry:
             Nested dict representing the tree.
         """
         with self._lock:
-            def build_subtree(display_id: str) -> Dict:
-                entry = self._contexts.get(display_id)
-                if not entry:
-                    return {}
-
-                # Only include SB children (not EXCH entries)
-                sb_children = [
-                    c for c in entry.children_ids
-                    if c.startswith("SB-")
-                ]
-
-                return {
-                    "id": display_id,
-                    "uuid": entry.uuid,
-                    "type": entry.context_type.value if isinstance(entry.context_type, ContextType) else str(entry.context_type),
-                    "created_by": entry.created_by,
-                    "description": entry.description,
-                    "children": [build_subtree(c) for c in sb_children]
-                }
-
             if root_id:
-                return build_subtree(root_id)
+                return self._build_subtree(root_id)
             else:
                 # Return forest of all roots (filtered by type)
                 return {
-                    "roots": [build_subtree(r) for r in self.get_roots(context_type=context_type)]
+                    "roots": [self._build_subtree(r) for r in self.get_roots(context_type=context_type)]
                 }
 
+    def _build_subtree(self, root_id: str) -> Dict:
+        """
+        Build one nested tree dict from the root's path range (caller holds the lock).
+
+        Only SB children are followed (not EXCH entries). The range lists
+        parents before children, so every node exists before it is linked.
+        """
+        entry = self._contexts.get(root_id)
+        if not entry:
+            return {}
+
+        nodes: Dict[str, Dict] = {}
+        for path in self._subtree(self._paths[root_id]):
+            display_id = path[-1]
+            if display_id != root_id and not display_id.startswith("SB-"):
+                continue
+            entry = self._contexts[display_id]
+            nodes[display_id] = {
+                "id": display_id,
+                "uuid": entry.uuid,
+                "type": entry.context_type.value if isinstance(entry.context_type, ContextType) else str(entry.context_type),
+                "created_by": entry.created_by,
+                "description": entry.description,
+                "children": []
+            }
+
+        for display_id, node in nodes.items():
+            node["children"] = [
+                nodes[c] for c in self._contexts[display_id].children_ids
+                if c.startswith("SB-") and c in nodes
+            ]
+        return nodes[root_id]
+
     def print_tree(self, root_id: Optional[str] = None, indent: int = 0):
         """Print tree structure to console (for debugging)."""
         with self._lock:
@@ -888,51 +1769,63 @@ class ContextRegistry:
     # PERSISTENCE (via StorageBackend)
     # =========================================================================
 
+    def _serialize_entry(self, entry: ContextEntry) -> Dict:
+        """Serialize one entry to dict for storage."""
+        return {
+            "display_id": entry.display_id,
+            "uuid": entry.uuid,
+            "context_type": entry.context_type.value if isinstance(entry.context_type, ContextType) else str(entry.context_type),
+            "parent_id": entry.parent_id,
+            "children_ids": list(entry.children_ids),
+            "created_at": entry.created_at.isoformat(),
+            "created_by": entry.created_by,
+            "created_in": entry.created_in,
+            "description": entry.description,
+            "tags": list(entry.tags)
+        }
+
+    def _locked_state(self) -> Dict:
+        """Serialize state under the lock (safe from backend worker threads)."""
+        with self._lock:
+            return self._serialize_state()
+
     def _serialize_state(self) -> Dict:
         """Serialize registry state to dict for storage."""
         return {
-            "counters": self._counters,
+            "counters": dict(self._counters),
             "contexts": {
-                display_id: {
-                    "display_id": entry.display_id,
-                    "uuid": entry.uuid,
-                    "context_type": entry.context_type.value if isinstance(entry.context_type, ContextType) else str(entry.context_type),
-                    "parent_id": entry.parent_id,
-                    "children_ids": entry.children_ids,
-                    "created_at": entry.created_at.isoformat(),
-                    "created_by": entry.created_by,
-                    "created_in": entry.created_in,
-                    "description": entry.description,
-                    "tags": entry.tags
-                }
+                display_id: self._serialize_entry(entry)
                 for display_id, entry in self._contexts.items()
             }
         }
 
+    def _deserialize_entry(self, data: Dict) -> ContextEntry:
+        """Deserialize one stored entry."""
+        # Parse context type
+        try:
+            ctx_type = ContextType(data["context_type"])
+        except ValueError:
+            ctx_type = ContextType.SIDEBAR  # Fallback
+
+        return ContextEntry(
+            display_id=data["display_id"],
+            uuid=data["uuid"],
+            context_type=ctx_type,
+            parent_id=data.get("parent_id"),
+            children_ids=list(data.get("children_ids", [])),
+            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else datetime.now(),
+            created_by=data.get("created_by", ""),
+            created_in=data.get("created_in"),
+            description=data.get("description"),
+            tags=list(data.get("tags", []))
+        )
+
     def _deserialize_state(self, state: Dict):
         """Deserialize state dict into registry."""
         self._counters = state.get("counters", {})
 
         for display_id, data in state.get("contexts", {}).items():
-            # Parse context type
-            try:
-                ctx_type = ContextType(data["context_type"])
-            except ValueError:
-                ctx_type = ContextType.SIDEBAR  # Fallback
-
-            entry = ContextEntry(
-                display_id=data["display_id"],
-                uuid=data["uuid"],
-                context_type=ctx_type,
-                parent_id=data.get("parent_id"),
-                children_ids=data.get("children_ids", []),
-                created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else datetime.now(),
-                created_by=data.get("created_by", ""),
-                created_in=data.get("created_in"),
-                description=data.get("description"),
-                tags=data.get("tags", [])
-            )
-
+            entry = self._deserialize_entry(data)
             self._contexts[display_id] = entry
             self._uuid_to_display[entry.uuid] = display_id
 
@@ -946,16 +1839,220 @@ class ContextRegistry:
         if not self._backend.save(state):
             logger.warning(f"Failed to save to {self._backend.get_name()}")
 
+    def _save_changes(self, display_ids: List[str]) -> bool:
+        """Save only the given entries via backend (full save if it can't)."""
+        if not self._backend.is_available():
+            logger.warning(f"Storage backend {self._backend.get_name()} not available")
+            return False
+
+        changed = {
+            display_id: self._serialize_entry(self._contexts[display_id])
+            for display_id in display_ids
+        }
+        if not self._backend.save_changes(dict(self._counters), changed, self._locked_state):
+            logger.warning(f"Failed to save to {self._backend.get_name()}")
+            return False
+        return True
+
     def _load_state(self):
         """Load registry state via backend."""
         if not self._backend.is_available():
             logger.debug(f"Storage backend {self._backend.get_name()} not available, starting fresh")
+        else:
+            state = self._backend.load()
+            if state is not None:
+                self._deserialize_state(state)
+                logger.debug(f"Loaded {len(self._contexts)} contexts from {self._backend.get_name()}")
+
+        self._rebuild_indexes()
+
+        if self._write_behind:
+            self._replay_journal()
+            self._rebuild_paths()
+
+    # =========================================================================
+    # WRITE-BEHIND JOURNAL
+    # =========================================================================
+    #
+    # Each mutation is one fsync'd JSON line in the journal:
+    #   {"op": "put", "counters": {...}, "contexts": {display_id: entry, ...}}
+    #   {"op": "clear_type", "context_type": "SB"}
+    # A "put" carries whole entries, so replaying a journal on top of any
+    # snapshot taken while it was being written converges to the same state.
+    #
+    # A snapshot moves the live journal aside to <journal>.pending, saves the
+    # full state to the backend outside the registry lock, then deletes the
+    # pending file. If the save fails the pending file stays, and load
+    # replays it before the live journal.
+
+    def _journal_put(self, display_ids: List[str]):
+        """Journal the current value of these entries (caller holds the lock)."""
+        self._journal_append({
+            "op": "put",
+            "counters": dict(self._counters),
+            "contexts": {
+                display_id: self._serialize_entry(self._contexts[display_id])
+                for display_id in display_ids
+            },
+        })
+
+    def _journal_append(self, record: Dict):
+        """Append one record to the journal and fsync (caller holds the lock)."""
+        if self._journal_file is None:
+            os.makedirs(os.path.dirname(self._journal_path) or ".", exist_ok=True)
+            self._journal_file = open(self._journal_path, "a")
+        self._journal_file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._journal_file.flush()
+        os.fsync(self._journal_file.fileno())
+
+        with self._snapshot_cond:
+            self._pending_ops += 1
+            self._last_op_at = time.monotonic()
+            self._snapshot_cond.notify()
+
+    def _apply_journal_record(self, record: Dict):
+        """
+        Apply one journal record to in-memory state (caller holds the lock).
+
+        Keeps the type/root indexes current; paths are rebuilt after replay.
+        """
+        if record["op"] == "clear_type":
+            self._remove_type(record["context_type"])
+            return
+
+        for context_type, value in record.get("counters", {}).items():
+            if value > self._counters.get(context_type, 0):
+                self._counters[context_type] = value
+        for display_id, data in record["contexts"].items():
+            entry = self._deserialize_entry(data)
+            old = self._contexts.get(display_id)
+            if old is not None:
+                self._unindex_entry(old)
+                if old.uuid != entry.uuid:
+                    self._uuid_to_display.pop(old.uuid, None)
+            self._index_entry(entry)
+            self._contexts[display_id] = entry
+            self._uuid_to_display[entry.uuid] = display_id
+
+    def _replay_journal(self):
+        """Replay the pending and live journals on top of the loaded snapshot."""
+        replayed = 0
+        for path in (self._journal_path + ".pending", self._journal_path):
+            if not os.path.exists(path):
+                continue
+
+            with open(path, "rb") as f:
+                data = f.read()
+
+            offset = 0
+            for line in data.splitlines(keepends=True):
+                if not line.endswith(b"\n"):
+                    # Torn final write - trim it so the next append starts clean
+                    logger.warning(f"Dropping incomplete record at end of {path}")
+                    with open(path, "r+b") as f:
+                        f.truncate(offset)
+                    break
+                offset += len(line)
+
+                try:
+                    self._apply_journal_record(json.loads(line))
+                    replayed += 1
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    logger.warning(f"Skipping unreadable journal record in {path}: {e}")
+
+        if replayed:
+            logger.debug(f"Replayed {replayed} journal records from {self._journal_path}")
+            # Fold the replayed tail into a snapshot soon
+            with self._snapshot_cond:
+                self._pending_ops += replayed
+                self._last_op_at = time.monotonic()
+
+    def _snapshot_loop(self):
+        """Background thread: snapshot after a quiet period or every N ops."""
+        while True:
+            with self._snapshot_cond:
+                while not self._closed and self._pending_ops == 0:
+                    self._snapshot_cond.wait()
+                while not self._closed and self._pending_ops < self._snapshot_every:
+                    remaining = self._last_op_at + self._snapshot_debounce - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._snapshot_cond.wait(remaining)
+                if self._closed:
+                    return
+
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"Context registry snapshot failed: {e}")
+                time.sleep(self._snapshot_debounce)
+
+    def flush(self) -> bool:
+        """
+        Write a full snapshot to the backend now and retire the journal.
+
+        Returns:
+            True if the snapshot was saved (or there was nothing to save)
+        """
+        if not self._write_behind:
+            self._save_state()
+            return True
+
+        with self._snapshot_lock:
+            pending_path = self._journal_path + ".pending"
+            with self._lock:
+                with self._snapshot_cond:
+                    if self._pending_ops == 0 and not os.path.exists(pending_path):
+                        return True
+                    self._pending_ops = 0
+                state = self._serialize_state()
+                self._rotate_journal(pending_path)
+
+            if not self._backend.is_available() or not self._backend.save(state):
+                logger.warning(f"Failed to save snapshot to {self._backend.get_name()}, keeping journal")
+                with self._snapshot_cond:
+                    # Retry after the next quiet period
+                    self._pending_ops += 1
+                    self._last_op_at = time.monotonic()
+                return False
+
+            os.remove(pending_path)
+            return True
+
+    def _rotate_journal(self, pending_path: str):
+        """Move the live journal into the pending file (caller holds the lock)."""
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
+        if not os.path.exists(self._journal_path):
+            if not os.path.exists(pending_path):
+                open(pending_path, "w").close()
             return
 
-        state = self._backend.load()
-        if state is not None:
-            self._deserialize_state(state)
-            logger.debug(f"Loaded {len(self._contexts)} contexts from {self._backend.get_name()}")
+        if os.path.exists(pending_path):
+            # An earlier snapshot failed - keep its records ahead of ours
+            with open(self._journal_path, "rb") as src, open(pending_path, "ab") as dst:
+                dst.write(src.read())
+                dst.flush()
+                os.fsync(dst.fileno())
+            os.remove(self._journal_path)
+        else:
+            os.replace(self._journal_path, pending_path)
+
+    def close(self):
+        """Stop the snapshot thread and write a final snapshot."""
+        if not self._write_behind or self._closed:
+            return
+        with self._snapshot_cond:
+            self._closed = True
+            self._snapshot_cond.notify_all()
+        if self._snapshot_thread is not None:
+            self._snapshot_thread.join()
+        self.flush()
+        with self._lock:
+            if self._journal_file is not None:
+                self._journal_file.close()
+                self._journal_file = None
 
     def get_backend_info(self) -> Dict:
         """Get info about current storage backend."""
@@ -982,7 +2079,7 @@ class ContextRegistry:
             return {
                 "total_contexts": len(self._contexts),
                 "by_type": type_counts,
-                "root_count": len(self.get_roots()),
+                "root_count": len(self._roots),
                 "counters": dict(self._counters)
             }
 
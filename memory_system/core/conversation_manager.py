@@ -43,7 +43,7 @@ def _get_ozolith():
     if _ozolith_instance is None:
         try:
             from ozolith import Ozolith
-            _ozolith_instance = Ozolith()
+            _ozolith_instance = Ozolith(group_commit=True)
         except ImportError:
             logger.warning("Ozolith not available - memory events will not be logged")
             return None
@@ -16,8 +16,11 @@ Source: UNIFIED_SIDEBAR_ARCHITECTURE.md
 
 import hashlib
 import logging
+import time
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence
 from uuid_extensions import uuid7
 
 from datashapes import (
@@ -36,6 +39,10 @@ from datashapes import (
     payload_to_dict,
 )
 from context_registry import get_registry, ContextType
+from exchange_pipeline import ExchangeAck, ExchangeDurability, ExchangeWritePipeline
+from exchange_sequence import ExchangeSequence
+from cross_ref_index import CrossRefIndex
+from yarn_render_cache import YarnRenderCache
 
 # Lazy import persistence to avoid circular dependencies
 _persistence_instance = None
@@ -63,7 +70,7 @@ def _get_ozolith():
     if _ozolith_instance is None:
         try:
             from ozolith import Ozolith
-            _ozolith_instance = Ozolith()
+            _ozolith_instance = Ozolith(group_commit=True)
         except ImportError:
             logging.warning("Ozolith not available - events will not be logged")
             return None
@@ -159,6 +166,18 @@ class ConversationOrchestrator:
         # One coordination huddle per context for grab collisions (prevents sidebar explosion)
         self._grab_huddles: Dict[str, str] = {}
 
+        # Counts and timings from the last _load_from_persistence()
+        self._load_metrics: Dict[str, Any] = {}
+
+        # Inverted index + adjacency over every cross_sidebar_refs (built on first query)
+        self._cross_ref_index: Optional[CrossRefIndex] = None
+
+        # Rendered yarn boards + point details, invalidated per context by _persist_context()
+        self._yarn_renders = YarnRenderCache()
+
+        # Stages add_exchange's registry / SQLite / OZOLITH writes and commits them together
+        self._exchange_pipeline = ExchangeWritePipeline(self.registry, _get_persistence, _get_ozolith)
+
         # Auto-load persisted state if available
         if auto_load:
             self._load_from_persistence()
@@ -216,28 +235,22 @@ class ConversationOrchestrator:
             return 0
 
         try:
-            # Load all contexts including archived (needed for tree visualization)
-            contexts = db.load_all_contexts(include_archived=True)
+            started = time.perf_counter()
+            self._cross_ref_index = None  # Rebuilt from the loaded refs when next queried
+            self._yarn_renders.clear()
+
+            # Load all contexts including archived (needed for tree visualization).
+            # Headers only: memory and the other fields load when first used.
+            contexts = db.load_all_contexts(include_archived=True, lazy=True)
+            fetched = time.perf_counter()
 
             # Clear SB entries from registry before importing
             # This ensures SQLite is authoritative - registry becomes derived index
             self.registry.clear_type("SB")
 
-            # Sort so parents come before children (needed for registry import)
-            # Roots first (parent_context_id is None), then by depth
-            def get_depth(ctx):
-                depth = 0
-                current = ctx.parent_context_id
-                visited = set()
-                while current and current not in visited:
-                    visited.add(current)
-                    depth += 1
-                    # Find parent in our list
-                    parent = next((c for c in contexts if c.sidebar_id == current), None)
-                    current = parent.parent_context_id if parent else None
-                return depth
-
-            contexts_sorted = sorted(contexts, key=get_depth)
+            # Parents before children (needed for registry import)
+            contexts_sorted, orphaned, cyclic = self._order_parents_first(contexts)
+            ordered = time.perf_counter()
 
             # Import each context
             imported_count = 0
@@ -272,13 +285,66 @@ class ConversationOrchestrator:
                     most_recent = max(active_contexts, key=lambda c: c.last_activity)
                     self._active_context_id = most_recent.sidebar_id
 
-            logger.info(f"Loaded {len(contexts)} contexts from persistence, active: {self._active_context_id}")
+            finished = time.perf_counter()
+            self._load_metrics = {
+                "contexts": len(contexts),
+                "imported": imported_count,
+                "orphaned": orphaned,
+                "cyclic": cyclic,
+                "fetch_seconds": round(fetched - started, 4),
+                "order_seconds": round(ordered - fetched, 4),
+                "import_seconds": round(finished - ordered, 4),
+                "total_seconds": round(finished - started, 4),
+            }
+
+            logger.info(
+                f"Loaded {len(contexts)} contexts from persistence in "
+                f"{self._load_metrics['total_seconds']:.3f}s, active: {self._active_context_id}"
+            )
+            if cyclic:
+                logger.warning(f"{cyclic} persisted contexts sit on a parent cycle; imported last")
             return len(contexts)
 
         except Exception as e:
             logger.error(f"Failed to load from persistence: {e}")
             return 0
 
+    @staticmethod
+    def _order_parents_first(contexts: List[SidebarContext]):
+        """
+        Order contexts so every parent precedes its children, in one O(n)
+        Kahn-style pass over an ID -> children map.
+
+        Contexts whose parent isn't in the list (orphans) start the order
+        alongside roots. Any left over sit on a parent cycle; they are
+        appended at the end rather than dropped.
+
+        Returns:
+            (ordered contexts, orphan count, cyclic count)
+        """
+        known = {ctx.sidebar_id for ctx in contexts}
+        children: Dict[str, List[SidebarContext]] = {}
+        ready = deque()
+        orphaned = 0
+        for ctx in contexts:
+            parent_id = ctx.parent_context_id
+            if parent_id is None or parent_id not in known:
+                if parent_id is not None:
+                    orphaned += 1
+                ready.append(ctx)
+            else:
+                children.setdefault(parent_id, []).append(ctx)
+
+        ordered = []
+        while ready:
+            ctx = ready.popleft()
+            ordered.append(ctx)
+            ready.extend(children.pop(ctx.sidebar_id, ()))
+
+        cyclic = [ctx for waiting in children.values() for ctx in waiting]
+        ordered.extend(cyclic)
+        return ordered, orphaned, len(cyclic)
+
     def _persist_context(self, context: SidebarContext) -> bool:
         """
         Persist a context to SQLite (write-through).
@@ -289,6 +355,9 @@ class ConversationOrchestrator:
         Returns:
             True if persisted successfully
         """
+        # Every mutation comes through here, persistence or not
+        self._yarn_renders.invalidate(context.sidebar_id)
+
         db = _get_persistence()
         if db is None:
             return False
@@ -300,6 +369,32 @@ class ConversationOrchestrator:
             # Don't crash - data is still in memory and OZOLITH
             return False
 
+    @contextmanager
+    def _persist_batch(self):
+        """
+        Commit the persistence writes made in the block as one transaction.
+
+        Like _persist_context(), a failed commit is logged rather than raised;
+        errors from the block itself propagate unchanged.
+        """
+        db = _get_persistence()
+        if db is None:
+            yield
+            return
+
+        body_failed = False
+        try:
+            with db.batch():
+                try:
+                    yield
+                except BaseException:
+                    body_failed = True
+                    raise
+        except Exception as e:
+            if body_failed:
+                raise
+            logger.error(f"Failed to commit persistence batch: {e}")
+
     def _persist_focus(self) -> bool:
         """
         Persist current focus state to SQLite.
@@ -335,12 +430,13 @@ class ConversationOrchestrator:
 
         try:
             saved_count = 0
-            for context in self._contexts.values():
-                if db.save_context(context):
-                    saved_count += 1
+            with db.batch():
+                for context in self._contexts.values():
+                    if db.save_context(context):
+                        saved_count += 1
 
-            # Also persist current focus state
-            self._persist_focus()
+                # Also persist current focus state
+                self._persist_focus()
 
             logger.info(f"Saved {saved_count} contexts to persistence")
             return db.db_path if hasattr(db, 'db_path') else "sqlite:memory"
@@ -491,19 +587,18 @@ class ConversationOrchestrator:
             description=reason
         )
 
-        # Build inherited memory (snapshot from parent)
-        if inherit_last_n is None:
-            # Inherit all
-            inherited = list(parent.local_memory)
-        elif inherit_last_n == 0:
-            inherited = []
+        # Build inherited memory (snapshot from parent). local_memory is
+        # append-only, so the snapshot is a view sharing the parent's list;
+        # the read-only markers are applied as exchanges are read, leaving
+        # the parent's own dicts untouched.
+        if inherit_last_n == 0:
+            inherited = ExchangeSequence()
         else:
-            inherited = list(parent.local_memory[-inherit_last_n:])
-
-        # Mark inherited exchanges as read-only snapshots
-        for exchange in inherited:
-            exchange["_inherited"] = True
-            exchange["_inherited_from"] = parent_id
+            start = 0 if inherit_last_n is None else -inherit_last_n
+            inherited = ExchangeSequence.of(
+                parent.local_memory, start,
+                tags={"_inherited": True, "_inherited_from": parent_id}
+            )
 
         # Create sidebar context
         context = SidebarContext(
@@ -529,9 +624,10 @@ class ConversationOrchestrator:
         self._active_context_id = display_id
 
         # Persist both contexts to SQLite
-        self._persist_context(context)  # New sidebar
-        self._persist_context(parent)    # Parent updated (PAUSED, new child)
-        self._persist_focus()
+        with self._persist_batch():
+            self._persist_context(context)  # New sidebar
+            self._persist_context(parent)    # Parent updated (PAUSED, new child)
+            self._persist_focus()
 
         # Log SIDEBAR_SPAWN to OZOLITH
         oz = _get_ozolith()
@@ -569,6 +665,11 @@ class ConversationOrchestrator:
         """
         Add an exchange to a context's local memory.
 
+        Commits fully (SQLite, registry and OZOLITH) before returning; see
+        submit_exchange() to trade durability for latency. If the commit
+        fails the exchange stays in local_memory and staged for a background
+        retry, and the error is raised.
+
         Args:
             context_id: Which context to add to
             user_message: What the user said
@@ -578,17 +679,76 @@ class ConversationOrchestrator:
 
         Returns:
             The exchange ID
+
+        Raises:
+            The commit's error if the exchange didn't reach OZOLITH (no
+            OZOLITH log at all is not an error - the exchange stops at LOCAL)
+        """
+        ack = self.submit_exchange(
+            context_id, user_message, assistant_response,
+            exchange_id=exchange_id, metadata=metadata,
+            durability=ExchangeDurability.CHAINED
+        )
+        if not ack.satisfied and ack.error is not None:
+            raise ack.error
+        context = self._contexts[context_id]
+        exchange = context.local_memory[-1]
+
+        # [DEBUG-SYNC] Log what was stored to local_memory
+        print(f"[DEBUG-SYNC] orchestrator.add_exchange():")
+        print(f"[DEBUG-SYNC]   context_id: {context_id}")
+        print(f"[DEBUG-SYNC]   Stored exchange keys: {list(exchange.keys())}")
+        print(f"[DEBUG-SYNC]   Has 'user' key: {'user' in exchange}")
+        print(f"[DEBUG-SYNC]   Has 'role' key: {'role' in exchange}")
+        print(f"[DEBUG-SYNC]   Has retrieved_memories: {'retrieved_memories' in exchange}")
+        print(f"[DEBUG-SYNC]   local_memory length now: {len(context.local_memory)}")
+
+        return ack.exchange_id
+
+    def submit_exchange(
+        self,
+        context_id: str,
+        user_message: str,
+        assistant_response: str,
+        exchange_id: Optional[str] = None,
+        metadata: Optional[Dict] = None,
+        durability: ExchangeDurability = ExchangeDurability.CHAINED
+    ) -> ExchangeAck:
+        """
+        Add an exchange, committing its writes only as far as asked.
+
+        The exchange is in local_memory (and the registry, in memory) on
+        return either way. Its registry entry, context rows and OZOLITH
+        EXCHANGE event are staged as one unit and committed with whatever
+        else is staged: one SQLite transaction, one grouped OZOLITH flush.
+
+        Args:
+            context_id: Which context to add to
+            user_message: What the user said
+            assistant_response: What the assistant replied
+            exchange_id: Optional ID (generated if not provided)
+            metadata: Optional additional data
+            durability: MEMORY (commit in background), LOCAL (SQLite and
+                        registry on disk) or CHAINED (also in OZOLITH)
+
+        Returns:
+            ExchangeAck - ack.durability is the level actually reached and
+            ack.error what stopped it; a failed commit is retried in the
+            background, not raised
         """
         context = self._contexts.get(context_id)
         if context is None:
             raise ValueError(f"Context '{context_id}' not found")
 
+        registry_ids = []
         if exchange_id is None:
             exchange_id = self.registry.register(
                 context_type="EXCH",
                 created_by="system",
-                created_in=context_id
+                created_in=context_id,
+                persist=False
             )
+            registry_ids.append(exchange_id)
 
         exchange = {
             "exchange_id": exchange_id,
@@ -602,42 +762,31 @@ class ConversationOrchestrator:
         context.local_memory.append(exchange)
         context.last_activity = datetime.now()
 
-        # [DEBUG-SYNC] Log what was stored to local_memory
-        print(f"[DEBUG-SYNC] orchestrator.add_exchange():")
-        print(f"[DEBUG-SYNC]   context_id: {context_id}")
-        print(f"[DEBUG-SYNC]   Stored exchange keys: {list(exchange.keys())}")
-        print(f"[DEBUG-SYNC]   Has 'user' key: {'user' in exchange}")
-        print(f"[DEBUG-SYNC]   Has 'role' key: {'role' in exchange}")
-        print(f"[DEBUG-SYNC]   Has retrieved_memories: {'retrieved_memories' in exchange}")
-        print(f"[DEBUG-SYNC]   local_memory length now: {len(context.local_memory)}")
+        payload = OzolithPayloadExchange(
+            content=f"[exchange:{exchange_id}]",  # Reference, not raw content
+            confidence=metadata.get("confidence", 0.0) if metadata else 0.0,
+            uncertainty_flags=metadata.get("uncertainty_flags", []) if metadata else [],
+            context_depth=len(context.inherited_memory),
+            extra={
+                "exchange_id": exchange_id,
+                "has_user_message": bool(user_message),
+                "has_assistant_response": bool(assistant_response),
+            }
+        )
+        event = (OzolithEventType.EXCHANGE, context_id, "assistant", payload_to_dict(payload))
 
-        # Persist updated context
-        self._persist_context(context)
+        return self._exchange_pipeline.submit(exchange_id, context, registry_ids, event, durability)
 
-        # Log EXCHANGE to OZOLITH
-        oz = _get_ozolith()
-        if oz:
-            payload = OzolithPayloadExchange(
-                content=f"[exchange:{exchange_id}]",  # Reference, not raw content
-                confidence=metadata.get("confidence", 0.0) if metadata else 0.0,
-                uncertainty_flags=metadata.get("uncertainty_flags", []) if metadata else [],
-                context_depth=len(context.inherited_memory),
-                extra={
-                    "exchange_id": exchange_id,
-                    "has_user_message": bool(user_message),
-                    "has_assistant_response": bool(assistant_response),
-                }
-            )
-            oz.append(
-                event_type=OzolithEventType.EXCHANGE,
-                context_id=context_id,
-                actor="assistant",
-                payload=payload_to_dict(payload)
-            )
+    def flush_exchanges(self) -> bool:
+        """
+        Commit every staged exchange all the way to OZOLITH.
 
-        return exchange_id
+        Returns:
+            True if nothing is left pending
+        """
+        return self._exchange_pipeline.flush()
 
-    def get_context_for_llm(self, context_id: str) -> List[Dict]:
+    def get_context_for_llm(self, context_id: str) -> Sequence[Dict]:
         """
         Get the full context to send to LLM.
 
@@ -647,14 +796,15 @@ class ConversationOrchestrator:
             context_id: Which context
 
         Returns:
-            List of exchanges ready for LLM consumption
+            Read-only sequence of exchanges ready for LLM consumption
         """
         context = self._contexts.get(context_id)
         if context is None:
             return []
 
-        # Inherited first (the snapshot), then local (the work)
-        return context.inherited_memory + context.local_memory
+        # Inherited first (the snapshot), then local (the work). A view over
+        # both, not a copy - exchanges added after this call aren't in it.
+        return ExchangeSequence.concat(context.inherited_memory, context.local_memory)
 
     def get_active_context(self) -> Optional[SidebarContext]:
         """Get the currently focused context."""
@@ -874,9 +1024,10 @@ class ConversationOrchestrator:
         self._active_context_id = parent_id
 
         # Persist both contexts and focus
-        self._persist_context(sidebar)
-        self._persist_context(parent)
-        self._persist_focus()
+        with self._persist_batch():
+            self._persist_context(sidebar)
+            self._persist_context(parent)
+            self._persist_focus()
 
         # Log SIDEBAR_MERGE to OZOLITH
         oz = _get_ozolith()
@@ -971,26 +1122,32 @@ class ConversationOrchestrator:
         # Store original conversation_id for history
         original_conversation_id = context.uuid if old_parent_id is None else None
 
-        # Remove from old parent's children list
-        if old_parent_id is not None and old_parent_id in self._contexts:
-            old_parent = self._contexts[old_parent_id]
-            if context_id in old_parent.child_sidebar_ids:
-                old_parent.child_sidebar_ids.remove(context_id)
-            self._persist_context(old_parent)
-
-        # Update context's parent
-        context.parent_context_id = new_parent_id
-        context.last_activity = datetime.now()
-
-        # Add to new parent's children list
-        if new_parent_id is not None:
-            new_parent = self._contexts[new_parent_id]
-            if context_id not in new_parent.child_sidebar_ids:
-                new_parent.child_sidebar_ids.append(context_id)
-            self._persist_context(new_parent)
-
-        # Persist the reparented context
-        self._persist_context(context)
+        # Old parent, new parent and the context itself commit together
+        with self._persist_batch():
+            # Remove from old parent's children list
+            if old_parent_id is not None and old_parent_id in self._contexts:
+                old_parent = self._contexts[old_parent_id]
+                if context_id in old_parent.child_sidebar_ids:
+                    old_parent.child_sidebar_ids.remove(context_id)
+                self._persist_context(old_parent)
+
+            # Update context's parent
+            context.parent_context_id = new_parent_id
+            context.last_activity = datetime.now()
+
+            # Add to new parent's children list
+            if new_parent_id is not None:
+                new_parent = self._contexts[new_parent_id]
+                if context_id not in new_parent.child_sidebar_ids:
+                    new_parent.child_sidebar_ids.append(context_id)
+                self._persist_context(new_parent)
+
+            # Persist the reparented context
+            self._persist_context(context)
+
+        # Keep registry lineage in step (it tracks SB contexts too)
+        if self.registry.exists(context_id) and (new_parent_id is None or self.registry.exists(new_parent_id)):
+            self.registry.reparent(context_id, new_parent_id)
 
         # Collect children that moved with this context
         children_moved = list(context.child_sidebar_ids)
@@ -1126,6 +1283,7 @@ class ConversationOrchestrator:
                     cluster_flagged = True
                     logger.info(f"Cross-ref {source_context_id}→{target_context_id} cluster-flagged ({len(sources)} sources)")
 
+                self._index_cross_ref(source_context_id, target_context_id)
                 self._persist_context(source)
 
             return {
@@ -1156,6 +1314,7 @@ class ConversationOrchestrator:
 
         # Add to source's cross_sidebar_refs
         source.cross_sidebar_refs[target_context_id] = metadata
+        self._index_cross_ref(source_context_id, target_context_id)
         self._persist_context(source)
 
         # Add reverse reference if bidirectional
@@ -1165,6 +1324,7 @@ class ConversationOrchestrator:
             reverse_metadata["ref_type"] = INVERSE_REF_TYPES[ref_type]
             reverse_metadata["suggested_sources"] = [{"source_id": suggester, "suggested_at": now.isoformat()}]
             target.cross_sidebar_refs[source_context_id] = reverse_metadata
+            self._index_cross_ref(target_context_id, source_context_id)
             self._persist_context(target)
 
         # Log CROSS_REF_ADDED to OZOLITH
@@ -1204,6 +1364,44 @@ class ConversationOrchestrator:
             "newly_flagged": False
         }
 
+    def _cross_refs(self) -> CrossRefIndex:
+        """The cross-ref index, built from every context's refs on first use."""
+        if self._cross_ref_index is None:
+            index = CrossRefIndex()
+            index.rebuild(
+                (context_id, context.cross_sidebar_refs)
+                for context_id, context in self._contexts.items()
+            )
+            self._cross_ref_index = index
+        return self._cross_ref_index
+
+    def _index_cross_ref(self, source_context_id: str, target_context_id: str):
+        """Re-post one ref after a change (or drop it if it's gone)."""
+        if self._cross_ref_index is None:
+            return  # Not built yet - it will read the change when it is
+
+        metadata = self._ref_metadata(source_context_id, target_context_id)
+        if metadata is None:
+            self._cross_ref_index.remove(source_context_id, target_context_id)
+        else:
+            self._cross_ref_index.put(source_context_id, target_context_id, metadata)
+
+    def _ref_metadata(self, source_context_id: str, target_context_id: str) -> Optional[Dict]:
+        """Live metadata for a ref, or None if either end or the ref is gone."""
+        source = self._contexts.get(source_context_id)
+        if source is None:
+            return None
+        return source.cross_sidebar_refs.get(target_context_id)
+
+    def reindex_cross_refs(self):
+        """
+        Rebuild the cross-ref index on next query.
+
+        Only needed after editing cross_sidebar_refs directly rather than
+        through add/update/validate/revoke_cross_ref().
+        """
+        self._cross_ref_index = None
+
     def get_cross_refs(
         self,
         context_id: str,
@@ -1263,34 +1461,34 @@ class ConversationOrchestrator:
             Dict with flagged refs grouped by source context
         """
         flagged_refs = []
+        index = self._cross_refs()
 
-        contexts_to_check = (
-            [self._contexts.get(context_id)] if context_id
-            else self._contexts.values()
-        )
+        if context_id:
+            candidates = [(context_id, target_id) for target_id in index.refs_from(context_id)]
+        elif include_validated:
+            candidates = index.find(flagged=True)
+        else:
+            candidates = index.find(flagged=True, validated=None)
 
-        for context in contexts_to_check:
-            if context is None:
+        for source_id, target_id in candidates:
+            metadata = self._ref_metadata(source_id, target_id)
+            if metadata is None or not metadata.get("cluster_flagged"):
                 continue
 
-            for target_id, metadata in context.cross_sidebar_refs.items():
-                if not metadata.get("cluster_flagged"):
-                    continue
-
-                # Skip already validated unless requested
-                if not include_validated and metadata.get("human_validated") is not None:
-                    continue
+            # Skip already validated unless requested
+            if not include_validated and metadata.get("human_validated") is not None:
+                continue
 
-                flagged_refs.append({
-                    "source_context_id": context.sidebar_id,
-                    "target_context_id": target_id,
-                    "ref_type": metadata.get("ref_type"),
-                    "suggested_sources": metadata.get("suggested_sources", []),
-                    "source_count": len(metadata.get("suggested_sources", [])),
-                    "confidence": metadata.get("confidence", 0.0),
-                    "reason": metadata.get("reason", ""),
-                    "human_validated": metadata.get("human_validated"),
-                })
+            flagged_refs.append({
+                "source_context_id": source_id,
+                "target_context_id": target_id,
+                "ref_type": metadata.get("ref_type"),
+                "suggested_sources": metadata.get("suggested_sources", []),
+                "source_count": len(metadata.get("suggested_sources", [])),
+                "confidence": metadata.get("confidence", 0.0),
+                "reason": metadata.get("reason", ""),
+                "human_validated": metadata.get("human_validated"),
+            })
 
         # Sort by source count (most suggestions first)
         flagged_refs.sort(key=lambda x: x["source_count"], reverse=True)
@@ -1345,11 +1543,13 @@ class ConversationOrchestrator:
 
         # Remove from source's cross_sidebar_refs
         del source.cross_sidebar_refs[target_context_id]
+        self._index_cross_ref(source_context_id, target_context_id)
         self._persist_context(source)
 
         # Also remove reverse ref if it exists (bidirectional cleanup)
         if source_context_id in target.cross_sidebar_refs:
             del target.cross_sidebar_refs[source_context_id]
+            self._index_cross_ref(target_context_id, source_context_id)
             self._persist_context(target)
 
         # Log CROSS_REF_REVOKED to OZOLITH (append-only - preserves history)
@@ -1451,6 +1651,7 @@ class ConversationOrchestrator:
         if new_validation_priority is not None:
             current["validation_priority"] = new_validation_priority
 
+        self._index_cross_ref(source_context_id, target_context_id)
         self._persist_context(source)
 
         # Log CROSS_REF_UPDATED to OZOLITH
@@ -1568,6 +1769,7 @@ class ConversationOrchestrator:
         if chase_after:
             current["chase_after"] = chase_after
 
+        self._index_cross_ref(source_context_id, target_context_id)
         self._persist_context(source)
 
         # Log CROSS_REF_VALIDATED to OZOLITH
@@ -1615,19 +1817,19 @@ class ConversationOrchestrator:
             List of dicts with source_id, target_id, and ref metadata
         """
         pending = []
-        for context_id, context in self._contexts.items():
-            for target_id, metadata in context.cross_sidebar_refs.items():
-                if metadata.get("human_validated") is None:
-                    pending.append({
-                        "source_context_id": context_id,
-                        "target_context_id": target_id,
-                        "ref_type": metadata.get("ref_type"),
-                        "strength": metadata.get("strength"),
-                        "confidence": metadata.get("confidence"),
-                        "reason": metadata.get("reason"),
-                        "created_at": metadata.get("created_at"),
-                        "validation_priority": metadata.get("validation_priority", "normal"),
-                    })
+        for context_id, target_id in self._cross_refs().find(validated=None):
+            metadata = self._ref_metadata(context_id, target_id)
+            if metadata is not None and metadata.get("human_validated") is None:
+                pending.append({
+                    "source_context_id": context_id,
+                    "target_context_id": target_id,
+                    "ref_type": metadata.get("ref_type"),
+                    "strength": metadata.get("strength"),
+                    "confidence": metadata.get("confidence"),
+                    "reason": metadata.get("reason"),
+                    "created_at": metadata.get("created_at"),
+                    "validation_priority": metadata.get("validation_priority", "normal"),
+                })
 
         # Sort by priority (urgent first), then by created_at
         pending.sort(key=lambda x: (
@@ -1789,48 +1991,41 @@ class ConversationOrchestrator:
         }
 
         contradictions = []
-        contexts_to_check = (
-            [self._contexts.get(context_id)] if context_id
-            else self._contexts.values()
-        )
-
-        for context in contexts_to_check:
-            if context is None:
-                continue
-
-            # Group refs by target
-            refs_by_target = {}
-            for target_id, metadata in context.cross_sidebar_refs.items():
-                if target_id not in refs_by_target:
-                    refs_by_target[target_id] = []
-                refs_by_target[target_id].append(metadata.get("ref_type"))
+        index = self._cross_refs()
+        contradicting_types = {ref_type for pair in CONTRADICTIONS for ref_type in pair}
+
+        # Find the context pairs worth checking. A contradiction needs a ref
+        # of each of its two types, so seed from whichever type is rarer.
+        # With context_id, just the refs into and out of that context.
+        if context_id:
+            candidates = (
+                [(context_id, target_id) for target_id in index.refs_from(context_id)]
+                + [(source_id, context_id) for source_id in index.refs_to(context_id)]
+            )
+        else:
+            candidates = []
+            for t1, t2 in CONTRADICTIONS:
+                rarer = t1 if index.type_count(t1) <= index.type_count(t2) else t2
+                candidates.extend(index.find(ref_type=rarer))
 
-            # Check for contradicting types to same target
-            # (This would require multiple refs to same target with different types,
-            #  which our current model doesn't support. But leaving logic for future.)
+        pairs = {}
+        for source_id, target_id in candidates:
+            if index.ref_type(source_id, target_id) in contradicting_types:
+                pairs[tuple(sorted([source_id, target_id]))] = None
 
         # Cross-context contradiction check
         # If context A says "A implements B" but context B says "B contradicts A"
-        seen_refs = {}  # {(sorted_pair): [(context, target, ref_type), ...]}
-
-        for context in (contexts_to_check if context_id else self._contexts.values()):
-            if context is None:
-                continue
-
-            for target_id, metadata in context.cross_sidebar_refs.items():
-                pair = tuple(sorted([context.sidebar_id, target_id]))
-                ref_type = metadata.get("ref_type")
-
-                if pair not in seen_refs:
-                    seen_refs[pair] = []
-                seen_refs[pair].append({
-                    "from": context.sidebar_id,
-                    "to": target_id,
-                    "ref_type": ref_type
-                })
+        for pair in pairs:
+            refs = []
+            for source_id, target_id in index.edges_between(*pair):
+                metadata = self._ref_metadata(source_id, target_id)
+                if metadata is not None:
+                    refs.append({
+                        "from": source_id,
+                        "to": target_id,
+                        "ref_type": metadata.get("ref_type")
+                    })
 
-        # Find pairs with contradicting ref_types
-        for pair, refs in seen_refs.items():
             ref_types = set(r["ref_type"] for r in refs)
             for t1, t2 in CONTRADICTIONS:
                 if t1 in ref_types and t2 in ref_types:
@@ -2258,6 +2453,14 @@ class ConversationOrchestrator:
 
         return result
 
+    # Color scheme for yarn board point types
+    YARN_TYPE_COLORS = {
+        "context": "#4A90D9",    # Blue - sidebars/conversations
+        "crossref": "#7B68EE",   # Purple - relationships
+        "finding": "#50C878",    # Green - discoveries
+        "question": "#FF6B6B",   # Red - questions needing answers
+    }
+
     def render_yarn_board(
         self,
         context_id: str,
@@ -2275,201 +2478,261 @@ class ConversationOrchestrator:
         - crossref:{sorted_a}:{sorted_b} - e.g., crossref:SB-1:SB-2
         - finding:{entry_id} - e.g., finding:ENTRY-001
 
+        Boards are cached and only rebuilt after a change to a context they
+        show. The returned version token can be passed to
+        get_yarn_board_changes() to fetch just what changed since this render.
+
         Args:
             context_id: Context whose board to render
             highlights: Optional list of point IDs to highlight (model suggestions)
             expanded: If True, include detail dict with rich metadata for each point/connection
 
         Returns:
-            Dict with points, connections, cushion, highlights
+            Dict with points, connections, cushion, highlights, version (token)
             When expanded=True, points and connections include 'detail' dict
         """
         context = self._contexts.get(context_id)
         if context is None:
             return {"success": False, "error": f"Context '{context_id}' not found"}
 
-        layout = context.yarn_board_layout or {}
-        point_positions = layout.get("point_positions", {})
+        version = self._yarn_renders.token(self._refresh_yarn_board(context))
+        points, connections, cushion = self._split_yarn_items(
+            self._yarn_renders.items(context_id), expanded
+        )
+
+        # --- Process highlights ---
+        highlight_list = highlights or []
 
-        # Color scheme for point types
-        TYPE_COLORS = {
-            "context": "#4A90D9",    # Blue - sidebars/conversations
-            "crossref": "#7B68EE",   # Purple - relationships
-            "finding": "#50C878",    # Green - discoveries
-            "question": "#FF6B6B",   # Red - questions needing answers
+        return {
+            "success": True,
+            "context_id": context_id,
+            "points": points,
+            "connections": connections,
+            "cushion": cushion,
+            "cushion_count": len(cushion),  # For UI to show "X items pending"
+            "highlights": highlight_list,
+            "type_colors": self.YARN_TYPE_COLORS,
+            "expanded": expanded,  # So frontend knows if details are included
+            "version": version
         }
 
-        points = []
-        connections = []
-        cushion = []  # Items without positions
+    def get_yarn_board_changes(
+        self,
+        context_id: str,
+        since: str,
+        expanded: bool = False
+    ) -> Dict:
+        """
+        Points and connections that changed since a version the client has.
+
+        Lets a client keep a large board current without re-fetching it:
+        render once, then pass the last version it saw. Changed items are
+        returned whole (upsert by point id / from_id+to_id), removed ones by
+        key. A point moving between board and cushion counts as a change.
 
-        # Helper to build context detail
-        def _build_context_detail(ctx) -> Dict:
-            """Build expanded detail for a context point."""
-            scratchpad = ctx.scratchpad_entries if hasattr(ctx, 'scratchpad_entries') else []
-            findings = [e for e in scratchpad if e.get("entry_type") == "finding"]
-            questions = [e for e in scratchpad if e.get("entry_type") == "question"]
-            return {
-                "task_description": ctx.task_description or "",
-                "status": ctx.status.value if hasattr(ctx.status, 'value') else str(ctx.status),
-                "findings_count": len(findings),
-                "questions_count": len(questions),
-                "child_count": len(ctx.child_sidebar_ids),
-                "cross_ref_count": len(ctx.cross_sidebar_refs),
-                "created_at": ctx.created_at.isoformat() if hasattr(ctx, 'created_at') and ctx.created_at else None
+        If the version is too old, from before a reload, or from another
+        process (its epoch doesn't match, e.g. after a restart) the changes
+        can't be worked out, so a full render comes back instead, marked
+        full=True.
+
+        Args:
+            context_id: Context whose board to diff
+            since: Version token from the client's last render or changes call
+            expanded: If True, include detail dicts (as render_yarn_board)
+
+        Returns:
+            Dict with changed points/connections/cushion, removed_points,
+            removed_connections, and the version to pass next time
+        """
+        context = self._contexts.get(context_id)
+        if context is None:
+            return {"success": False, "error": f"Context '{context_id}' not found"}
+
+        cache = self._yarn_renders
+        version = cache.token(self._refresh_yarn_board(context))
+        changes = cache.changes_since(context_id, cache.parse_token(since))
+        if changes is None:
+            result = self.render_yarn_board(context_id, expanded=expanded)
+            result.update({"since": since, "full": True})
+            return result
+
+        changed, removed = changes
+        points, connections, cushion = self._split_yarn_items(changed, expanded)
+
+        return {
+            "success": True,
+            "context_id": context_id,
+            "since": since,
+            "version": version,
+            "full": False,
+            "points": points,
+            "connections": connections,
+            "cushion": cushion,
+            "removed_points": [key for key in removed if isinstance(key, str)],
+            "removed_connections": [
+                {"from_id": key[0], "to_id": key[1]} for key in removed if isinstance(key, tuple)
+            ],
+            "expanded": expanded
+        }
+
+    def invalidate_yarn_renders(self, context_id: Optional[str] = None):
+        """
+        Mark cached yarn boards stale.
+
+        Only needed after editing a context directly rather than through an
+        orchestrator method (those all go through _persist_context()).
+
+        Args:
+            context_id: The context that changed, or None to drop every board
+        """
+        if context_id is None:
+            self._yarn_renders.clear()
+        else:
+            self._yarn_renders.invalidate(context_id)
+
+    def _refresh_yarn_board(self, context: SidebarContext) -> int:
+        """
+        Rebuild a context's cached board if anything on it changed.
+
+        Items always carry their detail dict (render_yarn_board strips it
+        unless expanded), so one cached board serves both render modes.
+        Details come from the cache too: only contexts and refs that
+        changed since the last build get their detail rebuilt.
+
+        Returns:
+            The render cache version
+        """
+        cache = self._yarn_renders
+        board_id = context.sidebar_id
+        if cache.is_fresh(board_id):
+            return cache.version
+
+        point_positions = (context.yarn_board_layout or {}).get("point_positions", {})
+        items: Dict[Any, Dict] = {}  # point_id or (from_id, to_id) -> item, in render order
+        depends_on = {board_id}
+
+        def add_point(point_id: str, label: str, point_type: str, detail: Dict):
+            point_data = {
+                "id": point_id,
+                "label": label,
+                "type": point_type,
+                "color": self.YARN_TYPE_COLORS[point_type],
+                "detail": detail
+            }
+            pos = point_positions.get(point_id)
+            if pos:
+                point_data["x"] = pos.get("x", 0)
+                point_data["y"] = pos.get("y", 0)
+            items[point_id] = point_data
+
+        def add_context_point(ctx: SidebarContext) -> str:
+            point_id = f"context:{ctx.sidebar_id}"
+            if point_id not in items:
+                detail = cache.context_detail(ctx.sidebar_id, lambda: self._build_context_detail(ctx))
+                add_point(point_id, ctx.sidebar_id, "context", detail)
+            return point_id
+
+        def add_connection(from_id: str, to_id: str, ref_type: str, detail: Dict):
+            items[(from_id, to_id)] = {
+                "from_id": from_id,
+                "to_id": to_id,
+                "ref_type": ref_type,
+                "detail": detail
             }
 
         # --- Collect context points ---
         # This context
-        ctx_point_id = f"context:{context.sidebar_id}"
-        pos = point_positions.get(ctx_point_id)
-        point_data = {
-            "id": ctx_point_id,
-            "label": context.sidebar_id,
-            "type": "context",
-            "color": TYPE_COLORS["context"]
-        }
-        if expanded:
-            point_data["detail"] = _build_context_detail(context)
-        if pos:
-            point_data["x"] = pos.get("x", 0)
-            point_data["y"] = pos.get("y", 0)
-            points.append(point_data)
-        else:
-            cushion.append(point_data)
+        ctx_point_id = add_context_point(context)
 
         # Child contexts
         for child_id in context.child_sidebar_ids:
+            depends_on.add(child_id)
             child = self._contexts.get(child_id)
             if child:
-                child_point_id = f"context:{child.sidebar_id}"
-                pos = point_positions.get(child_point_id)
-                child_data = {
-                    "id": child_point_id,
-                    "label": child.sidebar_id,
-                    "type": "context",
-                    "color": TYPE_COLORS["context"]
-                }
-                if expanded:
-                    child_data["detail"] = _build_context_detail(child)
-                if pos:
-                    child_data["x"] = pos.get("x", 0)
-                    child_data["y"] = pos.get("y", 0)
-                    points.append(child_data)
-                else:
-                    cushion.append(child_data)
+                child_point_id = add_context_point(child)
 
                 # Connection: parent -> child
-                conn_data = {
-                    "from_id": ctx_point_id,
-                    "to_id": child_point_id,
-                    "ref_type": "parent_child"
-                }
-                if expanded:
-                    conn_data["detail"] = {
-                        "ref_type": "parent_child",
-                        "relationship": "hierarchical"
-                    }
-                connections.append(conn_data)
-
-        # Helper to build crossref detail
-        def _build_crossref_detail(meta: Dict) -> Dict:
-            """Build expanded detail for a crossref point."""
-            if not isinstance(meta, dict):
-                return {"ref_type": "related_to"}
-            return {
-                "ref_type": meta.get("ref_type", "related_to"),
-                "strength": meta.get("strength", "normal"),
-                "confidence": meta.get("confidence", 0.0),
-                "human_validated": meta.get("human_validated"),
-                "validation_state": "validated" if meta.get("human_validated") is not None else "pending",
-                "reason": meta.get("reason", ""),
-                "suggested_sources_count": len(meta.get("suggested_sources", [])),
-                "cluster_flagged": meta.get("cluster_flagged", False),
-                "discovery_method": meta.get("discovery_method", "unknown"),
-                "created_at": meta.get("created_at")
-            }
+                add_connection(ctx_point_id, child_point_id, "parent_child", {
+                    "ref_type": "parent_child",
+                    "relationship": "hierarchical"
+                })
 
         # --- Collect cross-ref points and connections ---
         for target_id, metadata in context.cross_sidebar_refs.items():
-            # Cross-ref as a point (sorted IDs for consistency)
+            depends_on.add(target_id)
+            ref_type = metadata.get("ref_type", "related_to") if isinstance(metadata, dict) else "related_to"
+            detail = cache.ref_detail(
+                board_id, target_id, lambda: self._build_crossref_detail(metadata)
+            )
+
+            # Cross-ref as a point (sorted IDs for consistency).
+            # Only added once - bidirectional refs share a point.
             sorted_ids = sorted([context.sidebar_id, target_id])
             crossref_point_id = f"crossref:{sorted_ids[0]}:{sorted_ids[1]}"
-
-            # Only add if not already added (bidirectional refs share a point)
-            if not any(p["id"] == crossref_point_id for p in points + cushion):
-                ref_type = metadata.get("ref_type", "related_to") if isinstance(metadata, dict) else "related_to"
-                pos = point_positions.get(crossref_point_id)
-                crossref_data = {
-                    "id": crossref_point_id,
-                    "label": ref_type,
-                    "type": "crossref",
-                    "color": TYPE_COLORS["crossref"]
-                }
-                if expanded:
-                    crossref_data["detail"] = _build_crossref_detail(metadata)
-                if pos:
-                    crossref_data["x"] = pos.get("x", 0)
-                    crossref_data["y"] = pos.get("y", 0)
-                    points.append(crossref_data)
-                else:
-                    cushion.append(crossref_data)
+            if crossref_point_id not in items:
+                add_point(crossref_point_id, ref_type, "crossref", detail)
 
             # Connection: context -> crossref point
-            ref_type_val = metadata.get("ref_type", "related_to") if isinstance(metadata, dict) else "related_to"
-            conn_data = {
-                "from_id": ctx_point_id,
-                "to_id": crossref_point_id,
-                "ref_type": ref_type_val
-            }
-            if expanded:
-                conn_data["detail"] = _build_crossref_detail(metadata)
-            connections.append(conn_data)
+            add_connection(ctx_point_id, crossref_point_id, ref_type, detail)
 
             # Connection: crossref point -> target (if target exists)
             target = self._contexts.get(target_id)
             if target:
-                target_point_id = f"context:{target.sidebar_id}"
-                # Ensure target point exists
-                if not any(p["id"] == target_point_id for p in points + cushion):
-                    pos = point_positions.get(target_point_id)
-                    target_data = {
-                        "id": target_point_id,
-                        "label": target.sidebar_id,
-                        "type": "context",
-                        "color": TYPE_COLORS["context"]
-                    }
-                    if expanded:
-                        target_data["detail"] = _build_context_detail(target)
-                    if pos:
-                        target_data["x"] = pos.get("x", 0)
-                        target_data["y"] = pos.get("y", 0)
-                        points.append(target_data)
-                    else:
-                        cushion.append(target_data)
-
-                target_conn_data = {
-                    "from_id": crossref_point_id,
-                    "to_id": target_point_id,
-                    "ref_type": ref_type_val
-                }
-                if expanded:
-                    target_conn_data["detail"] = _build_crossref_detail(metadata)
-                connections.append(target_conn_data)
+                target_point_id = add_context_point(target)
+                add_connection(crossref_point_id, target_point_id, ref_type, detail)
 
-        # --- Process highlights ---
-        highlight_list = highlights or []
+        return cache.store(board_id, items, depends_on)
 
+    @staticmethod
+    def _split_yarn_items(items: List[Dict], expanded: bool):
+        """Copy cached board items out as (points, connections, cushion)."""
+        points, connections, cushion = [], [], []
+        for item in items:
+            if expanded:
+                out = dict(item)
+            else:
+                out = {k: v for k, v in item.items() if k != "detail"}
+
+            if "from_id" in item:
+                connections.append(out)
+            elif "x" in item:
+                points.append(out)
+            else:
+                cushion.append(out)  # Items without positions
+        return points, connections, cushion
+
+    @staticmethod
+    def _build_context_detail(ctx: SidebarContext) -> Dict:
+        """Build expanded detail for a context point."""
+        scratchpad = ctx.scratchpad_entries if hasattr(ctx, 'scratchpad_entries') else []
+        findings = [e for e in scratchpad if e.get("entry_type") == "finding"]
+        questions = [e for e in scratchpad if e.get("entry_type") == "question"]
         return {
-            "success": True,
-            "context_id": context_id,
-            "points": points,
-            "connections": connections,
-            "cushion": cushion,
-            "cushion_count": len(cushion),  # For UI to show "X items pending"
-            "highlights": highlight_list,
-            "type_colors": TYPE_COLORS,
-            "expanded": expanded  # So frontend knows if details are included
+            "task_description": ctx.task_description or "",
+            "status": ctx.status.value if hasattr(ctx.status, 'value') else str(ctx.status),
+            "findings_count": len(findings),
+            "questions_count": len(questions),
+            "child_count": len(ctx.child_sidebar_ids),
+            "cross_ref_count": len(ctx.cross_sidebar_refs),
+            "created_at": ctx.created_at.isoformat() if hasattr(ctx, 'created_at') and ctx.created_at else None
+        }
+
+    @staticmethod
+    def _build_crossref_detail(meta: Dict) -> Dict:
+        """Build expanded detail for a crossref point."""
+        if not isinstance(meta, dict):
+            return {"ref_type": "related_to"}
+        return {
+            "ref_type": meta.get("ref_type", "related_to"),
+            "strength": meta.get("strength", "normal"),
+            "confidence": meta.get("confidence", 0.0),
+            "human_validated": meta.get("human_validated"),
+            "validation_state": "validated" if meta.get("human_validated") is not None else "pending",
+            "reason": meta.get("reason", ""),
+            "suggested_sources_count": len(meta.get("suggested_sources", [])),
+            "cluster_flagged": meta.get("cluster_flagged", False),
+            "discovery_method": meta.get("discovery_method", "unknown"),
+            "created_at": meta.get("created_at")
         }
 
     # =========================================================================
@@ -2883,6 +3146,9 @@ class ConversationOrchestrator:
             "active_context_id": self._active_context_id,
             "by_status": status_counts,
             "registry_stats": self.registry.stats(),
+            "startup_load": dict(self._load_metrics),
+            "exchange_pipeline": self._exchange_pipeline.stats(),
+            "yarn_renders": self._yarn_renders.stats(),
         }
 
 
@@ -0,0 +1,169 @@
+"""
+Cross-Ref Index
+
+In-memory inverted index and adjacency lists over every context's
+cross_sidebar_refs, so cross-ref queries touch only the refs they are
+about instead of scanning every context.
+
+Each ref (source -> target) is posted under:
+    ("target", target_id)          who points at a context
+    ("type", ref_type)             e.g. every "contradicts" ref
+    ("state", human_validated)     None = not yet reviewed
+    ("flagged", True)              cluster-flagged refs
+
+plus out/in adjacency for walking the ref graph from either end.
+
+The index records the values it was given; it doesn't watch the metadata
+dicts. ConversationOrchestrator re-posts a ref whenever its own cross-ref
+methods change it, and its queries re-check the live metadata of every
+candidate the index returns. So an edit made straight to a metadata dict
+can drop a ref from a result but never add a wrong one; an edit that
+should add one (e.g. human_validated back to None) needs a reindex.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+RefKey = Tuple[str, str]  # (source_id, target_id)
+
+_ANY = object()  # find(): don't filter on validation state
+
+
+class CrossRefIndex:
+    """
+    Postings and adjacency for cross-refs.
+
+    Postings are insertion-ordered dicts used as sets, so results come out
+    in the order the refs were indexed.
+    """
+
+    def __init__(self):
+        self._postings: Dict[Tuple[str, Any], Dict[RefKey, None]] = {}
+        self._out: Dict[str, Dict[str, None]] = {}
+        self._in: Dict[str, Dict[str, None]] = {}
+        self._terms: Dict[RefKey, Tuple[Tuple[str, Any], ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def __contains__(self, key: RefKey) -> bool:
+        return key in self._terms
+
+    def put(self, source_id: str, target_id: str, metadata: Dict):
+        """Index (or re-index) one ref from its current metadata."""
+        key = (source_id, target_id)
+        terms = [
+            ("target", target_id),
+            ("type", metadata.get("ref_type")),
+            ("state", metadata.get("human_validated")),
+        ]
+        if metadata.get("cluster_flagged"):
+            terms.append(("flagged", True))
+        terms = tuple(terms)
+
+        old = self._terms.get(key)
+        if old == terms:
+            return
+        if old is not None:
+            self._unpost(key, old)
+
+        self._terms[key] = terms
+        for term in terms:
+            self._postings.setdefault(term, {})[key] = None
+        self._out.setdefault(source_id, {})[target_id] = None
+        self._in.setdefault(target_id, {})[source_id] = None
+
+    def remove(self, source_id: str, target_id: str):
+        """Drop one ref. No-op if it isn't indexed."""
+        key = (source_id, target_id)
+        terms = self._terms.pop(key, None)
+        if terms is None:
+            return
+        self._unpost(key, terms)
+        self._discard(self._out, source_id, target_id)
+        self._discard(self._in, target_id, source_id)
+
+    def rebuild(self, refs: Iterable[Tuple[str, Dict[str, Dict]]]):
+        """Replace the index with (source_id, cross_sidebar_refs) pairs."""
+        self.__init__()
+        for source_id, cross_refs in refs:
+            for target_id, metadata in cross_refs.items():
+                self.put(source_id, target_id, metadata)
+
+    # =========================================================================
+    # QUERIES
+    # =========================================================================
+
+    def find(
+        self,
+        target_id: Optional[str] = None,
+        ref_type: Optional[str] = None,
+        validated: Any = _ANY,
+        flagged: bool = False
+    ) -> List[RefKey]:
+        """
+        Refs matching every given filter, intersected smallest posting first.
+
+        validated filters on human_validated; pass None for unreviewed refs.
+
+        Usage:
+            index.find(ref_type="depends_on", validated=None)
+        """
+        terms = []
+        if target_id is not None:
+            terms.append(("target", target_id))
+        if ref_type is not None:
+            terms.append(("type", ref_type))
+        if validated is not _ANY:
+            terms.append(("state", validated))
+        if flagged:
+            terms.append(("flagged", True))
+        if not terms:
+            return list(self._terms)
+
+        postings = sorted((self._postings.get(term, {}) for term in terms), key=len)
+        first, rest = postings[0], postings[1:]
+        return [key for key in first if all(key in p for p in rest)]
+
+    def type_count(self, ref_type: str) -> int:
+        """How many refs have this ref_type."""
+        return len(self._postings.get(("type", ref_type), ()))
+
+    def refs_from(self, source_id: str) -> List[str]:
+        """Targets this context references."""
+        return list(self._out.get(source_id, ()))
+
+    def refs_to(self, target_id: str) -> List[str]:
+        """Contexts that reference this one."""
+        return list(self._in.get(target_id, ()))
+
+    def edges_between(self, a: str, b: str) -> Iterator[RefKey]:
+        """The refs a -> b and b -> a that exist, in that order."""
+        if b in self._out.get(a, ()):
+            yield (a, b)
+        if a != b and a in self._out.get(b, ()):
+            yield (b, a)
+
+    def ref_type(self, source_id: str, target_id: str) -> Optional[str]:
+        """ref_type as last indexed, or None if the ref isn't indexed."""
+        terms = self._terms.get((source_id, target_id))
+        return terms[1][1] if terms else None
+
+    # =========================================================================
+    # INTERNALS
+    # =========================================================================
+
+    def _unpost(self, key: RefKey, terms: Tuple[Tuple[str, Any], ...]):
+        for term in terms:
+            posting = self._postings.get(term)
+            if posting is not None:
+                posting.pop(key, None)
+                if not posting:
+                    del self._postings[term]
+
+    @staticmethod
+    def _discard(adjacency: Dict[str, Dict[str, None]], node: str, neighbour: str):
+        neighbours = adjacency.get(node)
+        if neighbours is not None:
+            neighbours.pop(neighbour, None)
+            if not neighbours:
+                del adjacency[node]
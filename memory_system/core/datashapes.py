@@ -115,7 +115,7 @@ class SidebarContext:
     coordinator_agent: Optional[str] = "AGENT-operator"    # Defaults to human
 
     # === Memory (Critical Separation) ===
-    inherited_memory: List[Dict] = field(default_factory=list)  # READ ONLY snapshot
+    inherited_memory: List[Dict] = field(default_factory=list)  # READ ONLY snapshot (an ExchangeSequence view when spawned)
     local_memory: List[Dict] = field(default_factory=list)      # This sidebar's work
     data_refs: Dict[str, Any] = field(default_factory=dict)     # Referenced artifacts
     cross_sidebar_refs: Dict[str, Any] = field(default_factory=dict)  # {target_id: CrossRefMetadata as dict} - Links with metadata
@@ -565,8 +565,8 @@ class EmergencyCache:
 #   Render Layer (human-readable, on-demand):
 #     - OzolithRenderer in ozolith.py - translates for human consumption
 #
-#   Future (stubbed):
-#     - MerkleLayer: O(log N) proofs when scale demands it
+#   Proofs:
+#     - MerkleLayer in ozolith.py - O(log N) inclusion / consistency proofs
 #
 # Why this exists (from the AI's perspective):
 #   - Decision provenance: What context did I have when I said X?
@@ -656,6 +656,11 @@ class OzolithEntry:
     signature: str = ""                      # HMAC signature of entry
     entry_hash: str = ""                     # SHA-256 of entire entry (computed on creation)
 
+    # Canonical JSON of the payload while an append is in flight, so signing,
+    # hashing and writing share one encoding. A plain class attribute rather
+    # than a field: never serialized or compared, and verification ignores it.
+    _canonical_payload = None
+
 
 # =============================================================================
 # OZOLITH TYPED PAYLOADS - Required/Optional/Extra Pattern
@@ -1232,6 +1237,7 @@ class OzolithAnchor:
     root_hash: str                           # Hash of latest entry at anchor time
     entry_count: int                         # Total entries in log
     signature: str = ""                      # HMAC of anchor
+    merkle_root: str = ""                    # Merkle root over the first entry_count entries ("" on old anchors)
 
     # Trigger info
     trigger_reason: str = ""                 # "manual", "count_threshold", "time_threshold", "skinflap_high"
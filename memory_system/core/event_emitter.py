@@ -154,7 +154,7 @@ class EventEmitter:
             if ozolith is not None:
                 self._ozolith = ozolith
             elif Ozolith is not None:
-                self._ozolith = Ozolith()
+                self._ozolith = Ozolith(group_commit=True)
             else:
                 self._ozolith = None
                 self._enable_ozolith = False
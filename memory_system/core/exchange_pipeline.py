@@ -0,0 +1,365 @@
+"""
+Exchange Write Pipeline
+
+Stages the three write effects of adding an exchange - the registry entry,
+the context's SQLite rows and the Ozolith EXCHANGE event - as one unit of
+work, and commits staged units together:
+
+    1. local:   one SQLite transaction (every touched context saved once,
+                new exchange rows appended) plus one registry write
+    2. chained: one Ozolith append_many() - a single grouped flush, events
+                chained in the order they were staged
+
+The caller picks how far its unit must get before submit() returns:
+
+    MEMORY   staged only; a background thread commits it a moment later
+    LOCAL    SQLite + registry durable; the Ozolith event follows in background
+    CHAINED  all three durable and the event is in the hash chain
+
+A commit that fails is retried one unit at a time, so one unit that can't
+be written doesn't hold back the rest; only the units that failed stay
+staged for the background thread to retry. The ExchangeAck always reports
+the level actually reached, which can be lower than the one requested, and
+the error that stopped it.
+"""
+
+import atexit
+import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# How long the background thread lets a burst of staged units gather
+FLUSH_WINDOW = 0.005
+
+# Wait before the background thread retries a failed commit
+RETRY_INTERVAL = 1.0
+
+
+class ExchangeDurability(Enum):
+    """How far an exchange's writes have got, weakest first."""
+    MEMORY = "memory"
+    LOCAL = "local"
+    CHAINED = "chained"
+
+    @property
+    def rank(self) -> int:
+        return _RANKS[self]
+
+
+_RANKS = {ExchangeDurability.MEMORY: 0, ExchangeDurability.LOCAL: 1, ExchangeDurability.CHAINED: 2}
+
+
+@dataclass
+class ExchangeAck:
+    """What submit() got done before returning."""
+    exchange_id: str
+    context_id: str
+    requested: ExchangeDurability
+    durability: ExchangeDurability
+    ozolith_sequence: Optional[int] = None
+    error: Optional[Exception] = None   # Why it stopped short, if it did
+
+    @property
+    def satisfied(self) -> bool:
+        """True if the requested durability was reached."""
+        return self.durability.rank >= self.requested.rank
+
+
+class _StagedExchange:
+    """One add_exchange's pending writes."""
+
+    __slots__ = ('exchange_id', 'context', 'registry_ids', 'event', 'local', 'entry', 'error')
+
+    def __init__(self, exchange_id: str, context: Any, registry_ids: List[str], event: Optional[Tuple]):
+        self.exchange_id = exchange_id
+        self.context = context
+        self.registry_ids = registry_ids
+        self.event = event
+        self.local = False
+        self.entry = None
+        self.error: Optional[Exception] = None
+
+    @property
+    def durability(self) -> ExchangeDurability:
+        if self.local and (self.entry is not None or self.event is None):
+            return ExchangeDurability.CHAINED
+        if self.local:
+            return ExchangeDurability.LOCAL
+        return ExchangeDurability.MEMORY
+
+
+def _remove(units: List[_StagedExchange], done: List[_StagedExchange]):
+    """Drop `done` from a staging list, keeping the rest in order."""
+    done_ids = {id(unit) for unit in done}
+    units[:] = [unit for unit in units if id(unit) not in done_ids]
+
+
+def _flush_on_exit(pipeline_ref):
+    pipeline = pipeline_ref()
+    if pipeline is not None:
+        pipeline.flush()
+
+
+class ExchangeWritePipeline:
+    """
+    Batches exchange writes across the registry, SQLite and Ozolith.
+
+    The stores are fetched through callables on every commit, so a store
+    that is unavailable (None) is skipped, like the orchestrator's own
+    _persist_context(). Thread-safe; commits run one at a time.
+
+    Usage:
+        pipeline = ExchangeWritePipeline(registry, _get_persistence, _get_ozolith)
+        ack = pipeline.submit(exchange_id, context, [exchange_id], event,
+                              ExchangeDurability.LOCAL)
+    """
+
+    def __init__(
+        self,
+        registry,
+        get_db: Callable[[], Any],
+        get_ozolith: Callable[[], Any],
+        window: float = FLUSH_WINDOW,
+        retry_interval: float = RETRY_INTERVAL
+    ):
+        self.registry = registry
+        self._get_db = get_db
+        self._get_ozolith = get_ozolith
+        self.window = window
+        self.retry_interval = retry_interval
+
+        self._cond = threading.Condition()
+        self._commit_lock = threading.Lock()
+        self._staged: List[_StagedExchange] = []       # Waiting on SQLite + registry
+        self._unchained: List[_StagedExchange] = []    # Waiting on Ozolith
+        self._thread: Optional[threading.Thread] = None
+
+        self.submitted = 0
+        self.local_commits = 0
+        self.chained_commits = 0
+        self.failed_commits = 0
+
+        atexit.register(_flush_on_exit, weakref.ref(self))
+
+    def submit(
+        self,
+        exchange_id: str,
+        context: Any,
+        registry_ids: List[str],
+        event: Optional[Tuple],
+        durability: ExchangeDurability = ExchangeDurability.CHAINED
+    ) -> ExchangeAck:
+        """
+        Stage one exchange's writes and commit them as far as `durability`.
+
+        Args:
+            exchange_id: The exchange's display ID
+            context: The SidebarContext the exchange was appended to
+            registry_ids: Registry entries created with register(persist=False)
+            event: Ozolith (event_type, context_id, actor, payload), or None
+            durability: How far to commit before returning
+
+        Returns:
+            ExchangeAck with the level reached
+        """
+        unit = _StagedExchange(exchange_id, context, list(registry_ids), event)
+        with self._cond:
+            self._staged.append(unit)
+            self.submitted += 1
+
+        if durability is not ExchangeDurability.MEMORY:
+            try:
+                self._commit(durability)
+            except Exception as e:
+                logger.error(f"Exchange {exchange_id} not yet {durability.value}, will retry: {e}")
+
+        if unit.durability is not ExchangeDurability.CHAINED:
+            self._wake()
+
+        return ExchangeAck(
+            exchange_id=exchange_id,
+            context_id=getattr(context, 'sidebar_id', ''),
+            requested=durability,
+            durability=unit.durability,
+            ozolith_sequence=unit.entry.sequence if unit.entry is not None else None,
+            error=unit.error
+        )
+
+    def flush(self) -> bool:
+        """
+        Commit everything staged so far, all the way to CHAINED.
+
+        Returns:
+            True if nothing is left pending
+        """
+        try:
+            self._commit(ExchangeDurability.CHAINED)
+        except Exception as e:
+            logger.error(f"Exchange pipeline flush failed: {e}")
+        return self.pending() == 0
+
+    def pending(self) -> int:
+        """Units not yet committed all the way."""
+        with self._cond:
+            return len(self._staged) + len(self._unchained)
+
+    def stats(self) -> dict:
+        """Submission and commit counters."""
+        with self._cond:
+            return {
+                'submitted': self.submitted,
+                'staged': len(self._staged),
+                'unchained': len(self._unchained),
+                'local_commits': self.local_commits,
+                'chained_commits': self.chained_commits,
+                'failed_commits': self.failed_commits,
+            }
+
+    # =========================================================================
+    # COMMIT
+    # =========================================================================
+
+    def _commit(self, durability: ExchangeDurability):
+        """Commit staged units up to `durability`. Raises on failure; failed units stay staged."""
+        with self._commit_lock:
+            errors = []
+            try:
+                self._commit_local()
+            except Exception as e:
+                errors.append(e)
+            if durability is ExchangeDurability.CHAINED:
+                # Units that did reach SQLite are chained even if others didn't
+                try:
+                    self._commit_chained()
+                except Exception as e:
+                    errors.append(e)
+            if errors:
+                with self._cond:
+                    self.failed_commits += 1
+                raise errors[0]
+
+    def _commit_local(self):
+        with self._cond:
+            units = list(self._staged)
+        if not units:
+            return
+
+        db = self._get_db()
+        failed = self._write_isolated(units, lambda batch: self._write_local(db, batch), "local")
+        if len(failed) < len(units):
+            with self._cond:
+                self.local_commits += 1
+        if failed:
+            raise failed[0].error
+
+    def _write_local(self, db, units: List[_StagedExchange]):
+        if db is not None:
+            with db.batch():
+                # A context that got several exchanges is saved once, after the last
+                saved = set()
+                for unit in units:
+                    if id(unit.context) not in saved:
+                        saved.add(id(unit.context))
+                        db.save_context(unit.context)
+                self._save_registry(units)
+        else:
+            self._save_registry(units)
+
+        with self._cond:
+            _remove(self._staged, units)
+            for unit in units:
+                unit.local = True
+                unit.error = None
+            self._unchained.extend(unit for unit in units if unit.event is not None)
+
+    def _save_registry(self, units: List[_StagedExchange]):
+        ids = [display_id for unit in units for display_id in unit.registry_ids]
+        if ids and not self.registry.save_entries(ids):
+            raise OSError("registry write failed")
+
+    def _commit_chained(self):
+        with self._cond:
+            units = list(self._unchained)
+        if not units:
+            return
+
+        oz = self._get_ozolith()
+        if oz is None:
+            # No log to chain into - these stop at LOCAL
+            with self._cond:
+                _remove(self._unchained, units)
+            return
+
+        failed = self._write_isolated(units, lambda batch: self._write_chained(oz, batch), "chained")
+        if len(failed) < len(units):
+            with self._cond:
+                self.chained_commits += 1
+        if failed:
+            raise failed[0].error
+
+    def _write_chained(self, oz, units: List[_StagedExchange]):
+        # All-or-nothing: if it raises, none of these units were chained
+        entries = oz.append_many([unit.event for unit in units])
+        with self._cond:
+            _remove(self._unchained, units)
+            for unit, entry in zip(units, entries):
+                unit.entry = entry
+                unit.error = None
+
+    def _write_isolated(self, units: List[_StagedExchange], write: Callable, stage: str) -> List[_StagedExchange]:
+        """
+        Write units in one go. If that fails, retry each on its own (like
+        SidebarPersistence._write_batch) so one unit that can't be written
+        doesn't hold back the rest.
+
+        Returns:
+            The units that failed, each with its error set
+        """
+        try:
+            write(units)
+            return []
+        except Exception as batch_error:
+            if len(units) == 1:
+                units[0].error = batch_error
+                return units
+            logger.warning(f"Exchange {stage} commit of {len(units)} units failed ({batch_error}); retrying one by one")
+
+        failed = []
+        for unit in units:
+            try:
+                write([unit])
+            except Exception as e:
+                unit.error = e
+                failed.append(unit)
+        return failed
+
+    # =========================================================================
+    # BACKGROUND COMMITS
+    # =========================================================================
+
+    def _wake(self):
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="exchange-write-pipeline", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._staged and not self._unchained:
+                    self._cond.wait()
+            time.sleep(self.window)     # Let the rest of the burst land
+            try:
+                self._commit(ExchangeDurability.CHAINED)
+            except Exception as e:
+                logger.error(f"Background exchange commit failed, retrying in {self.retry_interval}s: {e}")
+                time.sleep(self.retry_interval)
@@ -0,0 +1,160 @@
+"""
+Exchange Sequence
+
+An immutable, persistent sequence of exchange dicts that shares storage
+with the lists it was built from.
+
+A sidebar's local_memory is append-only: exchanges are added at the end
+and never edited, removed or reordered. So a fixed range of one - "the
+parent's first 40 exchanges" - never changes once it exists, and can be
+referenced instead of copied. ExchangeSequence is a list of such ranges
+(segments):
+
+    inherited = ExchangeSequence.of(parent.local_memory, tags={...})
+    view = ExchangeSequence.concat(inherited, child.local_memory)
+
+Building, slicing and concatenating cost O(segments), not O(exchanges).
+Spawning a sidebar therefore shares its parent's storage instead of
+copying it, and an LLM context view is a two-segment sequence. Later
+appends to the source lists don't show up in views made earlier.
+
+Per-segment tags are merged into each exchange as it is read (into a new
+dict), so inherited exchanges can carry "_inherited" markers without the
+parent's own dicts being modified.
+"""
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+# (source, start, stop, tags) - source[start:stop], read through tags
+_Segment = Tuple[Sequence, int, int, Optional[Dict[str, Any]]]
+
+
+class ExchangeSequence(Sequence):
+    """
+    Read-only view over ranges of append-only exchange lists.
+
+    Supports len(), indexing, slicing (step 1 stays a view; other steps
+    copy), iteration, + with lists or other sequences, and == against any
+    list or tuple. list(seq) materializes it, e.g. for JSON.
+    """
+
+    __slots__ = ('_segments', '_offsets', '_len')
+
+    def __init__(self, segments: Tuple[_Segment, ...] = ()):
+        # Drop empty ranges so lookups never land on one
+        self._segments = tuple(s for s in segments if s[2] > s[1])
+        offsets = []
+        total = 0
+        for _, start, stop, _ in self._segments:
+            offsets.append(total)
+            total += stop - start
+        self._offsets = offsets
+        self._len = total
+
+    @classmethod
+    def of(
+        cls,
+        source: Sequence,
+        start: int = 0,
+        stop: Optional[int] = None,
+        tags: Optional[Dict[str, Any]] = None
+    ) -> 'ExchangeSequence':
+        """
+        View source[start:stop] as it is now, without copying.
+
+        Args:
+            source: An append-only list (or another ExchangeSequence)
+            start, stop: Slice bounds, as for source[start:stop]
+            tags: Keys merged into every exchange read through this view
+        """
+        if isinstance(source, ExchangeSequence):
+            view = source[start:stop]
+            return view._with_tags(tags) if tags else view
+        start, stop, _ = slice(start, stop).indices(len(source))
+        return cls(((source, start, stop, dict(tags) if tags else None),))
+
+    @classmethod
+    def concat(cls, *parts: Sequence) -> 'ExchangeSequence':
+        """Join sequences and lists end to end (lists as they are now)."""
+        segments: List[_Segment] = []
+        for part in parts:
+            if isinstance(part, ExchangeSequence):
+                segments.extend(part._segments)
+            else:
+                segments.append((part, 0, len(part), None))
+        return cls(tuple(segments))
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return self._slice(index)
+
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("ExchangeSequence index out of range")
+        i = bisect_right(self._offsets, index) - 1
+        source, start, _, tags = self._segments[i]
+        return self._read(source[start + index - self._offsets[i]], tags)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for source, start, stop, tags in self._segments:
+            if tags is None:
+                for i in range(start, stop):
+                    yield source[i]
+            else:
+                for i in range(start, stop):
+                    yield {**source[i], **tags}
+
+    def __add__(self, other: Sequence) -> 'ExchangeSequence':
+        if not isinstance(other, (ExchangeSequence, list, tuple)):
+            return NotImplemented
+        return ExchangeSequence.concat(self, other)
+
+    def __radd__(self, other: Sequence) -> 'ExchangeSequence':
+        if not isinstance(other, (list, tuple)):
+            return NotImplemented
+        return ExchangeSequence.concat(other, self)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (ExchangeSequence, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # Exchanges are dicts
+
+    def __repr__(self) -> str:
+        return f"ExchangeSequence(len={self._len}, segments={len(self._segments)})"
+
+    def _slice(self, index: slice) -> 'ExchangeSequence':
+        lo, hi, step = index.indices(self._len)
+        if step != 1:
+            return ExchangeSequence.of(tuple(list(self)[lo:hi:step]))
+        if hi <= lo:
+            return ExchangeSequence()
+
+        segments = []
+        for offset, (source, start, stop, tags) in zip(self._offsets, self._segments):
+            seg_lo = max(lo - offset, 0)
+            seg_hi = min(hi - offset, stop - start)
+            if seg_lo < seg_hi:
+                segments.append((source, start + seg_lo, start + seg_hi, tags))
+        return ExchangeSequence(tuple(segments))
+
+    def _with_tags(self, tags: Dict[str, Any]) -> 'ExchangeSequence':
+        return ExchangeSequence(tuple(
+            (source, start, stop, {**(old or {}), **tags})
+            for source, start, stop, old in self._segments
+        ))
+
+    @staticmethod
+    def _read(exchange: Dict, tags: Optional[Dict[str, Any]]) -> Dict:
+        return exchange if tags is None else {**exchange, **tags}
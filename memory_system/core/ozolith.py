@@ -10,6 +10,14 @@ Architecture:
         - Ozolith: Main class for append, verify, anchor operations
         - Hash chain: Each entry links to previous via SHA-256
         - Signed entries: HMAC signature for provenance
+        - Verification checkpoints: verify_chain re-hashes only what's new;
+          ChainVerificationJob schedules full walks in the background
+        - OzolithAggregates: Running totals behind stats() and the analytics
+          helpers, updated per append and snapshotted next to the log
+
+    Storage:
+        - OzolithIndex: Secondary indexes (sequence, context, type, hour bucket)
+        - SegmentedLog: Fixed-size segment files + persisted sidecar indexes
 
     Anchor Policy (Skinflap-aware):
         - AnchorPolicy: Decides when to create checkpoints
@@ -19,8 +27,9 @@ Architecture:
         - OzolithRenderer: Translates for human consumption
         - Never modifies the log - read only
 
-    Future (stubbed):
-        - MerkleLayer: O(log N) proofs when scale demands it
+    Proofs:
+        - MerkleLayer: Incremental Merkle tree over entry hashes (binary
+          sidecar) for O(log N) inclusion and anchor consistency proofs
 
 Why this exists (from the AI's perspective):
     - Decision provenance: What context did I have when I said X?
@@ -29,6 +38,9 @@ Why this exists (from the AI's perspective):
     - Verifiable history: I can walk the chain and confirm nothing's been altered.
 
 Storage: JSON Lines format (.jsonl) - one entry per line, append-only.
+    Single file by default, or rolled segment files with sidecar indexes
+    (Ozolith(segment_size=N)) for logs large enough that startup and
+    lookups shouldn't touch every entry.
 
 Usage:
     from ozolith import Ozolith, AnchorPolicy, OzolithRenderer
@@ -43,14 +55,21 @@ Created: 2025-12-05
 See: datashapes.py for OzolithEntry, OzolithAnchor, OzolithEventType definitions
 """
 
+import bisect
 import hashlib
 import hmac
 import json
 import os
+import shutil
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import asdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from datashapes import (
     OzolithEntry,
@@ -71,6 +90,1440 @@ class OzolithWriteError(Exception):
     pass
 
 
+# =============================================================================
+# CANONICAL ENCODING - One payload encoding per append
+# =============================================================================
+
+def _canonical_json(data: Any) -> str:
+    """Canonical JSON: sorted keys, no whitespace. What gets signed and hashed."""
+    return json.dumps(data, sort_keys=True, separators=(',', ':'))
+
+
+def _canonical_entry_text(entry: OzolithEntry, payload_json: str, with_signature: bool) -> str:
+    """
+    Canonical JSON of an entry's signed fields (plus its signature, for the
+    entry hash), spliced around an already-encoded payload.
+
+    Byte-identical to _canonical_json() of the equivalent dict - keys are
+    emitted in sorted order - but the payload, usually the bulk of it, is
+    only encoded once however many times this is called.
+    """
+    dumps = json.dumps
+    parts = [
+        '{"actor":', dumps(entry.actor),
+        ',"context_id":', dumps(entry.context_id),
+        ',"event_type":', dumps(entry.event_type.value),
+        ',"payload":', payload_json,
+        ',"previous_hash":', dumps(entry.previous_hash),
+        ',"sequence":', dumps(entry.sequence),
+    ]
+    if with_signature:
+        parts += [',"signature":', dumps(entry.signature)]
+    parts += [',"timestamp":', dumps(entry.timestamp), '}']
+    return ''.join(parts)
+
+
+def _verify_range(signing_key: bytes, rows: List[tuple]) -> Tuple[Optional[int], str, str]:
+    """
+    Worker for parallel verification: check a contiguous run of entries.
+
+    rows are OzolithEntry field tuples. Links are checked inside the run
+    only; the caller stitches runs together using the returned boundary
+    hashes.
+
+    Returns:
+        (first broken sequence or None, first entry's previous_hash, last entry's hash)
+    """
+    previous = None
+    for row in rows:
+        entry = OzolithEntry(row[0], row[1], row[2], OzolithEventType(row[3]), *row[4:])
+        if previous is not None and entry.previous_hash != previous:
+            return entry.sequence, rows[0][2], rows[-1][8]
+
+        payload_json = _canonical_json(entry.payload)
+        text = _canonical_entry_text(entry, payload_json, True)
+        if entry.entry_hash != hashlib.sha256(text.encode()).hexdigest():
+            return entry.sequence, rows[0][2], rows[-1][8]
+
+        text = _canonical_entry_text(entry, payload_json, False)
+        if entry.signature != hmac.new(signing_key, text.encode(), hashlib.sha256).hexdigest():
+            return entry.sequence, rows[0][2], rows[-1][8]
+
+        previous = entry.entry_hash
+
+    return None, rows[0][2], rows[-1][8]
+
+
+# =============================================================================
+# STORAGE - Secondary indexes and segmented log files
+# =============================================================================
+
+def _entry_from_dict(data: Dict) -> OzolithEntry:
+    """Rebuild an OzolithEntry from its JSON dict (event_type stored as string)."""
+    data['event_type'] = OzolithEventType(data['event_type'])
+    return OzolithEntry(**data)
+
+
+def _anchor_to_dict(anchor: OzolithAnchor) -> Dict:
+    data = asdict(anchor)
+    data['sequence_range'] = list(data['sequence_range'])  # Tuple -> list for JSON
+    return data
+
+
+def _anchor_from_dict(data: Dict) -> OzolithAnchor:
+    data['sequence_range'] = tuple(data['sequence_range'])
+    return OzolithAnchor(**data)
+
+
+def _anchor_number(anchor: OzolithAnchor) -> int:
+    """The N in ANCHOR-N."""
+    return int(anchor.anchor_id.split('-')[1])
+
+
+def _file_digest(path: str, start: int, end: int, digest=None):
+    """Feed bytes [start, end) of a file into a sha256 (new one if not given)."""
+    digest = digest or hashlib.sha256()
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = f.read(min(remaining, 1 << 20))
+            if not chunk:
+                raise OSError(f"{path} is shorter than {end} bytes")
+            digest.update(chunk)
+            remaining -= len(chunk)
+    return digest
+
+
+def _timestamp_bucket(timestamp: str) -> str:
+    """Hour bucket for the timestamp index ("YYYY-MM-DDTHH")."""
+    return timestamp[:13]
+
+
+class OzolithIndex:
+    """
+    Secondary indexes over log positions.
+
+    A position is the 0-based offset of an entry in the log (the same offset
+    you'd use on Ozolith._entries), so one index shape serves both the
+    single-file log and each segment of a SegmentedLog.
+
+    Keys:
+        - sequence:   sorted list, bisected for O(log n) point/range lookups
+        - context_id: positions per context
+        - event_type: positions per type (keyed by enum value)
+        - bucket:     positions per hour bucket, bucket keys kept sorted
+
+    Sequences are normally strictly increasing. If they aren't (two writers
+    raced on the same file, or a line was spliced in), `ordered` flips to
+    False and sequence lookups fall back to a scan - same answers as before
+    indexing, just not faster.
+    """
+
+    def __init__(self, base_position: int = 0):
+        self.base_position = base_position
+        self.sequences: List[int] = []
+        self.by_context: Dict[str, List[int]] = {}
+        self.by_type: Dict[str, List[int]] = {}
+        self.by_bucket: Dict[str, List[int]] = {}
+        self.bucket_keys: List[str] = []
+        self.ordered = True
+
+    def __len__(self) -> int:
+        return len(self.sequences)
+
+    def add(self, entry: OzolithEntry):
+        """Index the entry at the next position."""
+        position = self.base_position + len(self.sequences)
+
+        if self.sequences and entry.sequence <= self.sequences[-1]:
+            self.ordered = False
+        self.sequences.append(entry.sequence)
+
+        self.by_context.setdefault(entry.context_id, []).append(position)
+        self.by_type.setdefault(entry.event_type.value, []).append(position)
+
+        bucket = _timestamp_bucket(entry.timestamp)
+        if bucket not in self.by_bucket:
+            bisect.insort(self.bucket_keys, bucket)
+            self.by_bucket[bucket] = []
+        self.by_bucket[bucket].append(position)
+
+    def position_of(self, sequence: int) -> Optional[int]:
+        """Position of the first entry with this sequence, or None."""
+        if self.ordered:
+            i = bisect.bisect_left(self.sequences, sequence)
+            if i < len(self.sequences) and self.sequences[i] == sequence:
+                return self.base_position + i
+            return None
+
+        try:
+            return self.base_position + self.sequences.index(sequence)
+        except ValueError:
+            return None
+
+    def seq_span(
+        self,
+        start_seq: Optional[int] = None,
+        end_seq: Optional[int] = None
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Half-open position span [lo, hi) covering start_seq..end_seq inclusive.
+
+        Returns None if sequences aren't ordered (caller should scan).
+        """
+        if not self.ordered:
+            return None
+
+        lo = 0 if start_seq is None else bisect.bisect_left(self.sequences, start_seq)
+        hi = len(self.sequences) if end_seq is None else bisect.bisect_right(self.sequences, end_seq)
+        return self.base_position + lo, self.base_position + max(lo, hi)
+
+    def positions_for_context(self, context_id: str) -> List[int]:
+        """Positions of entries for a context, in log order."""
+        return list(self.by_context.get(context_id, ()))
+
+    def positions_for_type(self, type_value: str) -> List[int]:
+        """Positions of entries of a type (enum value), in log order."""
+        return list(self.by_type.get(type_value, ()))
+
+    def positions_in_buckets(
+        self,
+        start_bucket: Optional[str] = None,
+        end_bucket: Optional[str] = None
+    ) -> List[int]:
+        """
+        Positions whose hour bucket falls in [start_bucket, end_bucket].
+
+        Candidates only - edge buckets still need an exact timestamp check.
+        """
+        lo = 0 if start_bucket is None else bisect.bisect_left(self.bucket_keys, start_bucket)
+        hi = len(self.bucket_keys) if end_bucket is None else bisect.bisect_right(self.bucket_keys, end_bucket)
+
+        positions = []
+        for key in self.bucket_keys[lo:hi]:
+            positions.extend(self.by_bucket[key])
+        positions.sort()
+        return positions
+
+    # Cardinality estimates for the query planner (exact here)
+
+    def estimate_context(self, context_id: str) -> int:
+        return len(self.by_context.get(context_id, ()))
+
+    def estimate_type(self, type_value: str) -> int:
+        return len(self.by_type.get(type_value, ()))
+
+    def estimate_buckets(
+        self,
+        start_bucket: Optional[str] = None,
+        end_bucket: Optional[str] = None
+    ) -> int:
+        lo = 0 if start_bucket is None else bisect.bisect_left(self.bucket_keys, start_bucket)
+        hi = len(self.bucket_keys) if end_bucket is None else bisect.bisect_right(self.bucket_keys, end_bucket)
+        return sum(len(self.by_bucket[key]) for key in self.bucket_keys[lo:hi])
+
+    def to_dict(self) -> Dict:
+        """Serialize for the sidecar index file."""
+        return {
+            'base_position': self.base_position,
+            'sequences': self.sequences,
+            'by_context': self.by_context,
+            'by_type': self.by_type,
+            'by_bucket': self.by_bucket,
+            'ordered': self.ordered,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'OzolithIndex':
+        """Rebuild from a sidecar index file."""
+        index = cls(base_position=data['base_position'])
+        index.sequences = data['sequences']
+        index.by_context = data['by_context']
+        index.by_type = data['by_type']
+        index.by_bucket = data['by_bucket']
+        index.bucket_keys = sorted(index.by_bucket)
+        index.ordered = data.get('ordered', True)
+        return index
+
+
+class SegmentedLog:
+    """
+    Log stored as fixed-size segment files with persisted sidecar indexes.
+
+    Layout (for storage_path=/x/ozolith.jsonl):
+        /x/ozolith.segments/000001.jsonl     - sealed segment (segment_size entries)
+        /x/ozolith.segments/000001.idx.json  - sidecar index + byte offsets for it
+        /x/ozolith.segments/000002.jsonl     - active segment, still appending
+        /x/ozolith.segments/manifest.json    - one summary row per sealed segment
+
+    Startup reads the manifest and parses only the active segment, so it
+    costs O(segments) instead of O(entries). Sealed segments are immutable:
+    their sidecar indexes are read on demand, point lookups seek straight to
+    the entry's byte offset, and whole segments are parsed only when
+    iterated (kept in a small LRU).
+
+    Behaves like a read-only list of OzolithEntry (len, indexing, slicing,
+    iteration) so Ozolith can use it as `_entries`, and exposes the same
+    lookup methods as OzolithIndex so it can also serve as `_index`.
+    """
+
+    MANIFEST_NAME = "manifest.json"
+
+    def __init__(self, directory: str, segment_size: int, cache_segments: int = 4):
+        if segment_size < 1:
+            raise ValueError("segment_size must be at least 1")
+
+        self.directory = directory
+        self.segment_size = segment_size
+        self.cache_segments = cache_segments
+        self.load_warnings: List[str] = []
+
+        # Sealed segment summaries (manifest rows), in log order
+        self._segments: List[Dict] = []
+        self._starts: List[int] = []
+
+        # Sequence bounds of non-empty sealed segments, for bisecting by seq
+        self._seq_segs: List[int] = []
+        self._first_seqs: List[int] = []
+        self._last_seqs: List[int] = []
+        self._sealed_ordered = True
+
+        # Lazily loaded per-segment data
+        self._sidecars: Dict[str, Dict] = {}
+        self._cache: 'OrderedDict[str, List[OzolithEntry]]' = OrderedDict()
+
+        # Active segment - fully in memory
+        self._active_number = 1
+        self._active: List[OzolithEntry] = []
+        self._active_index = OzolithIndex()
+        self._active_offsets: List[int] = []
+        self._active_bytes = 0
+
+        # Write side - runs ahead of the active segment while a batch is
+        # durable on disk but not yet appended in memory, so it can already
+        # be in the next segment file.
+        self._handle = None
+        self._write_number = 1
+        self._write_bytes = 0
+        self._write_count = 0
+        self._needs_newline = False
+        self._unappended: 'deque[Tuple[int, int, int]]' = deque()  # (segment number, offset, end)
+
+        os.makedirs(directory, exist_ok=True)
+        self._open()
+
+    # -------------------------------------------------------------------------
+    # File layout
+    # -------------------------------------------------------------------------
+
+    def _segment_path(self, number: int) -> str:
+        return os.path.join(self.directory, f"{number:06d}.jsonl")
+
+    def _sidecar_path(self, number: int) -> str:
+        return os.path.join(self.directory, f"{number:06d}.idx.json")
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.directory, self.MANIFEST_NAME)
+
+    @property
+    def active_path(self) -> str:
+        return self._segment_path(self._active_number)
+
+    def _segment_numbers(self) -> List[int]:
+        numbers = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".jsonl") and name[:-6].isdigit():
+                numbers.append(int(name[:-6]))
+        return sorted(numbers)
+
+    # -------------------------------------------------------------------------
+    # Startup
+    # -------------------------------------------------------------------------
+
+    def _open(self):
+        """Read the manifest, then parse only the active segment."""
+        manifest = {}
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path, 'r') as f:
+                    manifest = {row['number']: row for row in json.load(f)}
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                self.load_warnings.append(f"Segment manifest unreadable, rebuilding ({e})")
+
+        numbers = self._segment_numbers()
+        if not numbers:
+            return
+
+        manifest_dirty = False
+        for number in numbers[:-1]:
+            row = manifest.get(number)
+            if row is None:
+                # Sealed segment the manifest doesn't know about (crash between
+                # roll and manifest write, or lost manifest). Rebuild its row.
+                row = self._summarize_sealed(number)
+                manifest_dirty = True
+            self._add_sealed_row(row)
+
+        self._active_number = numbers[-1]
+        self._load_active()
+
+        if manifest_dirty:
+            self._write_manifest()
+
+        # Crash after the active segment filled but before it was sealed
+        if len(self._active) >= self.segment_size:
+            self._seal()
+
+    def _read_segment_file(
+        self,
+        path: str,
+        warn: bool = True
+    ) -> Tuple[List[OzolithEntry], List[int], int]:
+        """Parse a segment file. Returns (entries, byte offsets, file size)."""
+        entries = []
+        offsets = []
+        offset = 0
+        line_number = 0
+        name = os.path.basename(path)
+
+        with open(path, 'rb') as f:
+            for raw in f:
+                line_number += 1
+                line_offset = offset
+                offset += len(raw)
+
+                line = raw.strip()
+                if not line:
+                    continue
+
+                try:
+                    entry = _entry_from_dict(json.loads(line))
+                except json.JSONDecodeError as e:
+                    if warn:
+                        self.load_warnings.append(f"{name} line {line_number}: Corrupted JSON, skipped ({e})")
+                    continue
+                except (KeyError, ValueError, TypeError) as e:
+                    if warn:
+                        self.load_warnings.append(f"{name} line {line_number}: Invalid entry data, skipped ({e})")
+                    continue
+
+                entries.append(entry)
+                offsets.append(line_offset)
+
+        return entries, offsets, offset
+
+    def _load_active(self):
+        base = self._starts[-1] + self._segments[-1]['count'] if self._segments else 0
+        entries, offsets, size = self._read_segment_file(self.active_path)
+
+        self._active = entries
+        self._active_offsets = offsets
+        self._active_bytes = size
+
+        self._write_number = self._active_number
+        self._write_bytes = size
+        self._write_count = len(entries)
+        if size:
+            with open(self.active_path, 'rb') as f:
+                f.seek(size - 1)
+                self._needs_newline = f.read(1) != b'\n'
+
+        self._active_index = OzolithIndex(base_position=base)
+        for entry in entries:
+            self._active_index.add(entry)
+
+    def _summarize_sealed(self, number: int) -> Dict:
+        """Parse a sealed segment and (re)write its sidecar. Returns its manifest row."""
+        base = self._starts[-1] + self._segments[-1]['count'] if self._segments else 0
+        entries, offsets, size = self._read_segment_file(self._segment_path(number))
+
+        index = OzolithIndex(base_position=base)
+        for entry in entries:
+            index.add(entry)
+
+        self._write_sidecar(number, index, offsets)
+        return self._manifest_row(number, entries, index, size)
+
+    def _add_sealed_row(self, row: Dict):
+        if row['count']:
+            if not row['ordered'] or (self._last_seqs and row['first_seq'] <= self._last_seqs[-1]):
+                self._sealed_ordered = False
+            self._seq_segs.append(len(self._segments))
+            self._first_seqs.append(row['first_seq'])
+            self._last_seqs.append(row['last_seq'])
+
+        self._segments.append(row)
+        self._starts.append(row['first_position'])
+
+    # -------------------------------------------------------------------------
+    # Writing
+    # -------------------------------------------------------------------------
+
+    def write(self, line: str, sync: bool = True):
+        """Durably write one serialized entry. See write_lines()."""
+        self.write_lines([line], sync=sync)
+
+    def write_lines(self, lines: List[str], sync: bool = True):
+        """
+        Write serialized entries through the long-lived handle, one fsync per
+        segment file touched (normally one).
+
+        Lines past the end of the current segment go to the next file, so a
+        batch can straddle a roll. Nothing in memory changes until append();
+        on OSError the files are truncated back and the error re-raised.
+        """
+        snapshot = (self._write_number, self._write_bytes, self._write_count,
+                    self._needs_newline, len(self._unappended))
+        chunk = []
+        try:
+            for line in lines:
+                if self._write_count >= self.segment_size:
+                    self._write_chunk(chunk, sync)
+                    chunk = []
+                    self._next_write_file()
+
+                data = (line + '\n').encode()
+                offset = self._write_bytes
+                if self._needs_newline:
+                    # Previous writer died mid-line; don't glue our entry onto the fragment
+                    data = b'\n' + data
+                    offset += 1
+                    self._needs_newline = False
+
+                chunk.append(data)
+                self._write_bytes += len(data)
+                self._unappended.append((self._write_number, offset, self._write_bytes))
+                self._write_count += 1
+
+            self._write_chunk(chunk, sync)
+        except OSError:
+            self._rollback_write(snapshot)
+            raise
+
+    def _write_chunk(self, chunk: List[bytes], sync: bool):
+        if not chunk:
+            return
+        if self._handle is None:
+            self._handle = open(self._segment_path(self._write_number), 'ab')
+        self._handle.write(b''.join(chunk))
+        self._handle.flush()
+        if sync:
+            os.fsync(self._handle.fileno())
+
+    def _next_write_file(self):
+        self.sync()
+        self.close()
+        self._write_number += 1
+        self._write_bytes = 0
+        self._write_count = 0
+        self._needs_newline = False
+
+    def _rollback_write(self, snapshot: Tuple):
+        """Undo a failed write_lines() so disk matches memory again (best effort)."""
+        number, size, count, needs_newline, pending = snapshot
+        try:
+            self.close()
+        except OSError:
+            pass
+
+        try:
+            for later in range(number + 1, self._write_number + 1):
+                path = self._segment_path(later)
+                if os.path.exists(path):
+                    os.remove(path)
+            path = self._segment_path(number)
+            if os.path.exists(path):
+                os.truncate(path, size)
+        except OSError:
+            pass
+
+        self._write_number = number
+        self._write_bytes = size
+        self._write_count = count
+        self._needs_newline = needs_newline
+        while len(self._unappended) > pending:
+            self._unappended.pop()
+
+    def sync(self):
+        """fsync whatever has been written but not yet synced."""
+        if self._handle is not None:
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+
+    def close(self):
+        """Close the write handle. Reopened on the next write."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def append(self, entry: OzolithEntry):
+        """Record an entry already written by write_lines(); rolls the segment when full."""
+        number, offset, end = self._unappended.popleft()
+        self._active_offsets.append(offset)
+        self._active_bytes = end
+        self._active.append(entry)
+        self._active_index.add(entry)
+
+        if len(self._active) >= self.segment_size:
+            self._seal()
+
+    def _seal(self):
+        """Freeze the active segment: sidecar, manifest row, start a new one."""
+        number = self._active_number
+        if self._write_number == number:
+            self._next_write_file()
+
+        self._write_sidecar(number, self._active_index, self._active_offsets)
+
+        size = os.path.getsize(self._segment_path(number))
+        row = self._manifest_row(number, self._active, self._active_index, size)
+        self._add_sealed_row(row)
+        self._write_manifest()
+
+        # Keep the just-sealed entries hot - the next append needs the tip
+        self._remember(row['name'], self._active)
+        self._sidecars[row['name']] = {
+            'index': self._active_index,
+            'offsets': self._active_offsets,
+        }
+
+        self._active_number = number + 1
+        self._active = []
+        self._active_offsets = []
+        self._active_bytes = 0
+        self._active_index = OzolithIndex(base_position=row['first_position'] + row['count'])
+
+    def extent(self) -> List[Tuple[str, int]]:
+        """(path, bytes) of the segment files holding appended entries, in order."""
+        files = [(self._segment_path(row['number']), row['bytes']) for row in self._segments]
+        if self._active_bytes:
+            files.append((self.active_path, self._active_bytes))
+        return files
+
+    def _manifest_row(
+        self,
+        number: int,
+        entries: List[OzolithEntry],
+        index: OzolithIndex,
+        size: int
+    ) -> Dict:
+        return {
+            'number': number,
+            'name': os.path.basename(self._segment_path(number)),
+            'first_position': index.base_position,
+            'count': len(entries),
+            'bytes': size,
+            'first_seq': entries[0].sequence if entries else None,
+            'last_seq': entries[-1].sequence if entries else None,
+            'last_hash': entries[-1].entry_hash if entries else "",
+            'ordered': index.ordered,
+            'min_bucket': index.bucket_keys[0] if index.bucket_keys else None,
+            'max_bucket': index.bucket_keys[-1] if index.bucket_keys else None,
+            'contexts': sorted(index.by_context),
+            'types': sorted(index.by_type),
+        }
+
+    def _write_sidecar(self, number: int, index: OzolithIndex, offsets: List[int]):
+        data = index.to_dict()
+        data['offsets'] = offsets
+        path = self._sidecar_path(number)
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(temp_path, path)
+
+    def _write_manifest(self):
+        temp_path = self.manifest_path + ".tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(self._segments, f, indent=2)
+        os.replace(temp_path, self.manifest_path)
+
+    # -------------------------------------------------------------------------
+    # Lazy segment access
+    # -------------------------------------------------------------------------
+
+    def _remember(self, name: str, entries: List[OzolithEntry]):
+        self._cache[name] = entries
+        self._cache.move_to_end(name)
+        while len(self._cache) > self.cache_segments:
+            self._cache.popitem(last=False)
+
+    def _segment_entries(self, seg: int) -> List[OzolithEntry]:
+        """All entries of sealed segment #seg (list position), via the LRU."""
+        row = self._segments[seg]
+        cached = self._cache.get(row['name'])
+        if cached is not None:
+            self._cache.move_to_end(row['name'])
+            return cached
+
+        entries, _, _ = self._read_segment_file(self._segment_path(row['number']), warn=False)
+        self._remember(row['name'], entries)
+        return entries
+
+    def _sidecar(self, seg: int) -> Dict:
+        """Sidecar index for sealed segment #seg, loaded on first use."""
+        row = self._segments[seg]
+        sidecar = self._sidecars.get(row['name'])
+        if sidecar is None:
+            try:
+                with open(self._sidecar_path(row['number']), 'r') as f:
+                    data = json.load(f)
+                sidecar = {
+                    'index': OzolithIndex.from_dict(data),
+                    'offsets': data['offsets'],
+                }
+            except (OSError, json.JSONDecodeError, KeyError) as e:
+                self.load_warnings.append(f"Sidecar for {row['name']} unreadable, rebuilt ({e})")
+                entries, offsets, _ = self._read_segment_file(self._segment_path(row['number']), warn=False)
+                index = OzolithIndex(base_position=row['first_position'])
+                for entry in entries:
+                    index.add(entry)
+                self._write_sidecar(row['number'], index, offsets)
+                sidecar = {'index': index, 'offsets': offsets}
+            self._sidecars[row['name']] = sidecar
+        return sidecar
+
+    def _read_one(self, seg: int, local: int) -> OzolithEntry:
+        """Read a single entry from a sealed segment by byte offset."""
+        offset = self._sidecar(seg)['offsets'][local]
+        with open(self._segment_path(self._segments[seg]['number']), 'rb') as f:
+            f.seek(offset)
+            return _entry_from_dict(json.loads(f.readline()))
+
+    def loaded_segments(self) -> List[str]:
+        """Names of sealed segments currently parsed into memory."""
+        return list(self._cache)
+
+    def segment_count(self) -> int:
+        """Sealed segments plus the active one."""
+        return len(self._segments) + 1
+
+    # -------------------------------------------------------------------------
+    # List behaviour
+    # -------------------------------------------------------------------------
+
+    @property
+    def _active_base(self) -> int:
+        return self._active_index.base_position
+
+    def __len__(self) -> int:
+        return self._active_base + len(self._active)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __iter__(self):
+        for seg in range(len(self._segments)):
+            yield from self._segment_entries(seg)
+        yield from list(self._active)
+
+    def __reversed__(self):
+        yield from reversed(self._active)
+        for seg in range(len(self._segments) - 1, -1, -1):
+            yield from reversed(self._segment_entries(seg))
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return self._slice(start, stop)
+
+        position = key + len(self) if key < 0 else key
+        if position < 0 or position >= len(self):
+            raise IndexError("SegmentedLog index out of range")
+
+        if position >= self._active_base:
+            return self._active[position - self._active_base]
+
+        seg = bisect.bisect_right(self._starts, position) - 1
+        local = position - self._starts[seg]
+        cached = self._cache.get(self._segments[seg]['name'])
+        if cached is not None:
+            return cached[local]
+        return self._read_one(seg, local)
+
+    def _slice(self, start: int, stop: int) -> List[OzolithEntry]:
+        result = []
+        if start >= stop:
+            return result
+
+        if start < self._active_base:
+            seg = bisect.bisect_right(self._starts, start) - 1
+            while seg < len(self._segments) and self._starts[seg] < stop:
+                entries = self._segment_entries(seg)
+                lo = max(start - self._starts[seg], 0)
+                hi = min(stop - self._starts[seg], len(entries))
+                result.extend(entries[lo:hi])
+                seg += 1
+
+        if stop > self._active_base:
+            lo = max(start - self._active_base, 0)
+            result.extend(self._active[lo:stop - self._active_base])
+
+        return result
+
+    # -------------------------------------------------------------------------
+    # Index behaviour (fans out over segments, pruned by manifest)
+    # -------------------------------------------------------------------------
+
+    @property
+    def ordered(self) -> bool:
+        if not (self._sealed_ordered and self._active_index.ordered):
+            return False
+        if self._active and self._last_seqs:
+            return self._active_index.sequences[0] > self._last_seqs[-1]
+        return True
+
+    def position_of(self, sequence: int) -> Optional[int]:
+        """O(log segments) to find the segment, O(log segment_size) inside it."""
+        if self.ordered:
+            i = bisect.bisect_right(self._first_seqs, sequence) - 1
+            if i >= 0 and sequence <= self._last_seqs[i]:
+                return self._sidecar(self._seq_segs[i])['index'].position_of(sequence)
+            return self._active_index.position_of(sequence)
+
+        for seg in range(len(self._segments)):
+            position = self._sidecar(seg)['index'].position_of(sequence)
+            if position is not None:
+                return position
+        return self._active_index.position_of(sequence)
+
+    def seq_span(
+        self,
+        start_seq: Optional[int] = None,
+        end_seq: Optional[int] = None
+    ) -> Optional[Tuple[int, int]]:
+        """Same contract as OzolithIndex.seq_span, across all segments."""
+        if not self.ordered:
+            return None
+
+        lo = 0
+        if start_seq is not None:
+            # First segment that could hold a sequence >= start_seq
+            i = bisect.bisect_left(self._last_seqs, start_seq)
+            index = self._sidecar(self._seq_segs[i])['index'] if i < len(self._seq_segs) else self._active_index
+            lo = index.seq_span(start_seq, None)[0]
+
+        hi = len(self)
+        if end_seq is not None:
+            # First segment holding a sequence > end_seq
+            i = bisect.bisect_right(self._last_seqs, end_seq)
+            index = self._sidecar(self._seq_segs[i])['index'] if i < len(self._seq_segs) else self._active_index
+            hi = index.seq_span(None, end_seq)[1]
+
+        return lo, max(lo, hi)
+
+    def positions_for_context(self, context_id: str) -> List[int]:
+        positions = []
+        for seg, row in enumerate(self._segments):
+            if context_id in row['contexts']:
+                positions.extend(self._sidecar(seg)['index'].positions_for_context(context_id))
+        positions.extend(self._active_index.positions_for_context(context_id))
+        return positions
+
+    def positions_for_type(self, type_value: str) -> List[int]:
+        positions = []
+        for seg, row in enumerate(self._segments):
+            if type_value in row['types']:
+                positions.extend(self._sidecar(seg)['index'].positions_for_type(type_value))
+        positions.extend(self._active_index.positions_for_type(type_value))
+        return positions
+
+    def positions_in_buckets(
+        self,
+        start_bucket: Optional[str] = None,
+        end_bucket: Optional[str] = None
+    ) -> List[int]:
+        positions = []
+        for seg, row in enumerate(self._segments):
+            if row['min_bucket'] is None:
+                continue
+            if start_bucket is not None and row['max_bucket'] < start_bucket:
+                continue
+            if end_bucket is not None and row['min_bucket'] > end_bucket:
+                continue
+            positions.extend(self._sidecar(seg)['index'].positions_in_buckets(start_bucket, end_bucket))
+        positions.extend(self._active_index.positions_in_buckets(start_bucket, end_bucket))
+        return positions
+
+    # Cardinality estimates: sealed segments answer from the manifest alone
+    # (whole-segment counts, so an upper bound), the active segment exactly.
+    # Planning a query never parses a sealed segment's sidecar.
+
+    def estimate_context(self, context_id: str) -> int:
+        sealed = sum(row['count'] for row in self._segments if context_id in row['contexts'])
+        return sealed + self._active_index.estimate_context(context_id)
+
+    def estimate_type(self, type_value: str) -> int:
+        sealed = sum(row['count'] for row in self._segments if type_value in row['types'])
+        return sealed + self._active_index.estimate_type(type_value)
+
+    def estimate_buckets(
+        self,
+        start_bucket: Optional[str] = None,
+        end_bucket: Optional[str] = None
+    ) -> int:
+        sealed = 0
+        for row in self._segments:
+            if row['min_bucket'] is None:
+                continue
+            if start_bucket is not None and row['max_bucket'] < start_bucket:
+                continue
+            if end_bucket is not None and row['min_bucket'] > end_bucket:
+                continue
+            sealed += row['count']
+        return sealed + self._active_index.estimate_buckets(start_bucket, end_bucket)
+
+    def import_lines(self, lines):
+        """
+        Bulk-load serialized entries (one-time migration from a single-file log).
+
+        Invalid lines are skipped with a warning, same as a normal load.
+        """
+        for line_number, line in enumerate(lines, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = _entry_from_dict(json.loads(line))
+            except json.JSONDecodeError as e:
+                self.load_warnings.append(f"Line {line_number}: Corrupted JSON, skipped ({e})")
+                continue
+            except (KeyError, ValueError, TypeError) as e:
+                self.load_warnings.append(f"Line {line_number}: Invalid entry data, skipped ({e})")
+                continue
+            self.write(line, sync=False)
+            self.append(entry)
+
+        self.sync()
+
+
+class _CommitTicket:
+    """Submitted items waiting on group commit - always flushed together."""
+
+    __slots__ = ('items', 'done', 'error')
+
+    def __init__(self, items: List[Any]):
+        self.items = items
+        self.done = False
+        self.error: Optional[BaseException] = None
+
+
+class GroupCommitWriter:
+    """
+    Coalesces concurrent appends into one write + fsync (group commit).
+
+    Callers submit() an item (or submit_many() items that must land in the
+    same flush) and then wait() on the ticket. Whoever finds no
+    flush in progress becomes the leader: it lingers up to window_ms while
+    other announced appenders are still building their entries (never past
+    max_batch), then hands the whole batch to flush_fn in one call. Items
+    that arrive during a flush form the next batch, so batches grow on their
+    own under load while a lone writer never waits on the window.
+
+    Hooks:
+        flush_fn(items):   make every item durable or raise OSError
+        on_durable(items): runs in submission order after a successful flush,
+                           before any waiter is released
+        on_failed():       runs (under producer_lock) after a failed flush,
+                           once the failed batch and everything queued
+                           behind it have been drained
+
+    producer_lock is the lock callers hold while building + submitting; the
+    failure path takes it so nothing new gets chained onto failed items.
+    """
+
+    def __init__(
+        self,
+        flush_fn: Callable[[List[Any]], None],
+        on_durable: Optional[Callable[[List[Any]], None]] = None,
+        on_failed: Optional[Callable[[], None]] = None,
+        producer_lock: Optional[Any] = None,
+        window_ms: float = 2.0,
+        max_batch: int = 64
+    ):
+        self._flush_fn = flush_fn
+        self._on_durable = on_durable
+        self._on_failed = on_failed
+        self._producer_lock = producer_lock
+        self.window = max(window_ms, 0.0) / 1000.0
+        self.max_batch = max(max_batch, 1)
+
+        self._cond = threading.Condition()
+        self._queue: List[_CommitTicket] = []
+        self._queued_items = 0
+        self._announced = 0
+        self._leader_active = False
+
+        # Counters
+        self._batches = 0
+        self._items = 0
+        self._max_batch_seen = 0
+        self._failed_batches = 0
+        self._flush_total_ms = 0.0
+        self._flush_max_ms = 0.0
+        self._flush_last_ms = 0.0
+
+    def announce(self):
+        """An appender is about to build an item - worth lingering for."""
+        with self._cond:
+            self._announced += 1
+
+    def withdraw(self):
+        """An announced appender gave up before submitting."""
+        with self._cond:
+            self._announced = max(self._announced - 1, 0)
+            self._cond.notify_all()
+
+    def submit(self, item: Any) -> _CommitTicket:
+        """Queue an item. Call wait() on the returned ticket."""
+        return self.submit_many([item])
+
+    def submit_many(self, items: List[Any]) -> _CommitTicket:
+        """
+        Queue items that must be flushed in the same flush_fn call, so they
+        become durable (or fail) together. A group larger than max_batch is
+        flushed on its own. One announce() covers the whole group.
+        """
+        ticket = _CommitTicket(list(items))
+        with self._cond:
+            self._announced = max(self._announced - 1, 0)
+            self._queue.append(ticket)
+            self._queued_items += len(ticket.items)
+            self._cond.notify_all()
+        return ticket
+
+    def wait(self, ticket: _CommitTicket):
+        """Block until the ticket's item is durable. Re-raises flush errors."""
+        with self._cond:
+            while not ticket.done and self._leader_active:
+                self._cond.wait()
+            if not ticket.done:
+                self._leader_active = True
+
+        if not ticket.done:
+            try:
+                while not ticket.done:
+                    self._lead_one_batch()
+            finally:
+                with self._cond:
+                    self._leader_active = False
+                    self._cond.notify_all()
+
+        if ticket.error is not None:
+            raise ticket.error
+
+    def _lead_one_batch(self):
+        with self._cond:
+            deadline = time.monotonic() + self.window
+            while self._announced > 0 and self._queued_items < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            # Whole tickets only, up to max_batch items (a bigger group goes alone)
+            count = taken = 0
+            for ticket in self._queue:
+                if taken and count + len(ticket.items) > self.max_batch:
+                    break
+                count += len(ticket.items)
+                taken += 1
+            batch = self._queue[:taken]
+            del self._queue[:taken]
+            self._queued_items -= count
+
+        if not batch:
+            return
+
+        items = [item for t in batch for item in t.items]
+        started = time.perf_counter()
+        try:
+            self._flush_fn(items)
+        except OSError as e:
+            self._fail(batch, e)
+            return
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        error = None
+        try:
+            if self._on_durable:
+                self._on_durable(items)
+        except Exception as e:
+            # Items are on disk but bookkeeping failed - don't strand the waiters
+            error = e
+
+        with self._cond:
+            self._batches += 1
+            self._items += len(items)
+            self._max_batch_seen = max(self._max_batch_seen, len(items))
+            self._flush_last_ms = elapsed_ms
+            self._flush_total_ms += elapsed_ms
+            self._flush_max_ms = max(self._flush_max_ms, elapsed_ms)
+            for ticket in batch:
+                ticket.error = error
+                ticket.done = True
+            self._cond.notify_all()
+
+    def _fail(self, batch: List[_CommitTicket], error: OSError):
+        # Anything queued behind a failed batch is chained onto it - fail it too
+        lock = self._producer_lock or threading.Lock()
+        with lock:
+            with self._cond:
+                failed = batch + self._queue
+                self._queue = []
+                self._queued_items = 0
+                self._failed_batches += 1
+            if self._on_failed:
+                self._on_failed()
+
+        with self._cond:
+            for ticket in failed:
+                ticket.error = error
+                ticket.done = True
+            self._cond.notify_all()
+
+    def stats(self) -> Dict:
+        """Batch size and flush latency counters."""
+        with self._cond:
+            return {
+                'batches': self._batches,
+                'entries': self._items,
+                'avg_batch_size': self._items / self._batches if self._batches else 0.0,
+                'max_batch_size': self._max_batch_seen,
+                'failed_batches': self._failed_batches,
+                'last_flush_ms': self._flush_last_ms,
+                'avg_flush_ms': self._flush_total_ms / self._batches if self._batches else 0.0,
+                'max_flush_ms': self._flush_max_ms,
+                'queued': self._queued_items,
+            }
+
+
+# =============================================================================
+# AGGREGATES - Running totals kept current by append
+# =============================================================================
+
+def _clip(text: Any, length: int = 50) -> str:
+    """Payload text shortened for reports (non-strings report as empty)."""
+    return text[:length] if isinstance(text, str) else ""
+
+
+def _copy_records(records: List[Dict]) -> List[Dict]:
+    return [dict(record) for record in records]
+
+
+class OzolithAggregates:
+    """
+    Running totals over the log, updated as each entry is committed.
+
+    Holds what stats(), session_summary(), correction_analytics(),
+    audit_corrections() and find_learning_opportunities() used to recompute
+    by walking every entry: counts by type/context/actor/hour, confidence and
+    uncertainty tallies, correction bookkeeping, and one summary per session.
+
+    Saved (signed) next to the log at each anchor and on close(). A snapshot
+    is only trusted if the entry it stops at is still there with the same
+    hash; entries past it are replayed. Bump FORMAT whenever what's tracked
+    changes - older snapshots are then discarded and the whole log replayed,
+    same as Ozolith.rebuild_aggregates().
+    """
+
+    FORMAT = 1
+
+    # find_learning_opportunities() threshold for low confidence exchanges
+    LOW_CONFIDENCE = 0.5
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+        # Where the snapshot stops (entries applied, hash of the last one)
+        self.entry_count = 0
+        self.last_hash = ""
+
+        self.by_type: Dict[str, int] = {}
+        self.by_context: Dict[str, int] = {}
+        self.by_actor: Dict[str, int] = {}
+        self.by_hour: List[int] = [0] * 24
+
+        # Exchanges
+        self.confidence_sum = 0.0
+        self.confidence_count = 0
+        self.confidence_distribution = {'low': 0, 'medium': 0, 'high': 0}
+        self.uncertainty_flags: Dict[str, int] = {}
+        self.low_confidence: List[Dict] = []
+        self.flagged: List[Dict] = []
+
+        # Corrections (all CORRECTION entries, confirmations included)
+        self.correction_seqs: set = set()
+        self.corrections_by_type: Dict[str, int] = {}
+        self.correction_notes: List[Dict] = []
+
+        # Corrections excluding confirmations
+        self.actual: Dict[str, Any] = {
+            'total': 0,
+            'by_type': {},
+            'by_context': {},
+            'by_day': {},
+            'validated': 0,
+            'had_warnings': 0,
+        }
+        self.confirmations = 0
+        self.confirmed_seqs: set = set()
+        self.targeted: List[Dict] = []  # Orphan/chain checks need the current log
+        self.unvalidated: List[Dict] = []
+        self.needs_human_review: List[Dict] = []
+        self.had_warnings: List[Dict] = []
+
+        # Sessions, keyed by SESSION_START sequence (as str, for JSON)
+        self.sessions: Dict[str, Dict] = {}
+        self.open_sessions: List[str] = []
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def add(self, entry: OzolithEntry):
+        """Fold one committed entry into the totals."""
+        with self._lock:
+            self._add(entry)
+
+    def _add(self, entry: OzolithEntry):
+        payload = entry.payload
+        type_key = entry.event_type.value
+
+        self.entry_count += 1
+        self.last_hash = entry.entry_hash
+        self.by_type[type_key] = self.by_type.get(type_key, 0) + 1
+        self.by_context[entry.context_id] = self.by_context.get(entry.context_id, 0) + 1
+        self.by_actor[entry.actor] = self.by_actor.get(entry.actor, 0) + 1
+        try:
+            self.by_hour[int(entry.timestamp[11:13])] += 1
+        except (ValueError, IndexError):
+            pass
+
+        confidence = payload.get('confidence')
+        if not isinstance(confidence, (int, float)):
+            confidence = None
+
+        if entry.event_type == OzolithEventType.EXCHANGE:
+            self._add_exchange(entry, confidence)
+        elif entry.event_type == OzolithEventType.CORRECTION:
+            self._add_correction(entry)
+
+        self._add_to_sessions(entry, confidence)
+
+    def _add_exchange(self, entry: OzolithEntry, confidence: Optional[float]):
+        if confidence is not None:
+            self.confidence_sum += confidence
+            self.confidence_count += 1
+            if confidence < 0.5:
+                self.confidence_distribution['low'] += 1
+            elif confidence < 0.8:
+                self.confidence_distribution['medium'] += 1
+            else:
+                self.confidence_distribution['high'] += 1
+
+            if confidence < self.LOW_CONFIDENCE:
+                self.low_confidence.append({
+                    'sequence': entry.sequence,
+                    'confidence': confidence,
+                    'context_id': entry.context_id,
+                })
+
+        flags = entry.payload.get('uncertainty_flags')
+        if isinstance(flags, list) and flags:
+            for flag in flags:
+                if isinstance(flag, str):
+                    self.uncertainty_flags[flag] = self.uncertainty_flags.get(flag, 0) + 1
+            self.flagged.append({
+                'sequence': entry.sequence,
+                'flags': list(flags),
+                'context_id': entry.context_id,
+            })
+
+    def _add_correction(self, entry: OzolithEntry):
+        payload = entry.payload
+        seq = entry.sequence
+        target_seq = payload.get('original_exchange_seq')
+        correction_type = payload.get('correction_type', 'unknown')
+
+        self.correction_seqs.add(seq)
+        self.corrections_by_type[correction_type] = self.corrections_by_type.get(correction_type, 0) + 1
+        self.correction_notes.append({
+            'sequence': target_seq,
+            'correction_type': payload.get('correction_type'),
+            'context_id': entry.context_id,
+            'notes': payload.get('correction_notes', 'No notes'),
+        })
+
+        if correction_type == 'confirmation':
+            self.confirmations += 1
+            confirmed = payload.get('confirms_correction_seq')
+            if confirmed and isinstance(confirmed, int):
+                self.confirmed_seqs.add(confirmed)
+            return
+
+        actual = self.actual
+        actual['total'] += 1
+        actual['by_type'][correction_type] = actual['by_type'].get(correction_type, 0) + 1
+        actual['by_context'][entry.context_id] = actual['by_context'].get(entry.context_id, 0) + 1
+        day = entry.timestamp[:10]
+        actual['by_day'][day] = actual['by_day'].get(day, 0) + 1
+        if payload.get('agent_validated'):
+            actual['validated'] += 1
+        if payload.get('human_validated'):
+            self.confirmed_seqs.add(seq)
+
+        notes = _clip(payload.get('correction_notes', ''))
+        if target_seq:
+            self.targeted.append({'correction_seq': seq, 'target_seq': target_seq, 'notes': notes})
+
+        validation_status = payload.get('validation_status')
+        if not validation_status or validation_status == 'pending':
+            self.unvalidated.append({'correction_seq': seq, 'target_seq': target_seq, 'notes': notes})
+        elif validation_status == 'validated' and not payload.get('human_validated'):
+            self.needs_human_review.append({
+                'correction_seq': seq,
+                'target_seq': target_seq,
+                'notes': notes,
+                'reasoning': _clip(payload.get('correction_reasoning', ''))
+            })
+
+        warnings = payload.get('validation_warnings', [])
+        if warnings:
+            actual['had_warnings'] += 1
+            self.had_warnings.append({'correction_seq': seq, 'target_seq': target_seq, 'warnings': warnings})
+
+    def _add_to_sessions(self, entry: OzolithEntry, confidence: Optional[float]):
+        if entry.event_type == OzolithEventType.SESSION_START:
+            key = str(entry.sequence)
+            self.sessions[key] = {
+                'end_seq': None,
+                'total_entries': 0,
+                'by_type': {},
+                'contexts': [],
+                'confidence_sum': 0.0,
+                'confidence_count': 0,
+            }
+            self.open_sessions.append(key)
+
+        type_key = entry.event_type.value
+        for key in self.open_sessions:
+            session = self.sessions[key]
+            session['total_entries'] += 1
+            session['by_type'][type_key] = session['by_type'].get(type_key, 0) + 1
+            if entry.context_id not in session['contexts']:
+                session['contexts'].append(entry.context_id)
+            if entry.event_type == OzolithEventType.EXCHANGE and confidence is not None:
+                session['confidence_sum'] += confidence
+                session['confidence_count'] += 1
+
+        if entry.event_type == OzolithEventType.SESSION_END:
+            for key in self.open_sessions:
+                self.sessions[key]['end_seq'] = entry.sequence
+            self.open_sessions = []
+
+    # -------------------------------------------------------------------------
+    # Reads (copies, so callers can't disturb the running totals)
+    # -------------------------------------------------------------------------
+
+    def counts(self) -> Dict:
+        """Everything stats() reports that comes from the entries."""
+        with self._lock:
+            return {
+                'by_type': dict(self.by_type),
+                'by_context': dict(self.by_context),
+                'by_actor': dict(self.by_actor),
+                'entries_by_hour': dict(enumerate(self.by_hour)),
+                'avg_confidence': (self.confidence_sum / self.confidence_count
+                                   if self.confidence_count else None),
+                'confidence_distribution': dict(self.confidence_distribution),
+                'uncertainty_flag_counts': dict(self.uncertainty_flags),
+                'corrections_by_type': dict(self.corrections_by_type),
+            }
+
+    def session(self, start_seq: int) -> Optional[Dict]:
+        """Summary for the session opened at start_seq, or None if none was."""
+        with self._lock:
+            session = self.sessions.get(str(start_seq))
+            if session is None:
+                return None
+            return {
+                'end_seq': session['end_seq'],
+                'total_entries': session['total_entries'],
+                'by_type': dict(session['by_type']),
+                'contexts': list(session['contexts']),
+                'avg_confidence': (session['confidence_sum'] / session['confidence_count']
+                                   if session['confidence_count'] else None),
+            }
+
+    def correction_counts(self) -> Dict:
+        """Correction totals for correction_analytics()."""
+        with self._lock:
+            return {
+                'total': self.actual['total'],
+                'confirmations': self.confirmations,
+                'exchanges': self.by_type.get(OzolithEventType.EXCHANGE.value, 0),
+                'by_type': dict(self.actual['by_type']),
+                'by_context': dict(self.actual['by_context']),
+                'by_day': dict(self.actual['by_day']),
+                'validated': self.actual['validated'],
+                'had_warnings': self.actual['had_warnings'],
+                'human_confirmed': len(self.confirmed_seqs),
+            }
+
+    def correction_issues(self) -> Tuple[Dict[str, List[Dict]], List[Dict], set]:
+        """Audit lists that don't depend on the rest of the log, plus what does."""
+        with self._lock:
+            issues = {
+                'unvalidated': _copy_records(self.unvalidated),
+                'needs_human_review': _copy_records(self.needs_human_review),
+                'had_warnings': _copy_records(self.had_warnings),
+            }
+            return issues, _copy_records(self.targeted), set(self.correction_seqs)
+
+    def learning_records(self) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """Low confidence exchanges, corrections, and flagged exchanges."""
+        with self._lock:
+            return (_copy_records(self.low_confidence), _copy_records(self.correction_notes),
+                    _copy_records(self.flagged))
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    _FIELDS = (
+        'entry_count', 'last_hash', 'by_type', 'by_context', 'by_actor', 'by_hour',
+        'confidence_sum', 'confidence_count', 'confidence_distribution',
+        'uncertainty_flags', 'low_confidence', 'flagged', 'corrections_by_type',
+        'correction_notes', 'actual', 'confirmations', 'targeted', 'unvalidated',
+        'needs_human_review', 'had_warnings', 'sessions', 'open_sessions',
+    )
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            data = {name: getattr(self, name) for name in self._FIELDS}
+            data['format'] = self.FORMAT
+            data['correction_seqs'] = sorted(self.correction_seqs)
+            data['confirmed_seqs'] = sorted(self.confirmed_seqs)
+            return json.loads(json.dumps(data))
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> Optional['OzolithAggregates']:
+        """Restore a snapshot, or None if it was written in another format."""
+        if data.get('format') != cls.FORMAT:
+            return None
+        aggregates = cls()
+        for name in cls._FIELDS:
+            setattr(aggregates, name, data[name])
+        aggregates.correction_seqs = set(data['correction_seqs'])
+        aggregates.confirmed_seqs = set(data['confirmed_seqs'])
+        return aggregates
+
+
 # =============================================================================
 # OZOLITH CORE - The immutable log
 # =============================================================================
@@ -85,13 +1538,33 @@ class Ozolith:
         - SHA-256 of entire entry (self-verification)
 
     Storage is JSON Lines format - human readable, easy to verify externally.
+    By default that's one file; pass segment_size to roll it into fixed-size
+    segment files with persisted sidecar indexes (see SegmentedLog).
+
+    Lookups by sequence, context, type and time go through secondary indexes
+    (OzolithIndex) instead of scanning every entry.
+
+    Appends from one instance are serialized. With group_commit=True they
+    also share fsyncs: concurrent appends within the commit window are
+    written and flushed together (see GroupCommitWriter), and each caller
+    still returns only once its own entry is on disk.
+
+    Anchors are appended to a journal (<name>_anchors.jsonl), one fsync'd
+    line each, and folded into the <name>_anchors.json snapshot every
+    ANCHOR_COMPACT_EVERY anchors.
     """
 
+    ANCHOR_COMPACT_EVERY = 256
+
     def __init__(
         self,
         storage_path: Optional[str] = None,
         signing_key: Optional[str] = None,
-        anchor_policy: Optional['AnchorPolicy'] = None
+        anchor_policy: Optional['AnchorPolicy'] = None,
+        segment_size: Optional[int] = None,
+        group_commit: bool = False,
+        commit_window_ms: float = 2.0,
+        commit_max_batch: int = 64
     ):
         """
         Initialize OZOLITH.
@@ -100,6 +1573,16 @@ class Ozolith:
             storage_path: Where to store the log. Defaults to ~/.local/share/memory_system/ozolith.jsonl
             signing_key: HMAC key for signing entries. Defaults to machine-specific key.
             anchor_policy: When to create anchors. Defaults to hybrid policy.
+            segment_size: If set, store the log as rolled segment files of this many
+                entries under <storage_path minus .jsonl>.segments/. An existing
+                single-file log is imported on first open (the original is left alone).
+            group_commit: Keep the log file open and coalesce concurrent appends
+                into one write + fsync. Off by default - with it on, a file that
+                becomes unwritable after the first append isn't noticed until
+                the handle fails.
+            commit_window_ms: How long a group commit waits for other in-flight
+                appends before flushing (only while some are in flight).
+            commit_max_batch: Most entries flushed by one fsync.
         """
         # Storage setup
         if storage_path is None:
@@ -109,6 +1592,17 @@ class Ozolith:
 
         self.storage_path = storage_path
         self.anchors_path = storage_path.replace(".jsonl", "_anchors.json")
+        self.anchor_journal_path = storage_path.replace(".jsonl", "_anchors.jsonl")
+        self.segment_size = segment_size
+        self.segments_dir = storage_path.replace(".jsonl", "") + ".segments"
+        if segment_size:
+            self.merkle_path = os.path.join(self.segments_dir, "merkle.bin")
+            self.checkpoint_path = os.path.join(self.segments_dir, "verified.json")
+            self.aggregates_path = os.path.join(self.segments_dir, "aggregates.json")
+        else:
+            self.merkle_path = storage_path.replace(".jsonl", "_merkle.bin")
+            self.checkpoint_path = storage_path.replace(".jsonl", "_verified.json")
+            self.aggregates_path = storage_path.replace(".jsonl", "_aggregates.json")
 
         # Signing key - use provided or generate machine-specific
         if signing_key is None:
@@ -119,14 +1613,61 @@ class Ozolith:
         self.anchor_policy = anchor_policy or AnchorPolicy()
 
         # In-memory state (loaded from disk)
+        # _entries is a plain list for single-file storage, a SegmentedLog
+        # (which is also its own index) for segmented storage.
         self._entries: List[OzolithEntry] = []
+        self._index = OzolithIndex()
+        self._merkle: Optional[MerkleLayer] = None
+        self._merkle_confirmed = False
         self._anchors: List[OzolithAnchor] = []
+        self._anchor_positions: Dict[int, int] = {}  # ANCHOR-N -> index in _anchors
+        self._anchor_journal_lines = 0
+        self._anchors_need_compaction = False
         self._sequence = 0
         self._anchor_sequence = 0
+        self._log_bytes = 0  # single-file: bytes holding committed entries
+
+        # Verification checkpoint (see verify_chain). Confirmed against the
+        # files once per process; the digest covers the last file checkpointed
+        # so advancing only reads bytes appended since.
+        self._checkpoint: Optional[Dict] = None
+        self._checkpoint_confirmed = False
+        self._checkpoint_digest: Optional[Tuple[str, int, Any]] = None
+        self._verify_lock = threading.Lock()
+
+        # Running totals (see OzolithAggregates). The saved snapshot is
+        # caught up with the log on first read, not at startup.
+        self._aggregates = OzolithAggregates()
+        self._aggregates_current = False
+
+        # Appends are serialized by _append_lock; _state_lock covers the
+        # in-memory commit so readers like create_anchor see a consistent tip.
+        self._append_lock = threading.RLock()
+        self._state_lock = threading.RLock()
+        self._anchor_lock = threading.RLock()
+        self._log_handle = None
 
         # Load existing data
         self._load()
 
+        # Group commit: entries are built against the pending tip (which may
+        # be ahead of what's durable) and committed to memory after fsync.
+        self._pending_sequence = self._sequence
+        self._pending_hash = self.get_root_hash()
+        self._writer: Optional[GroupCommitWriter] = None
+        if group_commit:
+            self._writer = GroupCommitWriter(
+                flush_fn=self._flush_batch,
+                on_durable=lambda items: self._commit(
+                    [entry for entry, _ in items],
+                    sum(len(line) + 1 for _, line in items)
+                ),
+                on_failed=self._reset_pending,
+                producer_lock=self._append_lock,
+                window_ms=commit_window_ms,
+                max_batch=commit_max_batch,
+            )
+
     def _get_or_create_signing_key(self) -> str:
         """Get or create a machine-specific signing key."""
         key_path = Path(self.storage_path).parent / ".ozolith_key"
@@ -158,7 +1699,9 @@ class Ozolith:
         self.load_warnings: List[str] = []
 
         # Load entries
-        if os.path.exists(self.storage_path):
+        if self.segment_size:
+            self._load_segmented()
+        elif os.path.exists(self.storage_path):
             with open(self.storage_path, 'r') as f:
                 line_number = 0
                 for line in f:
@@ -168,93 +1711,471 @@ class Ozolith:
                         continue  # Skip blank lines
 
                     try:
-                        data = json.loads(line)
-                        # Convert event_type string back to enum
-                        data['event_type'] = OzolithEventType(data['event_type'])
-                        entry = OzolithEntry(**data)
+                        entry = _entry_from_dict(json.loads(line))
                         self._entries.append(entry)
+                        self._index.add(entry)
                     except json.JSONDecodeError as e:
                         warning = f"Line {line_number}: Corrupted JSON, skipped ({e})"
                         self.load_warnings.append(warning)
                     except (KeyError, ValueError, TypeError) as e:
                         warning = f"Line {line_number}: Invalid entry data, skipped ({e})"
                         self.load_warnings.append(warning)
+                self._log_bytes = os.fstat(f.fileno()).st_size
+
+        if self._entries:
+            self._sequence = self._entries[-1].sequence
 
-            if self._entries:
-                self._sequence = self._entries[-1].sequence
+        self._load_merkle()
+        self._load_checkpoint()
+        self._load_aggregates()
+
+        self._load_anchors()
+
+    def _load_anchors(self):
+        """
+        Load anchors: the compacted snapshot, then the journal of anchors since.
 
-        # Load anchors (with graceful fallback)
+        The journal only means something on top of its snapshot, so if the
+        snapshot can't be read we start with no anchors and the next anchor
+        rewrites both. A journal line cut short by a crash is dropped (and
+        trimmed off the file so the next append starts clean).
+        """
         if os.path.exists(self.anchors_path):
             try:
                 with open(self.anchors_path, 'r') as f:
                     anchors_data = json.load(f)
-                    for data in anchors_data:
-                        # Convert tuple back from list
-                        data['sequence_range'] = tuple(data['sequence_range'])
-                        anchor = OzolithAnchor(**data)
-                        self._anchors.append(anchor)
-
-                if self._anchors:
-                    # Extract sequence number from anchor_id (ANCHOR-X)
-                    last_id = self._anchors[-1].anchor_id
-                    self._anchor_sequence = int(last_id.split('-')[1])
+                self._anchors = [_anchor_from_dict(data) for data in anchors_data]
             except json.JSONDecodeError as e:
                 warning = f"Anchors file corrupted, starting with empty anchors ({e})"
                 self.load_warnings.append(warning)
+                self._anchors_need_compaction = True
             except (KeyError, ValueError, TypeError) as e:
                 warning = f"Anchors file has invalid data, starting with empty anchors ({e})"
                 self.load_warnings.append(warning)
+                self._anchors_need_compaction = True
+
+        if not self._anchors_need_compaction:
+            self._replay_anchor_journal()
+
+        self._anchor_positions = {
+            _anchor_number(anchor): i for i, anchor in enumerate(self._anchors)
+        }
+        if self._anchors:
+            self._anchor_sequence = _anchor_number(self._anchors[-1])
+
+    def _replay_anchor_journal(self):
+        if not os.path.exists(self.anchor_journal_path):
+            return
+
+        with open(self.anchor_journal_path, 'rb') as f:
+            data = f.read()
+
+        known = {anchor.anchor_id for anchor in self._anchors}
+        offset = 0
+        for line_number, line in enumerate(data.splitlines(keepends=True), start=1):
+            if not line.endswith(b'\n'):
+                # Torn final write - the anchor never finished being recorded
+                self.load_warnings.append(
+                    f"Anchors journal line {line_number}: incomplete record dropped")
+                try:
+                    with open(self.anchor_journal_path, 'r+b') as f:
+                        f.truncate(offset)
+                except OSError:
+                    self._anchors_need_compaction = True
+                break
+            offset += len(line)
+
+            try:
+                anchor = _anchor_from_dict(json.loads(line))
+                _anchor_number(anchor)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                self.load_warnings.append(f"Anchors journal line {line_number}: Corrupted JSON, skipped ({e})")
+                continue
+            except (KeyError, ValueError, TypeError, IndexError) as e:
+                self.load_warnings.append(f"Anchors journal line {line_number}: Invalid anchor data, skipped ({e})")
+                continue
+
+            self._anchor_journal_lines += 1
+            if anchor.anchor_id in known:
+                continue  # Compacted, but the journal wasn't emptied before a crash
+            known.add(anchor.anchor_id)
+            self._anchors.append(anchor)
+
+    def _load_segmented(self):
+        """
+        Open segmented storage, importing a single-file log the first time.
+
+        The import goes into a scratch directory that's renamed into place
+        only when complete, so a crash mid-import just means importing again.
+        """
+        if not os.path.isdir(self.segments_dir) and os.path.exists(self.storage_path):
+            scratch_dir = self.segments_dir + ".importing"
+            if os.path.isdir(scratch_dir):
+                shutil.rmtree(scratch_dir)
+
+            importer = SegmentedLog(scratch_dir, self.segment_size)
+            with open(self.storage_path, 'r') as f:
+                importer.import_lines(f)
+            self.load_warnings.extend(importer.load_warnings)
+            os.rename(scratch_dir, self.segments_dir)
+
+        log = SegmentedLog(self.segments_dir, self.segment_size)
+        self.load_warnings.extend(log.load_warnings)
+        self._entries = log
+        self._index = log
+
+    def _load_merkle(self):
+        """
+        Open the Merkle sidecar and bring its size in line with the log.
+
+        A sidecar that's behind (it isn't fsync'd, or the log predates it) is
+        extended from the log; only that tail is read here. Its contents are
+        checked on first use - see _merkle_tree().
+        """
+        tree = MerkleLayer(path=self.merkle_path)
+        if len(tree) > len(self._entries):
+            tree.truncate(len(self._entries))
+        tree.extend(entry.entry_hash for entry in self._entries[len(tree):])
+        self._merkle = tree
+        self._merkle_confirmed = False
+
+    def _merkle_tree(self) -> 'MerkleLayer':
+        """
+        The Merkle tree, checked node for node against the log once per process.
+
+        The sidecar isn't signed, so a log edited under an unchanged sidecar
+        would keep the old roots and pass verify_against_anchor(). Every
+        stored node must match a tree built from the log's own entry hashes;
+        any mismatch rebuilds it. Deferred to first use so segmented startup
+        still parses only the active segment.
+        """
+        with self._state_lock:
+            if not self._merkle_confirmed:
+                hashes = [entry.entry_hash for entry in self._entries[:len(self._merkle)]]
+                if self._merkle.node_bytes() != MerkleLayer(hashes).node_bytes():
+                    # Derived data, so not a load warning - anchors still catch
+                    # a tampered log, since the rebuilt roots won't match theirs
+                    self._merkle.truncate(0)
+                    self._merkle.extend(hashes)
+                self._merkle_confirmed = True
+            return self._merkle
+
+    def _load_checkpoint(self):
+        """
+        Read the verification checkpoint, if any.
+
+        It's trusted only after confirm - see _checkpoint_usable(). A missing,
+        unreadable or unsigned one just means the next verify is a full one.
+        """
+        if not os.path.exists(self.checkpoint_path):
+            return
+        try:
+            with open(self.checkpoint_path, 'r') as f:
+                data = json.load(f)
+            signature = data.pop('signature')
+            if hmac.compare_digest(signature, self._compute_signature(data)):
+                self._checkpoint = data
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, AttributeError):
+            pass
+
+    def _load_aggregates(self):
+        """
+        Read the aggregates snapshot, if any.
 
-    def _save_entry(self, entry: OzolithEntry) -> bool:
+        Like the checkpoint it's signed; a missing, unsigned or older-format
+        snapshot just means the first read replays the whole log.
+        """
+        if not os.path.exists(self.aggregates_path):
+            return
+        try:
+            with open(self.aggregates_path, 'r') as f:
+                data = json.load(f)
+            signature = data.pop('signature')
+            if hmac.compare_digest(signature, self._compute_signature(data)):
+                self._aggregates = OzolithAggregates.from_dict(data) or OzolithAggregates()
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, AttributeError):
+            pass
+
+    def _serialize_entry(self, entry: OzolithEntry) -> str:
+        """
+        One JSON line for the log file.
+
+        Reuses the payload encoding cached by _build_entry, so a new entry's
+        payload is written from the same bytes that were signed and hashed.
+        """
+        payload_json = entry._canonical_payload
+        if payload_json is None:
+            payload_json = _canonical_json(entry.payload)
+
+        dumps = json.dumps
+        return ''.join([
+            '{"sequence":', dumps(entry.sequence),
+            ',"timestamp":', dumps(entry.timestamp),
+            ',"previous_hash":', dumps(entry.previous_hash),
+            ',"event_type":', dumps(entry.event_type.value),
+            ',"context_id":', dumps(entry.context_id),
+            ',"actor":', dumps(entry.actor),
+            ',"payload":', payload_json,
+            ',"signature":', dumps(entry.signature),
+            ',"entry_hash":', dumps(entry.entry_hash),
+            '}',
+        ])
+
+    def _save_entry(self, entry: OzolithEntry, line: Optional[str] = None) -> bool:
         """
         Append single entry to log file.
 
+        Args:
+            entry: The entry to write
+            line: Its serialized form, if the caller already has it
+
         Returns:
             True if save succeeded, False if failed (disk full, permissions, etc.)
 
         Raises:
             OzolithWriteError: If write fails and caller needs to handle it
         """
-        entry_dict = asdict(entry)
-        # Convert enum to string for JSON
-        entry_dict['event_type'] = entry.event_type.value
+        if line is None:
+            line = self._serialize_entry(entry)
 
         try:
+            if self.segment_size:
+                self._entries.write(line)
+                return True
+
             with open(self.storage_path, 'a') as f:
-                f.write(json.dumps(entry_dict) + '\n')
+                f.write(line + '\n')
                 f.flush()  # Ensure it's written to OS buffer
                 os.fsync(f.fileno())  # Force to disk
             return True
         except OSError as e:
             # Disk full, permission denied, etc.
+            if not self.segment_size:
+                self._rollback_log()
             raise OzolithWriteError(f"Failed to write entry: {e}") from e
 
+    def _save_entries(self, lines: List[str]):
+        """Append several serialized entries with one write + fsync."""
+        try:
+            if self.segment_size:
+                self._entries.write_lines(lines)
+                return
+
+            with open(self.storage_path, 'a') as f:
+                f.write(''.join(line + '\n' for line in lines))
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            if not self.segment_size:
+                self._rollback_log()
+            raise OzolithWriteError(f"Failed to write entries: {e}") from e
+
+    def _flush_batch(self, items: List[Tuple[OzolithEntry, str]]):
+        """Group commit flush: one write + fsync for a batch of serialized entries."""
+        lines = [line for _, line in items]
+
+        if self.segment_size:
+            self._entries.write_lines(lines)
+            return
+
+        if self._log_handle is None:
+            self._log_handle = open(self.storage_path, 'ab')
+        try:
+            self._log_handle.write(''.join(line + '\n' for line in lines).encode())
+            self._log_handle.flush()
+            os.fsync(self._log_handle.fileno())
+        except OSError:
+            # Reopen next time rather than reuse a handle in an unknown state
+            handle, self._log_handle = self._log_handle, None
+            try:
+                handle.close()
+            except OSError:
+                pass
+            self._rollback_log()
+            raise
+
+    def _rollback_log(self):
+        """
+        Single-file: cut a failed write back off the log (best effort).
+
+        Whatever part of the batch reached the file would otherwise stay
+        there while the sequence numbers it used are handed out again.
+        _log_bytes only counts committed entries (all ASCII, so characters
+        are bytes), the same rollback SegmentedLog does for its segments.
+        """
+        try:
+            os.truncate(self.storage_path, self._log_bytes)
+        except OSError:
+            pass
+
+    def _commit(self, entries: List[OzolithEntry], nbytes: int = 0):
+        """Make durable entries visible in memory, in order. nbytes is what they took on disk."""
+        with self._state_lock:
+            self._log_bytes += nbytes
+            for entry in entries:
+                entry._canonical_payload = None  # Written - don't hold a second copy
+                self._entries.append(entry)
+                if not self.segment_size:
+                    self._index.add(entry)  # SegmentedLog indexes inside append()
+                if self._aggregates_current:
+                    self._aggregates.add(entry)
+                self._sequence = entry.sequence
+            self._merkle.extend(entry.entry_hash for entry in entries)
+
+    def _reset_pending(self):
+        """After a failed group flush, chain new entries from the durable tip again."""
+        self._pending_sequence = self._sequence
+        self._pending_hash = self.get_root_hash()
+
+    def commit_stats(self) -> Optional[Dict]:
+        """Group commit batch size / flush latency counters (None if group commit is off)."""
+        return self._writer.stats() if self._writer else None
+
+    def close(self):
+        """Release long-lived file handles. The instance reopens them if used again."""
+        with self._append_lock:
+            if self._log_handle is not None:
+                self._log_handle.close()
+                self._log_handle = None
+            if self.segment_size:
+                self._entries.close()
+            self._merkle.close()
+            with self._state_lock:
+                if self._aggregates_current:
+                    self._save_aggregates()
+
+    # -------------------------------------------------------------------------
+    # Aggregates
+    # -------------------------------------------------------------------------
+
+    def aggregates(self) -> OzolithAggregates:
+        """Running totals, caught up with the log."""
+        with self._state_lock:
+            if not self._aggregates_current:
+                self._catch_up_aggregates()
+            return self._aggregates
+
+    def rebuild_aggregates(self) -> int:
+        """
+        Throw the aggregates away and replay the whole log into new ones.
+
+        Needed only if a snapshot is suspected wrong - format changes and
+        logs that don't continue the snapshot are rebuilt automatically.
+        Returns the number of entries replayed.
+        """
+        with self._state_lock:
+            self._aggregates = OzolithAggregates()
+            self._aggregates_current = False
+            self._catch_up_aggregates()
+            return self._aggregates.entry_count
+
+    def _catch_up_aggregates(self):
+        """Replay entries the snapshot hasn't seen (all of them if it doesn't fit the log)."""
+        aggregates = self._aggregates
+        count = aggregates.entry_count
+        if count > len(self._entries) or (
+                count and self._entries[count - 1].entry_hash != aggregates.last_hash):
+            aggregates = OzolithAggregates()
+            count = 0
+
+        for entry in self._entries[count:]:
+            aggregates.add(entry)
+
+        self._aggregates = aggregates
+        self._aggregates_current = True
+        if aggregates.entry_count > count:
+            self._save_aggregates()
+
+    def _save_aggregates(self):
+        """Snapshot the aggregates. Derived data - if the write fails, the next load replays."""
+        data = self._aggregates.to_dict()
+        data['signature'] = self._compute_signature(data)
+        temp_path = self.aggregates_path + ".tmp"
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(temp_path, self.aggregates_path)
+        except OSError:
+            pass
+
+    def _record_anchor(self, anchor: OzolithAnchor):
+        """
+        Persist a newly created anchor: one fsync'd journal line.
+
+        Every ANCHOR_COMPACT_EVERY anchors the journal is folded into the
+        snapshot instead, so load time stays bounded too.
+        """
+        self._anchor_positions[_anchor_number(anchor)] = len(self._anchors)
+        self._anchors.append(anchor)
+
+        if self._anchors_need_compaction or self._anchor_journal_lines + 1 >= self.ANCHOR_COMPACT_EVERY:
+            self.compact_anchors()
+            return
+
+        line = json.dumps(_anchor_to_dict(anchor), separators=(',', ':')) + "\n"
+        with open(self.anchor_journal_path, 'a') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self._anchor_journal_lines += 1
+
+    def compact_anchors(self):
+        """
+        Rewrite the anchors snapshot from memory and empty the journal.
+
+        Crash-safe in either order of failure: the snapshot is replaced
+        atomically, and anchors still in the journal that the snapshot
+        already holds are skipped on load.
+        """
+        with self._anchor_lock:
+            self._save_anchors()
+            with open(self.anchor_journal_path, 'w') as f:
+                f.flush()
+                os.fsync(f.fileno())
+            self._anchor_journal_lines = 0
+            self._anchors_need_compaction = False
+
     def _save_anchors(self):
-        """Save all anchors to file."""
-        anchors_data = []
-        for anchor in self._anchors:
-            data = asdict(anchor)
-            # Convert tuple to list for JSON
-            data['sequence_range'] = list(data['sequence_range'])
-            anchors_data.append(data)
+        """Save all anchors to the snapshot file."""
+        anchors_data = [_anchor_to_dict(anchor) for anchor in self._anchors]
 
         # Atomic write
         temp_path = self.anchors_path + ".tmp"
         with open(temp_path, 'w') as f:
             json.dump(anchors_data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
         os.replace(temp_path, self.anchors_path)
 
     def _compute_hash(self, data: Dict) -> str:
         """Compute SHA-256 hash of data."""
         # Canonical JSON encoding for consistent hashing
-        canonical = json.dumps(data, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(canonical.encode()).hexdigest()
+        return self._hash_text(_canonical_json(data))
 
     def _compute_signature(self, data: Dict) -> str:
         """Compute HMAC signature of data."""
-        canonical = json.dumps(data, sort_keys=True, separators=(',', ':'))
+        return self._sign_text(_canonical_json(data))
+
+    def _hash_text(self, canonical: str) -> str:
+        """SHA-256 of already-canonical JSON."""
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _sign_text(self, canonical: str) -> str:
+        """HMAC of already-canonical JSON."""
         return hmac.new(self._signing_key, canonical.encode(), hashlib.sha256).hexdigest()
 
+    def _expected_digests(self, entry: OzolithEntry) -> Tuple[str, str]:
+        """
+        (signature, entry_hash) the entry's current content should have.
+
+        Always re-encodes the payload - never the append-time cache - so
+        changes made after the fact are caught.
+        """
+        payload_json = _canonical_json(entry.payload)
+        expected_hash = self._hash_text(_canonical_entry_text(entry, payload_json, True))
+        expected_sig = self._sign_text(_canonical_entry_text(entry, payload_json, False))
+        return expected_sig, expected_hash
+
     def _build_entry_for_hashing(self, entry: OzolithEntry) -> Dict:
         """Build dict for hashing (excludes entry_hash itself)."""
         return {
@@ -299,17 +2220,129 @@ class Ozolith:
             OzolithWriteError: If the entry cannot be persisted to disk.
                 In this case, the in-memory state is NOT modified.
         """
-        # Calculate next sequence (but don't commit yet)
-        next_sequence = self._sequence + 1
+        if self._writer is not None:
+            entry = self._append_grouped(event_type, context_id, actor, payload)
+        else:
+            with self._append_lock:
+                # Calculate next sequence (but don't commit yet)
+                next_sequence = self._sequence + 1
 
-        # Get previous hash (empty for first entry)
-        previous_hash = ""
-        if self._entries:
-            previous_hash = self._entries[-1].entry_hash
+                # Get previous hash (empty for first entry)
+                previous_hash = ""
+                if self._entries:
+                    previous_hash = self._entries[-1].entry_hash
+
+                entry = self._build_entry(event_type, context_id, actor, payload,
+                                          next_sequence, previous_hash)
+
+                # CRITICAL: Save to disk FIRST, before updating in-memory state.
+                # If save fails, we raise OzolithWriteError and memory stays unchanged.
+                # This prevents desync between disk and memory.
+                line = self._serialize_entry(entry)
+                self._save_entry(entry, line)
+
+                # Only after successful save do we update in-memory state
+                self._commit([entry], len(line) + 1)
+
+        # Check anchor policy
+        # Note: ANCHOR_CREATED events skip this check to prevent recursion -
+        # create_anchor() calls append(ANCHOR_CREATED), which would trigger
+        # another anchor if we didn't exclude it. Circular logic makes no sense.
+        if event_type != OzolithEventType.ANCHOR_CREATED:
+            with self._anchor_lock:
+                if self.anchor_policy.should_anchor(entry, skinflap_score):
+                    self.create_anchor(trigger_reason=self.anchor_policy.get_trigger_reason(entry, skinflap_score))
+                    self.anchor_policy.record_anchor()
+
+        return entry
+
+    def append_many(
+        self,
+        events: List[Tuple[OzolithEventType, str, str, Dict]]
+    ) -> List[OzolithEntry]:
+        """
+        Append several entries, chained in order, with one write + fsync.
+
+        Each event is (event_type, context_id, actor, payload). Same guarantee
+        as append(): if the write fails, OzolithWriteError is raised and none
+        of the entries appear in memory or on disk. With group_commit the
+        list is flushed as one unit, even past commit_max_batch, so it is
+        all-or-nothing there too.
+
+        Returns:
+            The created entries, in order
+        """
+        if not events:
+            return []
+
+        if self._writer is not None:
+            entries = self._append_many_grouped(events)
+        else:
+            with self._append_lock:
+                entries = []
+                sequence = self._sequence
+                previous_hash = self._entries[-1].entry_hash if self._entries else ""
+                for event_type, context_id, actor, payload in events:
+                    entry = self._build_entry(event_type, context_id, actor, payload,
+                                              sequence + 1, previous_hash)
+                    entries.append(entry)
+                    sequence, previous_hash = entry.sequence, entry.entry_hash
+
+                lines = [self._serialize_entry(entry) for entry in entries]
+                self._save_entries(lines)
+                self._commit(entries, sum(len(line) + 1 for line in lines))
+
+        # Same anchor policy check as append(), per entry
+        with self._anchor_lock:
+            for entry in entries:
+                if entry.event_type == OzolithEventType.ANCHOR_CREATED:
+                    continue
+                if self.anchor_policy.should_anchor(entry, None):
+                    self.create_anchor(trigger_reason=self.anchor_policy.get_trigger_reason(entry, None))
+                    self.anchor_policy.record_anchor()
+
+        return entries
 
+    def _append_many_grouped(
+        self,
+        events: List[Tuple[OzolithEventType, str, str, Dict]]
+    ) -> List[OzolithEntry]:
+        """Group commit append_many(): chain every entry, queue them as one unit, wait on it."""
+        writer = self._writer
+        with self._append_lock:
+            entries = []
+            sequence, previous_hash = self._pending_sequence, self._pending_hash
+            for event_type, context_id, actor, payload in events:
+                entry = self._build_entry(event_type, context_id, actor, payload,
+                                          sequence + 1, previous_hash)
+                entries.append(entry)
+                sequence, previous_hash = entry.sequence, entry.entry_hash
+
+            # Built them all first, so a bad payload queues nothing
+            writer.announce()
+            ticket = writer.submit_many([(entry, self._serialize_entry(entry)) for entry in entries])
+            self._pending_sequence, self._pending_hash = sequence, previous_hash
+
+        try:
+            writer.wait(ticket)
+        except OSError as e:
+            raise OzolithWriteError(f"Failed to write entries: {e}") from e
+
+        return entries
+
+    def _build_entry(
+        self,
+        event_type: OzolithEventType,
+        context_id: str,
+        actor: str,
+        payload: Dict,
+        sequence: int,
+        previous_hash: str
+    ) -> OzolithEntry:
+        """Build a signed, hashed entry (not yet saved)."""
         # Build entry without hash/signature first
         entry = OzolithEntry(
-            sequence=next_sequence,
+            sequence=sequence,
             timestamp=datetime.utcnow().isoformat() + "Z",
             previous_hash=previous_hash,
             event_type=event_type,
@@ -318,38 +2351,50 @@ class Ozolith:
             payload=payload
         )
 
+        # Encode the payload once; signing, hashing and the log line share it
+        payload_json = _canonical_json(payload)
+        entry._canonical_payload = payload_json
+
         # Compute signature (signs the content)
-        content_for_signing = {
-            'sequence': entry.sequence,
-            'timestamp': entry.timestamp,
-            'previous_hash': entry.previous_hash,
-            'event_type': entry.event_type.value,
-            'context_id': entry.context_id,
-            'actor': entry.actor,
-            'payload': entry.payload
-        }
-        entry.signature = self._compute_signature(content_for_signing)
+        entry.signature = self._sign_text(_canonical_entry_text(entry, payload_json, False))
 
         # Compute entry hash (includes signature)
-        entry.entry_hash = self._compute_hash(self._build_entry_for_hashing(entry))
+        entry.entry_hash = self._hash_text(_canonical_entry_text(entry, payload_json, True))
+
+        return entry
 
-        # CRITICAL: Save to disk FIRST, before updating in-memory state.
-        # If save fails, we raise OzolithWriteError and memory stays unchanged.
-        # This prevents desync between disk and memory.
-        self._save_entry(entry)
+    def _append_grouped(
+        self,
+        event_type: OzolithEventType,
+        context_id: str,
+        actor: str,
+        payload: Dict
+    ) -> OzolithEntry:
+        """
+        Group commit append: chain onto the pending tip, then wait for the
+        batch containing this entry to be fsync'd and committed to memory.
 
-        # Only after successful save do we update in-memory state
-        self._sequence = next_sequence
-        self._entries.append(entry)
+        Same guarantee as the plain path - if the write fails, this raises
+        OzolithWriteError and the entry never appears in memory.
+        """
+        writer = self._writer
+        writer.announce()
+        ticket = None
+        try:
+            with self._append_lock:
+                entry = self._build_entry(event_type, context_id, actor, payload,
+                                          self._pending_sequence + 1, self._pending_hash)
+                ticket = writer.submit((entry, self._serialize_entry(entry)))
+                self._pending_sequence = entry.sequence
+                self._pending_hash = entry.entry_hash
+        finally:
+            if ticket is None:
+                writer.withdraw()
 
-        # Check anchor policy
-        # Note: ANCHOR_CREATED events skip this check to prevent recursion -
-        # create_anchor() calls append(ANCHOR_CREATED), which would trigger
-        # another anchor if we didn't exclude it. Circular logic makes no sense.
-        if event_type != OzolithEventType.ANCHOR_CREATED and \
-           self.anchor_policy.should_anchor(entry, skinflap_score):
-            self.create_anchor(trigger_reason=self.anchor_policy.get_trigger_reason(entry, skinflap_score))
-            self.anchor_policy.record_anchor()
+        try:
+            writer.wait(ticket)
+        except OSError as e:
+            raise OzolithWriteError(f"Failed to write entry: {e}") from e
 
         return entry
 
@@ -359,22 +2404,34 @@ class Ozolith:
         end_seq: Optional[int] = None
     ) -> List[OzolithEntry]:
         """Get entries in sequence range (inclusive)."""
-        entries = self._entries
+        if start_seq is None and end_seq is None:
+            return list(self._entries)
+
+        span = self._index.seq_span(start_seq, end_seq)
+        if span is not None:
+            return self._entries[span[0]:span[1]]
 
+        # Sequences out of order (raced writers) - scan
+        entries = self._entries
         if start_seq is not None:
             entries = [e for e in entries if e.sequence >= start_seq]
         if end_seq is not None:
             entries = [e for e in entries if e.sequence <= end_seq]
 
-        return entries
+        return list(entries)
+
+    def _at_positions(self, positions: List[int]) -> List[OzolithEntry]:
+        """Resolve index positions to entries."""
+        entries = self._entries
+        return [entries[p] for p in positions]
 
     def get_by_context(self, context_id: str) -> List[OzolithEntry]:
         """Get all entries for a specific context."""
-        return [e for e in self._entries if e.context_id == context_id]
+        return self._at_positions(self._index.positions_for_context(context_id))
 
     def get_by_type(self, event_type: OzolithEventType) -> List[OzolithEntry]:
         """Get all entries of a specific type."""
-        return [e for e in self._entries if e.event_type == event_type]
+        return self._at_positions(self._index.positions_for_type(event_type.value))
 
     def get_around(self, sequence: int, window: int = 5) -> List[OzolithEntry]:
         """Get entries around a specific sequence (for error forensics)."""
@@ -399,14 +2456,19 @@ class Ozolith:
             yesterday = datetime.now() - timedelta(days=1)
             entries = oz.get_by_timerange(start=yesterday)
         """
-        entries = self._entries
+        start_iso = start.isoformat() if start is not None else None
+        end_iso = end.isoformat() if end is not None else None
 
-        if start is not None:
-            start_iso = start.isoformat()
+        # Hour buckets narrow the candidates; exact compare trims the edges
+        entries = self._at_positions(self._index.positions_in_buckets(
+            _timestamp_bucket(start_iso) if start_iso else None,
+            _timestamp_bucket(end_iso) if end_iso else None
+        ))
+
+        if start_iso is not None:
             entries = [e for e in entries if e.timestamp >= start_iso]
 
-        if end is not None:
-            end_iso = end.isoformat()
+        if end_iso is not None:
             entries = [e for e in entries if e.timestamp <= end_iso]
 
         return entries
@@ -477,10 +2539,10 @@ class Ozolith:
 
         Returns None if not found.
         """
-        for entry in self._entries:
-            if entry.sequence == sequence:
-                return entry
-        return None
+        position = self._index.position_of(sequence)
+        if position is None:
+            return None
+        return self._entries[position]
 
     def get_uncertain_exchanges(self, threshold: float = 0.6) -> List[OzolithEntry]:
         """
@@ -517,71 +2579,327 @@ class Ozolith:
     # VERIFICATION
     # =========================================================================
 
-    def verify_chain(self) -> Tuple[bool, Optional[int]]:
+    def verify_chain(self, full: bool = False) -> Tuple[bool, Optional[int]]:
         """
-        Walk the entire chain and verify integrity.
+        Verify chain integrity.
+
+        Incremental by default: entries covered by the verification checkpoint
+        are skipped and only those appended since are re-hashed. The checkpoint
+        records the last verified sequence and hash plus the byte extent and
+        sha256 of every log file it covers, so the on-disk bytes are confirmed
+        with a raw checksum (once per process) instead of re-hashing each
+        entry. A successful run advances the checkpoint to the tip.
+
+        Entries changed in memory after they were verified are only caught by
+        full=True, which walks the entire chain from genesis - run that on a
+        schedule (see ChainVerificationJob) rather than inline.
 
         Returns:
             (True, None) if valid
             (False, sequence) if invalid - sequence is first broken entry
         """
-        if not self._entries:
+        with self._verify_lock:
+            return self._verify_chain_unlocked(full)
+
+    def _verify_chain_unlocked(self, full: bool) -> Tuple[bool, Optional[int]]:
+        """verify_chain() body. Caller holds _verify_lock."""
+        with self._state_lock:
+            count = len(self._entries)
+            extent = self._log_extent()
+            tip = self._entries[-1] if count else None
+
+        if not count:
             return True, None
 
-        previous_hash = ""
+        start, previous_hash = 0, ""
+        if not full and self._checkpoint_usable(count, extent):
+            start = self._checkpoint['position']
+            previous_hash = self._checkpoint['entry_hash']
 
-        for entry in self._entries:
+        entries = self._entries if start == 0 and count == len(self._entries) else self._entries[start:count]
+        for entry in entries:
             # Check chain link
             if entry.previous_hash != previous_hash:
                 return False, entry.sequence
 
+            expected_sig, expected_hash = self._expected_digests(entry)
+
             # Verify entry hash
-            expected_hash = self._compute_hash(self._build_entry_for_hashing(entry))
             if entry.entry_hash != expected_hash:
                 return False, entry.sequence
 
             # Verify signature
-            content_for_signing = {
-                'sequence': entry.sequence,
-                'timestamp': entry.timestamp,
-                'previous_hash': entry.previous_hash,
-                'event_type': entry.event_type.value,
-                'context_id': entry.context_id,
-                'actor': entry.actor,
-                'payload': entry.payload
-            }
-            expected_sig = self._compute_signature(content_for_signing)
             if entry.signature != expected_sig:
                 return False, entry.sequence
 
             previous_hash = entry.entry_hash
 
+        self._advance_checkpoint(count, tip, extent, full=(start == 0))
         return True, None
 
+    def verify_chain_parallel(
+        self,
+        workers: Optional[int] = None,
+        min_entries: int = 5000
+    ) -> Tuple[bool, Optional[int]]:
+        """
+        Full verification spread over worker processes.
+
+        The log is cut into ranges at anchor boundaries (long stretches
+        without anchors are cut further so every worker gets a share); each
+        range is hashed in a ProcessPoolExecutor, then the ranges' boundary
+        hashes are stitched together to confirm they link up. Returns the
+        same thing verify_chain(full=True) would, including which sequence
+        broke first, and advances the checkpoint the same way.
+
+        Logs under min_entries (or workers=1) are verified in-process -
+        starting the pool costs more than it saves.
+
+        Args:
+            workers: Worker processes (defaults to the CPU count)
+            min_entries: Smallest log worth parallelizing
+        """
+        workers = workers or os.cpu_count() or 1
+        with self._verify_lock:
+            with self._state_lock:
+                count = len(self._entries)
+                extent = self._log_extent()
+                tip = self._entries[-1] if count else None
+                cuts = self._verification_ranges(count, workers)
+
+            if count < max(min_entries, 1) or workers < 2 or len(cuts) < 3:
+                return self._verify_chain_unlocked(True)
+
+            entries = self._entries
+            batches = []
+            for start, end in zip(cuts, cuts[1:]):
+                batches.append([
+                    (e.sequence, e.timestamp, e.previous_hash, e.event_type.value, e.context_id,
+                     e.actor, e.payload, e.signature, e.entry_hash)
+                    for e in entries[start:end]
+                ])
+
+            try:
+                with ProcessPoolExecutor(max_workers=min(workers, len(batches))) as pool:
+                    results = list(pool.map(_verify_range, [self._signing_key] * len(batches), batches))
+            except (OSError, BrokenProcessPool):
+                return self._verify_chain_unlocked(True)
+
+            # Stitch: each range must start where the previous one ended
+            previous_hash = ""
+            for batch, (bad_sequence, first_previous, last_hash) in zip(batches, results):
+                if first_previous != previous_hash:
+                    return False, batch[0][0]
+                if bad_sequence is not None:
+                    return False, bad_sequence
+                previous_hash = last_hash
+
+            self._advance_checkpoint(count, tip, extent, full=True)
+            return True, None
+
+    def _verification_ranges(self, count: int, workers: int) -> List[int]:
+        """
+        Positions to cut the log at for parallel verification.
+
+        Cuts fall on anchor boundaries, merged until a range holds about
+        count / (4 * workers) entries; a longer stretch without an anchor
+        is cut at that size.
+        """
+        target = max(-(-count // (workers * 4)), 1)
+        boundaries = sorted({a.entry_count for a in self._anchors if 0 < a.entry_count < count})
+        boundaries.append(count)
+
+        cuts = [0]
+        for boundary in boundaries:
+            while boundary - cuts[-1] > 2 * target:
+                cuts.append(cuts[-1] + target)
+            if boundary - cuts[-1] >= target or boundary == count:
+                cuts.append(boundary)
+        return cuts
+
+    def _log_extent(self) -> List[Tuple[str, int]]:
+        """(path, bytes) of the log files holding committed entries. Call under _state_lock."""
+        if self.segment_size:
+            return self._entries.extent()
+        return [(self.storage_path, self._log_bytes)] if self._log_bytes else []
+
+    def _checkpoint_usable(self, count: int, extent: List[Tuple[str, int]]) -> bool:
+        """
+        Can verification resume from the checkpoint?
+
+        The checkpointed tip must still be in place, and (first time in this
+        process) every file it covers must still hash to what was recorded.
+        """
+        checkpoint = self._checkpoint
+        if not checkpoint or not 0 < checkpoint['position'] <= count:
+            return False
+
+        tip = self._entries[checkpoint['position'] - 1]
+        if tip.sequence != checkpoint['sequence'] or tip.entry_hash != checkpoint['entry_hash']:
+            return False
+
+        if self._checkpoint_confirmed:
+            return True
+
+        files = checkpoint['files']
+        if len(files) > len(extent):
+            return False
+        try:
+            for i, record in enumerate(files):
+                path, size = extent[i]
+                if os.path.basename(path) != record['name'] or size < record['bytes']:
+                    return False
+                if i < len(files) - 1 and size != record['bytes']:
+                    return False
+                digest = _file_digest(path, 0, record['bytes'])
+                if digest.hexdigest() != record['checksum']:
+                    return False
+        except OSError:
+            return False
+
+        if files:
+            self._checkpoint_digest = (files[-1]['name'], files[-1]['bytes'], digest)
+        self._checkpoint_confirmed = True
+        return True
+
+    def _advance_checkpoint(
+        self,
+        count: int,
+        tip: OzolithEntry,
+        extent: List[Tuple[str, int]],
+        full: bool
+    ):
+        """Move the checkpoint to a just-verified tip. Reads only bytes not yet checksummed."""
+        previous = self._checkpoint if self._checkpoint_confirmed else None
+        if previous and previous['position'] == count and not full:
+            return
+
+        known = {record['name']: record for record in previous['files']} if previous else {}
+        files = []
+        try:
+            for path, size in extent:
+                name = os.path.basename(path)
+                record = known.get(name)
+                if record and record['bytes'] == size:
+                    files.append(record)
+                    continue
+
+                cached = self._checkpoint_digest
+                if previous and cached and cached[0] == name and cached[1] <= size:
+                    digest = _file_digest(path, cached[1], size, cached[2].copy())
+                else:
+                    digest = _file_digest(path, 0, size)
+                self._checkpoint_digest = (name, size, digest)
+                files.append({'name': name, 'bytes': size, 'checksum': digest.hexdigest()})
+        except OSError:
+            return  # Can't checksum - keep the old checkpoint
+
+        now = datetime.utcnow().isoformat() + "Z"
+        checkpoint = {
+            'sequence': tip.sequence,
+            'position': count,
+            'entry_hash': tip.entry_hash,
+            'files': files,
+            'verified_at': now,
+            'full_verified_at': now if full else (previous or {}).get('full_verified_at'),
+        }
+
+        data = dict(checkpoint, signature=self._compute_signature(checkpoint))
+        temp_path = self.checkpoint_path + ".tmp"
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(temp_path, self.checkpoint_path)
+        except OSError:
+            pass  # Still good for this process; next one re-verifies more
+
+        self._checkpoint = checkpoint
+        self._checkpoint_confirmed = True
+
+    def verification_status(self) -> Dict:
+        """Where the verification checkpoint stands."""
+        checkpoint = self._checkpoint or {}
+        return {
+            'verified_through': checkpoint.get('sequence', 0),
+            'unverified_entries': len(self._entries) - checkpoint.get('position', 0),
+            'verified_at': checkpoint.get('verified_at'),
+            'full_verified_at': checkpoint.get('full_verified_at'),
+        }
+
     def verify_entry(self, sequence: int) -> bool:
         """Verify a single entry (checks hash and signature only, not chain)."""
-        entry = next((e for e in self._entries if e.sequence == sequence), None)
+        entry = self.get_entry_by_seq(sequence)
         if not entry:
             return False
 
+        expected_sig, expected_hash = self._expected_digests(entry)
+
         # Verify hash
-        expected_hash = self._compute_hash(self._build_entry_for_hashing(entry))
         if entry.entry_hash != expected_hash:
             return False
 
         # Verify signature
-        content_for_signing = {
-            'sequence': entry.sequence,
-            'timestamp': entry.timestamp,
-            'previous_hash': entry.previous_hash,
-            'event_type': entry.event_type.value,
-            'context_id': entry.context_id,
-            'actor': entry.actor,
-            'payload': entry.payload
-        }
-        expected_sig = self._compute_signature(content_for_signing)
         return entry.signature == expected_sig
 
+    def merkle_tree_size(self) -> int:
+        """Number of entries covered by the Merkle tree."""
+        return len(self._merkle_tree())
+
+    def merkle_root(self, tree_size: Optional[int] = None) -> str:
+        """Merkle root over the first tree_size entries (default: all of them)."""
+        with self._state_lock:
+            return self._merkle_tree().root(tree_size)
+
+    def inclusion_proof(self, sequence: int, tree_size: Optional[int] = None) -> Optional[Dict]:
+        """
+        O(log N) proof that an entry is in the log.
+
+        Check it with MerkleLayer.verify_proof(entry_hash, path, root) -
+        no other entries needed. Returns None if the sequence isn't in the
+        tree of that size.
+        """
+        position = self._index.position_of(sequence)
+        with self._state_lock:
+            tree = self._merkle_tree()
+            tree_size = len(tree) if tree_size is None else tree_size
+            if position is None or position >= tree_size:
+                return None
+            return {
+                'sequence': sequence,
+                'leaf_index': position,
+                'tree_size': tree_size,
+                'entry_hash': self._entries[position].entry_hash,
+                'path': [list(step) for step in tree.get_proof(position, tree_size)],
+                'root': tree.root(tree_size),
+            }
+
+    def consistency_proof(
+        self,
+        old_anchor: OzolithAnchor,
+        new_anchor: Optional[OzolithAnchor] = None
+    ) -> Dict:
+        """
+        O(log N) proof that the log at old_anchor is a prefix of the log at
+        new_anchor (default: the log now).
+
+        Check it with MerkleLayer.verify_consistency(old_size, new_size,
+        old_root, new_root, path).
+        """
+        with self._state_lock:
+            tree = self._merkle_tree()
+            old_size = old_anchor.entry_count
+            new_size = new_anchor.entry_count if new_anchor else len(tree)
+            return {
+                'old_anchor': old_anchor.anchor_id,
+                'new_anchor': new_anchor.anchor_id if new_anchor else None,
+                'old_size': old_size,
+                'new_size': new_size,
+                'old_root': old_anchor.merkle_root or tree.root(old_size),
+                'new_root': (new_anchor.merkle_root if new_anchor and new_anchor.merkle_root
+                             else tree.root(new_size)),
+                'path': tree.consistency_proof(old_size, new_size) if old_size else [],
+            }
+
     # =========================================================================
     # ANCHORING
     # =========================================================================
@@ -592,18 +2910,28 @@ class Ozolith:
 
         Export this and store somewhere you control for external verification.
         """
+        with self._anchor_lock:
+            return self._create_anchor_locked(trigger_reason)
+
+    def _create_anchor_locked(self, trigger_reason: str) -> OzolithAnchor:
         self._anchor_sequence += 1
 
-        first_seq = 1 if self._entries else 0
-        last_seq = self._entries[-1].sequence if self._entries else 0
+        # Snapshot the durable tip - group commits may land while we work
+        with self._state_lock:
+            first_seq = 1 if self._entries else 0
+            last_seq = self._entries[-1].sequence if self._entries else 0
+            root_hash = self.get_root_hash()
+            entry_count = len(self._entries)
+            merkle_root = self._merkle_tree().root(entry_count)
 
         anchor = OzolithAnchor(
             anchor_id=f"ANCHOR-{self._anchor_sequence}",
             timestamp=datetime.utcnow().isoformat() + "Z",
             sequence_range=(first_seq, last_seq),
-            root_hash=self.get_root_hash(),
-            entry_count=len(self._entries),
-            trigger_reason=trigger_reason
+            root_hash=root_hash,
+            entry_count=entry_count,
+            trigger_reason=trigger_reason,
+            merkle_root=merkle_root
         )
 
         # Sign the anchor
@@ -613,12 +2941,12 @@ class Ozolith:
             'sequence_range': list(anchor.sequence_range),
             'root_hash': anchor.root_hash,
             'entry_count': anchor.entry_count,
-            'trigger_reason': anchor.trigger_reason
+            'trigger_reason': anchor.trigger_reason,
+            'merkle_root': anchor.merkle_root
         }
         anchor.signature = self._compute_signature(anchor_content)
 
-        self._anchors.append(anchor)
-        self._save_anchors()
+        self._record_anchor(anchor)
 
         # Also log the anchor creation as an event
         self.append(
@@ -632,6 +2960,10 @@ class Ozolith:
             }
         )
 
+        with self._state_lock:
+            if self._aggregates_current:
+                self._save_aggregates()
+
         return anchor
 
     def verify_against_anchor(self, anchor: OzolithAnchor) -> bool:
@@ -639,29 +2971,53 @@ class Ozolith:
         Verify current log against a saved anchor.
 
         Returns True if log state matches anchor (no tampering since anchor).
+
+        O(log N): the anchor's tip entry is found through the index, and the
+        Merkle root over the first entry_count entries must equal the one
+        recorded in the anchor. Anchors from before the Merkle layer only get
+        the tip check. To re-hash every entry, use verify_chain().
         """
         # Check we have at least as many entries
         if len(self._entries) < anchor.entry_count:
             return False
 
-        # Get entries up to anchor point
+        if anchor.entry_count == 0:
+            return anchor.root_hash == ""
+
+        # The anchor's tip must be exactly entry_count entries in
         _, last_seq = anchor.sequence_range
-        entries_at_anchor = [e for e in self._entries if e.sequence <= last_seq]
+        position = self._index.position_of(last_seq)
+        if position != anchor.entry_count - 1:
+            return False
 
-        if len(entries_at_anchor) != anchor.entry_count:
+        tip = self._entries[position]
+        if tip.entry_hash != anchor.root_hash:
             return False
 
-        # Check root hash matches
-        if entries_at_anchor:
-            actual_root = entries_at_anchor[-1].entry_hash
-            return actual_root == anchor.root_hash
+        if not anchor.merkle_root:
+            return True
 
-        return anchor.root_hash == ""
+        with self._state_lock:
+            tree = self._merkle_tree()
+            if len(tree) < anchor.entry_count:
+                return False
+            return (tree.leaf(position) == _merkle_leaf(tip.entry_hash).hex() and
+                    tree.root(anchor.entry_count) == anchor.merkle_root)
 
     def get_anchors(self) -> List[OzolithAnchor]:
         """Get all anchors."""
         return self._anchors.copy()
 
+    def get_anchor(self, anchor_id: str) -> Optional[OzolithAnchor]:
+        """Look up one anchor by id (ANCHOR-N), or None."""
+        try:
+            position = self._anchor_positions.get(int(anchor_id.split('-')[1]))
+        except (IndexError, ValueError, AttributeError):
+            return None
+        if position is None or self._anchors[position].anchor_id != anchor_id:
+            return None
+        return self._anchors[position]
+
     def export_anchor(self, anchor_id: Optional[str] = None) -> Dict:
         """
         Export an anchor for external storage.
@@ -669,7 +3025,7 @@ class Ozolith:
         Returns dict that can be JSON serialized and stored elsewhere.
         """
         if anchor_id:
-            anchor = next((a for a in self._anchors if a.anchor_id == anchor_id), None)
+            anchor = self.get_anchor(anchor_id)
         else:
             anchor = self._anchors[-1] if self._anchors else None
 
@@ -684,6 +3040,7 @@ class Ozolith:
             'entry_count': anchor.entry_count,
             'signature': anchor.signature,
             'trigger_reason': anchor.trigger_reason,
+            'merkle_root': anchor.merkle_root,
             'export_time': datetime.utcnow().isoformat() + "Z"
         }
 
@@ -692,61 +3049,10 @@ class Ozolith:
     # =========================================================================
 
     def stats(self) -> Dict:
-        """Get OZOLITH statistics."""
-        by_type = {}
-        by_context = {}
-        by_actor = {}
-
-        # Enhanced stats tracking
-        confidences = []
-        uncertainty_flags = {}
-        corrections_by_type = {}
-        entries_by_hour = {h: 0 for h in range(24)}
-
-        for entry in self._entries:
-            # By type
-            type_key = entry.event_type.value
-            by_type[type_key] = by_type.get(type_key, 0) + 1
-
-            # By context
-            by_context[entry.context_id] = by_context.get(entry.context_id, 0) + 1
-
-            # By actor
-            by_actor[entry.actor] = by_actor.get(entry.actor, 0) + 1
-
-            # Time patterns (by hour)
-            try:
-                hour = int(entry.timestamp[11:13])
-                entries_by_hour[hour] += 1
-            except (ValueError, IndexError):
-                pass
-
-            # Exchange-specific stats
-            if entry.event_type == OzolithEventType.EXCHANGE:
-                # Confidence tracking
-                conf = entry.payload.get('confidence')
-                if conf is not None:
-                    confidences.append(conf)
-
-                # Uncertainty flags
-                flags = entry.payload.get('uncertainty_flags', [])
-                for flag in flags:
-                    uncertainty_flags[flag] = uncertainty_flags.get(flag, 0) + 1
-
-            # Correction stats
-            if entry.event_type == OzolithEventType.CORRECTION:
-                corr_type = entry.payload.get('correction_type', 'unknown')
-                corrections_by_type[corr_type] = corrections_by_type.get(corr_type, 0) + 1
-
-        # Calculate confidence distribution
-        confidence_distribution = {'low': 0, 'medium': 0, 'high': 0}
-        for c in confidences:
-            if c < 0.5:
-                confidence_distribution['low'] += 1
-            elif c < 0.8:
-                confidence_distribution['medium'] += 1
-            else:
-                confidence_distribution['high'] += 1
+        """Get OZOLITH statistics (read from the running aggregates)."""
+        counts = self.aggregates().counts()
+        by_type = counts['by_type']
+        by_context = counts['by_context']
 
         # Calculate correction rate
         total_exchanges = by_type.get('exchange', 0)
@@ -767,21 +3073,129 @@ class Ozolith:
             'root_hash': self.get_root_hash()[:16] + "..." if self.get_root_hash() else "",
             'by_type': by_type,
             'by_context': by_context,
-            'by_actor': by_actor,
+            'by_actor': counts['by_actor'],
             'first_entry': self._entries[0].timestamp if self._entries else None,
             'last_entry': self._entries[-1].timestamp if self._entries else None,
             'last_anchor': self._anchors[-1].timestamp if self._anchors else None,
             # Enhanced stats
-            'avg_confidence': sum(confidences) / len(confidences) if confidences else None,
-            'confidence_distribution': confidence_distribution,
-            'uncertainty_flag_counts': uncertainty_flags,
+            'avg_confidence': counts['avg_confidence'],
+            'confidence_distribution': counts['confidence_distribution'],
+            'uncertainty_flag_counts': counts['uncertainty_flag_counts'],
             'correction_rate': correction_rate,
-            'corrections_by_type': corrections_by_type,
-            'entries_by_hour': entries_by_hour,
+            'corrections_by_type': counts['corrections_by_type'],
+            'entries_by_hour': counts['entries_by_hour'],
             'most_active_contexts': most_active_contexts,
         }
 
 
+# =============================================================================
+# BACKGROUND VERIFICATION - Scheduled full chain walks
+# =============================================================================
+
+class ChainVerificationJob:
+    """
+    Background daemon thread that re-verifies the whole chain on a schedule.
+
+    verify_chain() is incremental, so entries tampered with after they were
+    verified are only caught by a full walk. This runs one every `interval`
+    seconds, off the request path:
+
+        job = ChainVerificationJob(ozolith, interval=3600, on_failure=alert)
+        job.start_verification_thread()
+        ...
+        job.stop_verification_thread()
+
+    run_once() does a single pass in the calling thread.
+    """
+
+    def __init__(
+        self,
+        ozolith: Ozolith,
+        interval: float = 3600,
+        on_failure: Optional[Callable[[Optional[int]], None]] = None,
+        parallel_workers: Optional[int] = None
+    ):
+        """
+        Args:
+            ozolith: Log to verify
+            interval: Seconds between full verifications
+            on_failure: Called with the first broken sequence when one fails
+            parallel_workers: If set, verify with verify_chain_parallel() using
+                this many worker processes
+        """
+        self.ozolith = ozolith
+        self.interval = interval
+        self.on_failure = on_failure
+        self.parallel_workers = parallel_workers
+
+        # Threading control
+        self.thread: Optional[threading.Thread] = None
+        self.stop_event = threading.Event()
+
+        # Results
+        self.last_run: Optional[datetime] = None
+        self.last_result: Optional[Tuple[bool, Optional[int]]] = None
+        self.last_duration_ms = 0.0
+        self.runs = 0
+
+    def run_once(self) -> Tuple[bool, Optional[int]]:
+        """Full verification now. Returns verify_chain()'s result."""
+        started = time.perf_counter()
+        if self.parallel_workers:
+            result = self.ozolith.verify_chain_parallel(workers=self.parallel_workers)
+        else:
+            result = self.ozolith.verify_chain(full=True)
+        self.last_duration_ms = (time.perf_counter() - started) * 1000
+        self.last_run = datetime.now()
+        self.last_result = result
+        self.runs += 1
+
+        if not result[0] and self.on_failure:
+            self.on_failure(result[1])
+        return result
+
+    def _verification_loop(self):
+        while not self.stop_event.wait(self.interval):
+            self.run_once()
+
+    def start_verification_thread(self) -> bool:
+        """
+        Start the background thread.
+
+        Returns:
+            True if started, False if already running
+        """
+        if self.is_running():
+            return False
+
+        self.thread = threading.Thread(
+            target=self._verification_loop,
+            name="OzolithVerificationThread",
+            daemon=True  # Dies when main program exits
+        )
+        self.stop_event.clear()
+        self.thread.start()
+        return True
+
+    def stop_verification_thread(self, timeout: float = 10) -> bool:
+        """
+        Stop the background thread (an in-progress pass finishes first).
+
+        Returns:
+            True if stopped cleanly, False if timeout
+        """
+        if not self.is_running():
+            return True
+
+        self.stop_event.set()
+        self.thread.join(timeout=timeout)
+        return not self.thread.is_alive()
+
+    def is_running(self) -> bool:
+        """Check if the background thread is active."""
+        return bool(self.thread and self.thread.is_alive())
+
+
 # =============================================================================
 # ANCHOR POLICY - When to create checkpoints
 # =============================================================================
@@ -1032,6 +3446,7 @@ class OzolithRenderer:
             f"│ Coverage: Entries #{first} - #{last}\n"
             f"│ Count:    {anchor.entry_count} entries\n"
             f"│ Root:     {anchor.root_hash[:24]}...\n"
+            f"│ Merkle:   {anchor.merkle_root[:24] or '(none)'}...\n"
             f"│ Trigger:  {anchor.trigger_reason}\n"
             f"│ Sig:      {anchor.signature[:16]}...\n"
             f"╰{'─' * 55}"
@@ -1096,60 +3511,342 @@ class OzolithRenderer:
 
         return '\n'.join(lines)
 
+    def render_query_plan(self, plan: Dict) -> str:
+        """An OzolithQuery.explain() plan, one step per line."""
+        lines = [
+            f"Query plan over {plan['total_entries']} entries "
+            f"(~{plan['estimated_candidates']} candidates)",
+        ]
+        for step in plan['access']:
+            lines.append(
+                f"  {step['role']:<9} {step['index']:<10} "
+                f"~{step['estimate']:<8} {step['predicate']}"
+            )
+        for predicate in plan['residual']:
+            lines.append(f"  {'filter':<9} {'-':<10} {'':<9} {predicate}")
+        return '\n'.join(lines)
+
 
 # =============================================================================
-# MERKLE LAYER - Future stub for O(log N) proofs
+# MERKLE LAYER - O(log N) inclusion and consistency proofs
 # =============================================================================
 
+def _merkle_leaf(entry_hash: str) -> bytes:
+    """RFC 6962 leaf hash of an entry hash."""
+    return hashlib.sha256(b'\x00' + entry_hash.encode()).digest()
+
+
+def _merkle_node(left: bytes, right: bytes) -> bytes:
+    """RFC 6962 interior node hash."""
+    return hashlib.sha256(b'\x01' + left + right).digest()
+
+
+def _merkle_node_count(leaves: int) -> int:
+    """Nodes stored for a tree of this many leaves (leaves + completed parents)."""
+    return 2 * leaves - bin(leaves).count('1')
+
+
+def _largest_power_below(n: int) -> int:
+    """Largest power of two strictly less than n (n > 1)."""
+    return 1 << ((n - 1).bit_length() - 1)
+
+
 class MerkleLayer:
     """
-    STUB: Merkle tree layer for O(log N) verification proofs.
+    Incremental Merkle tree over entry hashes (RFC 6962 / 9162 hashing).
 
-    Currently not implemented - full chain verification is used instead.
-    When needed, integrate pymerkle or merkly library here.
+    Leaf i is the i-th entry in the log. Only complete (power-of-two,
+    aligned) subtrees are stored, in postorder: appending a leaf writes the
+    leaf followed by any parents it completes. So the node for leaves
+    [start, start + 2^h) sits at a fixed offset and any tree size - including
+    every past anchor - can be proven from the same nodes:
 
-    Future interface:
         tree = MerkleLayer(entry_hashes)
         root = tree.root_hash
         proof = tree.get_proof(entry_index)
-        valid = tree.verify_proof(entry_hash, proof, root)
-
-    Libraries to consider:
-        - pymerkle: RFC 9162 compliant, handles tens of millions of entries
-          https://pypi.org/project/pymerkle/
-        - merkly: Simpler API, compatible with MerkleTreeJS
-          https://pypi.org/project/merkly/
-        - merklelib: Also well-maintained
-          https://pypi.org/project/merklelib/
-
-    When to implement:
-        - When log exceeds ~100k entries and verification becomes slow
-        - When external auditors need efficient proofs
-        - When partial verification is needed (prove single entry without full chain)
-
-    pip install pymerkle  # When ready
+        valid = MerkleLayer.verify_proof(entry_hash, proof, root)
+
+        path = tree.consistency_proof(old_size)
+        valid = MerkleLayer.verify_consistency(old_size, new_size, old_root, new_root, path)
+
+    With a path the nodes live in a binary sidecar (32 bytes each, no
+    framing) and are read with pread, so opening a large tree is O(log N).
+    The sidecar is derived data: it isn't fsync'd, and Ozolith re-syncs it
+    against the log on load.
     """
 
-    def __init__(self, entry_hashes: List[str]):
-        raise NotImplementedError(
-            "Merkle tree layer not yet implemented. "
-            "Use Ozolith.verify_chain() for full verification. "
-            "See: https://pypi.org/project/pymerkle/"
-        )
+    NODE_SIZE = 32
+
+    def __init__(self, entry_hashes: Optional[List[str]] = None, path: Optional[str] = None):
+        self.path = path
+        self._size = 0
+        self._peaks: List[Tuple[int, bytes]] = []   # (height, hash), left to right
+        self._memory = bytearray()
+        self._file = None
+
+        if path:
+            self._file = open(path, 'a+b')
+            node_bytes = os.fstat(self._file.fileno()).st_size
+            self.truncate(self._leaves_in(node_bytes // self.NODE_SIZE))
+
+        if entry_hashes:
+            self.extend(entry_hashes)
+
+    @staticmethod
+    def _leaves_in(node_count: int) -> int:
+        """Most leaves whose full node set fits in node_count nodes."""
+        leaves = node_count // 2
+        while _merkle_node_count(leaves + 1) <= node_count:
+            leaves += 1
+        while leaves and _merkle_node_count(leaves) > node_count:
+            leaves -= 1
+        return leaves
+
+    def __len__(self) -> int:
+        return self._size
+
+    # -------------------------------------------------------------------------
+    # Node storage
+    # -------------------------------------------------------------------------
+
+    def _handle(self):
+        """Sidecar file, reopened after close(). None when held in memory."""
+        if self._file is None and self.path:
+            self._file = open(self.path, 'a+b')
+        return self._file
+
+    def _read(self, position: int) -> bytes:
+        offset = position * self.NODE_SIZE
+        handle = self._handle()
+        if handle is not None:
+            return os.pread(handle.fileno(), self.NODE_SIZE, offset)
+        return bytes(self._memory[offset:offset + self.NODE_SIZE])
+
+    def _write(self, data: bytes):
+        if not self.path:
+            self._memory += data
+            return
+        try:
+            handle = self._handle()
+            handle.write(data)
+            handle.flush()
+        except OSError:
+            self._detach()
+            self._memory += data
+
+    def _detach(self):
+        """Sidecar unwritable - carry on in memory; the next load re-syncs it."""
+        handle, self._file, self.path = self._file, None, None
+        try:
+            handle.seek(0)
+            self._memory = bytearray(handle.read(_merkle_node_count(self._size) * self.NODE_SIZE))
+            handle.close()
+        except (OSError, AttributeError):
+            self._memory = bytearray()
+            self._size = 0
+            self._peaks = []
+
+    def truncate(self, leaves: int):
+        """Drop everything after the first `leaves` leaves."""
+        keep = _merkle_node_count(leaves) * self.NODE_SIZE
+        handle = self._handle()
+        if handle is not None:
+            handle.truncate(keep)
+        else:
+            del self._memory[keep:]
+        self._size = leaves
+
+        # Peaks are the complete subtrees named by the set bits of the size
+        self._peaks = []
+        start = 0
+        for height in range(leaves.bit_length() - 1, -1, -1):
+            if leaves & (1 << height):
+                self._peaks.append((height, self._read(self._position(start, height))))
+                start += 1 << height
+
+    def node_bytes(self) -> bytes:
+        """Every stored node, in postorder - the sidecar's contents."""
+        count = _merkle_node_count(self._size) * self.NODE_SIZE
+        handle = self._handle()
+        if handle is not None:
+            return os.pread(handle.fileno(), count, 0)
+        return bytes(self._memory[:count])
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @staticmethod
+    def _position(start: int, height: int) -> int:
+        """Storage position of the complete subtree over [start, start + 2^height)."""
+        return _merkle_node_count(start + (1 << height) - 1) + height
+
+    # -------------------------------------------------------------------------
+    # Building
+    # -------------------------------------------------------------------------
+
+    def append(self, entry_hash: str):
+        self.extend([entry_hash])
+
+    def extend(self, entry_hashes):
+        """Add leaves, writing their nodes in one go."""
+        out = bytearray()
+        for entry_hash in entry_hashes:
+            node = _merkle_leaf(entry_hash)
+            out += node
+            height = 0
+            while self._peaks and self._peaks[-1][0] == height:
+                node = _merkle_node(self._peaks.pop()[1], node)
+                height += 1
+                out += node
+            self._peaks.append((height, node))
+            self._size += 1
+        if out:
+            self._write(bytes(out))
+
+    def leaf(self, index: int) -> str:
+        """Stored leaf hash (hex) at index."""
+        return self._read(self._position(index, 0)).hex()
+
+    # -------------------------------------------------------------------------
+    # Roots and proofs (RFC 6962 section 2.1)
+    # -------------------------------------------------------------------------
+
+    def _subtree(self, start: int, end: int) -> bytes:
+        """MTH of leaves [start, end)."""
+        n = end - start
+        if n & (n - 1) == 0 and start % n == 0:
+            return self._read(self._position(start, n.bit_length() - 1))
+        k = _largest_power_below(n)
+        return _merkle_node(self._subtree(start, start + k), self._subtree(start + k, end))
+
+    def root(self, tree_size: Optional[int] = None) -> str:
+        """Root hash (hex) of the tree over the first tree_size leaves."""
+        if tree_size is None or tree_size == self._size:
+            if not self._peaks:
+                return hashlib.sha256(b'').hexdigest()
+            node = self._peaks[-1][1]
+            for _, peak in reversed(self._peaks[:-1]):
+                node = _merkle_node(peak, node)
+            return node.hex()
+        self._check_size(tree_size)
+        if tree_size == 0:
+            return hashlib.sha256(b'').hexdigest()
+        return self._subtree(0, tree_size).hex()
 
     @property
     def root_hash(self) -> str:
         """The root hash - represents entire tree."""
-        raise NotImplementedError()
+        return self.root()
 
-    def get_proof(self, index: int) -> List[tuple]:
-        """Get O(log N) proof for entry at index."""
-        raise NotImplementedError()
+    def _check_size(self, tree_size: int):
+        if not 0 <= tree_size <= self._size:
+            raise ValueError(f"Tree size {tree_size} out of range (have {self._size} leaves)")
+
+    def get_proof(self, index: int, tree_size: Optional[int] = None) -> List[tuple]:
+        """
+        Inclusion proof for leaf `index` in the tree of tree_size leaves.
+
+        Returns [(side, sibling_hex), ...] from the leaf up, where side says
+        whether the sibling sits to the 'left' or 'right'.
+        """
+        tree_size = self._size if tree_size is None else tree_size
+        self._check_size(tree_size)
+        if not 0 <= index < tree_size:
+            raise ValueError(f"Leaf {index} not in tree of size {tree_size}")
+
+        proof = []
+        start, end = 0, tree_size
+        while end - start > 1:
+            k = _largest_power_below(end - start)
+            if index < start + k:
+                proof.append(('right', self._subtree(start + k, end).hex()))
+                end = start + k
+            else:
+                proof.append(('left', self._subtree(start, start + k).hex()))
+                start += k
+        proof.reverse()
+        return proof
+
+    def consistency_proof(self, old_size: int, new_size: Optional[int] = None) -> List[str]:
+        """Proof (hex hashes) that the tree of old_size leaves is a prefix of new_size."""
+        new_size = self._size if new_size is None else new_size
+        self._check_size(new_size)
+        if not 0 < old_size <= new_size:
+            raise ValueError(f"Need 0 < old_size <= new_size, got {old_size}, {new_size}")
+
+        proof = []
+        m, start, end, complete = old_size, 0, new_size, True
+        while m != end - start:
+            k = _largest_power_below(end - start)
+            if m <= k:
+                proof.append(self._subtree(start + k, end))
+                end = start + k
+            else:
+                proof.append(self._subtree(start, start + k))
+                m -= k
+                start += k
+                complete = False
+        if not complete:
+            proof.append(self._subtree(start, end))
+        proof.reverse()
+        return [node.hex() for node in proof]
 
     @staticmethod
     def verify_proof(entry_hash: str, proof: List[tuple], root: str) -> bool:
         """Verify entry belongs to tree without walking full chain."""
-        raise NotImplementedError()
+        node = _merkle_leaf(entry_hash)
+        try:
+            for side, sibling in proof:
+                sibling = bytes.fromhex(sibling)
+                node = _merkle_node(sibling, node) if side == 'left' else _merkle_node(node, sibling)
+        except (TypeError, ValueError):
+            return False
+        return node.hex() == root
+
+    @staticmethod
+    def verify_consistency(
+        old_size: int,
+        new_size: int,
+        old_root: str,
+        new_root: str,
+        proof: List[str]
+    ) -> bool:
+        """Check a consistency proof (RFC 9162 section 2.1.4.2)."""
+        if old_size == new_size:
+            return not proof and old_root == new_root
+        if not 0 < old_size < new_size or not proof:
+            return False
+
+        try:
+            path = [bytes.fromhex(node) for node in proof]
+            if old_size & (old_size - 1) == 0:
+                path.insert(0, bytes.fromhex(old_root))
+        except (TypeError, ValueError):
+            return False
+
+        fn, sn = old_size - 1, new_size - 1
+        while fn & 1:
+            fn >>= 1
+            sn >>= 1
+
+        fr = sr = path[0]
+        for node in path[1:]:
+            if sn == 0:
+                return False
+            if fn & 1 or fn == sn:
+                fr = _merkle_node(node, fr)
+                sr = _merkle_node(node, sr)
+                while not fn & 1 and fn != 0:
+                    fn >>= 1
+                    sn >>= 1
+            else:
+                sr = _merkle_node(sr, node)
+            fn >>= 1
+            sn >>= 1
+
+        return sn == 0 and fr.hex() == old_root and sr.hex() == new_root
 
 
 # =============================================================================
@@ -1172,41 +3869,104 @@ class OzolithQuery:
             .execute()
 
     This finds: "exchanges in SB-5 where I was uncertain but the query was good"
+
+    Filters aren't applied one after another. Type, context, sequence,
+    time range and corrections are pushed down into the log's indexes;
+    those candidate position sets are intersected smallest-first, and only
+    the survivors are loaded and checked against what's left (actor and
+    payload predicates) - lazily, so first() stops at the first hit.
+    explain() shows the plan and its estimated cardinalities.
     """
 
+    # Intersecting with an access path means building its whole position
+    # set. Once that set is this many times bigger than the candidates we
+    # already have, checking the predicate per candidate is cheaper.
+    PROBE_RATIO = 8
+
     def __init__(self, ozolith: 'Ozolith'):
         self._ozolith = ozolith
-        self._filters = []
+        self._access = []       # Index-backed predicates
+        self._envelope = []     # Residual checks on entry fields
+        self._payload = []      # Residual checks on payload (evaluated last)
+
+    # -------------------------------------------------------------------------
+    # Builders
+    # -------------------------------------------------------------------------
+
+    def _add_access(self, predicate, index, estimate, fetch, check, exact=True):
+        self._access.append({
+            'predicate': predicate,
+            'index': index,
+            'estimate': estimate,
+            'fetch': fetch,
+            'check': check,
+            'exact': exact,
+        })
+        return self
 
     def by_type(self, event_type: OzolithEventType) -> 'OzolithQuery':
         """Filter by event type."""
-        self._filters.append(lambda e: e.event_type == event_type)
-        return self
+        index = self._ozolith._index
+        return self._add_access(
+            f"event_type = {event_type.value}", 'event_type',
+            lambda: index.estimate_type(event_type.value),
+            lambda: index.positions_for_type(event_type.value),
+            lambda e: e.event_type == event_type
+        )
 
     def by_types(self, event_types: List[OzolithEventType]) -> 'OzolithQuery':
         """Filter by multiple event types (OR)."""
-        self._filters.append(lambda e: e.event_type in event_types)
-        return self
+        index = self._ozolith._index
+        values = list(dict.fromkeys(t.value for t in event_types))
+        return self._add_access(
+            f"event_type in ({', '.join(values)})", 'event_type',
+            lambda: sum(index.estimate_type(v) for v in values),
+            lambda: sorted(p for v in values for p in index.positions_for_type(v)),
+            lambda e: e.event_type in event_types
+        )
 
     def by_context(self, context_id: str) -> 'OzolithQuery':
         """Filter by context ID."""
-        self._filters.append(lambda e: e.context_id == context_id)
-        return self
+        index = self._ozolith._index
+        return self._add_access(
+            f"context_id = {context_id}", 'context_id',
+            lambda: index.estimate_context(context_id),
+            lambda: index.positions_for_context(context_id),
+            lambda e: e.context_id == context_id
+        )
 
     def by_contexts(self, context_ids: List[str]) -> 'OzolithQuery':
         """Filter by multiple context IDs (OR)."""
-        self._filters.append(lambda e: e.context_id in context_ids)
-        return self
+        index = self._ozolith._index
+        values = list(dict.fromkeys(context_ids))
+        return self._add_access(
+            f"context_id in ({', '.join(values)})", 'context_id',
+            lambda: sum(index.estimate_context(c) for c in values),
+            lambda: sorted(p for c in values for p in index.positions_for_context(c)),
+            lambda e: e.context_id in context_ids
+        )
 
     def by_actor(self, actor: str) -> 'OzolithQuery':
         """Filter by actor."""
-        self._filters.append(lambda e: e.actor == actor)
+        self._envelope.append((f"actor = {actor}", lambda e: e.actor == actor))
         return self
 
     def in_sequence_range(self, start: int, end: int) -> 'OzolithQuery':
         """Filter by sequence range (inclusive)."""
-        self._filters.append(lambda e: start <= e.sequence <= end)
-        return self
+        predicate = f"sequence {start}..{end}"
+        check = lambda e: start <= e.sequence <= end
+
+        index = self._ozolith._index
+        if not index.ordered:
+            # No usable sequence index - same answers from a scan
+            self._envelope.append((predicate, check))
+            return self
+
+        def span():
+            lo, hi = index.seq_span(start, end)
+            return range(lo, hi)
+
+        return self._add_access(predicate, 'sequence', lambda: len(span()), span, check)
 
     def in_timerange(
         self,
@@ -1214,14 +3974,27 @@ class OzolithQuery:
         end: Optional[datetime] = None
     ) -> 'OzolithQuery':
         """Filter by time range."""
+        start_iso = start.isoformat() if start else None
+        end_iso = end.isoformat() if end else None
+
         def time_filter(e):
-            if start and e.timestamp < start.isoformat():
+            if start_iso and e.timestamp < start_iso:
                 return False
-            if end and e.timestamp > end.isoformat():
+            if end_iso and e.timestamp > end_iso:
                 return False
             return True
-        self._filters.append(time_filter)
-        return self
+
+        # Hour buckets give candidates; time_filter trims the edge buckets
+        start_bucket = _timestamp_bucket(start_iso) if start_iso else None
+        end_bucket = _timestamp_bucket(end_iso) if end_iso else None
+        index = self._ozolith._index
+        return self._add_access(
+            f"timestamp {start_iso or '-inf'}..{end_iso or '+inf'}", 'bucket',
+            lambda: index.estimate_buckets(start_bucket, end_bucket),
+            lambda: index.positions_in_buckets(start_bucket, end_bucket),
+            time_filter,
+            exact=False
+        )
 
     def where_payload(
         self,
@@ -1262,19 +4035,20 @@ class OzolithQuery:
                 return value in val
             return False
 
-        self._filters.append(payload_filter)
+        self._payload.append((f"payload.{key} {comparator} {value!r}", payload_filter))
         return self
 
     def has_payload_key(self, key: str) -> 'OzolithQuery':
         """Filter for entries that have a specific payload key."""
-        self._filters.append(lambda e: key in e.payload)
+        self._payload.append((f"payload has {key}", lambda e: key in e.payload))
         return self
 
     def has_uncertainty_flag(self, flag: str) -> 'OzolithQuery':
         """Filter for exchanges with a specific uncertainty flag."""
-        self._filters.append(
+        self._payload.append((
+            f"payload.uncertainty_flags contains {flag!r}",
             lambda e: flag in e.payload.get('uncertainty_flags', [])
-        )
+        ))
         return self
 
     def with_corrections(self) -> 'OzolithQuery':
@@ -1283,31 +4057,136 @@ class OzolithQuery:
             c.payload.get('original_exchange_seq')
             for c in self._ozolith.get_by_type(OzolithEventType.CORRECTION)
         }
-        self._filters.append(lambda e: e.sequence in corrected_seqs)
-        return self
+        predicate = f"sequence in corrected ({len(corrected_seqs)})"
+        check = lambda e: e.sequence in corrected_seqs
 
-    def execute(self) -> List[OzolithEntry]:
-        """Execute the query and return matching entries."""
-        results = self._ozolith._entries
+        index = self._ozolith._index
+        if not index.ordered:
+            # position_of only finds the first of duplicated sequences
+            self._envelope.append((predicate, check))
+            return self
 
-        for filter_fn in self._filters:
-            results = [e for e in results if filter_fn(e)]
+        def positions():
+            found = (index.position_of(seq) for seq in corrected_seqs if isinstance(seq, int))
+            return sorted(p for p in found if p is not None)
 
-        return results
+        return self._add_access(predicate, 'sequence', lambda: len(corrected_seqs), positions, check)
+
+    # -------------------------------------------------------------------------
+    # Planning
+    # -------------------------------------------------------------------------
+
+    def _plan(self, run: bool):
+        """
+        Choose access order and (if run) produce the candidate positions.
+
+        Returns (candidates, residual checks, plan steps). Without run, the
+        candidates are None and each step's role is what run would do
+        assuming the estimates hold.
+        """
+        total = len(self._ozolith._entries)
+        access = sorted(
+            ((a['estimate'](), n, a) for n, a in enumerate(self._access)),
+            key=lambda item: (item[0], item[1])
+        )
+
+        steps = []
+        probes = []
+        inexact = []
+        candidates = None
+        expected = total
+
+        for estimate, _, a in access:
+            step = {
+                'predicate': a['predicate'],
+                'index': a['index'],
+                'estimate': estimate,
+            }
+            steps.append(step)
+
+            if len(steps) == 1:
+                step['role'] = 'drive'
+                expected = estimate
+                if run:
+                    candidates = a['fetch']()
+                    expected = len(candidates)
+            elif estimate > self.PROBE_RATIO * expected:
+                # Cheaper to test the few candidates we have
+                step['role'] = 'probe'
+                probes.append((a['predicate'], a['check']))
+                continue
+            else:
+                step['role'] = 'intersect'
+                expected = min(expected, estimate)
+                if run:
+                    fetched = a['fetch']()
+                    lookup = fetched if isinstance(fetched, range) else set(fetched)
+                    candidates = [p for p in candidates if p in lookup]
+                    expected = len(candidates)
+
+            if not a['exact']:
+                inexact.append((a['predicate'], a['check']))
+
+        if not steps:
+            steps.append({'predicate': '*', 'index': 'scan', 'estimate': total, 'role': 'scan'})
+            if run:
+                candidates = range(total)
+
+        residual = inexact + probes + self._envelope + self._payload
+        return candidates, residual, steps
+
+    def explain(self) -> Dict:
+        """
+        Describe how the query would run, without running it.
+
+        Access steps are listed in execution order: the smallest one drives,
+        the next ones intersect, and any too big to be worth building become
+        per-entry probes. Estimates on a segmented log are manifest-based
+        upper bounds for sealed segments.
+        """
+        _, residual, steps = self._plan(run=False)
+        driven = [s for s in steps if s['role'] in ('drive', 'intersect', 'scan')]
+        return {
+            'total_entries': len(self._ozolith._entries),
+            'access': steps,
+            'residual': [predicate for predicate, _ in residual],
+            'estimated_candidates': min(s['estimate'] for s in driven),
+        }
+
+    # -------------------------------------------------------------------------
+    # Execution
+    # -------------------------------------------------------------------------
+
+    def _iter(self, reverse: bool = False, plan=None):
+        candidates, residual, _ = plan or self._plan(run=True)
+        checks = [check for _, check in residual]
+        entries = self._ozolith._entries
+
+        for position in (reversed(candidates) if reverse else candidates):
+            entry = entries[position]
+            if all(check(entry) for check in checks):
+                yield entry
+
+    def execute(self) -> List[OzolithEntry]:
+        """Execute the query and return matching entries."""
+        return list(self._iter())
 
     def count(self) -> int:
         """Execute and return count only."""
-        return len(self.execute())
+        plan = self._plan(run=True)
+        candidates, residual, _ = plan
+        if not residual:
+            # Index answer is exact - no need to load a single entry
+            return len(candidates)
+        return sum(1 for _ in self._iter(plan=plan))
 
     def first(self) -> Optional[OzolithEntry]:
         """Execute and return first match (or None)."""
-        results = self.execute()
-        return results[0] if results else None
+        return next(self._iter(), None)
 
     def last(self) -> Optional[OzolithEntry]:
         """Execute and return last match (or None)."""
-        results = self.execute()
-        return results[-1] if results else None
+        return next(self._iter(reverse=True), None)
 
 
 # =============================================================================
@@ -1468,6 +4347,11 @@ def export_incident(
 
     Creates a self-contained bundle with entries, context, and verification.
 
+    Verification doesn't walk the whole chain: each entry in the window is
+    re-hashed and carries a Merkle inclusion proof against the current root,
+    and the root is proven consistent with the latest anchor. Anyone holding
+    the bundle can re-check the proofs with MerkleLayer.
+
     Args:
         oz: Ozolith instance
         sequence: The sequence number of the incident
@@ -1483,6 +4367,34 @@ def export_incident(
     for entry in entries:
         corrections.extend(oz.get_corrections_for(entry.sequence))
 
+    # Consistency with the latest anchor fixes the tree size for everything else
+    anchor = next((a for a in reversed(oz.get_anchors()) if a.entry_count), None)
+    anchor_proof = None
+    if anchor and anchor.entry_count <= oz.merkle_tree_size():
+        anchor_proof = oz.consistency_proof(anchor)
+        tree_size = anchor_proof['new_size']
+        verified = MerkleLayer.verify_consistency(
+            anchor_proof['old_size'], anchor_proof['new_size'],
+            anchor_proof['old_root'], anchor_proof['new_root'], anchor_proof['path']
+        )
+    else:
+        tree_size = oz.merkle_tree_size()
+        verified = anchor is None
+    merkle_root = oz.merkle_root(tree_size)
+
+    # Each entry: intact, linked to its neighbour, and included under the root
+    proofs = {}
+    previous = None
+    for e in entries:
+        proof = oz.inclusion_proof(e.sequence, tree_size)
+        if (proof is None or not oz.verify_entry(e.sequence) or
+                not MerkleLayer.verify_proof(e.entry_hash, proof['path'], merkle_root)):
+            verified = False
+        if previous is not None and e.previous_hash != previous.entry_hash:
+            verified = False
+        proofs[e.sequence] = proof['path'] if proof else None
+        previous = e
+
     # Build export bundle
     return {
         'incident_sequence': sequence,
@@ -1496,7 +4408,8 @@ def export_incident(
                 'context_id': e.context_id,
                 'actor': e.actor,
                 'payload': e.payload,
-                'entry_hash': e.entry_hash
+                'entry_hash': e.entry_hash,
+                'inclusion_proof': proofs[e.sequence]
             }
             for e in entries
         ],
@@ -1509,8 +4422,11 @@ def export_incident(
             }
             for c in corrections
         ],
-        'chain_verified': oz.verify_chain()[0],
-        'root_hash_at_export': oz.get_root_hash()
+        'chain_verified': verified,
+        'root_hash_at_export': oz.get_root_hash(),
+        'merkle_root': merkle_root,
+        'tree_size': tree_size,
+        'anchor_consistency': anchor_proof
     }
 
 
@@ -1525,7 +4441,26 @@ def session_summary(oz: Ozolith, session_start_seq: int) -> Dict:
     Returns:
         Dict with session summary
     """
-    # Get all entries from session start onward
+    # Sessions opened by a SESSION_START are tallied as they're appended
+    session = oz.aggregates().session(session_start_seq) if oz._index.ordered else None
+    if session is not None:
+        by_type = session['by_type']
+        return {
+            'session_start_seq': session_start_seq,
+            'session_end_seq': session['end_seq'],
+            'duration': None,  # Would need to parse timestamps to calculate
+            'total_entries': session['total_entries'],
+            'exchanges': by_type.get(OzolithEventType.EXCHANGE.value, 0),
+            'sidebars_spawned': by_type.get(OzolithEventType.SIDEBAR_SPAWN.value, 0),
+            'sidebars_merged': by_type.get(OzolithEventType.SIDEBAR_MERGE.value, 0),
+            'corrections': by_type.get(OzolithEventType.CORRECTION.value, 0),
+            'errors': by_type.get(OzolithEventType.ERROR_LOGGED.value, 0),
+            'contexts_touched': session['contexts'],
+            'avg_confidence': session['avg_confidence'],
+            'session_complete': session['end_seq'] is not None
+        }
+
+    # Any other starting point: walk from there
     entries = oz.get_entries(start_seq=session_start_seq)
 
     # Find session end (if exists)
@@ -1582,41 +4517,38 @@ def find_learning_opportunities(oz: Ozolith) -> List[Dict]:
     Returns list of opportunities with context.
     """
     opportunities = []
+    low_conf, corrections, uncertain = oz.aggregates().learning_records()
 
     # Low confidence exchanges
-    low_conf = oz.get_uncertain_exchanges(threshold=0.5)
-    for entry in low_conf:
+    for record in low_conf:
         opportunities.append({
             'type': 'low_confidence',
-            'sequence': entry.sequence,
-            'confidence': entry.payload.get('confidence'),
-            'context_id': entry.context_id,
-            'reason': 'Confidence below 0.5 - what made this uncertain?'
+            'sequence': record['sequence'],
+            'confidence': record['confidence'],
+            'context_id': record['context_id'],
+            'reason': f"Confidence below {OzolithAggregates.LOW_CONFIDENCE} - what made this uncertain?"
         })
 
     # Corrected exchanges
-    corrections = oz.get_by_type(OzolithEventType.CORRECTION)
-    for corr in corrections:
+    for record in corrections:
         opportunities.append({
             'type': 'correction',
-            'sequence': corr.payload.get('original_exchange_seq'),
-            'correction_type': corr.payload.get('correction_type'),
-            'context_id': corr.context_id,
-            'reason': f"Corrected: {corr.payload.get('correction_notes', 'No notes')}"
+            'sequence': record['sequence'],
+            'correction_type': record['correction_type'],
+            'context_id': record['context_id'],
+            'reason': f"Corrected: {record['notes']}"
         })
 
     # Exchanges with explicit uncertainty flags
-    uncertain = oz.query().by_type(OzolithEventType.EXCHANGE).has_payload_key('uncertainty_flags').execute()
-    for entry in uncertain:
-        flags = entry.payload.get('uncertainty_flags', [])
-        if flags:
-            opportunities.append({
-                'type': 'uncertainty_flagged',
-                'sequence': entry.sequence,
-                'flags': flags,
-                'context_id': entry.context_id,
-                'reason': f"Uncertainty flags: {', '.join(flags)}"
-            })
+    for record in uncertain:
+        flags = record['flags']
+        opportunities.append({
+            'type': 'uncertainty_flagged',
+            'sequence': record['sequence'],
+            'flags': flags,
+            'context_id': record['context_id'],
+            'reason': f"Uncertainty flags: {', '.join(map(str, flags))}"
+        })
 
     return opportunities
 
@@ -1885,64 +4817,28 @@ def audit_corrections(oz: Ozolith) -> Dict[str, List[Dict]]:
     Returns:
         Dict with categorized issues
     """
+    recorded, targeted, correction_seqs = oz.aggregates().correction_issues()
+
     issues = {
         'orphan': [],           # Target doesn't exist
-        'unvalidated': [],      # No validation metadata
-        'needs_human_review': [], # Agent validated, human hasn't confirmed
+        'unvalidated': recorded['unvalidated'],  # No validation metadata
+        'needs_human_review': recorded['needs_human_review'], # Agent validated, human hasn't confirmed
         'correction_chains': [], # Corrections pointing to other corrections
-        'had_warnings': [],     # Corrections that had validation warnings
+        'had_warnings': recorded['had_warnings'],  # Corrections that had validation warnings
     }
 
-    corrections = oz.get_by_type(OzolithEventType.CORRECTION)
-
-    for corr in corrections:
-        seq = corr.sequence
-        target_seq = corr.payload.get('original_exchange_seq')
-
-        # Skip confirmation entries
-        if corr.payload.get('correction_type') == 'confirmation':
-            continue
-
-        # Check for orphan
-        if target_seq:
-            target = oz.get_entry_by_seq(target_seq)
-            if not target:
-                issues['orphan'].append({
-                    'correction_seq': seq,
-                    'target_seq': target_seq,
-                    'notes': corr.payload.get('correction_notes', '')[:50]
-                })
-            elif target.event_type == OzolithEventType.CORRECTION:
-                # Correction of correction
-                issues['correction_chains'].append({
-                    'correction_seq': seq,
-                    'corrects_correction_seq': target_seq,
-                    'notes': corr.payload.get('correction_notes', '')[:50]
-                })
-
-        # Check validation status
-        validation_status = corr.payload.get('validation_status')
-        if not validation_status or validation_status == 'pending':
-            issues['unvalidated'].append({
-                'correction_seq': seq,
-                'target_seq': target_seq,
-                'notes': corr.payload.get('correction_notes', '')[:50]
-            })
-        elif validation_status == 'validated' and not corr.payload.get('human_validated'):
-            issues['needs_human_review'].append({
-                'correction_seq': seq,
-                'target_seq': target_seq,
-                'notes': corr.payload.get('correction_notes', '')[:50],
-                'reasoning': corr.payload.get('correction_reasoning', '')[:50]
-            })
-
-        # Check for warnings that were ignored
-        warnings = corr.payload.get('validation_warnings', [])
-        if warnings:
-            issues['had_warnings'].append({
-                'correction_seq': seq,
-                'target_seq': target_seq,
-                'warnings': warnings
+    # Whether a target exists can change as the log grows, so these are
+    # resolved now - one index lookup per targeted correction
+    for record in targeted:
+        target_seq = record['target_seq']
+        if not isinstance(target_seq, int) or oz._index.position_of(target_seq) is None:
+            issues['orphan'].append(record)
+        elif target_seq in correction_seqs:
+            # Correction of correction
+            issues['correction_chains'].append({
+                'correction_seq': record['correction_seq'],
+                'corrects_correction_seq': target_seq,
+                'notes': record['notes']
             })
 
     return issues
@@ -1958,72 +4854,32 @@ def correction_analytics(oz: Ozolith) -> Dict:
     - Validation statistics
     - Failed validation count (if tracked)
     """
-    corrections = oz.get_by_type(OzolithEventType.CORRECTION)
-    exchanges = oz.get_by_type(OzolithEventType.EXCHANGE)
-
-    # Filter out confirmation entries
-    actual_corrections = [c for c in corrections
-                          if c.payload.get('correction_type') != 'confirmation']
-    confirmations = [c for c in corrections
-                     if c.payload.get('correction_type') == 'confirmation']
-
-    # Types breakdown
-    types_breakdown = {}
-    for corr in actual_corrections:
-        ctype = corr.payload.get('correction_type', 'unknown')
-        types_breakdown[ctype] = types_breakdown.get(ctype, 0) + 1
-
-    # Validation statistics
-    validated = [c for c in actual_corrections if c.payload.get('agent_validated')]
-    had_warnings = [c for c in actual_corrections if c.payload.get('validation_warnings')]
-
-    # Count human confirmations by looking at confirmation entries
-    # (since we can't modify the original correction entry)
-    confirmed_seqs = set()
-    for conf in confirmations:
-        confirmed_seq = conf.payload.get('confirms_correction_seq')
-        if confirmed_seq:
-            confirmed_seqs.add(confirmed_seq)
-
-    # Also count corrections that have human_validated=True directly (for future flexibility)
-    for c in actual_corrections:
-        if c.payload.get('human_validated'):
-            confirmed_seqs.add(c.sequence)
-
-    human_confirmed_count = len(confirmed_seqs)
-
-    # Corrections by context
-    by_context = {}
-    for corr in actual_corrections:
-        ctx = corr.context_id
-        by_context[ctx] = by_context.get(ctx, 0) + 1
-
-    # Corrections over time (by day)
-    by_day = {}
-    for corr in actual_corrections:
-        day = corr.timestamp[:10]  # YYYY-MM-DD
-        by_day[day] = by_day.get(day, 0) + 1
-
-    # Calculate rate
-    total_exchanges = len(exchanges)
-    total_corrections = len(actual_corrections)
+    counts = oz.aggregates().correction_counts()
+    by_day = counts['by_day']
+
+    # Calculate rate (confirmation entries aren't corrections)
+    total_exchanges = counts['exchanges']
+    total_corrections = counts['total']
     correction_rate = total_corrections / total_exchanges if total_exchanges > 0 else 0.0
 
+    # Human confirmations are counted from confirmation entries (we can't
+    # modify the original correction) plus corrections logged with
+    # human_validated=True directly
     return {
         'total_corrections': total_corrections,
-        'total_confirmations': len(confirmations),
+        'total_confirmations': counts['confirmations'],
         'correction_rate': correction_rate,
         'correction_rate_percent': f"{correction_rate * 100:.2f}%",
-        'types_breakdown': types_breakdown,
-        'by_context': by_context,
+        'types_breakdown': counts['by_type'],
+        'by_context': counts['by_context'],
         'by_day': by_day,
         # Validation stats
         'validation_stats': {
-            'total_validated': len(validated),
-            'human_confirmed': human_confirmed_count,
-            'awaiting_human_review': len(validated) - human_confirmed_count,
-            'had_warnings': len(had_warnings),
-            'unvalidated_legacy': len(actual_corrections) - len(validated),
+            'total_validated': counts['validated'],
+            'human_confirmed': counts['human_confirmed'],
+            'awaiting_human_review': counts['validated'] - counts['human_confirmed'],
+            'had_warnings': counts['had_warnings'],
+            'unvalidated_legacy': total_corrections - counts['validated'],
         },
         # Trends
         'improvement_trend': _calculate_improvement_trend(by_day) if len(by_day) > 1 else None,
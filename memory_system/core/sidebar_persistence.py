@@ -4,19 +4,25 @@ sidebar_persistence.py - SQLite persistence layer for sidebar state
 
 Handles saving/loading SidebarContext objects across API restarts.
 Uses JSON blobs for complex fields, matching the episodic_memory pattern.
+Exchanges and cross-refs live in append-only child tables (schema v4).
 
 Created: 2026-01-06
 Source: SIDEBAR_PERSISTENCE_IMPLEMENTATION.md
 """
 
+import atexit
 import sqlite3
 import json
 import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from contextlib import contextmanager
-from dataclasses import asdict
+from dataclasses import asdict, fields
 
 from datashapes import (
     SidebarContext,
@@ -35,7 +41,7 @@ def _get_ozolith():
     if _ozolith_instance is None:
         try:
             from ozolith import Ozolith
-            _ozolith_instance = Ozolith()
+            _ozolith_instance = Ozolith(group_commit=True)
         except ImportError:
             logger.warning("Ozolith not available - deletions will not be logged")
             return None
@@ -44,7 +50,286 @@ def _get_ozolith():
 logger = logging.getLogger(__name__)
 
 # Schema version - increment when schema changes
-SCHEMA_VERSION = 3
+SCHEMA_VERSION = 5
+
+# Prepared-statement cache per connection. The module runs a fixed set of
+# ~20 distinct queries; leave headroom so none get evicted.
+STATEMENT_CACHE_SIZE = 64
+
+# Loaded contexts whose lazily-read fields may stay in memory at once
+# (least recently hydrated/saved are dropped back to a header first).
+MAX_RESIDENT_CONTEXTS = 256
+
+# Rows fetched per round-trip by a header-only load
+HEADER_PAGE_SIZE = 500
+
+# Suggested coalesce_window: writes landing this close together (seconds)
+# share one transaction
+COALESCE_WINDOW = 0.005
+
+# Recursion bound for subtree walks, so a corrupt (cyclic) parent chain
+# can't make a recursive CTE run forever
+MAX_TREE_DEPTH = 1000
+
+# Stored-vs-actual tree position for every reachable context. Seeds are
+# roots (depth 0) and orphans whose parent row is gone (depth 1, as the
+# missing parent still counts); both are their own root_id.
+_TREE_CTE = '''
+    WITH RECURSIVE tree(id, depth, root) AS (
+        SELECT c.sidebar_id,
+               CASE WHEN c.parent_context_id IS NULL THEN 0 ELSE 1 END,
+               c.sidebar_id
+        FROM sidebar_contexts c
+        WHERE c.parent_context_id IS NULL
+           OR NOT EXISTS (SELECT 1 FROM sidebar_contexts p WHERE p.sidebar_id = c.parent_context_id)
+        UNION ALL
+        SELECT c.sidebar_id, tree.depth + 1, tree.root
+        FROM sidebar_contexts c JOIN tree ON c.parent_context_id = tree.id
+        WHERE tree.depth < {max_depth}
+    )
+'''.format(max_depth=MAX_TREE_DEPTH)
+
+# Columns a header-only load reads
+_HEADER_COLUMNS = (
+    'sidebar_id, uuid, parent_context_id, status, priority, '
+    'created_at, last_activity, task_description, participants_json'
+)
+
+
+class _PooledConnection(sqlite3.Connection):
+    """sqlite3.Connection that can be weakly referenced (for shutdown tracking)."""
+
+
+class _ConnectionManager:
+    """
+    One long-lived connection per thread for a single database file.
+
+    PRAGMAs are applied once, when a thread's connection is opened. Each
+    connection keeps a prepared-statement cache of STATEMENT_CACHE_SIZE.
+    close_all() closes every connection (registered with atexit), and any
+    thread that uses the manager afterwards gets a fresh one.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._open: "weakref.WeakSet[_PooledConnection]" = weakref.WeakSet()
+        self.opened = 0
+
+    def connection(self) -> sqlite3.Connection:
+        """This thread's connection, opening it if needed."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.generation == self._generation:
+            return conn
+
+        # Don't use PARSE_DECLTYPES - we handle all conversions manually
+        # This avoids issues with timestamp format (ISO vs space-separated)
+        # check_same_thread=False only so close_all() can close it; each
+        # connection is still used by its own thread alone.
+        conn = sqlite3.connect(
+            self.db_path,
+            factory=_PooledConnection,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        # Enable foreign keys and WAL mode for better performance
+        conn.execute('PRAGMA foreign_keys = ON')
+        conn.execute('PRAGMA journal_mode = WAL')
+
+        with self._lock:
+            self._open.add(conn)
+            self.opened += 1
+            self._local.generation = self._generation
+        self._local.conn = conn
+        self._local.depth = 0
+        return conn
+
+    def close_all(self):
+        """Close every thread's connection."""
+        with self._lock:
+            self._generation += 1
+            connections = list(self._open)
+            self._open.clear()
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.debug(f"Error closing connection: {e}")
+
+    @contextmanager
+    def transaction(self):
+        """
+        Yield this thread's connection; commit on success, roll back on error.
+
+        Nested uses share one transaction: only the outermost block commits
+        or rolls back.
+        """
+        conn = self.connection()
+        local = self._local
+        local.depth += 1
+        try:
+            yield conn
+            if local.depth == 1:
+                conn.commit()
+        except Exception:
+            if local.depth == 1:
+                conn.rollback()
+            raise
+        finally:
+            local.depth -= 1
+
+
+def _close_on_exit(manager_ref):
+    manager = manager_ref()
+    if manager is not None:
+        manager.close_all()
+
+
+def _flush_on_exit(coalescer_ref):
+    coalescer = coalescer_ref()
+    if coalescer is not None:
+        coalescer.stop()
+
+
+class _WriteCoalescer:
+    """
+    Merges writes that land within `window` seconds into one transaction.
+
+    Pending writes are keyed, e.g. ("context", sidebar_id): a repeat write
+    to a key replaces the pending one (last value wins) but keeps its first
+    position, so commit order still follows submission and parents precede
+    children. A background thread commits once per window; flush() commits
+    on the calling thread straight away.
+    """
+
+    def __init__(self, write_batch, window: float):
+        self._write_batch = write_batch
+        self.window = window
+        self._cond = threading.Condition()
+        self._drain_lock = threading.Lock()
+        self._pending: Dict[Tuple, Tuple] = {}
+        self._error: Optional[Exception] = None
+        self._stopped = False
+
+        self.submitted = 0
+        self.collapsed = 0
+        self.commits = 0
+
+        self._thread = threading.Thread(target=self._run, name="sidebar-write-coalescer", daemon=True)
+        self._thread.start()
+
+    def submit(self, key: Tuple, write: Tuple):
+        with self._cond:
+            self.submitted += 1
+            if key in self._pending:
+                self.collapsed += 1
+            self._pending[key] = write
+            self._cond.notify()
+
+    def flush(self):
+        """Commit everything submitted so far; re-raise a failed background commit."""
+        self._drain()
+        with self._cond:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self._thread.join()
+        self.flush()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+            time.sleep(self.window)     # Let the rest of the burst land
+            try:
+                self._drain()
+            except Exception as e:
+                logger.error(f"Coalesced sidebar write failed: {e}")
+                with self._cond:
+                    self._error = e
+
+    def _drain(self):
+        with self._drain_lock:
+            with self._cond:
+                batch, self._pending = self._pending, {}
+            if batch:
+                self._write_batch(list(batch.values()))
+                self.commits += 1
+
+
+_hydrate_lock = threading.RLock()
+
+# Persisted fields a header-only load leaves out (local_memory aside, which
+# is always fetched separately). Read together on first access.
+_BODY_FIELDS = (
+    'forked_from', 'coordinator_agent', 'success_criteria', 'failure_reason',
+    'child_sidebar_ids', 'inherited_memory', 'data_refs', 'cross_sidebar_refs',
+    'relevance_scores', 'active_focus', 'yarn_board_layout', 'display_names', 'tags',
+)
+
+# inherited_memory is a read-only snapshot, so it never needs a dirty check
+_DIGEST_FIELDS = tuple(f for f in _BODY_FIELDS if f != 'inherited_memory')
+
+
+class _LazySidebarContext(SidebarContext):
+    """
+    SidebarContext loaded from SidebarPersistence that fills itself in on demand.
+
+    local_memory is read from sidebar_exchanges on first access. A header-only
+    load also leaves out _BODY_FIELDS, fetched together the first time any of
+    them is read. The owning SidebarPersistence may drop both again once they
+    are saved (see max_resident).
+
+    Assigning local_memory replaces it outright and cancels the pending load.
+    Compares equal to a plain SidebarContext with the same field values.
+    """
+
+    @classmethod
+    def _partial(cls, source: 'SidebarPersistence', **values) -> '_LazySidebarContext':
+        context = cls.__new__(cls)
+        context.__dict__.update(values, _source=source, scratchpad=None)
+        return context
+
+    def __getattr__(self, name):
+        # Only reached for attributes missing from __dict__
+        source = self.__dict__.get('_source')
+        if source is not None and name in _BODY_FIELDS:
+            source._hydrate_body(self)
+            return self.__dict__[name]
+        raise AttributeError(name)
+
+    @property
+    def local_memory(self) -> List[Dict]:
+        state = self.__dict__
+        if '_local_memory' not in state:
+            state['_source']._hydrate_exchanges(self)
+        return state['_local_memory']
+
+    @local_memory.setter
+    def local_memory(self, value: List[Dict]):
+        self.__dict__['_local_memory'] = value
+
+    def _exchanges_loaded(self) -> bool:
+        return '_local_memory' in self.__dict__
+
+    def _body_loaded(self) -> bool:
+        return all(name in self.__dict__ for name in _BODY_FIELDS)
+
+    def __eq__(self, other):
+        if not isinstance(other, SidebarContext):
+            return NotImplemented
+        return all(getattr(self, f.name) == getattr(other, f.name) for f in fields(SidebarContext))
 
 
 class SidebarPersistence:
@@ -71,12 +356,24 @@ class SidebarPersistence:
         active = db.get_session_state('active_context_id')
     """
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_resident: int = MAX_RESIDENT_CONTEXTS,
+        coalesce_window: Optional[float] = None,
+    ):
         """
         Initialize persistence layer.
 
         Args:
             db_path: Path to SQLite file. Defaults to data/sidebar_state.db
+            max_resident: How many loaded contexts keep their lazily-read
+                fields (body and local_memory) in memory at once
+            coalesce_window: If set (e.g. COALESCE_WINDOW), save_context,
+                set_session_state and register_conversation_root are queued
+                and committed together once per window by a background
+                thread. Reads (and other writes) flush the queue first; call
+                flush() for durability.
         """
         if db_path is None:
             # Default location: same folder as episodic_memory.db
@@ -86,33 +383,119 @@ class SidebarPersistence:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        self._connections = _ConnectionManager(self.db_path)
+        atexit.register(_close_on_exit, weakref.ref(self._connections))
+
+        # id(context) -> context, least recently hydrated/saved first
+        self.max_resident = max_resident
+        self._resident: "OrderedDict[int, _LazySidebarContext]" = OrderedDict()
+
         # Initialize schema (with migrations if needed)
         self._init_schema()
 
+        self._coalescer: Optional[_WriteCoalescer] = None
+        if coalesce_window is not None:
+            self._coalescer = _WriteCoalescer(self._write_batch, coalesce_window)
+            # Registered after the connection manager, so it runs first at exit
+            atexit.register(_flush_on_exit, weakref.ref(self._coalescer))
+
         logger.info(f"Sidebar persistence initialized at {self.db_path}")
 
     @contextmanager
     def _get_connection(self):
-        """Get database connection with proper error handling."""
-        conn = None
+        """Get this thread's (reused) database connection with proper error handling."""
         try:
-            # Don't use PARSE_DECLTYPES - we handle all conversions manually
-            # This avoids issues with timestamp format (ISO vs space-separated)
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            # Enable foreign keys and WAL mode for better performance
-            conn.execute('PRAGMA foreign_keys = ON')
-            conn.execute('PRAGMA journal_mode = WAL')
-            yield conn
-            conn.commit()
+            with self._connections.transaction() as conn:
+                yield conn
         except Exception as e:
-            if conn:
-                conn.rollback()
             logger.error(f"Database error: {e}")
             raise
-        finally:
-            if conn:
-                conn.close()
+
+    def close(self):
+        """Commit queued writes and close all pooled connections. Later calls reopen as needed."""
+        if self._coalescer is not None:
+            self._coalescer.flush()
+        self._connections.close_all()
+
+    # =========================================================================
+    # WRITE BATCHING
+    # =========================================================================
+
+    @contextmanager
+    def batch(self):
+        """
+        Run this thread's writes in one transaction, committed on exit.
+
+        Inside the block writes bypass the coalescer and are never queued.
+
+        Usage:
+            with db.batch():
+                db.save_context(parent)
+                db.save_context(child)
+                db.set_session_state('active_context_id', child.sidebar_id)
+        """
+        self._sync_pending()
+        with self._get_connection():
+            yield self
+
+    def flush(self):
+        """
+        Commit any coalesced writes still queued.
+
+        Returns once they are durable; raises if they (or an earlier
+        background commit) failed. A no-op without write coalescing.
+        """
+        if self._coalescer is not None:
+            self._coalescer.flush()
+
+    def _in_batch(self) -> bool:
+        return getattr(self._connections._local, 'depth', 0) > 0
+
+    def _coalescing(self) -> bool:
+        return self._coalescer is not None and not self._in_batch()
+
+    def _sync_pending(self):
+        """Commit queued writes so the caller reads (or writes after) them."""
+        if self._coalescing():
+            self._coalescer.flush()
+
+    def _write_batch(self, writes: List[Tuple]):
+        """
+        Commit coalesced writes in one transaction. If that fails, retry each
+        on its own so one bad write doesn't lose the rest; the first error is
+        then re-raised.
+        """
+        try:
+            with self._get_connection() as conn:
+                for write in writes:
+                    self._apply_write(conn, write)
+        except Exception as batch_error:
+            logger.warning(f"Coalesced batch of {len(writes)} failed ({batch_error}); retrying one by one")
+            first_error = None
+            for write in writes:
+                try:
+                    with self._get_connection() as conn:
+                        self._apply_write(conn, write)
+                    if write[0] == 'context':
+                        self._after_save(write[1])
+                except Exception as e:
+                    first_error = first_error or e
+            if first_error is not None:
+                raise first_error
+            return
+
+        for write in writes:
+            if write[0] == 'context':
+                self._after_save(write[1])
+
+    def _apply_write(self, conn, write: Tuple):
+        kind, *args = write
+        if kind == 'context':
+            self._write_context(conn, *args)
+        elif kind == 'session':
+            self._write_session_state(conn, *args)
+        else:
+            self._write_conversation_root(conn, *args)
 
     def _init_schema(self):
         """Create database tables and run migrations."""
@@ -133,6 +516,12 @@ class SidebarPersistence:
                 if current_version < 3:
                     self._migrate_v2_to_v3(conn)
 
+                if current_version < 4:
+                    self._migrate_v3_to_v4(conn)
+
+                if current_version < 5:
+                    self._migrate_v4_to_v5(conn)
+
                 # Update version
                 conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
                 conn.commit()
@@ -232,6 +621,84 @@ class SidebarPersistence:
                 else:
                     raise
 
+    def _migrate_v3_to_v4(self, conn):
+        """
+        Move exchanges and cross-refs out of the context row into child tables.
+
+        Both are keyed by (sidebar_id, seq) and removed with their context.
+        Existing local_memory_json / cross_sidebar_refs_json blobs are copied
+        over (legacy list-format refs converted on the way) and then cleared.
+        """
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS sidebar_exchanges (
+                sidebar_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                exchange_json TEXT NOT NULL,
+                PRIMARY KEY (sidebar_id, seq),
+                FOREIGN KEY (sidebar_id) REFERENCES sidebar_contexts(sidebar_id) ON DELETE CASCADE
+            ) WITHOUT ROWID
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS sidebar_cross_refs (
+                sidebar_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                target_id TEXT NOT NULL,
+                metadata_json TEXT NOT NULL,
+                PRIMARY KEY (sidebar_id, seq),
+                UNIQUE (sidebar_id, target_id),
+                FOREIGN KEY (sidebar_id) REFERENCES sidebar_contexts(sidebar_id) ON DELETE CASCADE
+            ) WITHOUT ROWID
+        ''')
+
+        rows = conn.execute('''
+            SELECT sidebar_id, local_memory_json, cross_sidebar_refs_json
+            FROM sidebar_contexts
+            WHERE local_memory_json IS NOT NULL OR cross_sidebar_refs_json IS NOT NULL
+        ''').fetchall()
+        for row in rows:
+            sidebar_id = row['sidebar_id']
+            exchanges = json.loads(row['local_memory_json'] or '[]')
+            conn.executemany(
+                'INSERT OR IGNORE INTO sidebar_exchanges (sidebar_id, seq, exchange_json) VALUES (?, ?, ?)',
+                [(sidebar_id, seq, json.dumps(exchange)) for seq, exchange in enumerate(exchanges)]
+            )
+            refs = self._migrate_cross_refs(row['cross_sidebar_refs_json'], sidebar_id)
+            conn.executemany(
+                'INSERT OR IGNORE INTO sidebar_cross_refs (sidebar_id, seq, target_id, metadata_json) VALUES (?, ?, ?, ?)',
+                [(sidebar_id, seq, target_id, json.dumps(metadata))
+                 for seq, (target_id, metadata) in enumerate(refs.items())]
+            )
+
+        conn.execute('''
+            UPDATE sidebar_contexts
+            SET local_memory_json = NULL, cross_sidebar_refs_json = NULL
+        ''')
+        logger.info(f"v3->v4 migration: Moved exchanges and cross-refs for {len(rows)} contexts into child tables")
+
+    def _migrate_v4_to_v5(self, conn):
+        """Add stored depth and root_id columns (with indexes) and fill them in."""
+        for col, col_type in (('depth', 'INTEGER'), ('root_id', 'TEXT')):
+            try:
+                conn.execute(f'''
+                    ALTER TABLE sidebar_contexts
+                    ADD COLUMN {col} {col_type}
+                ''')
+                logger.info(f"v4->v5 migration: Added {col} column")
+            except sqlite3.OperationalError as e:
+                if "duplicate column name" in str(e).lower():
+                    logger.debug(f"{col} column already exists")
+                else:
+                    raise
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_contexts_depth ON sidebar_contexts(depth)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_contexts_root ON sidebar_contexts(root_id)')
+
+        rows = conn.execute(_TREE_CTE + 'SELECT id, depth, root FROM tree').fetchall()
+        conn.executemany(
+            'UPDATE sidebar_contexts SET depth = ?, root_id = ? WHERE sidebar_id = ?',
+            [(row['depth'], row['root'], row['id']) for row in rows]
+        )
+        logger.info(f"v4->v5 migration: Stored depth/root_id for {len(rows)} contexts")
+
     # =========================================================================
     # CONTEXT OPERATIONS
     # =========================================================================
@@ -240,7 +707,15 @@ class SidebarPersistence:
         """
         Save or update a SidebarContext.
 
-        Uses INSERT OR REPLACE for upsert behavior.
+        The context row is upserted in place (ON CONFLICT DO UPDATE, so child
+        rows are never cascaded away). local_memory is append-only: only
+        exchanges past the stored count are inserted, one row each.
+        inherited_memory is a read-only snapshot and is written on insert
+        only. Cross-refs are diffed against the stored rows. depth/root_id
+        are set on insert and, when the parent changes, for the whole subtree.
+
+        With write coalescing on (and outside batch()), the write is queued
+        and this returns at once; see flush().
 
         Args:
             context: The SidebarContext to save
@@ -248,48 +723,14 @@ class SidebarPersistence:
         Returns:
             True if successful
         """
+        if self._coalescing():
+            self._coalescer.submit(('context', context.sidebar_id), ('context', context))
+            return True
+
         try:
             with self._get_connection() as conn:
-                conn.execute('''
-                    INSERT OR REPLACE INTO sidebar_contexts (
-                        sidebar_id, uuid, parent_context_id, forked_from,
-                        original_conversation_id,
-                        status, priority, task_description, success_criteria,
-                        failure_reason, coordinator_agent,
-                        created_at, last_activity,
-                        child_sidebar_ids_json, participants_json,
-                        inherited_memory_json, local_memory_json,
-                        data_refs_json, cross_sidebar_refs_json,
-                        relevance_scores_json, active_focus_json,
-                        yarn_board_layout_json,
-                        display_names_json, tags_json
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    context.sidebar_id,
-                    context.uuid,
-                    context.parent_context_id,
-                    context.forked_from,
-                    getattr(context, 'original_conversation_id', None),
-                    context.status.value if isinstance(context.status, SidebarStatus) else context.status,
-                    context.priority.value if isinstance(context.priority, SidebarPriority) else context.priority,
-                    context.task_description,
-                    context.success_criteria,
-                    context.failure_reason,
-                    context.coordinator_agent,
-                    context.created_at.isoformat() if isinstance(context.created_at, datetime) else context.created_at,
-                    context.last_activity.isoformat() if isinstance(context.last_activity, datetime) else context.last_activity,
-                    json.dumps(context.child_sidebar_ids),
-                    json.dumps(context.participants),
-                    json.dumps(context.inherited_memory),
-                    json.dumps(context.local_memory),
-                    json.dumps(context.data_refs),
-                    json.dumps(context.cross_sidebar_refs),
-                    json.dumps(context.relevance_scores),
-                    json.dumps(context.active_focus),
-                    json.dumps(context.yarn_board_layout) if context.yarn_board_layout else None,
-                    json.dumps(context.display_names) if context.display_names else None,
-                    json.dumps(context.tags) if context.tags else None,
-                ))
+                self._write_context(conn, context)
+            self._after_save(context)
 
             logger.debug(f"Saved context {context.sidebar_id}")
             return True
@@ -298,6 +739,230 @@ class SidebarPersistence:
             logger.error(f"Failed to save context {context.sidebar_id}: {e}")
             raise
 
+    def _write_context(self, conn, context: SidebarContext):
+        """save_context's writes, inside the caller's transaction."""
+        stored = conn.execute(
+            'SELECT parent_context_id, depth, root_id FROM sidebar_contexts WHERE sidebar_id = ?',
+            (context.sidebar_id,)
+        ).fetchone()
+        exists = stored is not None
+        moved = exists and stored['parent_context_id'] != context.parent_context_id
+        if exists and not moved and stored['depth'] is not None:
+            depth, root_id = stored['depth'], stored['root_id']
+        else:
+            depth, root_id = self._tree_position(conn, context.sidebar_id, context.parent_context_id)
+        conn.execute('''
+            INSERT INTO sidebar_contexts (
+                sidebar_id, uuid, parent_context_id, forked_from,
+                original_conversation_id,
+                status, priority, task_description, success_criteria,
+                failure_reason, coordinator_agent,
+                created_at, last_activity,
+                child_sidebar_ids_json, participants_json,
+                inherited_memory_json,
+                data_refs_json,
+                relevance_scores_json, active_focus_json,
+                yarn_board_layout_json,
+                display_names_json, tags_json,
+                depth, root_id
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(sidebar_id) DO UPDATE SET
+                uuid = excluded.uuid,
+                parent_context_id = excluded.parent_context_id,
+                forked_from = excluded.forked_from,
+                original_conversation_id = excluded.original_conversation_id,
+                status = excluded.status,
+                priority = excluded.priority,
+                task_description = excluded.task_description,
+                success_criteria = excluded.success_criteria,
+                failure_reason = excluded.failure_reason,
+                coordinator_agent = excluded.coordinator_agent,
+                created_at = excluded.created_at,
+                last_activity = excluded.last_activity,
+                child_sidebar_ids_json = excluded.child_sidebar_ids_json,
+                participants_json = excluded.participants_json,
+                data_refs_json = excluded.data_refs_json,
+                relevance_scores_json = excluded.relevance_scores_json,
+                active_focus_json = excluded.active_focus_json,
+                yarn_board_layout_json = excluded.yarn_board_layout_json,
+                display_names_json = excluded.display_names_json,
+                tags_json = excluded.tags_json,
+                depth = excluded.depth,
+                root_id = excluded.root_id
+        ''', (
+            context.sidebar_id,
+            context.uuid,
+            context.parent_context_id,
+            context.forked_from,
+            getattr(context, 'original_conversation_id', None),
+            context.status.value if isinstance(context.status, SidebarStatus) else context.status,
+            context.priority.value if isinstance(context.priority, SidebarPriority) else context.priority,
+            context.task_description,
+            context.success_criteria,
+            context.failure_reason,
+            context.coordinator_agent,
+            context.created_at.isoformat() if isinstance(context.created_at, datetime) else context.created_at,
+            context.last_activity.isoformat() if isinstance(context.last_activity, datetime) else context.last_activity,
+            json.dumps(context.child_sidebar_ids),
+            json.dumps(context.participants),
+            None if exists else json.dumps(list(context.inherited_memory)),
+            json.dumps(context.data_refs),
+            json.dumps(context.relevance_scores),
+            json.dumps(context.active_focus),
+            json.dumps(context.yarn_board_layout) if context.yarn_board_layout else None,
+            json.dumps(context.display_names) if context.display_names else None,
+            json.dumps(context.tags) if context.tags else None,
+            depth,
+            root_id,
+        ))
+        if moved:
+            self._rebase_subtree(conn, context.sidebar_id, depth, root_id)
+
+        # An untouched lazy context has nothing new to append
+        if not isinstance(context, _LazySidebarContext) or context._exchanges_loaded():
+            self._sync_exchanges(conn, context.sidebar_id, context.local_memory)
+        self._sync_cross_refs(conn, context.sidebar_id, context.cross_sidebar_refs)
+
+    def _after_save(self, context: SidebarContext):
+        """Bookkeeping once a context's save has committed."""
+        if isinstance(context, _LazySidebarContext) and context.__dict__.get('_source') is self:
+            with _hydrate_lock:
+                self._track_resident(context)
+
+    def append_exchange(self, sidebar_id: str, exchange: Dict) -> int:
+        """
+        Append one exchange to a saved context's local memory.
+
+        A single-row INSERT; the context row itself is left alone.
+
+        Args:
+            sidebar_id: The (already saved) context to append to
+            exchange: The exchange dict
+
+        Returns:
+            The exchange's sequence number within the context
+        """
+        try:
+            self._sync_pending()
+            with self._get_connection() as conn:
+                seq = self._exchange_count(conn, sidebar_id)
+                conn.execute(
+                    'INSERT INTO sidebar_exchanges (sidebar_id, seq, exchange_json) VALUES (?, ?, ?)',
+                    (sidebar_id, seq, json.dumps(exchange))
+                )
+            return seq
+
+        except Exception as e:
+            logger.error(f"Failed to append exchange to {sidebar_id}: {e}")
+            raise
+
+    def _tree_position(self, conn, sidebar_id: str, parent_id: Optional[str]):
+        """(depth, root_id) for a context placed under parent_id."""
+        if parent_id is None:
+            return 0, sidebar_id
+        parent = conn.execute(
+            'SELECT depth, root_id FROM sidebar_contexts WHERE sidebar_id = ?',
+            (parent_id,)
+        ).fetchone()
+        if parent is None or parent['depth'] is None:
+            return 1, sidebar_id
+        return parent['depth'] + 1, parent['root_id']
+
+    def _rebase_subtree(self, conn, sidebar_id: str, depth: int, root_id: str):
+        """Re-derive depth/root_id for every descendant of a moved context."""
+        rows = conn.execute('''
+            WITH RECURSIVE sub(id, depth) AS (
+                SELECT sidebar_id, ? FROM sidebar_contexts WHERE parent_context_id = ?
+                UNION ALL
+                SELECT c.sidebar_id, sub.depth + 1
+                FROM sidebar_contexts c JOIN sub ON c.parent_context_id = sub.id
+                WHERE sub.depth < ?
+            )
+            SELECT id, depth FROM sub
+        ''', (depth + 1, sidebar_id, MAX_TREE_DEPTH)).fetchall()
+        conn.executemany(
+            'UPDATE sidebar_contexts SET depth = ?, root_id = ? WHERE sidebar_id = ?',
+            [(row['depth'], root_id, row['id']) for row in rows]
+        )
+
+    def _exchange_count(self, conn, sidebar_id: str) -> int:
+        # seq runs 0..n-1, so MAX(seq) is one index probe where COUNT(*) would scan
+        row = conn.execute(
+            'SELECT MAX(seq) FROM sidebar_exchanges WHERE sidebar_id = ?',
+            (sidebar_id,)
+        ).fetchone()
+        return 0 if row[0] is None else row[0] + 1
+
+    def _sync_exchanges(self, conn, sidebar_id: str, exchanges: List[Dict]):
+        """Insert exchanges past the stored count; drop stored ones past the list's end."""
+        stored = self._exchange_count(conn, sidebar_id)
+        if len(exchanges) > stored:
+            conn.executemany(
+                'INSERT INTO sidebar_exchanges (sidebar_id, seq, exchange_json) VALUES (?, ?, ?)',
+                [(sidebar_id, seq, json.dumps(exchanges[seq])) for seq in range(stored, len(exchanges))]
+            )
+        elif len(exchanges) < stored:
+            conn.execute(
+                'DELETE FROM sidebar_exchanges WHERE sidebar_id = ? AND seq >= ?',
+                (sidebar_id, len(exchanges))
+            )
+
+    def _sync_cross_refs(self, conn, sidebar_id: str, refs: Dict[str, Any]):
+        """Insert, update and delete cross-ref rows so they match refs."""
+        stored = {
+            row['target_id']: (row['seq'], row['metadata_json'])
+            for row in conn.execute(
+                'SELECT target_id, seq, metadata_json FROM sidebar_cross_refs WHERE sidebar_id = ?',
+                (sidebar_id,)
+            )
+        }
+        next_seq = max((seq for seq, _ in stored.values()), default=-1) + 1
+
+        for target_id in stored.keys() - refs.keys():
+            conn.execute(
+                'DELETE FROM sidebar_cross_refs WHERE sidebar_id = ? AND target_id = ?',
+                (sidebar_id, target_id)
+            )
+        for target_id, metadata in refs.items():
+            metadata_json = json.dumps(metadata)
+            if target_id not in stored:
+                conn.execute(
+                    'INSERT INTO sidebar_cross_refs (sidebar_id, seq, target_id, metadata_json) VALUES (?, ?, ?, ?)',
+                    (sidebar_id, next_seq, target_id, metadata_json)
+                )
+                next_seq += 1
+            elif stored[target_id][1] != metadata_json:
+                conn.execute(
+                    'UPDATE sidebar_cross_refs SET metadata_json = ? WHERE sidebar_id = ? AND target_id = ?',
+                    (metadata_json, sidebar_id, target_id)
+                )
+
+    def _load_exchanges(self, sidebar_id: str) -> List[Dict]:
+        """Read a context's exchanges back in order."""
+        with self._get_connection() as conn:
+            return [
+                json.loads(row[0]) for row in conn.execute(
+                    'SELECT exchange_json FROM sidebar_exchanges WHERE sidebar_id = ? ORDER BY seq',
+                    (sidebar_id,)
+                )
+            ]
+
+    def _load_cross_refs(self, conn, sidebar_id: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Cross-refs grouped by context, in insertion order. Every context's if sidebar_id is None."""
+        if sidebar_id is None:
+            rows = conn.execute(
+                'SELECT sidebar_id, target_id, metadata_json FROM sidebar_cross_refs ORDER BY sidebar_id, seq'
+            )
+        else:
+            rows = conn.execute(
+                'SELECT sidebar_id, target_id, metadata_json FROM sidebar_cross_refs WHERE sidebar_id = ? ORDER BY seq',
+                (sidebar_id,)
+            )
+        refs: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            refs.setdefault(row['sidebar_id'], {})[row['target_id']] = json.loads(row['metadata_json'])
+        return refs
+
     def load_context(self, sidebar_id: str) -> Optional[SidebarContext]:
         """
         Load a single SidebarContext by ID.
@@ -309,6 +974,7 @@ class SidebarPersistence:
             SidebarContext or None if not found
         """
         try:
+            self._sync_pending()
             with self._get_connection() as conn:
                 row = conn.execute(
                     'SELECT * FROM sidebar_contexts WHERE sidebar_id = ?',
@@ -316,36 +982,58 @@ class SidebarPersistence:
                 ).fetchone()
 
                 if row:
-                    return self._row_to_context(row)
+                    cross_refs = self._load_cross_refs(conn, sidebar_id)
+                    return self._row_to_context(row, cross_refs.get(sidebar_id, {}))
                 return None
 
         except Exception as e:
             logger.error(f"Failed to load context {sidebar_id}: {e}")
             raise
 
-    def load_all_contexts(self, include_archived: bool = False) -> List[SidebarContext]:
+    def load_all_contexts(self, include_archived: bool = False, lazy: bool = False) -> List[SidebarContext]:
         """
         Load all contexts from database.
 
+        With lazy=True only the header columns (ID, parent, status, priority,
+        timestamps, task description, participants) are read, a page at a
+        time. Every other field is fetched when the context first needs it,
+        and at most max_resident contexts keep those fields in memory.
+
         Args:
             include_archived: Whether to include archived contexts
+            lazy: Load headers only
 
         Returns:
             List of SidebarContext objects
         """
+        self._sync_pending()
+        columns = _HEADER_COLUMNS if lazy else '*'
         try:
             with self._get_connection() as conn:
                 if include_archived:
-                    rows = conn.execute(
-                        'SELECT * FROM sidebar_contexts ORDER BY last_activity DESC'
-                    ).fetchall()
+                    cursor = conn.execute(
+                        f'SELECT {columns} FROM sidebar_contexts ORDER BY last_activity DESC'
+                    )
                 else:
-                    rows = conn.execute(
-                        'SELECT * FROM sidebar_contexts WHERE status != ? ORDER BY last_activity DESC',
+                    cursor = conn.execute(
+                        f'SELECT {columns} FROM sidebar_contexts WHERE status != ? ORDER BY last_activity DESC',
                         (SidebarStatus.ARCHIVED.value,)
-                    ).fetchall()
+                    )
+
+                if lazy:
+                    contexts = []
+                    while True:
+                        rows = cursor.fetchmany(HEADER_PAGE_SIZE)
+                        if not rows:
+                            break
+                        contexts.extend(
+                            _LazySidebarContext._partial(self, **self._header_fields(row)) for row in rows
+                        )
+                else:
+                    rows = cursor.fetchall()
+                    cross_refs = self._load_cross_refs(conn)
+                    contexts = [self._row_to_context(row, cross_refs.get(row['sidebar_id'], {})) for row in rows]
 
-                contexts = [self._row_to_context(row) for row in rows]
                 logger.info(f"Loaded {len(contexts)} contexts from persistence")
                 return contexts
 
@@ -370,6 +1058,7 @@ class SidebarPersistence:
             True if deleted, False if not found
         """
         try:
+            self._sync_pending()
             # First, load the full context so we can preserve it
             context = self.load_context(sidebar_id)
             if context is None:
@@ -395,7 +1084,7 @@ class SidebarPersistence:
                     'last_activity': context.last_activity.isoformat() if isinstance(context.last_activity, datetime) else context.last_activity,
                     'child_sidebar_ids': context.child_sidebar_ids,
                     'participants': context.participants,
-                    'inherited_memory': context.inherited_memory,
+                    'inherited_memory': list(context.inherited_memory),
                     'local_memory': context.local_memory,
                     'data_refs': context.data_refs,
                     'cross_sidebar_refs': context.cross_sidebar_refs,
@@ -417,7 +1106,7 @@ class SidebarPersistence:
                 )
                 logger.info(f"Logged deletion of {sidebar_id} to OZOLITH")
 
-            # NOW delete from SQLite
+            # NOW delete from SQLite (exchange and cross-ref rows cascade)
             with self._get_connection() as conn:
                 cursor = conn.execute(
                     'DELETE FROM sidebar_contexts WHERE sidebar_id = ?',
@@ -516,8 +1205,33 @@ class SidebarPersistence:
         logger.info(f"Migration complete for {context_id}: {len(migrated)} refs migrated")
         return migrated
 
-    def _row_to_context(self, row: sqlite3.Row) -> SidebarContext:
-        """Convert database row to SidebarContext."""
+    def _row_to_context(self, row: sqlite3.Row, cross_refs: Dict[str, Any]) -> SidebarContext:
+        """
+        Convert database row (plus its cross-ref rows) to SidebarContext.
+
+        local_memory is not read here: the returned context fetches it from
+        sidebar_exchanges the first time it is accessed.
+        """
+        return _LazySidebarContext._partial(
+            self, **self._header_fields(row), **self._body_fields(row, cross_refs)
+        )
+
+    def _header_fields(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """The _HEADER_COLUMNS of a row, as SidebarContext fields."""
+        return {
+            'sidebar_id': row['sidebar_id'],
+            'uuid': row['uuid'],
+            'parent_context_id': row['parent_context_id'],
+            'status': SidebarStatus(row['status']),
+            'priority': SidebarPriority(row['priority']),
+            'created_at': datetime.fromisoformat(row['created_at']) if row['created_at'] else datetime.now(),
+            'last_activity': datetime.fromisoformat(row['last_activity']) if row['last_activity'] else datetime.now(),
+            'task_description': row['task_description'],
+            'participants': json.loads(row['participants_json'] or '[]'),
+        }
+
+    def _body_fields(self, row: sqlite3.Row, cross_refs: Dict[str, Any]) -> Dict[str, Any]:
+        """The _BODY_FIELDS of a full row."""
         # Handle yarn_board_layout - may not exist in older DBs
         yarn_layout = None
         try:
@@ -545,34 +1259,91 @@ class SidebarPersistence:
         except (KeyError, IndexError):
             pass
 
-        return SidebarContext(
-            sidebar_id=row['sidebar_id'],
-            uuid=row['uuid'],
-            parent_context_id=row['parent_context_id'],
-            forked_from=row['forked_from'],
-
-            status=SidebarStatus(row['status']),
-            priority=SidebarPriority(row['priority']),
-            task_description=row['task_description'],
-            success_criteria=row['success_criteria'],
-            failure_reason=row['failure_reason'],
-            coordinator_agent=row['coordinator_agent'],
-
-            created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else datetime.now(),
-            last_activity=datetime.fromisoformat(row['last_activity']) if row['last_activity'] else datetime.now(),
-
-            child_sidebar_ids=json.loads(row['child_sidebar_ids_json'] or '[]'),
-            participants=json.loads(row['participants_json'] or '[]'),
-            inherited_memory=json.loads(row['inherited_memory_json'] or '[]'),
-            local_memory=json.loads(row['local_memory_json'] or '[]'),
-            data_refs=json.loads(row['data_refs_json'] or '{}'),
-            cross_sidebar_refs=self._migrate_cross_refs(row['cross_sidebar_refs_json'], row['sidebar_id']),
-            relevance_scores=json.loads(row['relevance_scores_json'] or '{}'),
-            active_focus=json.loads(row['active_focus_json'] or '[]'),
-            yarn_board_layout=yarn_layout,
-            display_names=display_names,
-            tags=tags,
-        )
+        return {
+            'forked_from': row['forked_from'],
+            'coordinator_agent': row['coordinator_agent'],
+            'success_criteria': row['success_criteria'],
+            'failure_reason': row['failure_reason'],
+            'child_sidebar_ids': json.loads(row['child_sidebar_ids_json'] or '[]'),
+            'inherited_memory': json.loads(row['inherited_memory_json'] or '[]'),
+            'data_refs': json.loads(row['data_refs_json'] or '{}'),
+            'cross_sidebar_refs': cross_refs,
+            'relevance_scores': json.loads(row['relevance_scores_json'] or '{}'),
+            'active_focus': json.loads(row['active_focus_json'] or '[]'),
+            'yarn_board_layout': yarn_layout,
+            'display_names': display_names,
+            'tags': tags,
+        }
+
+    # =========================================================================
+    # LAZY HYDRATION
+    # =========================================================================
+
+    def _hydrate_body(self, context: _LazySidebarContext):
+        """Fill in a header-only context's _BODY_FIELDS from its row."""
+        with _hydrate_lock:
+            if context._body_loaded():
+                return
+            sidebar_id = context.sidebar_id
+            with self._get_connection() as conn:
+                row = conn.execute(
+                    'SELECT * FROM sidebar_contexts WHERE sidebar_id = ?',
+                    (sidebar_id,)
+                ).fetchone()
+                cross_refs = self._load_cross_refs(conn, sidebar_id).get(sidebar_id, {})
+
+            if row is not None:
+                body = self._body_fields(row, cross_refs)
+            else:
+                # Deleted since the header was read: fall back to defaults
+                defaults = SidebarContext(sidebar_id=sidebar_id, uuid=context.uuid)
+                body = {name: getattr(defaults, name) for name in _BODY_FIELDS}
+
+            # Fields assigned before hydration win over stored ones
+            for name, value in body.items():
+                context.__dict__.setdefault(name, value)
+            self._track_resident(context)
+
+    def _hydrate_exchanges(self, context: _LazySidebarContext):
+        """Fill in a context's local_memory from sidebar_exchanges."""
+        with _hydrate_lock:
+            if not context._exchanges_loaded():
+                context.__dict__['_local_memory'] = self._load_exchanges(context.sidebar_id)
+                self._track_resident(context)
+
+    def _track_resident(self, context: _LazySidebarContext):
+        """
+        Mark context as matching storage and most recently used; drop the
+        lazily-read fields of the least recently used beyond max_resident.
+
+        Caller holds _hydrate_lock.
+        """
+        context.__dict__['_clean_digest'] = self._resident_digest(context)
+        key = id(context)
+        self._resident[key] = context
+        self._resident.move_to_end(key)
+        while len(self._resident) > self.max_resident:
+            _, victim = self._resident.popitem(last=False)
+            self._release(victim)
+
+    def _release(self, context: _LazySidebarContext):
+        """Drop a context back to its header, unless it has unsaved changes."""
+        if self._resident_digest(context) != context.__dict__.get('_clean_digest'):
+            # Left untracked; the next save_context() tracks it again
+            logger.debug(f"Keeping unsaved changes to {context.sidebar_id} in memory")
+            return
+        state = context.__dict__
+        for name in _BODY_FIELDS:
+            state.pop(name, None)
+        state.pop('_local_memory', None)
+
+    @staticmethod
+    def _resident_digest(context: _LazySidebarContext) -> int:
+        # Reads __dict__ directly so a digest never triggers hydration.
+        # local_memory is append-only, so its length is enough.
+        state = context.__dict__
+        body = json.dumps([state.get(name) for name in _DIGEST_FIELDS], default=str)
+        return hash((body, len(state.get('_local_memory', ()))))
 
     # =========================================================================
     # SESSION STATE OPERATIONS
@@ -590,6 +1361,7 @@ class SidebarPersistence:
             The stored value (JSON-decoded) or default
         """
         try:
+            self._sync_pending()
             with self._get_connection() as conn:
                 row = conn.execute(
                     'SELECT value FROM session_state WHERE key = ?',
@@ -608,6 +1380,8 @@ class SidebarPersistence:
         """
         Set a session state value.
 
+        Queued like save_context() when write coalescing is on.
+
         Args:
             key: State key
             value: Value to store (will be JSON-encoded)
@@ -615,12 +1389,14 @@ class SidebarPersistence:
         Returns:
             True if successful
         """
+        write = ('session', key, json.dumps(value), datetime.now().isoformat())
+        if self._coalescing():
+            self._coalescer.submit(('session', key), write)
+            return True
+
         try:
             with self._get_connection() as conn:
-                conn.execute('''
-                    INSERT OR REPLACE INTO session_state (key, value, updated_at)
-                    VALUES (?, ?, ?)
-                ''', (key, json.dumps(value), datetime.now().isoformat()))
+                self._write_session_state(conn, *write[1:])
 
             logger.debug(f"Set session state '{key}'")
             return True
@@ -637,6 +1413,8 @@ class SidebarPersistence:
         """
         Register a conversation_id -> root context mapping.
 
+        Queued like save_context() when write coalescing is on.
+
         Args:
             conversation_id: The conversation identifier
             root_context_id: The root context's sidebar_id
@@ -644,13 +1422,14 @@ class SidebarPersistence:
         Returns:
             True if successful
         """
+        write = ('root', conversation_id, root_context_id, datetime.now().isoformat())
+        if self._coalescing():
+            self._coalescer.submit(('root', conversation_id), write)
+            return True
+
         try:
             with self._get_connection() as conn:
-                conn.execute('''
-                    INSERT OR REPLACE INTO conversation_roots
-                    (conversation_id, root_context_id, created_at, is_active)
-                    VALUES (?, ?, ?, 1)
-                ''', (conversation_id, root_context_id, datetime.now().isoformat()))
+                self._write_conversation_root(conn, *write[1:])
 
             logger.debug(f"Registered conversation root: {conversation_id} -> {root_context_id}")
             return True
@@ -659,6 +1438,19 @@ class SidebarPersistence:
             logger.error(f"Failed to register conversation root: {e}")
             raise
 
+    def _write_session_state(self, conn, key: str, value_json: str, updated_at: str):
+        conn.execute('''
+            INSERT OR REPLACE INTO session_state (key, value, updated_at)
+            VALUES (?, ?, ?)
+        ''', (key, value_json, updated_at))
+
+    def _write_conversation_root(self, conn, conversation_id: str, root_context_id: str, created_at: str):
+        conn.execute('''
+            INSERT OR REPLACE INTO conversation_roots
+            (conversation_id, root_context_id, created_at, is_active)
+            VALUES (?, ?, ?, 1)
+        ''', (conversation_id, root_context_id, created_at))
+
     def get_conversation_root(self, conversation_id: str) -> Optional[str]:
         """
         Get the root context ID for a conversation.
@@ -670,6 +1462,7 @@ class SidebarPersistence:
             The root context's sidebar_id or None
         """
         try:
+            self._sync_pending()
             with self._get_connection() as conn:
                 row = conn.execute(
                     'SELECT root_context_id FROM conversation_roots WHERE conversation_id = ? AND is_active = 1',
@@ -693,6 +1486,7 @@ class SidebarPersistence:
             True if successful
         """
         try:
+            self._sync_pending()
             with self._get_connection() as conn:
                 conn.execute(
                     'UPDATE conversation_roots SET is_active = 0 WHERE conversation_id = ?',
@@ -713,6 +1507,7 @@ class SidebarPersistence:
     def get_statistics(self) -> Dict[str, Any]:
         """Get database statistics."""
         try:
+            self._sync_pending()
             with self._get_connection() as conn:
                 total = conn.execute('SELECT COUNT(*) FROM sidebar_contexts').fetchone()[0]
 
@@ -743,33 +1538,24 @@ class SidebarPersistence:
 
                 # Largest context by local_memory size
                 largest = conn.execute('''
-                    SELECT sidebar_id, LENGTH(local_memory_json) as size
-                    FROM sidebar_contexts
+                    SELECT sidebar_id, SUM(LENGTH(exchange_json)) as size
+                    FROM sidebar_exchanges
+                    GROUP BY sidebar_id
                     ORDER BY size DESC
                     LIMIT 1
                 ''').fetchone()
 
-                # Depth distribution (how nested are things)
-                # Count contexts at each depth level
-                depth_counts = {}
-                all_contexts = conn.execute(
-                    'SELECT sidebar_id, parent_context_id FROM sidebar_contexts'
-                ).fetchall()
-
-                # Build parent lookup
-                parent_map = {row['sidebar_id']: row['parent_context_id'] for row in all_contexts}
-
-                def get_depth(sid):
-                    depth = 0
-                    current = sid
-                    while parent_map.get(current):
-                        depth += 1
-                        current = parent_map[current]
-                    return depth
-
-                for sid in parent_map.keys():
-                    d = get_depth(sid)
-                    depth_counts[d] = depth_counts.get(d, 0) + 1
+                # Depth distribution (how nested are things), from the
+                # stored depth column
+                depth_counts = {
+                    row['depth']: row['count']
+                    for row in conn.execute('''
+                        SELECT depth, COUNT(*) as count
+                        FROM sidebar_contexts
+                        WHERE depth IS NOT NULL
+                        GROUP BY depth
+                    ''')
+                }
 
                 return {
                     'total_contexts': total,
@@ -792,6 +1578,29 @@ class SidebarPersistence:
             logger.error(f"Failed to get statistics: {e}")
             return {'error': str(e)}
 
+    def check_tree_integrity(self) -> List[str]:
+        """
+        Recompute every context's tree position with a recursive CTE and
+        compare it against the stored depth/root_id columns.
+
+        Returns:
+            sidebar_ids whose stored values are wrong, or which can't be
+            reached from any root (a parent cycle)
+        """
+        try:
+            self._sync_pending()
+            with self._get_connection() as conn:
+                rows = conn.execute(_TREE_CTE + '''
+                    SELECT c.sidebar_id
+                    FROM sidebar_contexts c LEFT JOIN tree t ON t.id = c.sidebar_id
+                    WHERE t.id IS NULL OR c.depth IS NOT t.depth OR c.root_id IS NOT t.root
+                    ORDER BY c.sidebar_id
+                ''').fetchall()
+                return [row['sidebar_id'] for row in rows]
+        except Exception as e:
+            logger.error(f"Failed to check tree integrity: {e}")
+            raise
+
     def context_exists(self, sidebar_id: str) -> bool:
         """
         Check if a context exists without loading it.
@@ -803,6 +1612,7 @@ class SidebarPersistence:
             True if exists, False otherwise
         """
         try:
+            self._sync_pending()
             with self._get_connection() as conn:
                 row = conn.execute(
                     'SELECT 1 FROM sidebar_contexts WHERE sidebar_id = ? LIMIT 1',
@@ -842,6 +1652,8 @@ def get_persistence(db_path: Optional[str] = None) -> SidebarPersistence:
 def reset_persistence():
     """Reset the global persistence instance (for testing)."""
     global _persistence_instance
+    if _persistence_instance is not None:
+        _persistence_instance.close()
     _persistence_instance = None
 
 
@@ -0,0 +1,241 @@
+"""
+Yarn Render Cache
+
+Versioned cache of rendered yarn boards, so a render only rebuilds what
+changed and a client can ask for just the points and connections that
+changed since the version it last saw.
+
+Two layers:
+    details     context detail per context, cross-ref detail per ref -
+                the expensive part of a render, built once per change
+    boards      each board's rendered items, keyed by point id or
+                (from_id, to_id), with the version each last changed at
+
+A board is built from its own context, its children and its cross-ref
+targets, and records those ids as dependencies. invalidate(context_id)
+drops that context's details and marks every board that depends on it
+stale. ConversationOrchestrator calls it from _persist_context(), which
+every context mutation already goes through.
+
+A stale board is rebuilt on its next render and diffed against the
+previous build: only items that actually differ get a new version, and
+items that disappeared are kept as tombstones. Versions come from one
+counter for the whole cache, so they only ever increase.
+
+The counter starts again at 0 in a new process, so clients are handed a
+token - "<epoch>:<version>" - rather than the bare number. The epoch is
+random per cache; a token from another process (or a mangled one) parses
+to None, and the caller falls back to a full render.
+"""
+
+import uuid
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+ItemKey = Hashable  # point id, or (from_id, to_id) for a connection
+
+
+class _Board:
+    """One rendered board and its change history."""
+
+    __slots__ = ('items', 'changed', 'removed', 'depends_on', 'floor', 'stale')
+
+    def __init__(self, floor: int):
+        self.items: Dict[ItemKey, Dict] = {}          # Render order
+        self.changed: Dict[ItemKey, int] = {}         # Oldest change first
+        self.removed: Dict[ItemKey, int] = {}         # Tombstones, oldest first
+        self.depends_on: Set[str] = set()
+        self.floor = floor                            # Lowest `since` we can diff from
+        self.stale = False
+
+
+class YarnRenderCache:
+    """
+    Rendered yarn boards and the details they are built from.
+
+    Usage:
+        if not cache.is_fresh(board_id):
+            cache.store(board_id, items, depends_on=ids)
+        changes = cache.changes_since(board_id, cache.parse_token(token))
+    """
+
+    def __init__(self, max_tombstones: int = 1024):
+        self.max_tombstones = max_tombstones
+        self.epoch = uuid.uuid4().hex[:12]
+        self._version = 0
+        self._boards: Dict[str, _Board] = {}
+        self._dependents: Dict[str, Set[str]] = {}    # context_id -> board ids
+        self._context_details: Dict[str, Dict] = {}
+        self._ref_details: Dict[str, Dict[str, Dict]] = {}  # source -> target -> detail
+        self._counts = {"hits": 0, "rebuilds": 0, "detail_builds": 0}
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def token(self, version: int) -> str:
+        """The version as handed to clients, tagged with this cache's epoch."""
+        return f"{self.epoch}:{version}"
+
+    def parse_token(self, token: Any) -> Optional[int]:
+        """The version in a client's token, or None if it isn't one of ours."""
+        epoch, _, version = str(token).partition(":")
+        if epoch != self.epoch:
+            return None
+        try:
+            return int(version)
+        except ValueError:
+            return None
+
+    # =========================================================================
+    # INVALIDATION
+    # =========================================================================
+
+    def invalidate(self, context_id: str):
+        """A context changed: drop its details, mark boards showing it stale."""
+        self._context_details.pop(context_id, None)
+        self._ref_details.pop(context_id, None)
+        for board_id in self._dependents.get(context_id, ()):
+            self._boards[board_id].stale = True
+
+    def clear(self):
+        """Forget every board and detail (e.g. after reloading contexts)."""
+        self._boards.clear()
+        self._dependents.clear()
+        self._context_details.clear()
+        self._ref_details.clear()
+
+    # =========================================================================
+    # DETAILS
+    # =========================================================================
+
+    def context_detail(self, context_id: str, build: Callable[[], Dict]) -> Dict:
+        """Cached context detail, built if missing."""
+        detail = self._context_details.get(context_id)
+        if detail is None:
+            detail = self._context_details[context_id] = build()
+            self._counts["detail_builds"] += 1
+        return detail
+
+    def ref_detail(self, source_id: str, target_id: str, build: Callable[[], Dict]) -> Dict:
+        """Cached cross-ref detail, built if missing."""
+        details = self._ref_details.setdefault(source_id, {})
+        detail = details.get(target_id)
+        if detail is None:
+            detail = details[target_id] = build()
+            self._counts["detail_builds"] += 1
+        return detail
+
+    # =========================================================================
+    # BOARDS
+    # =========================================================================
+
+    def is_fresh(self, board_id: str) -> bool:
+        """True if the board is built and nothing it shows has changed."""
+        board = self._boards.get(board_id)
+        if board is None or board.stale:
+            return False
+        self._counts["hits"] += 1
+        return True
+
+    def store(self, board_id: str, items: Dict[ItemKey, Dict], depends_on: Iterable[str]) -> int:
+        """
+        Record a fresh build of a board and version whatever changed.
+
+        Args:
+            board_id: Context whose board this is
+            items: Every point and connection, keyed and in render order
+            depends_on: Context ids the build read
+
+        Returns:
+            The cache version, to hand the client as its next `since`
+        """
+        self._counts["rebuilds"] += 1
+        board = self._boards.get(board_id)
+        if board is None:
+            # Its first build gets the next version; nothing older can diff
+            board = self._boards[board_id] = _Board(floor=self._version + 1)
+
+        changed = [key for key, item in items.items() if board.items.get(key) != item]
+        gone = [key for key in board.items if key not in items]
+        if changed or gone:
+            self._version += 1
+            for key in changed:
+                board.changed.pop(key, None)
+                board.changed[key] = self._version
+                board.removed.pop(key, None)
+            for key in gone:
+                board.changed.pop(key, None)
+                board.removed[key] = self._version
+            self._prune(board)
+
+        board.items = items
+        board.stale = False
+        self._set_dependencies(board_id, board, set(depends_on))
+        return self._version
+
+    def items(self, board_id: str) -> List[Dict]:
+        """Every item on the board, in render order."""
+        return list(self._boards[board_id].items.values())
+
+    def changes_since(self, board_id: str, since: Optional[int]) -> Optional[Tuple[List[Dict], List[ItemKey]]]:
+        """
+        Items changed and keys removed after version `since`.
+
+        Walks the change log newest first, so the cost is the number of
+        changes, not the size of the board.
+
+        Returns:
+            (changed items, removed keys), oldest change first, or None if
+            `since` is None, older than the history kept or newer than the
+            cache - the client needs a full render
+        """
+        board = self._boards[board_id]
+        if since is None or since < board.floor or since > self._version:
+            return None
+
+        changed = self._newer_than(board.changed, since)
+        removed = self._newer_than(board.removed, since)
+        return [board.items[key] for key in changed], removed
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "epoch": self.epoch,
+            "version": self._version,
+            "boards": len(self._boards),
+            "stale_boards": sum(1 for b in self._boards.values() if b.stale),
+            "context_details": len(self._context_details),
+            "ref_details": sum(len(d) for d in self._ref_details.values()),
+            **self._counts,
+        }
+
+    # =========================================================================
+    # INTERNALS
+    # =========================================================================
+
+    @staticmethod
+    def _newer_than(log: Dict[ItemKey, int], since: int) -> List[ItemKey]:
+        keys = []
+        for key in reversed(log):
+            if log[key] <= since:
+                break
+            keys.append(key)
+        keys.reverse()
+        return keys
+
+    def _prune(self, board: _Board):
+        # Old changes stay in board.changed (one entry per live item); only
+        # tombstones grow without bound. Dropping one raises the floor.
+        while len(board.removed) > self.max_tombstones:
+            key = next(iter(board.removed))
+            board.floor = max(board.floor, board.removed.pop(key))
+
+    def _set_dependencies(self, board_id: str, board: _Board, depends_on: Set[str]):
+        for context_id in board.depends_on - depends_on:
+            dependents = self._dependents.get(context_id)
+            if dependents is not None:
+                dependents.discard(board_id)
+                if not dependents:
+                    del self._dependents[context_id]
+        for context_id in depends_on - board.depends_on:
+            self._dependents.setdefault(context_id, set()).add(board_id)
+        board.depends_on = depends_on
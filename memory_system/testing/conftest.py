@@ -115,6 +115,66 @@ def context_tree(fresh_orchestrator):
     }
 
 
+@pytest.fixture
+def orch(tmp_path, monkeypatch):
+    """
+    Orchestrator with a scratch registry and no persistence / Ozolith.
+
+    Nothing is read from or written to the real registry, SQLite file or log,
+    so tests can build contexts freely.
+    """
+    pytest.importorskip("uuid_extensions")
+    import conversation_orchestrator
+    from conversation_orchestrator import ConversationOrchestrator
+    from context_registry import ContextRegistry, JSONFileBackend
+
+    registry = ContextRegistry(backend=JSONFileBackend(file_path=str(tmp_path / "registry.json")))
+    monkeypatch.setattr(conversation_orchestrator, "get_registry", lambda: registry)
+    monkeypatch.setattr(conversation_orchestrator, "_get_persistence", lambda: None)
+    monkeypatch.setattr(conversation_orchestrator, "_get_ozolith", lambda: None)
+    return ConversationOrchestrator(auto_load=False)
+
+
+@pytest.fixture
+def scratch_stores(tmp_path, monkeypatch):
+    """
+    Point the orchestrator at a scratch SQLite file and registry.
+
+    A factory: call it before creating the orchestrator. With ozolith=True
+    it also gets a scratch Ozolith log (group commit on, as in production);
+    otherwise _get_ozolith returns None.
+
+    Usage:
+        db, registry, oz = scratch_stores(ozolith=True)
+        orch = ConversationOrchestrator(auto_load=False)
+    """
+    pytest.importorskip("uuid_extensions")
+    import conversation_orchestrator
+    from context_registry import ContextRegistry, JSONFileBackend
+    from ozolith import Ozolith
+    from sidebar_persistence import SidebarPersistence
+
+    opened = []
+
+    def make(ozolith: bool = False):
+        db = SidebarPersistence(db_path=str(tmp_path / "sidebar_state.db"))
+        opened.append(db)
+        registry = ContextRegistry(backend=JSONFileBackend(file_path=str(tmp_path / "registry.json")))
+        monkeypatch.setattr(conversation_orchestrator, "_persistence_instance", db)
+        monkeypatch.setattr(conversation_orchestrator, "get_registry", lambda: registry)
+        oz = None
+        if ozolith:
+            oz = Ozolith(storage_path=str(tmp_path / "ozolith.jsonl"), group_commit=True)
+            monkeypatch.setattr(conversation_orchestrator, "_ozolith_instance", oz)
+        else:
+            monkeypatch.setattr(conversation_orchestrator, "_get_ozolith", lambda: None)
+        return db, registry, oz
+
+    yield make
+    for db in opened:
+        db.close()
+
+
 # =============================================================================
 # REDIS FIXTURES
 # =============================================================================
@@ -0,0 +1,695 @@
+"""
+Context Registry Storage Tests
+
+Covers the registry's storage backends and how the registry drives them:
+- SQLiteBackend round-trips, per-row upserts, and the JSON migrator
+- RedisBackend hash-per-entry storage (needs fakeredis)
+- register() writing only the rows it changed
+- Write-behind journal replay and debounced snapshots
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add core directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "core"))
+
+from context_registry import (
+    ContextRegistry,
+    JSONFileBackend,
+    MultiLayerBackend,
+    RedisBackend,
+    SQLiteBackend,
+)
+
+
+def _context(display_id, parent_id=None, children=None):
+    return {
+        "display_id": display_id,
+        "uuid": f"uuid-{display_id}",
+        "context_type": display_id.split("-")[0],
+        "parent_id": parent_id,
+        "children_ids": children or [],
+        "created_at": "2026-01-01T00:00:00",
+        "created_by": "human",
+        "created_in": None,
+        "description": f"context {display_id}",
+        "tags": ["t"],
+    }
+
+
+@pytest.fixture
+def sqlite_backend(tmp_path):
+    backend = SQLiteBackend(db_path=str(tmp_path / "registry.db"))
+    yield backend
+    backend.close()
+
+
+# =============================================================================
+# SQLITE BACKEND
+# =============================================================================
+
+class TestSQLiteBackend:
+
+    def test_empty_database_loads_none(self, sqlite_backend):
+        assert sqlite_backend.is_available()
+        assert sqlite_backend.load() is None
+
+    def test_uses_wal_mode(self, sqlite_backend):
+        sqlite_backend.is_available()
+        mode = sqlite_backend._get_connection().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_full_save_round_trip(self, sqlite_backend):
+        state = {
+            "counters": {"SB": 2},
+            "contexts": {
+                "SB-1": _context("SB-1", children=["SB-2"]),
+                "SB-2": _context("SB-2", parent_id="SB-1"),
+            },
+        }
+        assert sqlite_backend.save(state)
+        assert sqlite_backend.load() == state
+
+    def test_full_save_drops_missing_rows(self, sqlite_backend):
+        sqlite_backend.save({"counters": {"SB": 2}, "contexts": {
+            "SB-1": _context("SB-1"), "SB-2": _context("SB-2"),
+        }})
+        sqlite_backend.save({"counters": {"SB": 2}, "contexts": {"SB-1": _context("SB-1")}})
+        assert list(sqlite_backend.load()["contexts"]) == ["SB-1"]
+
+    def test_save_changes_upserts_only_given_rows(self, sqlite_backend):
+        sqlite_backend.save({"counters": {"SB": 1}, "contexts": {"SB-1": _context("SB-1")}})
+
+        def no_full_state():
+            raise AssertionError("SQLite should not need the full state")
+
+        assert sqlite_backend.save_changes(
+            {"SB": 2},
+            {
+                "SB-1": _context("SB-1", children=["SB-2"]),
+                "SB-2": _context("SB-2", parent_id="SB-1"),
+            },
+            no_full_state,
+        )
+
+        state = sqlite_backend.load()
+        assert state["counters"] == {"SB": 2}
+        assert state["contexts"]["SB-1"]["children_ids"] == ["SB-2"]
+        assert state["contexts"]["SB-2"]["parent_id"] == "SB-1"
+
+    def test_migrate_from_json(self, sqlite_backend, tmp_path):
+        json_path = tmp_path / "registry.json"
+        state = {"counters": {"SB": 1, "EXCH": 1}, "contexts": {
+            "SB-1": _context("SB-1", children=["EXCH-1"]),
+            "EXCH-1": _context("EXCH-1", parent_id="SB-1"),
+        }}
+        json_path.write_text(json.dumps(state))
+
+        assert sqlite_backend.migrate_from_json(str(json_path)) == 2
+        assert sqlite_backend.load() == state
+
+        # One-shot: a populated database is left alone
+        json_path.write_text(json.dumps({"counters": {}, "contexts": {"SB-9": _context("SB-9")}}))
+        assert sqlite_backend.migrate_from_json(str(json_path)) == 0
+        assert "SB-9" not in sqlite_backend.load()["contexts"]
+
+    def test_migrate_without_json_file(self, sqlite_backend, tmp_path):
+        assert sqlite_backend.migrate_from_json(str(tmp_path / "missing.json")) == 0
+
+
+# =============================================================================
+# REDIS BACKEND
+# =============================================================================
+
+class TestRedisBackend:
+
+    @pytest.fixture
+    def redis_backend(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        return RedisBackend(client=fakeredis.FakeRedis(decode_responses=True))
+
+    def test_empty_loads_none(self, redis_backend):
+        assert redis_backend.is_available()
+        assert redis_backend.load() is None
+
+    def test_full_save_round_trip(self, redis_backend):
+        state = {"counters": {"SB": 2}, "contexts": {
+            "SB-1": _context("SB-1", children=["SB-2"]),
+            "SB-2": _context("SB-2", parent_id="SB-1"),
+        }}
+        assert redis_backend.save(state)
+        assert redis_backend.load() == state
+
+        # Entries missing from a full save are deleted
+        redis_backend.save({"counters": {"SB": 2}, "contexts": {"SB-1": _context("SB-1")}})
+        assert list(redis_backend.load()["contexts"]) == ["SB-1"]
+
+    def test_one_hash_per_entry(self, redis_backend):
+        redis_backend.save({"counters": {"SB": 1}, "contexts": {"SB-1": _context("SB-1")}})
+        client = redis_backend._get_client()
+        fields = client.hgetall("context_registry:ctx:SB-1")
+        assert json.loads(fields["parent_id"]) is None
+        assert json.loads(fields["tags"]) == ["t"]
+
+    def test_save_changes_publishes_once(self, redis_backend):
+        pubsub = redis_backend._get_client().pubsub()
+        pubsub.subscribe(redis_backend.CHANGES_CHANNEL)
+        pubsub.get_message(timeout=1)  # subscribe confirmation
+
+        assert redis_backend.save_changes(
+            {"SB": 2},
+            {"SB-1": _context("SB-1", children=["SB-2"]), "SB-2": _context("SB-2", parent_id="SB-1")},
+            lambda: pytest.fail("Redis should not need the full state"),
+        )
+
+        message = pubsub.get_message(timeout=1)
+        assert json.loads(message["data"]) == {"type": "updated", "ids": ["SB-1", "SB-2"]}
+        assert pubsub.get_message(timeout=0.1) is None
+        assert redis_backend.load()["counters"] == {"SB": 2}
+
+    def test_load_spans_scan_pages(self, redis_backend):
+        redis_backend.SCAN_COUNT = 7
+        contexts = {f"EXCH-{n}": _context(f"EXCH-{n}") for n in range(1, 51)}
+        redis_backend.save({"counters": {"EXCH": 50}, "contexts": contexts})
+        assert redis_backend.load()["contexts"] == contexts
+
+    def test_hot_tier_in_multilayer(self, redis_backend, tmp_path):
+        json_backend = JSONFileBackend(file_path=str(tmp_path / "registry.json"))
+        json_backend.save({"counters": {"SB": 1}, "contexts": {"SB-1": _context("SB-1")}})
+
+        # Redis starts cold and is warmed from the JSON tier on load
+        layered = MultiLayerBackend([redis_backend, json_backend])
+        registry = ContextRegistry(backend=layered)
+        assert registry.exists("SB-1")
+        assert redis_backend.load()["contexts"].keys() == {"SB-1"}
+
+
+# =============================================================================
+# REGISTRY WRITE PATH
+# =============================================================================
+
+class TestRegistryWrites:
+
+    @pytest.fixture(autouse=True)
+    def _needs_uuid7(self):
+        pytest.importorskip("uuid_extensions")
+
+    def test_register_writes_only_changed_rows(self, sqlite_backend):
+        registry = ContextRegistry(backend=sqlite_backend)
+        root = registry.register("SB", created_by="human")
+
+        calls = []
+        original = sqlite_backend.save_changes
+
+        def spy(counters, changed, get_state):
+            calls.append(sorted(changed))
+            return original(counters, changed, get_state)
+
+        sqlite_backend.save_changes = spy
+        child = registry.register("SB", parent_id=root, created_by="human")
+
+        assert calls == [sorted([root, child])]
+
+        reloaded = ContextRegistry(backend=sqlite_backend)
+        assert reloaded.get_children(root) == [child]
+        assert reloaded.get_parent(child) == root
+
+    def test_json_backend_falls_back_to_full_save(self, tmp_path):
+        path = tmp_path / "registry.json"
+        registry = ContextRegistry(backend=JSONFileBackend(file_path=str(path)))
+        root = registry.register("SB", created_by="human")
+        registry.register("EXCH", parent_id=root)
+
+        saved = json.loads(path.read_text())
+        assert set(saved["contexts"]) == {root, "EXCH-1"}
+
+    def test_multilayer_serializes_full_state_once(self, tmp_path):
+        sqlite = SQLiteBackend(db_path=str(tmp_path / "registry.db"))
+        first = JSONFileBackend(file_path=str(tmp_path / "a.json"))
+        second = JSONFileBackend(file_path=str(tmp_path / "b.json"))
+        registry = ContextRegistry(backend=MultiLayerBackend([sqlite, first, second]))
+
+        calls = []
+        original = registry._serialize_state
+        registry._serialize_state = lambda: calls.append(1) or original()
+
+        registry.register("SB", created_by="human")
+        assert len(calls) == 1
+        assert sqlite.load()["contexts"].keys() == {"SB-1"}
+        sqlite.close()
+
+
+    def test_multilayer_warms_empty_faster_tier(self, tmp_path):
+        sqlite = SQLiteBackend(db_path=str(tmp_path / "registry.db"))
+        json_backend = JSONFileBackend(file_path=str(tmp_path / "registry.json"))
+        json_backend.save({"counters": {"SB": 1}, "contexts": {"SB-1": _context("SB-1")}})
+
+        state = MultiLayerBackend([sqlite, json_backend]).load()
+        assert state["contexts"].keys() == {"SB-1"}
+        assert sqlite.load() == state
+        sqlite.close()
+
+
+# =============================================================================
+# ASYNC TIERS
+# =============================================================================
+
+class _SlowBackend(JSONFileBackend):
+    """JSON backend that sleeps on every write and counts them."""
+
+    def __init__(self, file_path, delay=0.2):
+        super().__init__(file_path=file_path)
+        self.delay = delay
+        self.saves = 0
+        self.fail = False
+
+    def save(self, state):
+        time.sleep(self.delay)
+        self.saves += 1
+        if self.fail:
+            return False
+        return super().save(state)
+
+
+class TestAsyncTiers:
+
+    @pytest.fixture
+    def tiers(self, tmp_path):
+        primary = JSONFileBackend(file_path=str(tmp_path / "primary.json"))
+        slow = _SlowBackend(str(tmp_path / "slow.json"))
+        return primary, slow
+
+    def _changes(self, backend, *display_ids):
+        contexts = {d: _context(d) for d in display_ids}
+        return backend.save_changes({"SB": len(display_ids)}, contexts,
+                                    lambda: {"counters": {"SB": len(display_ids)}, "contexts": contexts})
+
+    def test_slow_tier_does_not_block(self, tiers):
+        primary, slow = tiers
+        layered = MultiLayerBackend([primary, slow], async_secondaries=True)
+
+        start = time.perf_counter()
+        assert self._changes(layered, "SB-1")
+        assert time.perf_counter() - start < slow.delay, "Caller waited on the slow tier"
+        assert primary.load()["contexts"].keys() == {"SB-1"}
+
+        assert layered.flush(timeout=5)
+        assert slow.load()["contexts"].keys() == {"SB-1"}
+        layered.close()
+
+    def test_queued_writes_coalesce(self, tiers, tmp_path):
+        primary, slow = tiers
+        layered = MultiLayerBackend([primary, slow], async_secondaries=True)
+        registry = ContextRegistry(backend=layered)
+        for n in range(1, 11):
+            registry.import_context(f"SB-{n}", f"uuid-SB-{n}", "SB")
+            registry.save()
+
+        assert layered.flush(timeout=10)
+        assert slow.saves < 10, "Queued saves should be merged into fewer writes"
+        assert len(slow.load()["contexts"]) == 10
+        layered.close()
+
+    def test_overflow_resyncs_tier(self, tiers):
+        primary, slow = tiers
+        layered = MultiLayerBackend([primary, slow], async_secondaries=True, max_queue=1)
+        for n in range(1, 6):
+            layered.save({"counters": {"SB": n}, "contexts": {f"SB-{i}": _context(f"SB-{i}") for i in range(1, n + 1)}})
+
+        stats = layered.get_tier_stats()
+        assert stats[0]["mode"] == "sync"
+        assert stats[1]["overflows"] > 0
+        assert layered.flush(timeout=10)
+        assert len(slow.load()["contexts"]) == 5
+        layered.close()
+
+    def test_failed_tier_retries(self, tiers):
+        primary, slow = tiers
+        slow.delay = 0
+        layered = MultiLayerBackend([primary, slow], async_secondaries=True)
+        layered._writers[0].RETRY_INTERVAL = 0.05
+
+        slow.fail = True
+        self._changes(layered, "SB-1")
+        deadline = time.monotonic() + 5
+        while layered.get_tier_stats()[1]["failures"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stats = layered.get_tier_stats()[1]
+        assert stats["failures"] > 0 and stats["lag_seconds"] > 0
+
+        slow.fail = False
+        assert layered.flush(timeout=5)
+        assert slow.load()["contexts"].keys() == {"SB-1"}
+        assert layered.get_tier_stats()[1]["lag_seconds"] == 0
+        layered.close()
+
+    def test_startup_reconciles_lagging_tier(self, tmp_path):
+        primary = JSONFileBackend(file_path=str(tmp_path / "primary.json"))
+        behind = SQLiteBackend(db_path=str(tmp_path / "behind.db"))
+        empty = JSONFileBackend(file_path=str(tmp_path / "empty.json"))
+        state = {"counters": {"SB": 2}, "contexts": {"SB-1": _context("SB-1"), "SB-2": _context("SB-2")}}
+        primary.save(state)
+        behind.save({"counters": {"SB": 1}, "contexts": {"SB-1": _context("SB-1")}})
+
+        layered = MultiLayerBackend([primary, behind, empty], async_secondaries=True)
+        assert layered.load() == state
+        assert behind.load() == state
+        assert empty.load() == state
+        assert [r["status"] for r in layered.last_reconcile] == ["source", "repaired", "repaired"]
+
+        assert layered.load() == state
+        assert [r["status"] for r in layered.last_reconcile] == ["source", "in_sync", "in_sync"]
+        layered.close()
+        behind.close()
+
+
+# =============================================================================
+# WRITE-BEHIND JOURNAL
+# =============================================================================
+
+class _FailingBackend(JSONFileBackend):
+    """JSON backend whose saves can be switched off."""
+
+    fail = False
+
+    def save(self, state):
+        if self.fail:
+            return False
+        return super().save(state)
+
+
+class TestWriteBehind:
+
+    @pytest.fixture
+    def paths(self, tmp_path):
+        return str(tmp_path / "registry.json"), str(tmp_path / "registry.journal")
+
+    def _open(self, paths, backend=None, **kwargs):
+        json_path, journal_path = paths
+        kwargs.setdefault("snapshot_debounce", 60.0)
+        return ContextRegistry(
+            backend=backend or JSONFileBackend(file_path=json_path),
+            write_behind=True,
+            journal_path=journal_path,
+            **kwargs,
+        )
+
+    def _import(self, registry, display_id, parent_id=None):
+        registry.import_context(display_id, f"uuid-{display_id}", display_id.split("-")[0], parent_id=parent_id)
+
+    def test_mutations_journal_without_saving(self, paths):
+        json_path, journal_path = paths
+        registry = self._open(paths)
+        self._import(registry, "SB-1")
+        self._import(registry, "SB-2", parent_id="SB-1")
+
+        assert not Path(json_path).exists(), "Snapshot should wait for the debounce"
+        with open(journal_path) as f:
+            assert len(f.readlines()) == 2
+
+        # Crash: never closed. The journal alone rebuilds the state.
+        reopened = self._open(paths)
+        assert reopened.get_children("SB-1") == ["SB-2"]
+        assert reopened.get_parent("SB-2") == "SB-1"
+        assert reopened.stats()["counters"] == {"SB": 2}
+        reopened.close()
+        registry.close()
+
+    def test_debounced_snapshot(self, paths):
+        json_path, journal_path = paths
+        registry = self._open(paths, snapshot_debounce=0.05)
+        self._import(registry, "SB-1")
+
+        deadline = time.monotonic() + 5
+        while not Path(json_path).exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert set(json.loads(Path(json_path).read_text())["contexts"]) == {"SB-1"}
+        assert not Path(journal_path + ".pending").exists()
+        registry.close()
+
+    def test_snapshot_after_n_ops(self, paths):
+        json_path, _ = paths
+        registry = self._open(paths, snapshot_every=3)
+        for n in range(1, 4):
+            self._import(registry, f"SB-{n}")
+
+        deadline = time.monotonic() + 5
+        while not Path(json_path).exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert Path(json_path).exists(), "Hitting snapshot_every should skip the debounce"
+        registry.close()
+
+    def test_clear_type_replays(self, paths):
+        registry = self._open(paths)
+        self._import(registry, "SB-1")
+        self._import(registry, "EXCH-1", parent_id="SB-1")
+        registry.flush()
+
+        registry.clear_type("EXCH")
+        self._import(registry, "EXCH-2", parent_id="SB-1")
+
+        reopened = self._open(paths)
+        assert reopened.get_all_of_type("EXCH") == ["EXCH-2"]
+        assert reopened.get_children("SB-1") == ["EXCH-2"]
+        reopened.close()
+        registry.close()
+
+    def test_torn_journal_tail_dropped(self, paths):
+        _, journal_path = paths
+        registry = self._open(paths)
+        self._import(registry, "SB-1")
+        with open(journal_path, "a") as f:
+            f.write('{"op": "put", "contex')
+
+        reopened = self._open(paths)
+        assert reopened.get_all_of_type("SB") == ["SB-1"]
+        self._import(reopened, "SB-2")
+
+        again = self._open(paths)
+        assert sorted(again.get_all_of_type("SB")) == ["SB-1", "SB-2"]
+        for r in (again, reopened, registry):
+            r.close()
+
+    def test_failed_snapshot_keeps_journal(self, paths):
+        json_path, journal_path = paths
+        backend = _FailingBackend(file_path=json_path)
+        registry = self._open(paths, backend=backend)
+        self._import(registry, "SB-1")
+
+        backend.fail = True
+        assert registry.flush() is False
+        self._import(registry, "SB-2")
+
+        reopened = self._open(paths)
+        assert sorted(reopened.get_all_of_type("SB")) == ["SB-1", "SB-2"]
+
+        backend.fail = False
+        assert registry.flush()
+        assert not Path(journal_path + ".pending").exists()
+        assert set(json.loads(Path(json_path).read_text())["contexts"]) == {"SB-1", "SB-2"}
+        reopened.close()
+        registry.close()
+
+    def test_register_journals(self, paths):
+        pytest.importorskip("uuid_extensions")
+        json_path, _ = paths
+        registry = self._open(paths)
+        root = registry.register("SB", created_by="human")
+        child = registry.register("SB", parent_id=root)
+        assert not Path(json_path).exists()
+
+        registry.close()
+        assert Path(json_path).exists()
+        reopened = ContextRegistry(backend=JSONFileBackend(file_path=json_path))
+        assert reopened.get_children(root) == [child]
+
+
+# =============================================================================
+# PATH INDEX
+# =============================================================================
+
+class TestPathIndex:
+
+    @pytest.fixture
+    def registry(self, tmp_path):
+        return ContextRegistry(backend=JSONFileBackend(file_path=str(tmp_path / "registry.json")))
+
+    def _import(self, registry, display_id, parent_id=None):
+        registry.import_context(display_id, f"uuid-{display_id}", display_id.split("-")[0], parent_id=parent_id)
+
+    def _build(self, registry):
+        # SB-1 -> SB-2 -> SB-3, SB-1 -> SB-4, SB-2 -> EXCH-1
+        self._import(registry, "SB-1")
+        self._import(registry, "SB-2", parent_id="SB-1")
+        self._import(registry, "SB-3", parent_id="SB-2")
+        self._import(registry, "SB-4", parent_id="SB-1")
+        self._import(registry, "EXCH-1", parent_id="SB-2")
+
+    def test_lineage_and_descendants(self, registry):
+        self._build(registry)
+        assert registry.get_lineage("SB-3") == ["SB-1", "SB-2", "SB-3"]
+        assert registry.get_lineage("SB-1") == ["SB-1"]
+        assert registry.get_lineage("SB-99") == ["SB-99"]
+        assert sorted(registry.get_descendants("SB-1")) == ["EXCH-1", "SB-2", "SB-3", "SB-4"]
+        assert sorted(registry.get_descendants("SB-2")) == ["EXCH-1", "SB-3"]
+        assert registry.get_descendants("SB-4") == []
+        assert registry.get_descendants("SB-99") == []
+
+    def test_out_of_order_import(self, registry):
+        # Child first: lineage stops at the unknown parent until it arrives
+        self._import(registry, "SB-3", parent_id="SB-2")
+        assert registry.get_lineage("SB-3") == ["SB-2", "SB-3"]
+
+        self._import(registry, "SB-1")
+        self._import(registry, "SB-2", parent_id="SB-1")
+        assert registry.get_lineage("SB-3") == ["SB-1", "SB-2", "SB-3"]
+        assert sorted(registry.get_descendants("SB-1")) == ["SB-2", "SB-3"]
+
+    def test_reparent_moves_subtree(self, registry):
+        self._build(registry)
+        registry.reparent("SB-2", "SB-4")
+
+        assert registry.get_lineage("SB-3") == ["SB-1", "SB-4", "SB-2", "SB-3"]
+        assert registry.get_children("SB-1") == ["SB-4"]
+        assert registry.get_children("SB-4") == ["SB-2"]
+        assert sorted(registry.get_descendants("SB-4")) == ["EXCH-1", "SB-2", "SB-3"]
+
+        registry.reparent("SB-2", None)
+        assert registry.get_lineage("EXCH-1") == ["SB-2", "EXCH-1"]
+        assert sorted(registry.get_roots()) == ["SB-1", "SB-2"]
+
+    def test_reparent_rejects_cycles(self, registry):
+        self._build(registry)
+        with pytest.raises(ValueError):
+            registry.reparent("SB-1", "SB-3")
+        with pytest.raises(ValueError):
+            registry.reparent("SB-2", "SB-99")
+
+    def test_reparent_persists(self, registry, tmp_path):
+        self._build(registry)
+        registry.save()
+        registry.reparent("SB-3", "SB-4")
+
+        reloaded = ContextRegistry(backend=JSONFileBackend(file_path=str(tmp_path / "registry.json")))
+        assert reloaded.get_lineage("SB-3") == ["SB-1", "SB-4", "SB-3"]
+        assert "SB-3" not in reloaded.get_children("SB-2")
+
+    def test_clear_type_updates_paths(self, registry):
+        self._build(registry)
+        registry.clear_type("SB")
+        assert registry.get_lineage("EXCH-1") == ["SB-2", "EXCH-1"]
+        assert registry.get_descendants("SB-1") == []
+
+    def test_get_tree(self, registry):
+        self._build(registry)
+        tree = registry.get_tree("SB-1")
+
+        assert tree["id"] == "SB-1"
+        assert [c["id"] for c in tree["children"]] == ["SB-2", "SB-4"]
+        assert [c["id"] for c in tree["children"][0]["children"]] == ["SB-3"], "EXCH entries stay out of the tree"
+
+        forest = registry.get_tree()
+        assert [r["id"] for r in forest["roots"]] == ["SB-1"]
+        assert registry.get_tree("SB-99") == {}
+
+
+# =============================================================================
+# TYPE AND ROOT INDEXES
+# =============================================================================
+
+class TestTypeIndex:
+
+    @pytest.fixture
+    def registry(self, tmp_path):
+        return ContextRegistry(backend=JSONFileBackend(file_path=str(tmp_path / "registry.json")))
+
+    def _import(self, registry, display_id, parent_id=None):
+        registry.import_context(display_id, f"uuid-{display_id}", display_id.split("-")[0], parent_id=parent_id)
+
+    def test_queries_follow_mutations(self, registry):
+        self._import(registry, "SB-1")
+        self._import(registry, "SB-2", parent_id="SB-1")
+        self._import(registry, "EXCH-1", parent_id="SB-2")
+        self._import(registry, "CITE-1")
+
+        assert registry.get_all_of_type("SB") == ["SB-1", "SB-2"]
+        assert registry.get_all_of_type("EXCH") == ["EXCH-1"]
+        assert registry.get_all_of_type("GOLD") == []
+        assert registry.get_roots() == ["SB-1", "CITE-1"]
+        assert registry.get_roots(context_type="SB") == ["SB-1"]
+        assert registry.get_roots(context_type="CITE") == ["CITE-1"]
+
+        registry.reparent("SB-2", None)
+        assert registry.get_roots(context_type="SB") == ["SB-1", "SB-2"]
+        registry.reparent("SB-2", "SB-1")
+        assert registry.get_roots(context_type="SB") == ["SB-1"]
+
+        registry.clear_type("SB")
+        assert registry.get_all_of_type("SB") == []
+        assert registry.get_roots() == ["CITE-1"]
+        assert registry.get_all_of_type("EXCH") == ["EXCH-1"]
+        assert registry.stats()["root_count"] == 1
+
+    def test_indexes_rebuilt_on_load(self, registry, tmp_path):
+        self._import(registry, "SB-1")
+        self._import(registry, "EXCH-1", parent_id="SB-1")
+        registry.save()
+
+        reloaded = ContextRegistry(backend=JSONFileBackend(file_path=str(tmp_path / "registry.json")))
+        assert reloaded.get_all_of_type("EXCH") == ["EXCH-1"]
+        assert reloaded.get_roots(context_type="SB") == ["SB-1"]
+
+
+# =============================================================================
+# PERFORMANCE BENCHMARK
+# =============================================================================
+
+@pytest.mark.slow
+def test_million_id_benchmark(tmp_path):
+    """
+    1M registered IDs: 1,000 sidebars with 999 exchanges each.
+
+    Reports timings rather than gating on them - the soft thresholds only
+    catch a query going back to scanning every entry.
+    """
+    registry = ContextRegistry(backend=JSONFileBackend(file_path=str(tmp_path / "registry.json")))
+
+    start = time.perf_counter()
+    exch = 0
+    for sb in range(1, 1001):
+        sb_id = f"SB-{sb}"
+        registry.import_context(sb_id, f"uuid-{sb_id}", "SB")
+        for _ in range(999):
+            exch += 1
+            registry.import_context(f"EXCH-{exch}", f"uuid-EXCH-{exch}", "EXCH", parent_id=sb_id)
+    build = time.perf_counter() - start
+    assert registry.stats()["total_contexts"] == 1_000_000
+
+    def timed(fn, repeat=20):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            result = fn()
+        return result, (time.perf_counter() - start) / repeat * 1000
+
+    sidebars, all_of_type_ms = timed(lambda: registry.get_all_of_type("SB"))
+    roots, roots_ms = timed(lambda: registry.get_roots(context_type="SB"))
+    lineage, lineage_ms = timed(lambda: registry.get_lineage("EXCH-500000"))
+    descendants, descendants_ms = timed(lambda: registry.get_descendants("SB-500"))
+
+    print(f"\n    Build: 1M IDs in {build:.1f}s"
+          f"\n    get_all_of_type('SB'): {all_of_type_ms:.3f}ms"
+          f"\n    get_roots('SB'): {roots_ms:.3f}ms"
+          f"\n    get_lineage: {lineage_ms:.4f}ms"
+          f"\n    get_descendants (999): {descendants_ms:.3f}ms")
+
+    assert len(sidebars) == 1000 and len(roots) == 1000
+    assert lineage == ["SB-501", "EXCH-500000"]
+    assert len(descendants) == 999
+    assert all_of_type_ms < 10, f"get_all_of_type too slow: {all_of_type_ms:.2f}ms"
+    assert roots_ms < 10, f"get_roots too slow: {roots_ms:.2f}ms"
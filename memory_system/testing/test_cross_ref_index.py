@@ -0,0 +1,193 @@
+"""
+Cross-Ref Index Tests
+
+Covers CrossRefIndex and the orchestrator queries built on it:
+- Postings and adjacency follow put / re-put / remove
+- add / update / validate / revoke_cross_ref keep the index current
+- Indexed queries match a full scan of every context's refs
+- Query time vs. graph size (benchmark)
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add core directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "core"))
+
+from cross_ref_index import CrossRefIndex
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+
+class TestCrossRefIndex:
+
+    def test_postings_and_adjacency(self):
+        index = CrossRefIndex()
+        index.put("SB-1", "SB-2", {"ref_type": "depends_on", "human_validated": None})
+        index.put("SB-3", "SB-2", {"ref_type": "cites", "human_validated": "true"})
+        index.put("SB-1", "SB-3", {"ref_type": "depends_on", "cluster_flagged": True})
+
+        assert len(index) == 3
+        assert index.find(target_id="SB-2") == [("SB-1", "SB-2"), ("SB-3", "SB-2")]
+        assert index.find(ref_type="depends_on", validated=None) == [("SB-1", "SB-2"), ("SB-1", "SB-3")]
+        assert index.find(target_id="SB-2", validated="true") == [("SB-3", "SB-2")]
+        assert index.find(flagged=True) == [("SB-1", "SB-3")]
+        assert index.refs_from("SB-1") == ["SB-2", "SB-3"]
+        assert index.refs_to("SB-2") == ["SB-1", "SB-3"]
+        assert list(index.edges_between("SB-2", "SB-1")) == [("SB-1", "SB-2")]
+
+    def test_put_again_moves_postings(self):
+        index = CrossRefIndex()
+        index.put("SB-1", "SB-2", {"ref_type": "cites", "human_validated": None})
+        index.put("SB-1", "SB-2", {"ref_type": "implements", "human_validated": "true"})
+
+        assert index.find(ref_type="cites") == []
+        assert index.find(validated=None) == []
+        assert index.find(ref_type="implements", validated="true") == [("SB-1", "SB-2")]
+        assert index.ref_type("SB-1", "SB-2") == "implements"
+
+    def test_remove_cleans_up(self):
+        index = CrossRefIndex()
+        index.put("SB-1", "SB-2", {"ref_type": "cites"})
+        index.remove("SB-1", "SB-2")
+        index.remove("SB-1", "SB-2")  # No-op
+
+        assert len(index) == 0
+        assert index.find(ref_type="cites") == []
+        assert index.refs_from("SB-1") == [] and index.refs_to("SB-2") == []
+        assert index._postings == {} and index._out == {} and index._in == {}
+
+    def test_rebuild(self):
+        index = CrossRefIndex()
+        index.put("SB-9", "SB-8", {"ref_type": "cites"})
+        index.rebuild([("SB-1", {"SB-2": {"ref_type": "blocks"}}), ("SB-2", {})])
+
+        assert index.find() == [("SB-1", "SB-2")]
+
+
+# =============================================================================
+# ORCHESTRATOR
+# =============================================================================
+
+def _scan(orch):
+    """Every ref as the index should see it, read straight from the contexts."""
+    return {
+        (source_id, target_id): (m.get("ref_type"), m.get("human_validated"), bool(m.get("cluster_flagged")))
+        for source_id, context in orch._contexts.items()
+        for target_id, m in context.cross_sidebar_refs.items()
+    }
+
+
+def _indexed(orch):
+    index = orch._cross_refs()
+    return {
+        key: (index.ref_type(*key), index._terms[key][2][1], key in index.find(flagged=True))
+        for key in index.find()
+    }
+
+
+class TestOrchestratorIndex:
+
+    def test_mutations_keep_index_current(self, orch):
+        a, b, c = (orch.create_root_context(task_description=n) for n in "abc")
+        orch._cross_refs()  # Build first so every change below is incremental
+
+        orch.add_cross_ref(a, b, ref_type="depends_on")
+        for agent in ("X", "Y", "Z"):
+            orch.add_cross_ref(a, c, ref_type="cites", suggested_by=agent)
+        orch.update_cross_ref(a, b, reason="closer look", new_ref_type="implements")
+        orch.validate_cross_ref(a, c, validation_state="true")
+        orch.revoke_cross_ref(b, a, reason="wrong")
+
+        assert _indexed(orch) == _scan(orch)
+        assert orch._cross_refs().find(flagged=True) == [(a, c)]
+
+    def test_contradictions(self, orch):
+        a, b, c = (orch.create_root_context(task_description=n) for n in "abc")
+        orch.add_cross_ref(a, b, ref_type="depends_on", bidirectional=False)
+        orch.add_cross_ref(b, a, ref_type="blocks", bidirectional=False)
+        orch.add_cross_ref(a, c, ref_type="related_to")
+
+        found = orch.detect_contradictions()
+        assert [r["contradiction_type"] for r in found] == ["depends_on_vs_blocks"]
+        assert sorted(found[0]["contexts"]) == sorted([a, b])
+        assert {(r["from"], r["ref_type"]) for r in found[0]["conflicting_refs"]} == {(a, "depends_on"), (b, "blocks")}
+
+        # Scoped to a context: refs in either direction count
+        assert len(orch.detect_contradictions(context_id=b)) == 1
+        assert orch.detect_contradictions(context_id=c) == []
+
+        orch.revoke_cross_ref(b, a, reason="resolved")
+        assert orch.detect_contradictions() == []
+
+    def test_cluster_flagged_skips_validated(self, orch):
+        a, b = (orch.create_root_context(task_description=n) for n in "ab")
+        for agent in ("X", "Y", "Z"):
+            orch.add_cross_ref(a, b, suggested_by=agent)
+        assert orch.get_cluster_flagged_refs()["count"] == 1
+
+        # Direct metadata edits are re-checked live
+        orch.get_context(a).cross_sidebar_refs[b]["human_validated"] = True
+        assert orch.get_cluster_flagged_refs()["count"] == 0
+        assert orch.get_cluster_flagged_refs(include_validated=True)["count"] == 1
+
+    def test_pending_validations(self, orch):
+        a, b, c = (orch.create_root_context(task_description=n) for n in "abc")
+        orch.add_cross_ref(a, b)
+        orch.add_cross_ref(a, c, bidirectional=False)
+        orch.validate_cross_ref(a, b, validation_state="false")
+
+        pending = {(p["source_context_id"], p["target_context_id"]) for p in orch.get_pending_validations()}
+        assert pending == {(b, a), (a, c)}
+
+
+# =============================================================================
+# PERFORMANCE BENCHMARK
+# =============================================================================
+
+@pytest.mark.slow
+@pytest.mark.parametrize("count", [100, 1_000, 10_000])
+def test_cross_ref_query_benchmark(orch, count):
+    """
+    Query time vs. context count, with two refs per context.
+
+    Only one pair contradicts and one ref is cluster-flagged, so the
+    indexed queries should stay flat as the graph grows (the cites refs
+    never seed a contradiction search while "contradicts" is rarer).
+    """
+    from datashapes import SidebarContext
+
+    # Straight into the orchestrator - registering each would dominate setup
+    ids = [f"SB-{n}" for n in range(1, count + 1)]
+    for context_id in ids:
+        orch._contexts[context_id] = SidebarContext(sidebar_id=context_id, uuid=f"uuid-{context_id}")
+    for n, context_id in enumerate(ids):
+        orch.add_cross_ref(context_id, ids[(n + 1) % count], ref_type="related_to", bidirectional=False)
+        orch.add_cross_ref(context_id, ids[(n + 7) % count], ref_type="cites", bidirectional=False)
+    orch.add_cross_ref(ids[3], ids[5], ref_type="implements", bidirectional=False)
+    orch.add_cross_ref(ids[5], ids[3], ref_type="contradicts", bidirectional=False)
+    for agent in ("X", "Y", "Z"):
+        orch.add_cross_ref(ids[2], ids[9], ref_type="cites", suggested_by=agent, bidirectional=False)
+    orch._cross_refs()
+
+    timings = {}
+    for name, query in [
+        ("contradictions", orch.detect_contradictions),
+        ("cluster_flagged", orch.get_cluster_flagged_refs),
+        ("chain_stability", lambda: orch.check_chain_stability(ids[0])),
+    ]:
+        start = time.perf_counter()
+        for _ in range(100):
+            query()
+        timings[name] = (time.perf_counter() - start) * 10  # ms per call
+
+    print(f"\n    {count:>5} contexts: " + ", ".join(f"{k} {v:.3f}ms" for k, v in timings.items()))
+
+    assert len(orch.detect_contradictions()) == 1
+    assert orch.get_cluster_flagged_refs()["count"] == 1
+    assert timings["contradictions"] < 5 and timings["cluster_flagged"] < 5
@@ -0,0 +1,239 @@
+"""
+Exchange Write Pipeline Tests
+
+Covers ExchangeWritePipeline and ConversationOrchestrator.submit_exchange:
+- Durability levels (memory / local / chained) and what each ack reports
+- Staged units committed together (one transaction, one Ozolith batch)
+- Failed commits stay staged and are retried; one bad unit doesn't block the rest
+"""
+
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add core directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "core"))
+
+pytest.importorskip("uuid_extensions")
+
+import conversation_orchestrator
+from conversation_orchestrator import ConversationOrchestrator
+from context_registry import ContextRegistry, JSONFileBackend
+from exchange_pipeline import ExchangeDurability
+from ozolith import OzolithEventType
+
+
+@pytest.fixture
+def stores(scratch_stores):
+    return scratch_stores(ozolith=True)
+
+
+@pytest.fixture
+def pipeline_orch(stores):
+    orchestrator = ConversationOrchestrator(auto_load=False)
+    orchestrator.create_root_context(task_description="pipeline test")
+    return orchestrator
+
+
+def _exchange_events(oz):
+    return [e for e in oz.get_entries() if e.event_type == OzolithEventType.EXCHANGE]
+
+
+def _stored_exchanges(db, context_id):
+    return db._load_exchanges(context_id)
+
+
+# =============================================================================
+# DURABILITY LEVELS
+# =============================================================================
+
+class TestDurability:
+
+    def test_chained_commits_everything(self, pipeline_orch, stores):
+        db, registry, oz = stores
+        root_id = pipeline_orch.get_active_context_id()
+
+        ack = pipeline_orch.submit_exchange(root_id, "hi", "hello")
+
+        assert ack.durability is ExchangeDurability.CHAINED and ack.satisfied
+        assert [e["exchange_id"] for e in _stored_exchanges(db, root_id)] == [ack.exchange_id]
+        events = _exchange_events(oz)
+        assert len(events) == 1 and events[0].sequence == ack.ozolith_sequence
+
+        reloaded = ContextRegistry(backend=JSONFileBackend(file_path=registry._backend.file_path))
+        assert reloaded.get_entry(ack.exchange_id) is not None
+
+    def test_local_defers_ozolith(self, pipeline_orch, stores):
+        db, _, oz = stores
+        root_id = pipeline_orch.get_active_context_id()
+        pipeline_orch._exchange_pipeline.window = 60     # Keep the background thread out of the way
+
+        ack = pipeline_orch.submit_exchange(root_id, "hi", "hello", durability=ExchangeDurability.LOCAL)
+
+        assert ack.durability is ExchangeDurability.LOCAL and ack.ozolith_sequence is None
+        assert len(_stored_exchanges(db, root_id)) == 1
+        assert _exchange_events(oz) == []
+
+        assert pipeline_orch.flush_exchanges()
+        assert len(_exchange_events(oz)) == 1
+
+    def test_memory_commits_in_background(self, pipeline_orch, stores):
+        db, _, oz = stores
+        root_id = pipeline_orch.get_active_context_id()
+
+        ack = pipeline_orch.submit_exchange(root_id, "hi", "hello", durability=ExchangeDurability.MEMORY)
+
+        assert ack.durability is ExchangeDurability.MEMORY
+        assert pipeline_orch.get_context(root_id).local_memory[-1]["exchange_id"] == ack.exchange_id
+
+        deadline = time.monotonic() + 5
+        while pipeline_orch._exchange_pipeline.pending() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert pipeline_orch._exchange_pipeline.pending() == 0
+        assert len(_stored_exchanges(db, root_id)) == 1
+        assert len(_exchange_events(oz)) == 1
+
+    def test_add_exchange_is_chained(self, pipeline_orch, stores):
+        db, _, oz = stores
+        root_id = pipeline_orch.get_active_context_id()
+
+        exchange_id = pipeline_orch.add_exchange(root_id, "hi", "hello")
+
+        assert _stored_exchanges(db, root_id)[-1]["exchange_id"] == exchange_id
+        assert _exchange_events(oz)[-1].payload["exchange_id"] == exchange_id
+
+
+# =============================================================================
+# BATCHING
+# =============================================================================
+
+class TestBatching:
+
+    def test_staged_units_commit_together(self, pipeline_orch, stores):
+        db, _, oz = stores
+        root_id = pipeline_orch.get_active_context_id()
+        pipeline = pipeline_orch._exchange_pipeline
+        pipeline.window = 60
+        batches_before = oz.commit_stats()["batches"]
+
+        acks = [pipeline_orch.submit_exchange(root_id, f"q{i}", f"a{i}", durability=ExchangeDurability.MEMORY)
+                for i in range(5)]
+        ack = pipeline_orch.submit_exchange(root_id, "q5", "a5")
+
+        stats = pipeline.stats()
+        assert stats["local_commits"] == 1 and stats["chained_commits"] == 1
+        assert oz.commit_stats()["batches"] == batches_before + 1
+
+        # Ozolith events land in staging order
+        ids = [a.exchange_id for a in acks] + [ack.exchange_id]
+        assert [e.payload["exchange_id"] for e in _exchange_events(oz)] == ids
+        assert [e["exchange_id"] for e in _stored_exchanges(db, root_id)] == ids
+
+    def test_failed_commit_is_retried(self, pipeline_orch, stores):
+        db, _, oz = stores
+        root_id = pipeline_orch.get_active_context_id()
+        pipeline = pipeline_orch._exchange_pipeline
+        pipeline.window = 60
+
+        real_append_many = oz.append_many
+
+        def failing_append_many(events):
+            raise OSError("disk full")
+
+        oz.append_many = failing_append_many
+        try:
+            ack = pipeline_orch.submit_exchange(root_id, "hi", "hello")
+        finally:
+            oz.append_many = real_append_many
+
+        # SQLite got it; the chain didn't, and the ack says so
+        assert ack.durability is ExchangeDurability.LOCAL and not ack.satisfied
+        assert pipeline.stats()["failed_commits"] == 1
+        assert len(_stored_exchanges(db, root_id)) == 1
+
+        assert pipeline.flush()
+        assert len(_exchange_events(oz)) == 1
+
+    def test_failed_oversized_batch_not_duplicated(self, pipeline_orch, stores):
+        _, _, oz = stores
+        root_id = pipeline_orch.get_active_context_id()
+        pipeline = pipeline_orch._exchange_pipeline
+        pipeline.window = 60
+        oz._writer.max_batch = 2    # The staged batch is bigger than one group-commit batch
+
+        for i in range(5):
+            pipeline_orch.submit_exchange(root_id, f"q{i}", f"a{i}", durability=ExchangeDurability.MEMORY)
+
+        # Any flush after the first fails - a batch split across flushes
+        # would leave its first part chained and then retry all of it
+        real_flush, flushes = oz._writer._flush_fn, []
+
+        def flaky_flush(items):
+            flushes.append(len(items))
+            if len(flushes) > 1:
+                raise OSError("disk full")
+            real_flush(items)
+
+        oz._writer._flush_fn = flaky_flush
+        try:
+            pipeline.flush()
+        finally:
+            oz._writer._flush_fn = real_flush
+
+        assert flushes == [5], f"Batch should be one flush, got {flushes}"
+        assert pipeline.flush()
+        assert len(_exchange_events(oz)) == 5
+        assert oz.verify_chain(full=True)[0]
+
+    def test_poisoned_unit_does_not_block_others(self, pipeline_orch, stores):
+        db, _, oz = stores
+        root_id = pipeline_orch.get_active_context_id()
+        other_id = pipeline_orch.create_root_context(task_description="other")
+
+        # Not JSON-serialisable, so this exchange's SQLite write fails every time
+        bad = pipeline_orch.submit_exchange(root_id, "bad", "x", metadata={"when": datetime.now()})
+        assert bad.durability is ExchangeDurability.MEMORY and isinstance(bad.error, TypeError)
+        ids = [pipeline_orch.add_exchange(other_id, f"q{i}", f"a{i}") for i in range(3)]
+
+        assert [e["exchange_id"] for e in _stored_exchanges(db, other_id)] == ids
+        assert [e.payload["exchange_id"] for e in _exchange_events(oz)] == ids
+
+        # Only the bad unit is left to retry
+        stats = pipeline_orch._exchange_pipeline.stats()
+        assert stats["staged"] == 1 and stats["unchained"] == 0
+
+    def test_add_exchange_raises_if_not_chained(self, pipeline_orch, stores):
+        _, _, oz = stores
+        root_id = pipeline_orch.get_active_context_id()
+        pipeline_orch._exchange_pipeline.window = 60
+
+        real_append_many = oz.append_many
+
+        def failing_append_many(events):
+            raise OSError("disk full")
+
+        oz.append_many = failing_append_many
+        try:
+            with pytest.raises(OSError, match="disk full"):
+                pipeline_orch.add_exchange(root_id, "hi", "hello")
+        finally:
+            oz.append_many = real_append_many
+
+        assert pipeline_orch.flush_exchanges()
+        assert len(_exchange_events(oz)) == 1
+
+    def test_without_ozolith_stops_at_local(self, pipeline_orch, stores, monkeypatch):
+        db, _, _ = stores
+        root_id = pipeline_orch.get_active_context_id()
+        monkeypatch.setattr(conversation_orchestrator, "_ozolith_instance", None)
+        monkeypatch.setattr(conversation_orchestrator, "_get_ozolith", lambda: None)
+        pipeline_orch._exchange_pipeline._get_ozolith = conversation_orchestrator._get_ozolith
+
+        ack = pipeline_orch.submit_exchange(root_id, "hi", "hello")
+
+        assert ack.durability is ExchangeDurability.LOCAL
+        assert pipeline_orch._exchange_pipeline.pending() == 0
+        assert len(_stored_exchanges(db, root_id)) == 1
@@ -0,0 +1,198 @@
+"""
+Exchange Sequence Tests
+
+Covers ExchangeSequence (structural-sharing exchange views):
+- List semantics: indexing, slicing, iteration, +, ==
+- Views stay fixed while their source lists grow
+- Tags are applied on read, never written into the source dicts
+- spawn_sidebar / get_context_for_llm share the parent's storage
+- Memory growth with deep fork trees (benchmark)
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add core directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "core"))
+
+from exchange_sequence import ExchangeSequence
+
+
+def _exchanges(n, prefix="e"):
+    return [{"exchange_id": f"{prefix}{i}", "user": f"q{i}"} for i in range(n)]
+
+
+# =============================================================================
+# SEQUENCE SEMANTICS
+# =============================================================================
+
+class TestSequenceSemantics:
+
+    def test_matches_list(self):
+        a, b = _exchanges(5, "a"), _exchanges(7, "b")
+        seq = ExchangeSequence.concat(a, b)
+        expected = a + b
+
+        assert len(seq) == 12
+        assert seq == expected and list(seq) == expected
+        assert [seq[i] for i in range(-12, 12)] == expected + expected
+        with pytest.raises(IndexError):
+            seq[12]
+
+    @pytest.mark.parametrize("bounds", [(0, 12), (2, 9), (5, 6), (-4, None), (3, 3), (10, 2), (None, -20)])
+    def test_slices_match_list(self, bounds):
+        a, b, c = _exchanges(5, "a"), _exchanges(3, "b"), _exchanges(4, "c")
+        seq = ExchangeSequence.concat(a, b, c)
+        lo, hi = bounds
+
+        assert seq[lo:hi] == (a + b + c)[lo:hi]
+        assert seq[::3] == (a + b + c)[::3]
+
+    def test_slice_is_a_view(self):
+        source = _exchanges(100)
+        view = ExchangeSequence.of(source)[10:90][5:15]
+
+        assert view.segment_count == 1
+        assert view[0] is source[15]
+        assert list(view) == source[15:25]
+
+    def test_add_with_lists(self):
+        a, b = _exchanges(2, "a"), _exchanges(2, "b")
+        seq = ExchangeSequence.of(a)
+
+        assert (seq + b) == a + b
+        assert (b + seq) == b + a
+        assert isinstance(b + seq, ExchangeSequence)
+
+    def test_empty(self):
+        empty = ExchangeSequence()
+        assert len(empty) == 0 and list(empty) == [] and empty == []
+        assert ExchangeSequence.concat([], empty, []).segment_count == 0
+
+    def test_json_via_list(self):
+        source = _exchanges(3)
+        seq = ExchangeSequence.of(source, tags={"_inherited": True})
+        assert json.loads(json.dumps(list(seq))) == [{**e, "_inherited": True} for e in source]
+
+
+# =============================================================================
+# SHARING
+# =============================================================================
+
+class TestSharing:
+
+    def test_view_fixed_while_source_grows(self):
+        source = _exchanges(3)
+        view = ExchangeSequence.of(source)
+        source.append({"exchange_id": "late"})
+
+        assert len(view) == 3
+        assert [e["exchange_id"] for e in view] == ["e0", "e1", "e2"]
+
+    def test_tags_applied_on_read(self):
+        source = _exchanges(3)
+        view = ExchangeSequence.of(source, 1, tags={"_inherited": True, "_inherited_from": "SB-1"})
+
+        assert view[0] == {**source[1], "_inherited": True, "_inherited_from": "SB-1"}
+        assert all(e["_inherited_from"] == "SB-1" for e in view)
+        assert all("_inherited" not in e for e in source)
+
+    def test_nested_views_reference_source(self):
+        source = _exchanges(10)
+        child = ExchangeSequence.of(source, 2, tags={"_inherited_from": "SB-1"})
+        grandchild = ExchangeSequence.of(child, -3, tags={"_inherited_from": "SB-2"})
+
+        assert grandchild.segment_count == 1
+        assert [e["exchange_id"] for e in grandchild] == ["e7", "e8", "e9"]
+        assert grandchild[0]["_inherited_from"] == "SB-2"
+
+
+# =============================================================================
+# ORCHESTRATOR
+# =============================================================================
+
+def _fill(orch, context_id, n):
+    context = orch.get_context(context_id)
+    for i in range(n):
+        context.local_memory.append({"exchange_id": f"{context_id}-{i}", "user": "q", "assistant": "a"})
+
+
+class TestOrchestratorViews:
+
+    def test_spawn_shares_parent_storage(self, orch):
+        root_id = orch.create_root_context(task_description="root")
+        _fill(orch, root_id, 10)
+        parent = orch.get_context(root_id)
+
+        child_id = orch.spawn_sidebar(root_id, "look closer", inherit_last_n=4)
+        inherited = orch.get_context(child_id).inherited_memory
+
+        assert len(inherited) == 4
+        assert [e["exchange_id"] for e in inherited] == [f"{root_id}-{i}" for i in range(6, 10)]
+        assert all(e["_inherited"] and e["_inherited_from"] == root_id for e in inherited)
+        # The parent's own exchanges aren't marked
+        assert all("_inherited" not in e for e in parent.local_memory)
+
+    def test_context_for_llm_is_a_view(self, orch):
+        root_id = orch.create_root_context(task_description="root")
+        _fill(orch, root_id, 5)
+        child_id = orch.spawn_sidebar(root_id, "branch")
+        _fill(orch, child_id, 3)
+
+        view = orch.get_context_for_llm(child_id)
+
+        assert len(view) == 8 and view.segment_count == 2
+        assert view[-1]["exchange_id"] == f"{child_id}-2"
+        assert [e["exchange_id"] for e in view][:5] == [f"{root_id}-{i}" for i in range(5)]
+
+
+# =============================================================================
+# PERFORMANCE BENCHMARK
+# =============================================================================
+
+def _footprint(seq: ExchangeSequence) -> int:
+    """Bytes a view holds itself - everything but the shared source lists."""
+    size = sys.getsizeof(seq) + sys.getsizeof(seq._segments) + sys.getsizeof(seq._offsets)
+    for segment in seq._segments:
+        size += sys.getsizeof(segment) + (sys.getsizeof(segment[3]) if segment[3] else 0)
+    return size
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("depth", [10, 100, 500])
+def test_deep_fork_memory_benchmark(orch, depth):
+    """
+    Memory held by a chain of forks, each inheriting all of its parent.
+
+    Every level adds 200 exchanges, then spawns the next. Compared with a
+    list copy of each parent's local_memory (the old snapshot), a view's
+    own footprint is a small constant per fork.
+    """
+    per_level = 200
+    context_id = orch.create_root_context(task_description="root")
+
+    view_bytes = copy_bytes = 0
+    start = time.perf_counter()
+    for _ in range(depth):
+        _fill(orch, context_id, per_level)
+        copy_bytes += sys.getsizeof(list(orch.get_context(context_id).local_memory))
+        context_id = orch.spawn_sidebar(context_id, "deeper")
+        view_bytes += _footprint(orch.get_context(context_id).inherited_memory)
+    elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        view = orch.get_context_for_llm(context_id)
+    view_us = (time.perf_counter() - start) * 1000
+
+    print(f"\n    depth {depth:>5}: inherited views {view_bytes / depth:,.0f} B/fork"
+          f" vs list copies {copy_bytes / depth:,.0f} B/fork"
+          f" (build {elapsed:.2f}s, LLM view {view_us:.1f}us)")
+
+    assert len(view) == per_level
+    assert view_bytes < copy_bytes
+    assert view_bytes / depth < 1024, "A fork's view should not grow with its parent's history"
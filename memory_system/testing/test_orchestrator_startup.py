@@ -0,0 +1,109 @@
+"""
+Orchestrator Startup Loader Tests
+
+Covers ConversationOrchestrator._load_from_persistence:
+- Parent-before-child ordering (single pass, orphans and cycles kept)
+- Load metrics
+- Startup benchmark at 1k / 10k / 100k sidebars
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add core directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "core"))
+
+pytest.importorskip("uuid_extensions")
+
+from conversation_orchestrator import ConversationOrchestrator
+from datashapes import SidebarContext
+
+
+def _ctx(sidebar_id, parent_id=None) -> SidebarContext:
+    return SidebarContext(sidebar_id=sidebar_id, uuid=f"uuid-{sidebar_id}", parent_context_id=parent_id)
+
+
+# =============================================================================
+# ORDERING
+# =============================================================================
+
+class TestOrderParentsFirst:
+
+    def _positions(self, ordered):
+        return {ctx.sidebar_id: i for i, ctx in enumerate(ordered)}
+
+    def test_parents_precede_children(self):
+        # Children listed before their parents on purpose
+        contexts = [_ctx("SB-4", "SB-3"), _ctx("SB-3", "SB-1"), _ctx("SB-2", "SB-1"), _ctx("SB-1")]
+        ordered, orphaned, cyclic = ConversationOrchestrator._order_parents_first(contexts)
+
+        pos = self._positions(ordered)
+        assert len(ordered) == 4
+        assert pos["SB-1"] < pos["SB-2"] and pos["SB-1"] < pos["SB-3"] < pos["SB-4"]
+        assert (orphaned, cyclic) == (0, 0)
+
+    def test_orphans_and_cycles_kept(self):
+        contexts = [_ctx("SB-1"), _ctx("SB-2", "SB-gone"), _ctx("SB-5", "SB-6"), _ctx("SB-6", "SB-5")]
+        ordered, orphaned, cyclic = ConversationOrchestrator._order_parents_first(contexts)
+
+        assert {ctx.sidebar_id for ctx in ordered} == {"SB-1", "SB-2", "SB-5", "SB-6"}
+        assert (orphaned, cyclic) == (1, 2)
+        assert [ctx.sidebar_id for ctx in ordered[-2:]] == ["SB-5", "SB-6"]
+
+
+# =============================================================================
+# LOADER
+# =============================================================================
+
+def test_load_from_persistence_metrics(scratch_stores):
+    db, registry, _ = scratch_stores()
+    with db.batch():
+        db.save_context(_ctx("SB-1"))
+        db.save_context(_ctx("SB-2", "SB-1"))
+        db.save_context(_ctx("SB-3", "SB-2"))
+
+    orch = ConversationOrchestrator(auto_load=True)
+
+    metrics = orch.stats()["startup_load"]
+    assert metrics["contexts"] == 3
+    assert metrics["imported"] == 3
+    assert metrics["orphaned"] == 0 and metrics["cyclic"] == 0
+    assert metrics["total_seconds"] >= metrics["order_seconds"]
+    assert registry.get_lineage("SB-3") == ["SB-1", "SB-2", "SB-3"]
+
+
+# =============================================================================
+# PERFORMANCE BENCHMARK
+# =============================================================================
+
+@pytest.mark.slow
+@pytest.mark.parametrize("count", [1_000, 10_000, 100_000])
+def test_startup_benchmark(scratch_stores, count):
+    """
+    Startup time vs. sidebar count.
+
+    Trees are built 10 wide (SB-n hangs off SB-((n - 2) // 10 + 1)), so
+    depth grows with count. Reports the loader's own metrics; the soft
+    floor only catches a regression to quadratic ordering.
+    """
+    db, _, _ = scratch_stores()
+    with db.batch():
+        for n in range(1, count + 1):
+            parent = f"SB-{(n - 2) // 10 + 1}" if n > 1 else None
+            db.save_context(_ctx(f"SB-{n}", parent))
+
+    start = time.perf_counter()
+    orch = ConversationOrchestrator(auto_load=True)
+    elapsed = time.perf_counter() - start
+
+    metrics = orch.stats()["startup_load"]
+    print(f"\n    {count:>7,} sidebars: {elapsed:.2f}s total"
+          f" (fetch {metrics['fetch_seconds']:.2f}s,"
+          f" order {metrics['order_seconds']:.3f}s,"
+          f" import {metrics['import_seconds']:.2f}s)")
+
+    assert metrics["contexts"] == count
+    assert metrics["order_seconds"] < count / 50_000 + 0.5
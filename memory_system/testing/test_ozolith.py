@@ -195,7 +195,8 @@ def test_hash_chain_integrity(suite: TestSuite):
         original_payload = oz._entries[0].payload.copy()
         oz._entries[0].payload["tampered"] = True
 
-        valid, bad_idx = oz.verify_chain()
+        # Entry 1 was verified above, so only a full walk re-hashes it
+        valid, bad_idx = oz.verify_chain(full=True)
 
         # Restore
         oz._entries[0].payload = original_payload
@@ -210,7 +211,7 @@ def test_hash_chain_integrity(suite: TestSuite):
         original_hash = oz._entries[0].entry_hash
         oz._entries[0].entry_hash = "tampered_hash_value"
 
-        valid, bad_idx = oz.verify_chain()
+        valid, bad_idx = oz.verify_chain(full=True)
 
         # Restore
         oz._entries[0].entry_hash = original_hash
@@ -227,7 +228,7 @@ def test_hash_chain_integrity(suite: TestSuite):
         original_prev = oz._entries[1].previous_hash
         oz._entries[1].previous_hash = "broken_link"
 
-        valid, bad_idx = oz.verify_chain()
+        valid, bad_idx = oz.verify_chain(full=True)
 
         # Restore
         oz._entries[1].previous_hash = original_prev
@@ -2096,6 +2097,70 @@ def test_performance(suite: TestSuite):
 
     suite.run_test("Stats performance benchmark", test_stats_performance)
 
+    # Test: Single-pass encoding vs the old triple encoding, by payload size
+    def test_append_encoding_throughput():
+        """Appends/sec before and after the canonical encoding cache."""
+        from dataclasses import asdict
+
+        class TripleEncodingOzolith(Ozolith):
+            """Append path as it was: payload encoded to sign, to hash, and to write."""
+
+            def _build_entry(self, event_type, context_id, actor, payload, sequence, previous_hash):
+                entry = OzolithEntry(
+                    sequence=sequence,
+                    timestamp=datetime.utcnow().isoformat() + "Z",
+                    previous_hash=previous_hash,
+                    event_type=event_type,
+                    context_id=context_id,
+                    actor=actor,
+                    payload=payload
+                )
+                entry.signature = self._compute_signature({
+                    'sequence': entry.sequence,
+                    'timestamp': entry.timestamp,
+                    'previous_hash': entry.previous_hash,
+                    'event_type': entry.event_type.value,
+                    'context_id': entry.context_id,
+                    'actor': entry.actor,
+                    'payload': entry.payload
+                })
+                entry.entry_hash = self._compute_hash(self._build_entry_for_hashing(entry))
+                return entry
+
+            def _serialize_entry(self, entry):
+                entry_dict = asdict(entry)
+                entry_dict['event_type'] = entry.event_type.value
+                return json.dumps(entry_dict)
+
+        def make_payload(size: int) -> dict:
+            """Exchange-like payload of roughly `size` bytes of JSON."""
+            payload = {"confidence": 0.82, "uncertainty_flags": ["ambiguous"], "turns": []}
+            while len(json.dumps(payload)) < size:
+                n = len(payload["turns"])
+                payload["turns"].append({"n": n, "role": "assistant", "text": f"turn {n} " + "lorem ipsum " * 3})
+            return payload
+
+        for size, count in ((256, 300), (4096, 200), (65536, 40)):
+            payload = make_payload(size)
+            rates = {}
+            for label, cls in (("before", TripleEncodingOzolith), ("after", Ozolith)):
+                oz = cls(storage_path=os.path.join(suite.temp_dir, f"perf_encoding_{label}_{size}.jsonl"))
+                start = time.perf_counter()
+                for _ in range(count):
+                    oz.append(OzolithEventType.EXCHANGE, "SB-1", "assistant", payload)
+                rates[label] = count / (time.perf_counter() - start)
+                assert oz.verify_chain(full=True)[0], f"{label} chain invalid at {size}B"
+
+            print(f"\n    Encoding {size:>6}B: {rates['before']:.0f} -> {rates['after']:.0f} appends/s "
+                  f"({rates['after'] / rates['before']:.2f}x)", end="")
+
+            # Soft threshold - disk noise can swamp small payloads
+            assert rates['after'] > rates['before'] * 0.8, \
+                f"Single-pass encoding slower at {size}B: {rates}"
+        print()
+
+    suite.run_test("Append encoding throughput benchmark", test_append_encoding_throughput)
+
 
 # =============================================================================
 # 18. CORRECTION VALIDATION TESTS
@@ -2267,6 +2332,1479 @@ def test_correction_validation(suite: TestSuite):
     suite.run_test("Analytics tracks validation stats", test_analytics_tracks_validation)
 
 
+# =============================================================================
+# 19. SEGMENTED STORAGE AND INDEX TESTS
+# =============================================================================
+
+def test_segmented_storage(suite: TestSuite):
+    """
+    Tests for segment files, sidecar indexes and indexed lookups.
+
+    Segmented mode must answer every query exactly like the single-file log,
+    while only parsing the active segment at startup.
+    """
+
+    no_auto_anchor = lambda: AnchorPolicy(count_threshold=10**6, significant_events=[OzolithEventType.SESSION_END])
+
+    def build(oz: Ozolith, count: int = 25):
+        for i in range(count):
+            oz.append(
+                OzolithEventType.CORRECTION if i % 7 == 0 else OzolithEventType.EXCHANGE,
+                f"SB-{i % 3}", "assistant", {"i": i, "confidence": (i % 10) / 10}
+            )
+
+    # Test: Log rolls into fixed-size segments with sidecars
+    def test_segments_roll():
+        path = os.path.join(suite.temp_dir, "roll.jsonl")
+        oz = Ozolith(storage_path=path, anchor_policy=no_auto_anchor(), segment_size=10)
+        build(oz, 25)
+
+        seg_dir = oz.segments_dir
+        files = sorted(os.listdir(seg_dir))
+        assert "000001.jsonl" in files and "000002.jsonl" in files and "000003.jsonl" in files, files
+        assert "000001.idx.json" in files and "000002.idx.json" in files, files
+        assert "000003.idx.json" not in files, "Active segment shouldn't have a sidecar yet"
+        assert "manifest.json" in files
+
+        with open(os.path.join(seg_dir, "000001.jsonl")) as f:
+            assert len(f.readlines()) == 10, "Sealed segment should hold segment_size entries"
+        assert not os.path.exists(path), "Segmented mode shouldn't write the single file"
+
+    suite.run_test("Log rolls into segments with sidecar indexes", test_segments_roll)
+
+    # Test: Reload only parses the active segment
+    def test_startup_reads_active_only():
+        path = os.path.join(suite.temp_dir, "startup.jsonl")
+        oz1 = Ozolith(storage_path=path, anchor_policy=no_auto_anchor(), segment_size=10)
+        build(oz1, 35)
+        root = oz1.get_root_hash()
+
+        oz2 = Ozolith(storage_path=path, anchor_policy=no_auto_anchor(), segment_size=10)
+        assert oz2._entries.loaded_segments() == [], \
+            f"Startup parsed sealed segments: {oz2._entries.loaded_segments()}"
+        assert len(oz2._entries) == 35
+        assert oz2._sequence == 35
+        assert oz2.get_root_hash() == root
+
+        # Point lookup reads one line by offset, still no full segment parse
+        entry = oz2.get_entry_by_seq(4)
+        assert entry is not None and entry.sequence == 4
+        assert oz2._entries.loaded_segments() == []
+
+        valid, bad = oz2.verify_chain()
+        assert valid, f"Chain should verify across segments, failed at {bad}"
+
+        entry = oz2.append(OzolithEventType.EXCHANGE, "SB-1", "human", {"msg": "after reload"})
+        assert entry.sequence == 36
+        assert entry.previous_hash == root
+
+    suite.run_test("Startup parses only the active segment", test_startup_reads_active_only)
+
+    # Test: Indexed lookups match the single-file log
+    def test_lookups_match_single_file():
+        single = Ozolith(storage_path=os.path.join(suite.temp_dir, "single.jsonl"),
+                         anchor_policy=no_auto_anchor())
+        segmented = Ozolith(storage_path=os.path.join(suite.temp_dir, "segmented.jsonl"),
+                            anchor_policy=no_auto_anchor(), segment_size=8)
+        build(single, 40)
+        build(segmented, 40)
+
+        seqs = lambda entries: [e.sequence for e in entries]
+
+        for oz in (single, segmented):
+            assert seqs(oz.get_by_context("SB-1")) == [i + 1 for i in range(40) if i % 3 == 1]
+            assert seqs(oz.get_by_type(OzolithEventType.CORRECTION)) == [i + 1 for i in range(40) if i % 7 == 0]
+            assert seqs(oz.get_entries(start_seq=7, end_seq=19)) == list(range(7, 20))
+            assert seqs(oz.get_entries(start_seq=38)) == [38, 39, 40]
+            assert seqs(oz.get_around(16, window=2)) == [14, 15, 16, 17, 18]
+            assert oz.get_entry_by_seq(40).payload["i"] == 39
+            assert oz.get_entry_by_seq(41) is None
+            assert seqs(oz.get_corrections_for(99)) == []
+
+            hour_ago = datetime.utcnow() - timedelta(hours=1)
+            assert len(oz.get_by_timerange(start=hour_ago)) == 40
+            assert oz.get_by_timerange(end=hour_ago) == []
+
+        assert seqs(segmented.get_entries()) == seqs(single.get_entries())
+
+    suite.run_test("Indexed lookups match single-file log", test_lookups_match_single_file)
+
+    # Test: Existing single-file log is imported on first segmented open
+    def test_import_single_file():
+        path = os.path.join(suite.temp_dir, "legacy.jsonl")
+        legacy = Ozolith(storage_path=path, anchor_policy=no_auto_anchor())
+        build(legacy, 23)
+        root = legacy.get_root_hash()
+
+        oz = Ozolith(storage_path=path, anchor_policy=no_auto_anchor(), segment_size=10)
+        assert len(oz._entries) == 23
+        assert oz.get_root_hash() == root
+        assert oz.verify_chain()[0], "Imported chain should verify"
+        assert os.path.exists(path), "Original single file should be left in place"
+        assert not os.path.exists(oz.segments_dir + ".importing")
+
+    suite.run_test("Single-file log imported into segments", test_import_single_file)
+
+    # Test: Lost manifest is rebuilt from segment files
+    def test_manifest_rebuilt():
+        path = os.path.join(suite.temp_dir, "manifest.jsonl")
+        oz1 = Ozolith(storage_path=path, anchor_policy=no_auto_anchor(), segment_size=5)
+        build(oz1, 17)
+        os.remove(os.path.join(oz1.segments_dir, "manifest.json"))
+
+        oz2 = Ozolith(storage_path=path, anchor_policy=no_auto_anchor(), segment_size=5)
+        assert len(oz2._entries) == 17
+        assert [e.sequence for e in oz2.get_by_context("SB-2")] == [3, 6, 9, 12, 15]
+        assert os.path.exists(os.path.join(oz2.segments_dir, "manifest.json"))
+
+    suite.run_test("Missing manifest is rebuilt", test_manifest_rebuilt)
+
+    # Test: Torn write in the active segment
+    def test_torn_active_segment():
+        path = os.path.join(suite.temp_dir, "torn.jsonl")
+        oz1 = Ozolith(storage_path=path, anchor_policy=no_auto_anchor(), segment_size=10)
+        build(oz1, 13)
+
+        active = os.path.join(oz1.segments_dir, "000002.jsonl")
+        with open(active, 'a') as f:
+            f.write('{"sequence": 14, "timest')  # power loss mid-line
+
+        oz2 = Ozolith(storage_path=path, anchor_policy=no_auto_anchor(), segment_size=10)
+        assert len(oz2._entries) == 13
+        assert len(oz2.load_warnings) == 1, oz2.load_warnings
+
+        oz2.append(OzolithEventType.EXCHANGE, "SB-1", "human", {"msg": "after crash"})
+        oz3 = Ozolith(storage_path=path, anchor_policy=no_auto_anchor(), segment_size=10)
+        assert len(oz3._entries) == 14, "Entry after torn line must not be glued to the fragment"
+        assert oz3.get_entry_by_seq(14).payload == {"msg": "after crash"}
+
+    suite.run_test("Torn write in active segment is isolated", test_torn_active_segment)
+
+    # Test: Out-of-order sequences fall back to scanning
+    def test_unordered_sequences():
+        path = os.path.join(suite.temp_dir, "raced.jsonl")
+        oz1 = Ozolith(storage_path=path, anchor_policy=no_auto_anchor())
+        oz2 = Ozolith(storage_path=path, anchor_policy=no_auto_anchor())
+        oz1.append(OzolithEventType.EXCHANGE, "SB-1", "human", {"from": 1})
+        oz2.append(OzolithEventType.EXCHANGE, "SB-2", "human", {"from": 2})  # also seq 1
+
+        oz3 = Ozolith(storage_path=path, anchor_policy=no_auto_anchor())
+        assert not oz3._index.ordered
+        assert len(oz3.get_entries(start_seq=1, end_seq=1)) == 2
+        assert oz3.get_entry_by_seq(1).payload == {"from": 1}
+
+    suite.run_test("Out-of-order sequences fall back to scan", test_unordered_sequences)
+
+
+# =============================================================================
+# 20. GROUP COMMIT TESTS
+# =============================================================================
+
+def test_group_commit(suite: TestSuite):
+    """
+    Tests for group-commit appends.
+
+    Concurrent appends share fsyncs, but every caller still only returns
+    once its own entry is durable, and the chain stays intact.
+    """
+    import threading
+    from ozolith import GroupCommitWriter, OzolithWriteError
+
+    # Test: Concurrent appends on one instance keep the chain intact
+    def test_concurrent_grouped_appends():
+        for segment_size in (None, 7):
+            path = os.path.join(suite.temp_dir, f"grouped_{segment_size}.jsonl")
+            oz = Ozolith(storage_path=path, group_commit=True, segment_size=segment_size)
+
+            def worker(thread_id: int):
+                for i in range(25):
+                    oz.append(OzolithEventType.EXCHANGE, f"SB-{thread_id}", "assistant", {"i": i})
+
+            threads = [threading.Thread(target=worker, args=(t,)) for t in range(6)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            user_entries = [e for e in oz._entries if e.event_type != OzolithEventType.ANCHOR_CREATED]
+            assert len(user_entries) == 150, f"Expected 150 entries, got {len(user_entries)}"
+            assert [e.sequence for e in oz._entries] == list(range(1, len(oz._entries) + 1))
+            valid, bad = oz.verify_chain()
+            assert valid, f"Grouped appends broke chain at {bad} (segment_size={segment_size})"
+
+            stats = oz.commit_stats()
+            assert stats['entries'] == len(oz._entries)
+            assert stats['batches'] <= stats['entries']
+
+            oz.close()
+            reloaded = Ozolith(storage_path=path, segment_size=segment_size)
+            assert reloaded.get_root_hash() == oz.get_root_hash()
+            assert reloaded.verify_chain()[0]
+
+    suite.run_test("Concurrent grouped appends keep chain intact", test_concurrent_grouped_appends)
+
+    # Test: Appends waiting on a slow flush are coalesced
+    def test_batches_coalesce():
+        flushed = []
+
+        def slow_flush(items):
+            time.sleep(0.02)
+            flushed.append(list(items))
+
+        writer = GroupCommitWriter(slow_flush, window_ms=5, max_batch=64)
+
+        def submit(i):
+            writer.wait(writer.submit(i))
+
+        threads = [threading.Thread(target=submit, args=(i,)) for i in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = writer.stats()
+        assert stats['entries'] == 20
+        assert stats['max_batch_size'] > 1, f"Expected coalesced batches, got {flushed}"
+        assert stats['batches'] == len(flushed) < 20
+        assert stats['avg_flush_ms'] >= 20
+        assert sorted(i for batch in flushed for i in batch) == list(range(20))
+
+    suite.run_test("Waiting appends are coalesced into batches", test_batches_coalesce)
+
+    # Test: max_batch caps a single flush
+    def test_max_batch_respected():
+        flushed = []
+        gate = threading.Event()
+
+        def gated_flush(items):
+            gate.wait(1.0)
+            flushed.append(len(items))
+
+        writer = GroupCommitWriter(gated_flush, window_ms=0, max_batch=4)
+        tickets = [writer.submit(i) for i in range(10)]
+        gate.set()
+        for ticket in tickets:
+            writer.wait(ticket)
+
+        assert max(flushed) <= 4, f"Batch exceeded max_batch: {flushed}"
+        assert sum(flushed) == 10
+
+    suite.run_test("max_batch caps batch size", test_max_batch_respected)
+
+    # Test: A lone writer doesn't sit out the window
+    def test_lone_writer_no_linger():
+        writer = GroupCommitWriter(lambda items: None, window_ms=500)
+        start = time.time()
+        writer.announce()
+        writer.wait(writer.submit("only"))
+        assert time.time() - start < 0.25, "Lone writer waited for the commit window"
+
+    suite.run_test("Lone writer doesn't wait for window", test_lone_writer_no_linger)
+
+    # Test: Failed flush leaves memory untouched and re-chains from durable tip
+    def test_failed_flush_memory_safety():
+        path = os.path.join(suite.temp_dir, "grouped_fail.jsonl")
+        oz = Ozolith(storage_path=path, group_commit=True)
+        oz.append(OzolithEventType.SESSION_START, "SB-1", "system", {})
+
+        count_before = len(oz._entries)
+        sequence_before = oz._sequence
+        real_flush = oz._writer._flush_fn
+
+        def failing_flush(items):
+            raise OSError("disk full")
+
+        oz._writer._flush_fn = failing_flush
+        try:
+            oz.append(OzolithEventType.EXCHANGE, "SB-1", "human", {"msg": "lost"})
+            raised = False
+        except OzolithWriteError:
+            raised = True
+        finally:
+            oz._writer._flush_fn = real_flush
+
+        assert raised, "Failed flush should raise OzolithWriteError"
+        assert len(oz._entries) == count_before
+        assert oz._sequence == sequence_before
+        assert oz.commit_stats()['failed_batches'] == 1
+
+        entry = oz.append(OzolithEventType.EXCHANGE, "SB-1", "human", {"msg": "kept"})
+        assert entry.sequence == sequence_before + 1, "Sequence should reuse the failed slot"
+        assert oz.verify_chain()[0]
+
+        oz.close()
+        reloaded = Ozolith(storage_path=path)
+        assert len(reloaded._entries) == len(oz._entries)
+        assert reloaded.verify_chain()[0]
+
+    suite.run_test("Failed group flush preserves in-memory state", test_failed_flush_memory_safety)
+
+    # Test: Bytes written before a failed fsync are cut off the single-file log
+    def test_failed_fsync_truncates_log():
+        from unittest.mock import patch
+
+        path = os.path.join(suite.temp_dir, "grouped_fsync_fail.jsonl")
+        oz = Ozolith(storage_path=path, group_commit=True)
+        oz.append(OzolithEventType.SESSION_START, "SB-1", "system", {})
+        size_before = os.path.getsize(path)
+
+        with patch("ozolith.os.fsync", side_effect=OSError("fsync failed")):
+            try:
+                oz.append(OzolithEventType.EXCHANGE, "SB-1", "human", {"msg": "lost"})
+                raised = False
+            except OzolithWriteError:
+                raised = True
+
+        assert raised, "Failed fsync should raise OzolithWriteError"
+        assert os.path.getsize(path) == size_before, "Failed batch left bytes in the log"
+
+        oz.append(OzolithEventType.EXCHANGE, "SB-1", "human", {"msg": "kept"})
+        oz.close()
+
+        reloaded = Ozolith(storage_path=path)
+        assert [e.sequence for e in reloaded._entries] == [1, 2]
+        assert reloaded.verify_chain(full=True) == (True, None)
+
+    suite.run_test("Failed fsync truncates single-file log", test_failed_fsync_truncates_log)
+
+
+# =============================================================================
+# 21. MERKLE LAYER TESTS
+# =============================================================================
+
+def test_merkle_layer(suite: TestSuite):
+    """
+    Tests for the Merkle layer.
+
+    Roots must match a straight RFC 6962 computation, proofs must verify
+    (and fail when anything is swapped), and the sidecar must survive
+    reloads, truncation and loss.
+    """
+    from ozolith import MerkleLayer
+
+    def reference_root(hashes: List[str]) -> str:
+        """Plain recursive RFC 6962 MTH over entry hashes."""
+        def mth(items):
+            if len(items) == 1:
+                return hashlib.sha256(b'\x00' + items[0].encode()).digest()
+            k = 1
+            while k * 2 < len(items):
+                k *= 2
+            return hashlib.sha256(b'\x01' + mth(items[:k]) + mth(items[k:])).digest()
+        return mth(hashes).hex() if hashes else hashlib.sha256(b'').hexdigest()
+
+    hashes = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(40)]
+
+    # Test: Incremental roots match the reference at every size
+    def test_roots_match_reference():
+        tree = MerkleLayer()
+        assert tree.root_hash == reference_root([])
+        for i, h in enumerate(hashes):
+            tree.append(h)
+            assert tree.root_hash == reference_root(hashes[:i + 1]), f"Root mismatch at size {i + 1}"
+        for size in range(41):
+            assert tree.root(size) == reference_root(hashes[:size]), f"Historic root mismatch at {size}"
+
+    suite.run_test("Roots match RFC 6962 reference", test_roots_match_reference)
+
+    # Test: Inclusion proofs verify, and only for the right entry
+    def test_inclusion_proofs():
+        tree = MerkleLayer(hashes)
+        for size in (1, 2, 7, 16, 33, 40):
+            root = tree.root(size)
+            for index in range(size):
+                proof = tree.get_proof(index, size)
+                assert len(proof) <= size.bit_length(), "Proof longer than O(log N)"
+                assert MerkleLayer.verify_proof(hashes[index], proof, root)
+                if size > 1:
+                    assert not MerkleLayer.verify_proof(hashes[(index + 1) % size], proof, root)
+
+    suite.run_test("Inclusion proofs verify", test_inclusion_proofs)
+
+    # Test: Consistency proofs verify between any two sizes
+    def test_consistency_proofs():
+        tree = MerkleLayer(hashes[:20])
+        forged = reference_root(hashes[:19] + ["forged"])
+        for new_size in range(1, 21):
+            for old_size in range(1, new_size + 1):
+                proof = tree.consistency_proof(old_size, new_size)
+                assert MerkleLayer.verify_consistency(
+                    old_size, new_size, tree.root(old_size), tree.root(new_size), proof
+                ), f"Consistency {old_size}->{new_size} failed"
+            if new_size < 20:
+                assert not MerkleLayer.verify_consistency(
+                    new_size, 20, tree.root(new_size), forged, tree.consistency_proof(new_size, 20)
+                ), f"Forged root accepted from {new_size}"
+
+    suite.run_test("Consistency proofs verify", test_consistency_proofs)
+
+    # Test: Anchors record a Merkle root; proofs come from Ozolith
+    def test_ozolith_proofs():
+        oz = suite.create_test_ozolith("merkle_proofs")
+        for i in range(10):
+            oz.append(OzolithEventType.EXCHANGE, "SB-1", "assistant", {"i": i})
+        first = oz.create_anchor("manual")
+        for i in range(13):
+            oz.append(OzolithEventType.EXCHANGE, "SB-2", "assistant", {"i": i})
+        second = oz.create_anchor("manual")
+
+        assert first.merkle_root == reference_root([e.entry_hash for e in oz._entries[:first.entry_count]])
+        assert oz.verify_against_anchor(first) and oz.verify_against_anchor(second)
+
+        proof = oz.inclusion_proof(5)
+        assert proof['root'] == oz.merkle_root()
+        assert MerkleLayer.verify_proof(proof['entry_hash'], proof['path'], proof['root'])
+        assert oz.inclusion_proof(9999) is None
+
+        consistency = oz.consistency_proof(first, second)
+        assert consistency['old_root'] == first.merkle_root
+        assert consistency['new_root'] == second.merkle_root
+        assert MerkleLayer.verify_consistency(
+            consistency['old_size'], consistency['new_size'],
+            consistency['old_root'], consistency['new_root'], consistency['path']
+        )
+
+    suite.run_test("Ozolith anchors and proofs", test_ozolith_proofs)
+
+    # Test: Sidecar is reused, extended, trimmed and rebuilt as needed
+    def test_sidecar_resync():
+        path = os.path.join(suite.temp_dir, "merkle_sidecar.jsonl")
+        oz = Ozolith(storage_path=path)
+        for i in range(12):
+            oz.append(OzolithEventType.EXCHANGE, "SB-1", "assistant", {"i": i})
+        root = oz.merkle_root()
+        oz.close()
+        assert os.path.exists(oz.merkle_path)
+        full_size = os.path.getsize(oz.merkle_path)
+
+        # Behind (e.g. crash before the sidecar write hit disk)
+        with open(oz.merkle_path, 'r+b') as f:
+            f.truncate(full_size - 40)
+        assert Ozolith(storage_path=path).merkle_root() == root
+
+        # Trailing garbage
+        with open(oz.merkle_path, 'ab') as f:
+            f.write(b'junk')
+        assert Ozolith(storage_path=path).merkle_root() == root
+
+        # Lost entirely
+        os.remove(oz.merkle_path)
+        reloaded = Ozolith(storage_path=path)
+        assert reloaded.merkle_root() == root
+        assert reloaded.merkle_tree_size() == 12
+
+    suite.run_test("Merkle sidecar resyncs with log", test_sidecar_resync)
+
+    # Test: Rewriting history under an anchor is caught without a chain walk
+    def test_anchor_catches_rewrite():
+        path = os.path.join(suite.temp_dir, "merkle_rewrite.jsonl")
+        oz = Ozolith(storage_path=path)
+        for i in range(8):
+            oz.append(OzolithEventType.EXCHANGE, "SB-1", "assistant", {"i": i})
+        anchor = oz.create_anchor("manual")
+        oz.close()
+
+        # Swap a middle entry's hash on disk; the anchor tip is untouched
+        with open(path, 'r') as f:
+            lines = f.readlines()
+        data = json.loads(lines[3])
+        data['entry_hash'] = hashlib.sha256(b"rewritten").hexdigest()
+        lines[3] = json.dumps(data) + '\n'
+        with open(path, 'w') as f:
+            f.writelines(lines)
+        os.remove(oz.merkle_path)
+
+        reloaded = Ozolith(storage_path=path)
+        assert not reloaded.verify_against_anchor(anchor), "Rewrite under anchor not detected"
+
+    suite.run_test("Anchor Merkle root catches rewritten history", test_anchor_catches_rewrite)
+
+    # Test: A stale sidecar can't vouch for an edited log
+    def test_stale_sidecar_rewrite():
+        path = os.path.join(suite.temp_dir, "merkle_stale_sidecar.jsonl")
+        oz = Ozolith(storage_path=path)
+        for i in range(40):
+            oz.append(OzolithEventType.EXCHANGE, "SB-1", "assistant", {"i": i})
+        anchor = oz.create_anchor("manual")
+        oz.close()
+
+        # Rewrite a middle entry's payload and hash; merkle.bin is left alone
+        with open(path, 'r') as f:
+            lines = f.readlines()
+        data = json.loads(lines[32])
+        data['payload'] = {"i": "rewritten"}
+        data['entry_hash'] = hashlib.sha256(b"rewritten").hexdigest()
+        lines[32] = json.dumps(data) + '\n'
+        with open(path, 'w') as f:
+            f.writelines(lines)
+
+        reloaded = Ozolith(storage_path=path)
+        assert not reloaded.verify_against_anchor(anchor), "Stale sidecar hid the rewrite"
+        assert not export_incident(reloaded, 33, window=1)['chain_verified']
+
+    suite.run_test("Stale Merkle sidecar doesn't hide a rewrite", test_stale_sidecar_rewrite)
+
+    # Test: export_incident ships verifiable proofs
+    def test_incident_proofs():
+        oz = suite.create_test_ozolith("merkle_incident")
+        for i in range(15):
+            oz.append(OzolithEventType.EXCHANGE, "SB-1", "assistant", {"i": i})
+        oz.create_anchor("manual")
+        oz.append(OzolithEventType.EXCHANGE, "SB-1", "assistant", {"i": 99})
+
+        bundle = export_incident(oz, 8, window=3)
+        assert bundle['chain_verified']
+        assert bundle['tree_size'] == len(oz._entries)
+        for e in bundle['entries']:
+            assert MerkleLayer.verify_proof(e['entry_hash'], e['inclusion_proof'], bundle['merkle_root'])
+        assert bundle['anchor_consistency']['old_root'] == oz.get_anchors()[-1].merkle_root
+
+        original = oz._entries[7].payload
+        oz._entries[7].payload = {"i": "tampered"}
+        assert not export_incident(oz, 8, window=3)['chain_verified']
+        oz._entries[7].payload = original
+
+    suite.run_test("export_incident() includes Merkle proofs", test_incident_proofs)
+
+    # Test: Segmented storage builds the same tree
+    def test_segmented_tree():
+        path = os.path.join(suite.temp_dir, "merkle_segmented.jsonl")
+        plain = Ozolith(storage_path=path)
+        for i in range(17):
+            plain.append(OzolithEventType.EXCHANGE, "SB-1", "assistant", {"i": i})
+
+        segmented = Ozolith(storage_path=path, segment_size=5)
+        assert segmented.merkle_path.startswith(segmented.segments_dir)
+        assert segmented.merkle_root() == plain.merkle_root()
+
+    suite.run_test("Segmented storage builds same Merkle tree", test_segmented_tree)
+
+
+# =============================================================================
+# 22. VERIFICATION CHECKPOINT TESTS
+# =============================================================================
+
+def test_verification_checkpoints(suite: TestSuite):
+    """
+    Tests for incremental verify_chain and scheduled full verification.
+
+    Verified entries aren't re-hashed; the checkpoint survives restarts but
+    only while the bytes it covers are unchanged.
+    """
+    from ozolith import ChainVerificationJob
+
+    def count_hashes(oz: Ozolith) -> List[int]:
+        """Count entry hash computations on this instance."""
+        calls = [0]
+        original = oz._hash_text
+
+        def counting(canonical):
+            calls[0] += 1
+            return original(canonical)
+
+        oz._hash_text = counting
+        return calls
+
+    def fill(oz: Ozolith, n: int, start: int = 0):
+        for i in range(start, start + n):
+            oz.append(OzolithEventType.EXCHANGE, "SB-1", "assistant", {"i": i})
+
+    # Test: Second verify only re-hashes new entries
+    def test_incremental_verify():
+        oz = suite.create_test_ozolith("checkpoint_incremental")
+        fill(oz, 20)
+        calls = count_hashes(oz)
+
+        assert oz.verify_chain() == (True, None)
+        assert calls[0] == 20, f"First verify should hash all 20, hashed {calls[0]}"
+
+        fill(oz, 3, start=20)
+        calls[0] = 0
+        assert oz.verify_chain() == (True, None)
+        assert calls[0] == 3, f"Incremental verify should hash 3, hashed {calls[0]}"
+
+        status = oz.verification_status()
+        assert status['verified_through'] == 23
+        assert status['unverified_entries'] == 0
+
+    suite.run_test("verify_chain() only re-hashes new entries", test_incremental_verify)
+
+    # Test: Checkpoint survives a restart
+    def test_checkpoint_persists():
+        path = os.path.join(suite.temp_dir, "checkpoint_persist.jsonl")
+        oz = Ozolith(storage_path=path)
+        fill(oz, 15)
+        assert oz.verify_chain()[0]
+        assert os.path.exists(oz.checkpoint_path)
+
+        reloaded = Ozolith(storage_path=path)
+        fill(reloaded, 2, start=15)
+        calls = count_hashes(reloaded)
+        assert reloaded.verify_chain() == (True, None)
+        assert calls[0] == 2, f"Should resume from checkpoint, hashed {calls[0]}"
+
+    suite.run_test("Checkpoint persists across restarts", test_checkpoint_persists)
+
+    # Test: Tampering under the checkpoint invalidates it
+    def test_disk_tamper_detected():
+        path = os.path.join(suite.temp_dir, "checkpoint_tamper.jsonl")
+        oz = Ozolith(storage_path=path)
+        fill(oz, 10)
+        assert oz.verify_chain()[0]
+
+        with open(path, 'r') as f:
+            lines = f.readlines()
+        data = json.loads(lines[4])
+        data['payload']['i'] = 999
+        lines[4] = json.dumps(data) + '\n'
+        with open(path, 'w') as f:
+            f.writelines(lines)
+
+        valid, bad_seq = Ozolith(storage_path=path).verify_chain()
+        assert not valid, "Tampered bytes under checkpoint not detected"
+        assert bad_seq == 5, f"Should fail at entry 5, got {bad_seq}"
+
+    suite.run_test("Tampering under checkpoint is detected", test_disk_tamper_detected)
+
+    # Test: An edited checkpoint file isn't trusted
+    def test_forged_checkpoint_ignored():
+        path = os.path.join(suite.temp_dir, "checkpoint_forged.jsonl")
+        oz = Ozolith(storage_path=path)
+        fill(oz, 6)
+        assert oz.verify_chain()[0]
+
+        with open(oz.checkpoint_path, 'r') as f:
+            data = json.load(f)
+        data['full_verified_at'] = "2099-01-01T00:00:00Z"
+        with open(oz.checkpoint_path, 'w') as f:
+            json.dump(data, f)
+
+        reloaded = Ozolith(storage_path=path)
+        calls = count_hashes(reloaded)
+        assert reloaded.verify_chain()[0]
+        assert calls[0] == 6, "Forged checkpoint should force a full verify"
+
+    suite.run_test("Edited checkpoint is ignored", test_forged_checkpoint_ignored)
+
+    # Test: Segmented storage checkpoints per segment
+    def test_segmented_checkpoint():
+        path = os.path.join(suite.temp_dir, "checkpoint_segmented.jsonl")
+        oz = Ozolith(storage_path=path, segment_size=4)
+        fill(oz, 10)
+        assert oz.verify_chain()[0]
+        fill(oz, 5, start=10)
+        calls = count_hashes(oz)
+        assert oz.verify_chain()[0]
+        assert calls[0] == 5
+
+        with open(oz.checkpoint_path, 'r') as f:
+            names = [record['name'] for record in json.load(f)['files']]
+        assert names == ["000001.jsonl", "000002.jsonl", "000003.jsonl", "000004.jsonl"]
+
+        # Tamper a sealed segment, then restart
+        segment = os.path.join(oz.segments_dir, "000001.jsonl")
+        with open(segment, 'r') as f:
+            lines = f.readlines()
+        data = json.loads(lines[1])
+        data['actor'] = "attacker"
+        lines[1] = json.dumps(data) + '\n'
+        with open(segment, 'w') as f:
+            f.writelines(lines)
+
+        valid, bad_seq = Ozolith(storage_path=path, segment_size=4).verify_chain()
+        assert not valid and bad_seq == 2, f"Expected failure at 2, got {(valid, bad_seq)}"
+
+    suite.run_test("Segmented storage checkpoints", test_segmented_checkpoint)
+
+    # Test: The scheduled full walk catches what incremental skips
+    def test_verification_job():
+        oz = suite.create_test_ozolith("checkpoint_job")
+        fill(oz, 8)
+        assert oz.verify_chain()[0]
+
+        failures = []
+        job = ChainVerificationJob(oz, interval=3600, on_failure=failures.append)
+        assert job.run_once() == (True, None)
+        assert oz.verification_status()['full_verified_at'] is not None
+
+        original = oz._entries[2].payload
+        oz._entries[2].payload = {"i": "tampered"}
+        assert oz.verify_chain()[0], "Incremental verify skips verified entries"
+        assert job.run_once() == (False, 3)
+        assert failures == [3]
+        oz._entries[2].payload = original
+
+    suite.run_test("ChainVerificationJob catches skipped tampering", test_verification_job)
+
+    # Test: Background thread runs and stops
+    def test_verification_thread():
+        oz = suite.create_test_ozolith("checkpoint_thread")
+        fill(oz, 3)
+
+        job = ChainVerificationJob(oz, interval=0.01)
+        assert job.start_verification_thread()
+        assert not job.start_verification_thread(), "Second start should be refused"
+
+        deadline = time.time() + 2
+        while job.runs == 0 and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert job.stop_verification_thread(timeout=2)
+        assert not job.is_running()
+        assert job.runs >= 1
+        assert job.last_result == (True, None)
+
+    suite.run_test("Verification thread starts and stops", test_verification_thread)
+
+
+# =============================================================================
+# 23. CANONICAL ENCODING TESTS
+# =============================================================================
+
+def test_canonical_encoding(suite: TestSuite):
+    """
+    Tests for single-pass canonical encoding.
+
+    The spliced encoding must hash exactly like the dict encoding it
+    replaces, or existing logs would stop verifying.
+    """
+    from dataclasses import asdict
+    from ozolith import _canonical_json, _canonical_entry_text
+
+    # Test: Spliced encoding is byte-identical to the dict encoding
+    def test_splice_matches_dict():
+        payloads = [
+            {},
+            {"b": 1, "a": [1, 2, {"z": None, "y": 1.5}]},
+            {"emoji": "🎉", "quote": "\"x\"\n", "flag": True},
+        ]
+        for payload in payloads:
+            entry = OzolithEntry(
+                sequence=7, timestamp="2025-01-01T00:00:00Z", previous_hash="ab",
+                event_type=OzolithEventType.EXCHANGE, context_id="SB-1", actor="hüman",
+                payload=payload, signature="sig"
+            )
+            content = {
+                'sequence': entry.sequence,
+                'timestamp': entry.timestamp,
+                'previous_hash': entry.previous_hash,
+                'event_type': entry.event_type.value,
+                'context_id': entry.context_id,
+                'actor': entry.actor,
+                'payload': entry.payload
+            }
+            payload_json = _canonical_json(payload)
+            assert _canonical_entry_text(entry, payload_json, False) == _canonical_json(content)
+            content['signature'] = entry.signature
+            assert _canonical_entry_text(entry, payload_json, True) == _canonical_json(content)
+
+    suite.run_test("Spliced encoding matches dict encoding", test_splice_matches_dict)
+
+    # Test: Logs written with the old line format still verify
+    def test_old_line_format_verifies():
+        path = os.path.join(suite.temp_dir, "encoding_old_format.jsonl")
+        oz = Ozolith(storage_path=path)
+        for i in range(5):
+            oz.append(OzolithEventType.EXCHANGE, "SB-1", "assistant", {"i": i, "nested": {"b": 2, "a": 1}})
+
+        with open(path, 'w') as f:
+            for entry in oz._entries:
+                entry_dict = asdict(entry)
+                entry_dict['event_type'] = entry.event_type.value
+                f.write(json.dumps(entry_dict) + '\n')
+
+        reloaded = Ozolith(storage_path=path)
+        assert reloaded.verify_chain(full=True) == (True, None)
+        reloaded.append(OzolithEventType.EXCHANGE, "SB-1", "assistant", {"i": 5})
+        assert Ozolith(storage_path=path).verify_chain(full=True) == (True, None)
+
+    suite.run_test("Old line format still verifies", test_old_line_format_verifies)
+
+    # Test: The cached encoding is what gets written, then dropped
+    def test_cache_written_then_dropped():
+        path = os.path.join(suite.temp_dir, "encoding_cache.jsonl")
+        oz = Ozolith(storage_path=path)
+        payload = {"z": 1, "a": "text"}
+        entry = oz.append(OzolithEventType.EXCHANGE, "SB-1", "assistant", payload)
+
+        assert entry._canonical_payload is None, "Cache should be dropped once written"
+        with open(path, 'r') as f:
+            line = f.readline()
+        assert '"payload":' + _canonical_json(payload) in line
+        assert json.loads(line)['entry_hash'] == entry.entry_hash
+
+        # Verification re-encodes rather than trusting anything cached
+        entry._canonical_payload = _canonical_json(payload)
+        entry.payload["z"] = 2
+        assert not oz.verify_entry(entry.sequence)
+        entry.payload["z"] = 1
+        entry._canonical_payload = None
+
+    suite.run_test("Cached encoding is written then dropped", test_cache_written_then_dropped)
+
+
+# =============================================================================
+# 24. PARALLEL VERIFICATION TESTS
+# =============================================================================
+
+def test_parallel_verification(suite: TestSuite):
+    """
+    Tests for verify_chain_parallel.
+
+    Whatever the ranges, it must give the same answer as a sequential full
+    walk - including which sequence broke first.
+    """
+    oz = suite.create_test_ozolith("parallel_verify")
+    for i in range(450):
+        oz.append(OzolithEventType.EXCHANGE, f"SB-{i % 3}", "assistant", {"i": i})
+
+    def parallel():
+        return oz.verify_chain_parallel(workers=2, min_entries=0)
+
+    # Test: Ranges are cut at anchor boundaries
+    def test_ranges_at_anchors():
+        count = len(oz._entries)
+        cuts = oz._verification_ranges(count, workers=2)
+        anchor_counts = {a.entry_count for a in oz._anchors}
+
+        assert cuts[0] == 0 and cuts[-1] == count
+        assert cuts == sorted(set(cuts)), f"Cuts not increasing: {cuts}"
+        assert all(c in anchor_counts for c in cuts[1:-1]), f"Cuts off anchor boundaries: {cuts}"
+
+        # More workers - smaller ranges
+        bare = oz._verification_ranges(count, workers=4)
+        assert len(bare) > 2
+
+    suite.run_test("Ranges are cut at anchor boundaries", test_ranges_at_anchors)
+
+    # Test: Valid log verifies in parallel
+    def test_parallel_valid():
+        assert parallel() == (True, None)
+        assert oz.verification_status()['unverified_entries'] == 0
+
+    suite.run_test("Parallel verify passes valid log", test_parallel_valid)
+
+    # Test: Tampering inside a range matches the sequential result
+    def test_parallel_detects_tamper():
+        target = oz._entries[237]
+        original = target.payload
+        target.payload = {"i": "tampered"}
+        try:
+            assert parallel() == oz.verify_chain(full=True) == (False, target.sequence)
+        finally:
+            target.payload = original
+
+    suite.run_test("Parallel verify finds tampered entry", test_parallel_detects_tamper)
+
+    # Test: A broken link at a range boundary is caught by stitching
+    def test_parallel_detects_boundary_break():
+        cut = oz._verification_ranges(len(oz._entries), workers=2)[1]
+        target = oz._entries[cut]
+        original = target.previous_hash
+        target.previous_hash = "0" * 64
+        try:
+            assert parallel() == oz.verify_chain(full=True) == (False, target.sequence)
+        finally:
+            target.previous_hash = original
+
+    suite.run_test("Parallel verify finds broken boundary link", test_parallel_detects_boundary_break)
+
+    # Test: Deleted entries are caught
+    def test_parallel_detects_deletion():
+        original_entries = oz._entries.copy()
+        del oz._entries[120]
+        try:
+            result = parallel()
+            assert not result[0]
+            assert result == oz.verify_chain(full=True)
+        finally:
+            oz._entries = original_entries
+
+    suite.run_test("Parallel verify finds deleted entry", test_parallel_detects_deletion)
+
+    # Test: Small logs run in-process with the same result
+    def test_small_log_fallback():
+        small = suite.create_test_ozolith("parallel_small")
+        for i in range(5):
+            small.append(OzolithEventType.EXCHANGE, "SB-1", "assistant", {"i": i})
+        assert small.verify_chain_parallel(workers=4) == (True, None)
+
+    suite.run_test("Small logs verify in-process", test_small_log_fallback)
+
+
+# =============================================================================
+# 25. QUERY PLANNER TESTS
+# =============================================================================
+
+def test_query_planner(suite: TestSuite):
+    """
+    Tests for OzolithQuery planning.
+
+    Whatever plan is chosen, results must match filtering every entry with
+    every predicate - on a single file and on a segmented log.
+    """
+
+    no_auto_anchor = lambda: AnchorPolicy(count_threshold=10**6, significant_events=[OzolithEventType.SESSION_END])
+
+    def build(oz: Ozolith, count: int = 60):
+        for i in range(count):
+            oz.append(
+                OzolithEventType.CORRECTION if i % 7 == 0 else OzolithEventType.EXCHANGE,
+                f"SB-{i % 4}", "human" if i % 5 == 0 else "assistant",
+                {"i": i, "confidence": (i % 10) / 10, "original_exchange_seq": i // 2}
+            )
+
+    single = Ozolith(storage_path=os.path.join(suite.temp_dir, "planner_single.jsonl"),
+                     anchor_policy=no_auto_anchor())
+    segmented = Ozolith(storage_path=os.path.join(suite.temp_dir, "planner_segmented.jsonl"),
+                        anchor_policy=no_auto_anchor(), segment_size=9)
+    build(single)
+    build(segmented)
+
+    hour_ago = datetime.utcnow() - timedelta(hours=1)
+    queries = [
+        lambda q: q.by_type(OzolithEventType.EXCHANGE).by_context("SB-1"),
+        lambda q: q.by_context("SB-2").in_sequence_range(10, 45).where_payload("confidence", ">=", 0.5),
+        lambda q: q.by_types([OzolithEventType.CORRECTION, OzolithEventType.EXCHANGE]).by_actor("human"),
+        lambda q: q.by_contexts(["SB-0", "SB-3"]).in_timerange(start=hour_ago).has_payload_key("i"),
+        lambda q: q.in_sequence_range(5, 50).by_type(OzolithEventType.CORRECTION),
+        lambda q: q.with_corrections().by_context("SB-1"),
+        lambda q: q.in_timerange(end=hour_ago),
+        lambda q: q.where_payload("i", "in", [3, 33, 59]),
+        lambda q: q.by_context("SB-9"),
+    ]
+
+    def naive(oz, build_query):
+        query = build_query(OzolithQuery(oz))
+        checks = [a['check'] for a in query._access] + [c for _, c in query._envelope + query._payload]
+        return [e.sequence for e in oz._entries if all(check(e) for check in checks)]
+
+    # Test: Planned results match filtering every entry
+    def test_matches_naive():
+        for oz in (single, segmented):
+            for n, build_query in enumerate(queries):
+                expected = naive(oz, build_query)
+                got = [e.sequence for e in build_query(oz.query()).execute()]
+                assert got == expected, f"Query {n}: {got} != {expected}"
+                assert build_query(oz.query()).count() == len(expected)
+
+    suite.run_test("Planned results match naive filtering", test_matches_naive)
+
+    # Test: Smallest access path drives, the rest intersect
+    def test_explain_order():
+        plan = single.query() \
+            .by_type(OzolithEventType.EXCHANGE) \
+            .in_sequence_range(1, 60) \
+            .by_context("SB-1") \
+            .where_payload("confidence", "<", 0.5) \
+            .explain()
+
+        steps = plan['access']
+        assert [s['index'] for s in steps] == ['context_id', 'event_type', 'sequence']
+        assert [s['estimate'] for s in steps] == [15, 51, 60]
+        assert steps[0]['role'] == 'drive'
+        assert all(s['role'] == 'intersect' for s in steps[1:])
+        assert plan['residual'] == ["payload.confidence < 0.5"]
+        assert plan['total_entries'] == 60
+        assert plan['estimated_candidates'] == 15
+
+    suite.run_test("Explain orders access smallest-first", test_explain_order)
+
+    # Test: Huge access paths become per-entry probes
+    def test_probe_instead_of_intersect():
+        plan = single.query() \
+            .in_sequence_range(1, 60) \
+            .in_sequence_range(30, 31) \
+            .explain()
+        assert [s['role'] for s in plan['access']] == ['drive', 'probe']
+        assert plan['residual'] == ["sequence 1..60"]
+
+        assert [e.sequence for e in single.query().in_sequence_range(1, 60).in_sequence_range(30, 31).execute()] == [30, 31]
+
+    suite.run_test("Oversized access paths become probes", test_probe_instead_of_intersect)
+
+    # Test: No indexable predicate means a scan
+    def test_scan_plan():
+        plan = single.query().by_actor("human").explain()
+        assert plan['access'][0]['role'] == 'scan'
+        assert plan['estimated_candidates'] == 60
+        assert plan['residual'] == ["actor = human"]
+
+        rendered = OzolithRenderer(single).render_query_plan(plan)
+        assert "scan" in rendered and "actor = human" in rendered
+
+    suite.run_test("Unindexed query scans", test_scan_plan)
+
+    # Test: Time ranges keep an exact residual check
+    def test_timerange_residual():
+        plan = single.query().in_timerange(start=hour_ago).explain()
+        assert plan['access'][0]['index'] == 'bucket'
+        assert len(plan['residual']) == 1
+
+    suite.run_test("Time range keeps exact edge check", test_timerange_residual)
+
+    # Test: Segmented estimates come from the manifest, not sidecars
+    def test_segmented_estimates():
+        reopened = Ozolith(storage_path=os.path.join(suite.temp_dir, "planner_segmented.jsonl"),
+                           anchor_policy=no_auto_anchor(), segment_size=9)
+        plan = reopened.query().by_context("SB-1").explain()
+        assert plan['access'][0]['estimate'] >= 15
+        assert reopened._entries.loaded_segments() == []
+
+    suite.run_test("Segmented estimates read no segments", test_segmented_estimates)
+
+    # Test: first() stops at the first match
+    def test_first_is_lazy():
+        seen = []
+        def spy(e):
+            seen.append(e.sequence)
+            return True
+
+        query = single.query().by_context("SB-2")
+        query._payload.append(("spy", spy))
+        assert query.first().sequence == 3
+        assert seen == [3]
+
+        seen.clear()
+        assert query.last().sequence == 59
+        assert seen == [59]
+
+    suite.run_test("first() and last() stop early", test_first_is_lazy)
+
+    # Test: Unordered sequences fall back to a residual check
+    def test_unordered_fallback():
+        from ozolith import OzolithIndex
+
+        oz = suite.create_test_ozolith("planner_unordered")
+        build(oz, 12)
+        oz._entries[4], oz._entries[5] = oz._entries[5], oz._entries[4]
+        oz._index = OzolithIndex()
+        for entry in oz._entries:
+            oz._index.add(entry)
+        assert not oz._index.ordered
+
+        query = oz.query().in_sequence_range(3, 8)
+        assert query.explain()['access'][0]['role'] == 'scan'
+        assert sorted(e.sequence for e in query.execute()) == list(range(3, 9))
+
+    suite.run_test("Unordered log falls back to scan", test_unordered_fallback)
+
+
+# =============================================================================
+# 26. STREAMING AGGREGATE TESTS
+# =============================================================================
+
+def test_streaming_aggregates(suite: TestSuite):
+    """
+    Tests for OzolithAggregates.
+
+    Totals kept up by append must equal a replay of the log, survive a
+    restart without re-reading entries, and be rebuilt when they can't
+    be trusted.
+    """
+    from ozolith import OzolithAggregates, audit_corrections, correction_analytics, confirm_correction
+
+    no_auto_anchor = lambda: AnchorPolicy(count_threshold=10**6, significant_events=[OzolithEventType.SESSION_END])
+
+    def build(oz: Ozolith):
+        oz.append(OzolithEventType.SESSION_START, "SYSTEM", "system", {})
+        for i in range(30):
+            payload = {"confidence": (i % 10) / 10}
+            if i % 6 == 0:
+                payload["uncertainty_flags"] = ["ambiguous"]
+            oz.append(OzolithEventType.EXCHANGE, f"SB-{i % 3}", "assistant", payload)
+        log_correction(oz, 3, "Wrong function name", context_id="SB-1")
+        log_correction(oz, 500, "Target not written yet", "approach")
+        oz.append(OzolithEventType.SESSION_END, "SYSTEM", "system", {})
+        oz.append(OzolithEventType.SESSION_START, "SYSTEM", "system", {})
+        oz.append(OzolithEventType.EXCHANGE, "SB-4", "assistant", {"confidence": 0.9})
+
+    def reports(oz: Ozolith):
+        stats = oz.stats()
+        stats.pop('root_hash')
+        return (stats, session_summary(oz, 1), session_summary(oz, 36),
+                correction_analytics(oz), audit_corrections(oz), find_learning_opportunities(oz))
+
+    def count_adds():
+        calls = []
+        original = OzolithAggregates.add
+        def counting(self, entry):
+            calls.append(entry.sequence)
+            return original(self, entry)
+        return calls, patch.object(OzolithAggregates, 'add', counting)
+
+    path = os.path.join(suite.temp_dir, "aggregates.jsonl")
+    oz = Ozolith(storage_path=path, anchor_policy=no_auto_anchor())
+    oz.stats()  # Current from the first entry on
+    build(oz)
+
+    # Test: Live totals match a full replay
+    def test_matches_replay():
+        live = reports(oz)
+        assert oz.rebuild_aggregates() == len(oz._entries)
+        assert reports(oz) == live
+
+        stats = live[0]
+        assert stats['by_type']['exchange'] == 31
+        assert stats['by_context']['SB-1'] == 11
+        assert stats['uncertainty_flag_counts'] == {'ambiguous': 5}
+        assert stats['confidence_distribution'] == {'low': 15, 'medium': 9, 'high': 7}
+        assert sum(stats['entries_by_hour'].values()) == len(oz._entries)
+
+    suite.run_test("Live totals match full replay", test_matches_replay)
+
+    # Test: Sessions are summarized as they happen
+    def test_session_summaries():
+        first = session_summary(oz, 1)
+        assert first['session_end_seq'] == 34
+        assert first['total_entries'] == 34
+        assert first['exchanges'] == 30 and first['corrections'] == 2
+        assert first['session_complete']
+        assert set(first['contexts_touched']) == {"SYSTEM", "SB-0", "SB-1", "SB-2"}
+
+        # SESSION_END anchored (#35), so the next session opens at #36
+        second = session_summary(oz, 36)
+        assert second['session_end_seq'] is None
+        assert second['total_entries'] == 2
+        assert second['avg_confidence'] == 0.9
+
+        # Not a SESSION_START - walked the old way
+        assert session_summary(oz, 30)['total_entries'] == 5
+
+    suite.run_test("Sessions summarized incrementally", test_session_summaries)
+
+    # Test: Correction reports track appends
+    def test_correction_reports():
+        audit = audit_corrections(oz)
+        assert [o['target_seq'] for o in audit['orphan']] == [500]
+        assert len(audit['unvalidated']) == 2
+
+        before = correction_analytics(oz)
+        assert before['total_corrections'] == 2
+        assert confirm_correction(oz, 32, notes="Yes")
+        after = correction_analytics(oz)
+        assert after['total_corrections'] == 2
+        assert after['total_confirmations'] == 1
+        assert after['validation_stats']['human_confirmed'] == 1
+
+        # A correction of that correction is a chain
+        log_correction(oz, 32, "Correction was itself wrong")
+        chains = audit_corrections(oz)['correction_chains']
+        assert [c['corrects_correction_seq'] for c in chains] == [32]
+
+    suite.run_test("Correction reports track appends", test_correction_reports)
+
+    # Test: Reopening reads the snapshot instead of replaying
+    def test_snapshot_reload():
+        expected = reports(oz)
+        oz.close()
+
+        calls, patched = count_adds()
+        with patched:
+            reopened = Ozolith(storage_path=path, anchor_policy=no_auto_anchor())
+            assert reports(reopened) == expected
+            assert calls == [], f"Replayed {len(calls)} entries"
+
+            # Appended after the snapshot - only those are replayed
+            reopened.append(OzolithEventType.EXCHANGE, "SB-1", "assistant", {})
+            again = Ozolith(storage_path=path, anchor_policy=no_auto_anchor())
+            calls.clear()
+            assert again.stats()['total_entries'] == len(oz._entries) + 1
+            assert calls == [again._entries[-1].sequence]
+
+    suite.run_test("Reopen catches up from snapshot", test_snapshot_reload)
+
+    # Test: Format change or a different log means a full replay
+    def test_snapshot_discarded():
+        fresh = Ozolith(storage_path=path, anchor_policy=no_auto_anchor())
+        fresh.stats()
+        count = len(fresh._entries)
+
+        calls, patched = count_adds()
+        with patched, patch.object(OzolithAggregates, 'FORMAT', OzolithAggregates.FORMAT + 1):
+            Ozolith(storage_path=path, anchor_policy=no_auto_anchor()).stats()
+        assert len(calls) == count
+
+        # Log replaced underneath the snapshot
+        other = os.path.join(suite.temp_dir, "aggregates_other.jsonl")
+        donor = Ozolith(storage_path=other, anchor_policy=no_auto_anchor())
+        for i in range(count + 2):
+            donor.append(OzolithEventType.EXCHANGE, "SB-9", "assistant", {})
+        shutil.copy(other, path)
+
+        replaced = Ozolith(storage_path=path, anchor_policy=no_auto_anchor())
+        assert replaced.stats()['by_context'] == {"SB-9": count + 2}
+
+    suite.run_test("Stale snapshot is rebuilt", test_snapshot_discarded)
+
+    # Test: Segmented stats don't parse sealed segments once snapshotted
+    def test_segmented_reads_no_segments():
+        seg_path = os.path.join(suite.temp_dir, "aggregates_segmented.jsonl")
+        seg = Ozolith(storage_path=seg_path, anchor_policy=no_auto_anchor(), segment_size=8)
+        build(seg)
+        expected = seg.stats()['by_type']
+        seg.close()
+
+        reopened = Ozolith(storage_path=seg_path, anchor_policy=no_auto_anchor(), segment_size=8)
+        assert reopened.stats()['by_type'] == expected
+        assert reopened._entries.loaded_segments() == []
+
+    suite.run_test("Segmented stats skip sealed segments", test_segmented_reads_no_segments)
+
+
+# =============================================================================
+# 27. ANCHOR JOURNAL TESTS
+# =============================================================================
+
+def test_anchor_journal(suite: TestSuite):
+    """
+    Tests for the append-only anchors journal and its snapshot.
+
+    Each anchor costs one journal line, compaction folds the journal into
+    the snapshot, and a crash at any point loses at most the anchor being
+    written.
+    """
+
+    no_auto_anchor = lambda: AnchorPolicy(count_threshold=10**6, significant_events=[OzolithEventType.SESSION_END])
+
+    def open_log(name: str, compact_every: int = 256) -> Ozolith:
+        oz = Ozolith(storage_path=os.path.join(suite.temp_dir, f"{name}.jsonl"),
+                     anchor_policy=no_auto_anchor())
+        oz.ANCHOR_COMPACT_EVERY = compact_every
+        return oz
+
+    def journal_lines(oz: Ozolith) -> List[str]:
+        if not os.path.exists(oz.anchor_journal_path):
+            return []
+        with open(oz.anchor_journal_path) as f:
+            return f.readlines()
+
+    # Test: Anchors append to the journal, snapshot untouched
+    def test_journal_append():
+        oz = open_log("journal_append")
+        for i in range(3):
+            oz.append(OzolithEventType.EXCHANGE, "SB-1", "assistant", {"i": i})
+            oz.create_anchor("test")
+
+        lines = journal_lines(oz)
+        assert [json.loads(line)['anchor_id'] for line in lines] == ["ANCHOR-1", "ANCHOR-2", "ANCHOR-3"]
+        assert not os.path.exists(oz.anchors_path), "Snapshot shouldn't be written before compaction"
+
+        reopened = open_log("journal_append")
+        assert [a.anchor_id for a in reopened.get_anchors()] == ["ANCHOR-1", "ANCHOR-2", "ANCHOR-3"]
+        assert reopened.get_anchor("ANCHOR-2").entry_count == oz.get_anchor("ANCHOR-2").entry_count
+        assert reopened.get_anchor("ANCHOR-9") is None
+        assert reopened.get_anchor("bogus") is None
+        assert reopened.verify_against_anchor(reopened.get_anchor("ANCHOR-3"))
+
+    suite.run_test("Anchors append to journal", test_journal_append)
+
+    # Test: Journal folds into the snapshot periodically
+    def test_periodic_compaction():
+        oz = open_log("journal_compact", compact_every=4)
+        for i in range(6):
+            oz.create_anchor("test")
+
+        assert len(journal_lines(oz)) == 2, "Compaction at the 4th anchor should empty the journal"
+        with open(oz.anchors_path) as f:
+            assert len(json.load(f)) == 4
+
+        reopened = open_log("journal_compact")
+        assert [a.anchor_id for a in reopened.get_anchors()] == [f"ANCHOR-{n}" for n in range(1, 7)]
+        reopened.create_anchor("test")
+        assert reopened.get_anchors()[-1].anchor_id == "ANCHOR-7"
+
+    suite.run_test("Journal compacts into snapshot", test_periodic_compaction)
+
+    # Test: A torn last line is dropped and trimmed
+    def test_torn_write():
+        oz = open_log("journal_torn")
+        oz.create_anchor("test")
+        oz.create_anchor("test")
+        with open(oz.anchor_journal_path, 'a') as f:
+            f.write('{"anchor_id": "ANCHOR-3", "timest')
+
+        reopened = open_log("journal_torn")
+        assert [a.anchor_id for a in reopened.get_anchors()] == ["ANCHOR-1", "ANCHOR-2"]
+        assert any("incomplete record" in w for w in reopened.load_warnings)
+        assert len(journal_lines(reopened)) == 2, "Torn tail should be trimmed"
+
+        reopened.create_anchor("test")
+        again = open_log("journal_torn")
+        assert [a.anchor_id for a in again.get_anchors()] == ["ANCHOR-1", "ANCHOR-2", "ANCHOR-3"]
+        assert again.load_warnings == []
+
+    suite.run_test("Torn journal write is dropped", test_torn_write)
+
+    # Test: Crash after snapshot, before the journal was emptied
+    def test_crash_mid_compaction():
+        oz = open_log("journal_midcompact")
+        for i in range(3):
+            oz.create_anchor("test")
+        lines = journal_lines(oz)
+
+        oz.compact_anchors()
+        with open(oz.anchor_journal_path, 'w') as f:
+            f.writelines(lines)  # As if the truncate never happened
+
+        reopened = open_log("journal_midcompact")
+        assert [a.anchor_id for a in reopened.get_anchors()] == ["ANCHOR-1", "ANCHOR-2", "ANCHOR-3"]
+
+    suite.run_test("Crash mid-compaction loses nothing", test_crash_mid_compaction)
+
+    # Test: Unreadable snapshot is replaced by the next anchor
+    def test_snapshot_rewritten_after_corruption():
+        oz = open_log("journal_corrupt")
+        oz.create_anchor("test")
+        with open(oz.anchors_path, 'w') as f:
+            f.write("not json")
+
+        reopened = open_log("journal_corrupt")
+        assert reopened.get_anchors() == []
+        reopened.create_anchor("test")
+        assert journal_lines(reopened) == []
+
+        again = open_log("journal_corrupt")
+        assert [a.anchor_id for a in again.get_anchors()] == ["ANCHOR-1"]
+        assert again.load_warnings == []
+
+    suite.run_test("Corrupt snapshot rewritten on next anchor", test_snapshot_rewritten_after_corruption)
+
+
+# =============================================================================
+# 28. BATCHED APPEND TESTS
+# =============================================================================
+
+def test_append_many(suite: TestSuite):
+    """
+    Tests for append_many().
+
+    A batch is chained in order with one write, on both the plain and the
+    group-commit path, and a failed write leaves memory untouched.
+    """
+    from ozolith import OzolithWriteError
+
+    def events(n: int, context_id: str = "SB-1"):
+        return [(OzolithEventType.EXCHANGE, context_id, "assistant", {"i": i}) for i in range(n)]
+
+    # Test: Batch is chained in order and survives reload
+    def test_batch_chained():
+        for group_commit in (False, True):
+            for segment_size in (None, 4):
+                path = os.path.join(suite.temp_dir, f"many_{group_commit}_{segment_size}.jsonl")
+                oz = Ozolith(storage_path=path, group_commit=group_commit, segment_size=segment_size)
+                oz.append(OzolithEventType.SESSION_START, "SB-1", "system", {})
+
+                entries = oz.append_many(events(10))
+                assert [e.payload["i"] for e in entries] == list(range(10))
+                assert [e.sequence for e in entries] == list(range(2, 12))
+                assert entries[0].previous_hash == oz._entries[0].entry_hash
+                assert oz.verify_chain()[0]
+
+                oz.close()
+                reloaded = Ozolith(storage_path=path, segment_size=segment_size)
+                assert reloaded.get_root_hash() == oz.get_root_hash()
+                assert reloaded.verify_chain()[0]
+
+    suite.run_test("Batch is chained in order", test_batch_chained)
+
+    # Test: One write + fsync for the whole batch
+    def test_single_fsync():
+        oz = Ozolith(storage_path=os.path.join(suite.temp_dir, "many_fsync.jsonl"))
+        real_fsync = os.fsync
+        calls = []
+
+        def counting_fsync(fd):
+            calls.append(fd)
+            real_fsync(fd)
+
+        os.fsync = counting_fsync
+        try:
+            oz.append_many(events(20))
+        finally:
+            os.fsync = real_fsync
+
+        assert len(calls) == 1, f"Expected one fsync, got {len(calls)}"
+
+    suite.run_test("Batch written with one fsync", test_single_fsync)
+
+    # Test: Grouped batch shares a flush
+    def test_grouped_single_batch():
+        oz = Ozolith(storage_path=os.path.join(suite.temp_dir, "many_grouped.jsonl"), group_commit=True)
+        oz.append_many(events(20))
+        stats = oz.commit_stats()
+        assert stats['entries'] == 20
+        assert stats['batches'] == 1, f"Expected one flush, got {stats['batches']}"
+
+    suite.run_test("Grouped batch shares one flush", test_grouped_single_batch)
+
+    # Test: A grouped batch past commit_max_batch is still one all-or-nothing flush
+    def test_grouped_batch_all_or_nothing():
+        from unittest.mock import patch
+
+        path = os.path.join(suite.temp_dir, "many_grouped_cap.jsonl")
+        oz = Ozolith(storage_path=path, group_commit=True, commit_max_batch=4)
+        oz.append(OzolithEventType.SESSION_START, "SB-1", "system", {})
+        oz.append_many(events(10))
+        assert oz.commit_stats()['batches'] == 2, "Oversized batch should flush once"
+
+        count_before, size_before = len(oz._entries), os.path.getsize(path)
+        with patch("ozolith.os.fsync", side_effect=OSError("fsync failed")):
+            try:
+                oz.append_many(events(10))
+                raised = False
+            except OzolithWriteError:
+                raised = True
+
+        assert raised, "Failed grouped batch should raise OzolithWriteError"
+        assert len(oz._entries) == count_before, "Part of a failed batch was appended"
+        assert os.path.getsize(path) == size_before
+
+        oz.append_many(events(3))
+        oz.close()
+        reloaded = Ozolith(storage_path=path)
+        assert len(reloaded._entries) == count_before + 3
+        assert reloaded.verify_chain(full=True)[0]
+
+    suite.run_test("Grouped batch past max_batch is all-or-nothing", test_grouped_batch_all_or_nothing)
+
+    # Test: Failed write leaves memory and the chain tip untouched
+    def test_failed_batch_memory_safety():
+        path = os.path.join(suite.temp_dir, "many_fail.jsonl")
+        oz = Ozolith(storage_path=path)
+        oz.append(OzolithEventType.SESSION_START, "SB-1", "system", {})
+        count_before = len(oz._entries)
+
+        def failing_save(lines):
+            raise OzolithWriteError("disk full")
+
+        oz._save_entries = failing_save
+        try:
+            oz.append_many(events(5))
+            raised = False
+        except OzolithWriteError:
+            raised = True
+        finally:
+            del oz._save_entries
+
+        assert raised, "Failed batch should raise OzolithWriteError"
+        assert len(oz._entries) == count_before
+
+        entries = oz.append_many(events(2))
+        assert entries[0].sequence == count_before + 1
+        assert oz.verify_chain()[0]
+
+    suite.run_test("Failed batch preserves in-memory state", test_failed_batch_memory_safety)
+
+    # Test: Empty batch is a no-op
+    def test_empty_batch():
+        oz = Ozolith(storage_path=os.path.join(suite.temp_dir, "many_empty.jsonl"))
+        assert oz.append_many([]) == []
+        assert len(oz._entries) == 0
+
+    suite.run_test("Empty batch is a no-op", test_empty_batch)
+
+
 # =============================================================================
 # MAIN TEST RUNNER
 # =============================================================================
@@ -2296,6 +3834,16 @@ def run_all_tests():
         ("Timestamp Manipulation", test_timestamp_manipulation),
         ("Performance Benchmarks", test_performance),
         ("Correction Validation", test_correction_validation),
+        ("Segmented Storage", test_segmented_storage),
+        ("Group Commit", test_group_commit),
+        ("Merkle Layer", test_merkle_layer),
+        ("Verification Checkpoints", test_verification_checkpoints),
+        ("Canonical Encoding", test_canonical_encoding),
+        ("Parallel Verification", test_parallel_verification),
+        ("Query Planner", test_query_planner),
+        ("Streaming Aggregates", test_streaming_aggregates),
+        ("Anchor Journal", test_anchor_journal),
+        ("Batched Appends", test_append_many),
     ]
 
     total_passed = 0
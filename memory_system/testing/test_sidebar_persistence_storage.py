@@ -0,0 +1,499 @@
+"""
+SidebarPersistence Storage Tests
+
+Covers the storage layer underneath the orchestrator:
+- Pooled per-thread connections, transactions, and shutdown
+- Append-only exchange and cross-ref child tables (schema v4)
+- Header-only loads with lazy hydration and a bound on resident contexts
+- Stored depth/root_id tree columns and SQL-side statistics
+- batch() transactions and the background write coalescer
+- save_context/load_context throughput benchmark
+"""
+
+import json
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add core directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "core"))
+
+from datashapes import SidebarContext
+from sidebar_persistence import SidebarPersistence, SCHEMA_VERSION, COALESCE_WINDOW, _BODY_FIELDS
+
+
+def _make_context(n: int, parent_id=None) -> SidebarContext:
+    return SidebarContext(
+        sidebar_id=f"SB-{n}",
+        uuid=f"uuid-{n}",
+        parent_context_id=parent_id,
+        task_description=f"Task {n}",
+        local_memory=[{"id": f"EXCH-{n}-{i}", "content": "x" * 200} for i in range(5)],
+    )
+
+
+@pytest.fixture
+def db(tmp_path):
+    persistence = SidebarPersistence(db_path=str(tmp_path / "sidebar_state.db"))
+    yield persistence
+    persistence.close()
+
+
+# =============================================================================
+# CONNECTION POOLING
+# =============================================================================
+
+class TestConnectionPool:
+
+    def test_connection_reused_per_thread(self, db):
+        opened = db._connections.opened
+        for n in range(1, 21):
+            db.save_context(_make_context(n))
+            db.load_context(f"SB-{n}")
+        assert db._connections.opened == opened, "Operations on one thread should share a connection"
+
+    def test_threads_get_own_connections(self, db):
+        seen = []
+
+        def work(n):
+            db.save_context(_make_context(n))
+            with db._get_connection() as conn:
+                seen.append(id(conn))
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(1, 5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(set(seen)) == 4
+        assert len(db.load_all_contexts()) == 4
+
+    def test_pragmas_applied(self, db):
+        with db._get_connection() as conn:
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_failed_block_rolls_back(self, db):
+        with pytest.raises(RuntimeError):
+            with db._get_connection() as conn:
+                conn.execute("INSERT INTO session_state (key, value) VALUES ('k', '1')")
+                raise RuntimeError("boom")
+        assert db.get_session_state("k") is None
+
+        # The connection is still usable afterwards
+        db.set_session_state("k", 2)
+        assert db.get_session_state("k") == 2
+
+    def test_nested_blocks_share_transaction(self, db):
+        with pytest.raises(RuntimeError):
+            with db._get_connection() as outer:
+                outer.execute("INSERT INTO session_state (key, value) VALUES ('a', '1')")
+                with db._get_connection() as inner:
+                    inner.execute("INSERT INTO session_state (key, value) VALUES ('b', '1')")
+                raise RuntimeError("boom")
+        assert db.get_session_state("a") is None
+        assert db.get_session_state("b") is None
+
+    def test_close_then_reopen(self, db):
+        db.save_context(_make_context(1))
+        opened = db._connections.opened
+        db.close()
+        assert db.load_context("SB-1") is not None
+        assert db._connections.opened == opened + 1
+
+
+# =============================================================================
+# EXCHANGE / CROSS-REF CHILD TABLES
+# =============================================================================
+
+def _count(db, table, sidebar_id):
+    with db._get_connection() as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table} WHERE sidebar_id = ?", (sidebar_id,)).fetchone()[0]
+
+
+class TestExchangeTables:
+
+    def test_round_trip(self, db):
+        context = _make_context(1)
+        context.cross_sidebar_refs = {"SB-2": {"ref_type": "cites"}, "SB-3": {"ref_type": "related_to"}}
+        context.yarn_board_layout = {"zoom": 1.0}
+        db.save_context(context)
+
+        loaded = db.load_context("SB-1")
+        assert loaded == context
+        assert list(loaded.cross_sidebar_refs) == ["SB-2", "SB-3"]
+
+    def test_save_appends_only_new_exchanges(self, db):
+        context = _make_context(1)
+        db.save_context(context)
+
+        statements = []
+        with db._get_connection() as conn:
+            conn.set_trace_callback(statements.append)
+        context.local_memory.append({"id": "EXCH-1-5", "content": "new"})
+        db.save_context(context)
+        with db._get_connection() as conn:
+            conn.set_trace_callback(None)
+
+        inserts = [s for s in statements if s.lstrip().startswith("INSERT INTO sidebar_exchanges")]
+        assert len(inserts) == 1
+        assert "EXCH-1-5" in inserts[0]
+        assert _count(db, "sidebar_exchanges", "SB-1") == 6
+
+    def test_append_exchange(self, db):
+        db.save_context(_make_context(1))
+        assert db.append_exchange("SB-1", {"id": "EXCH-1-5"}) == 5
+        assert db.load_context("SB-1").local_memory[-1] == {"id": "EXCH-1-5"}
+
+    def test_local_memory_loaded_lazily(self, db):
+        db.save_context(_make_context(1))
+        loaded = db.load_context("SB-1")
+        assert not loaded._exchanges_loaded()
+
+        # Saving an untouched context leaves stored exchanges alone
+        db.save_context(loaded)
+        assert _count(db, "sidebar_exchanges", "SB-1") == 5
+
+        assert len(loaded.local_memory) == 5
+        assert loaded._exchanges_loaded()
+        loaded.local_memory.append({"id": "EXCH-1-5"})
+        db.save_context(loaded)
+        assert len(db.load_context("SB-1").local_memory) == 6
+
+    def test_shrunk_local_memory_trims_rows(self, db):
+        context = _make_context(1)
+        db.save_context(context)
+        context.local_memory = context.local_memory[:2]
+        db.save_context(context)
+        assert _count(db, "sidebar_exchanges", "SB-1") == 2
+
+    def test_cross_refs_synced(self, db):
+        context = _make_context(1)
+        context.cross_sidebar_refs = {"SB-2": {"strength": "normal"}, "SB-3": {"strength": "normal"}}
+        db.save_context(context)
+
+        del context.cross_sidebar_refs["SB-2"]
+        context.cross_sidebar_refs["SB-3"]["strength"] = "strong"
+        context.cross_sidebar_refs["SB-4"] = {"strength": "weak"}
+        db.save_context(context)
+
+        loaded = db.load_context("SB-1")
+        assert loaded.cross_sidebar_refs == {"SB-3": {"strength": "strong"}, "SB-4": {"strength": "weak"}}
+
+    def test_children_deleted_with_context(self, db):
+        context = _make_context(1)
+        context.cross_sidebar_refs = {"SB-2": {}}
+        db.save_context(context)
+        db.delete_context("SB-1", reason="test")
+        assert _count(db, "sidebar_exchanges", "SB-1") == 0
+        assert _count(db, "sidebar_cross_refs", "SB-1") == 0
+
+    def test_statistics_largest_context(self, db):
+        db.save_context(_make_context(1))
+        big = _make_context(2)
+        big.local_memory.append({"content": "y" * 5000})
+        db.save_context(big)
+        assert db.get_statistics()["largest_context"]["sidebar_id"] == "SB-2"
+
+    def test_migrates_v3_blobs(self, tmp_path):
+        path = tmp_path / "v3.db"
+        SidebarPersistence(db_path=str(path)).close()
+
+        # Rewind to a v3-shaped row: exchanges and (legacy list) refs as blobs
+        conn = sqlite3.connect(path)
+        conn.execute("DROP TABLE sidebar_exchanges")
+        conn.execute("DROP TABLE sidebar_cross_refs")
+        conn.execute("""
+            INSERT INTO sidebar_contexts (sidebar_id, uuid, status, priority, created_at,
+                last_activity, local_memory_json, cross_sidebar_refs_json)
+            VALUES ('SB-1', 'uuid-1', 'active', 'normal', '2026-01-01T00:00:00',
+                '2026-01-01T00:00:00', ?, ?)
+        """, (json.dumps([{"id": "a"}, {"id": "b"}]), json.dumps(["SB-2"])))
+        conn.execute("PRAGMA user_version = 3")
+        conn.commit()
+        conn.close()
+
+        db = SidebarPersistence(db_path=str(path))
+        try:
+            loaded = db.load_context("SB-1")
+            assert loaded.local_memory == [{"id": "a"}, {"id": "b"}]
+            assert list(loaded.cross_sidebar_refs) == ["SB-2"]
+            with db._get_connection() as conn:
+                assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+                row = conn.execute("SELECT local_memory_json, cross_sidebar_refs_json FROM sidebar_contexts").fetchone()
+                assert tuple(row) == (None, None)
+        finally:
+            db.close()
+
+
+# =============================================================================
+# LAZY HYDRATION
+# =============================================================================
+
+def _resident_fields(context):
+    return [name for name in _BODY_FIELDS + ("_local_memory",) if name in context.__dict__]
+
+
+class TestLazyLoad:
+
+    def test_header_load_reads_header_columns_only(self, db):
+        for n in range(1, 4):
+            db.save_context(_make_context(n))
+
+        statements = []
+        with db._get_connection() as conn:
+            conn.set_trace_callback(statements.append)
+        contexts = db.load_all_contexts(lazy=True)
+        with db._get_connection() as conn:
+            conn.set_trace_callback(None)
+
+        assert len(contexts) == 3
+        assert not any("*" in s or "sidebar_exchanges" in s or "sidebar_cross_refs" in s for s in statements)
+        for context in contexts:
+            assert _resident_fields(context) == []
+            assert context.task_description == f"Task {context.sidebar_id[3:]}"
+
+    def test_fields_hydrate_on_access(self, db):
+        context = _make_context(1)
+        context.tags = ["a"]
+        context.cross_sidebar_refs = {"SB-2": {}}
+        context.yarn_board_layout = {"zoom": 1.0}
+        db.save_context(context)
+
+        (header,) = db.load_all_contexts(lazy=True)
+        assert header.tags == ["a"]
+        assert set(_resident_fields(header)) == set(_BODY_FIELDS)
+        assert header == context
+
+    def test_assignment_before_hydration_wins(self, db):
+        context = _make_context(1)
+        context.tags = ["old"]
+        db.save_context(context)
+
+        (header,) = db.load_all_contexts(lazy=True)
+        header.tags = ["new"]
+        assert header.data_refs == {}
+        assert header.tags == ["new"]
+
+    def test_resident_contexts_bounded(self, tmp_path):
+        db = SidebarPersistence(db_path=str(tmp_path / "sidebar_state.db"), max_resident=2)
+        try:
+            for n in range(1, 6):
+                db.save_context(_make_context(n))
+            contexts = db.load_all_contexts(lazy=True)
+            for context in contexts:
+                assert len(context.local_memory) == 5
+                _ = context.tags
+
+            resident = [c for c in contexts if _resident_fields(c)]
+            assert resident == contexts[-2:]
+
+            # Evicted contexts reload transparently
+            assert contexts[0].local_memory[0]["id"] == f"EXCH-{contexts[0].sidebar_id[3:]}-0"
+        finally:
+            db.close()
+
+    def test_unsaved_changes_not_evicted(self, tmp_path):
+        db = SidebarPersistence(db_path=str(tmp_path / "sidebar_state.db"), max_resident=1)
+        try:
+            db.save_context(_make_context(1))
+            db.save_context(_make_context(2))
+            first, second = db.load_all_contexts(lazy=True)
+
+            first.local_memory.append({"id": "unsaved"})
+            first.tags.append("unsaved")
+            _ = second.tags  # pushes first out of the resident set
+
+            assert first.local_memory[-1] == {"id": "unsaved"}
+            assert first.tags == ["unsaved"]
+            db.save_context(first)
+            assert db.load_context(first.sidebar_id).local_memory[-1] == {"id": "unsaved"}
+        finally:
+            db.close()
+
+
+# =============================================================================
+# TREE COLUMNS
+# =============================================================================
+
+def _tree_columns(db):
+    with db._get_connection() as conn:
+        return {
+            row["sidebar_id"]: (row["depth"], row["root_id"])
+            for row in conn.execute("SELECT sidebar_id, depth, root_id FROM sidebar_contexts")
+        }
+
+
+class TestTreeColumns:
+
+    def _chain(self, db):
+        # SB-1 -> SB-2 -> SB-3, plus a second root SB-4
+        db.save_context(_make_context(1))
+        db.save_context(_make_context(2, parent_id="SB-1"))
+        db.save_context(_make_context(3, parent_id="SB-2"))
+        db.save_context(_make_context(4))
+
+    def test_set_on_insert(self, db):
+        self._chain(db)
+        assert _tree_columns(db) == {
+            "SB-1": (0, "SB-1"), "SB-2": (1, "SB-1"), "SB-3": (2, "SB-1"), "SB-4": (0, "SB-4"),
+        }
+        assert db.check_tree_integrity() == []
+
+    def test_reparent_rebases_subtree(self, db):
+        self._chain(db)
+        moved = db.load_context("SB-2")
+        moved.parent_context_id = "SB-4"
+        db.save_context(moved)
+
+        columns = _tree_columns(db)
+        assert columns["SB-2"] == (1, "SB-4")
+        assert columns["SB-3"] == (2, "SB-4")
+        assert db.check_tree_integrity() == []
+
+    def test_statistics_depth_counts(self, db):
+        self._chain(db)
+        stats = db.get_statistics()
+        assert stats["contexts_by_depth"] == {0: 2, 1: 1, 2: 1}
+        assert stats["root_contexts"] == 2
+
+    def test_integrity_check_flags_bad_rows(self, db):
+        self._chain(db)
+        with db._get_connection() as conn:
+            conn.execute("UPDATE sidebar_contexts SET depth = 7 WHERE sidebar_id = 'SB-3'")
+        assert db.check_tree_integrity() == ["SB-3"]
+
+    def test_migration_fills_columns(self, tmp_path):
+        path = tmp_path / "v4.db"
+        db = SidebarPersistence(db_path=str(path))
+        self._chain(db)
+        with db._get_connection() as conn:
+            conn.execute("UPDATE sidebar_contexts SET depth = NULL, root_id = NULL")
+            conn.execute("PRAGMA user_version = 4")
+        db.close()
+
+        db = SidebarPersistence(db_path=str(path))
+        try:
+            assert _tree_columns(db)["SB-3"] == (2, "SB-1")
+            assert db.check_tree_integrity() == []
+        finally:
+            db.close()
+
+
+# =============================================================================
+# WRITE BATCHING
+# =============================================================================
+
+def _trace_statements(db):
+    statements = []
+    with db._get_connection() as conn:
+        conn.set_trace_callback(statements.append)
+    return statements
+
+
+class TestWriteBatching:
+
+    def test_batch_commits_once(self, db):
+        statements = _trace_statements(db)
+        with db.batch():
+            db.save_context(_make_context(1))
+            db.save_context(_make_context(2, parent_id="SB-1"))
+            db.set_session_state("active_context_id", "SB-2")
+            db.register_conversation_root("conv-1", "SB-1")
+        assert sum(1 for s in statements if s.strip().upper() == "COMMIT") == 1
+        assert db.get_conversation_root("conv-1") == "SB-1"
+
+    def test_batch_rolls_back_on_error(self, db):
+        with pytest.raises(RuntimeError):
+            with db.batch():
+                db.save_context(_make_context(1))
+                raise RuntimeError("boom")
+        assert not db.context_exists("SB-1")
+
+    @pytest.fixture
+    def coalesced(self, tmp_path):
+        persistence = SidebarPersistence(db_path=str(tmp_path / "sidebar_state.db"), coalesce_window=60)
+        yield persistence
+        persistence.close()
+
+    def test_coalesced_writes_collapse(self, coalesced):
+        context = _make_context(1)
+        for n in range(5):
+            context.task_description = f"Task v{n}"
+            coalesced.save_context(context)
+            coalesced.set_session_state("active_context_id", f"SB-{n}")
+
+        assert coalesced._coalescer.collapsed == 8
+        coalesced.flush()
+        assert coalesced._coalescer.commits == 1
+        assert coalesced.load_context("SB-1").task_description == "Task v4"
+        assert coalesced.get_session_state("active_context_id") == "SB-4"
+
+    def test_reads_see_queued_writes(self, coalesced):
+        coalesced.save_context(_make_context(1))
+        assert coalesced.context_exists("SB-1")
+
+    def test_parent_queued_before_child(self, coalesced):
+        parent = _make_context(1)
+        coalesced.save_context(parent)
+        coalesced.save_context(_make_context(2, parent_id="SB-1"))
+        parent.task_description = "updated"
+        coalesced.save_context(parent)
+        coalesced.flush()
+        assert coalesced.load_context("SB-2").parent_context_id == "SB-1"
+        assert coalesced.load_context("SB-1").task_description == "updated"
+
+    def test_background_commit(self, tmp_path):
+        db = SidebarPersistence(db_path=str(tmp_path / "sidebar_state.db"), coalesce_window=COALESCE_WINDOW)
+        try:
+            db.save_context(_make_context(1))
+            deadline = time.monotonic() + 5
+            while db._coalescer.commits == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert db._coalescer.commits == 1
+        finally:
+            db.close()
+
+    def test_flush_surfaces_failed_write(self, coalesced):
+        coalesced.save_context(_make_context(1))
+        coalesced.save_context(_make_context(2, parent_id="SB-missing"))
+        with pytest.raises(sqlite3.IntegrityError):
+            coalesced.flush()
+        # The good write in the same batch still landed
+        assert coalesced.context_exists("SB-1")
+
+
+# =============================================================================
+# PERFORMANCE BENCHMARK
+# =============================================================================
+
+@pytest.mark.slow
+def test_save_load_benchmark(db):
+    """
+    save_context/load_context ops/sec.
+
+    Reports numbers rather than gating on them; the soft floor only catches
+    a regression back to a connection (and PRAGMAs) per operation.
+    """
+    count = 2000
+    contexts = [_make_context(n) for n in range(1, count + 1)]
+
+    start = time.perf_counter()
+    for context in contexts:
+        db.save_context(context)
+    save_rate = count / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for n in range(1, count + 1):
+        db.load_context(f"SB-{n}")
+    load_rate = count / (time.perf_counter() - start)
+
+    print(f"\n    save_context: {save_rate:,.0f} ops/sec"
+          f"\n    load_context: {load_rate:,.0f} ops/sec")
+
+    assert load_rate > 5000, f"load_context too slow: {load_rate:.0f} ops/sec"
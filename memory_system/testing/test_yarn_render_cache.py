@@ -0,0 +1,255 @@
+"""
+Yarn Render Cache Tests
+
+Covers YarnRenderCache and the yarn board renders built on it:
+- Versions, change log, tombstones and epoch-tagged version tokens
+- invalidate() marks exactly the boards that show a context
+- Cached renders match an uncached render
+- get_yarn_board_changes returns only what changed
+- Render time for a large board, full vs. incremental (benchmark)
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add core directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "core"))
+
+from yarn_render_cache import YarnRenderCache
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class TestYarnRenderCache:
+
+    def test_versions_only_changed_items(self):
+        cache = YarnRenderCache()
+        v1 = cache.store("SB-1", {"a": {"id": "a"}, "b": {"id": "b"}}, depends_on=["SB-1"])
+        v2 = cache.store("SB-1", {"a": {"id": "a"}, "b": {"id": "b", "x": 1}}, depends_on=["SB-1"])
+        v3 = cache.store("SB-1", {"a": {"id": "a"}, "b": {"id": "b", "x": 1}}, depends_on=["SB-1"])
+
+        assert v1 < v2 == v3  # An identical rebuild doesn't bump the version
+        assert cache.changes_since("SB-1", v1) == ([{"id": "b", "x": 1}], [])
+        assert cache.changes_since("SB-1", v2) == ([], [])
+
+    def test_tombstones(self):
+        cache = YarnRenderCache()
+        v1 = cache.store("SB-1", {"a": {"id": "a"}, ("a", "b"): {"from_id": "a"}}, depends_on=[])
+        v2 = cache.store("SB-1", {"a": {"id": "a"}}, depends_on=[])
+        cache.store("SB-1", {"a": {"id": "a"}, "c": {"id": "c"}}, depends_on=[])
+
+        assert cache.changes_since("SB-1", v1) == ([{"id": "c"}], [("a", "b")])
+        assert cache.changes_since("SB-1", v2) == ([{"id": "c"}], [])
+
+    def test_too_old_or_new_needs_full(self):
+        cache = YarnRenderCache(max_tombstones=1)
+        v1 = cache.store("SB-1", {"a": {}, "b": {}}, depends_on=[])
+        cache.store("SB-1", {"b": {}}, depends_on=[])
+        v3 = cache.store("SB-1", {}, depends_on=[])  # Pushes the "a" tombstone out
+
+        assert cache.changes_since("SB-1", v1) is None
+        assert cache.changes_since("SB-1", v3 + 1) is None
+        assert cache.changes_since("SB-1", v3) == ([], [])
+
+        # A board first built after the client's version can't be diffed
+        cache.store("SB-2", {"a": {}}, depends_on=[])
+        assert cache.changes_since("SB-2", v3) is None
+
+    def test_tokens_carry_the_epoch(self):
+        cache = YarnRenderCache()
+        version = cache.store("SB-1", {"a": {}}, depends_on=[])
+        token = cache.token(version)
+
+        assert cache.parse_token(token) == version
+        assert cache.changes_since("SB-1", cache.parse_token(token)) == ([], [])
+
+        # Same number, different process: the counter restarted, so it can't be trusted
+        restarted = YarnRenderCache()
+        restarted.store("SB-1", {"a": {}, "b": {}}, depends_on=[])
+        assert restarted.parse_token(token) is None
+        assert restarted.changes_since("SB-1", restarted.parse_token(token)) is None
+
+        for junk in (version, "", "nonsense", f"{cache.epoch}:x", None):
+            assert cache.parse_token(junk) is None
+
+    def test_invalidate_marks_dependents(self):
+        cache = YarnRenderCache()
+        cache.store("SB-1", {}, depends_on=["SB-1", "SB-2"])
+        cache.store("SB-3", {}, depends_on=["SB-3"])
+        cache.context_detail("SB-2", lambda: {"n": 1})
+
+        cache.invalidate("SB-2")
+
+        assert not cache.is_fresh("SB-1") and cache.is_fresh("SB-3")
+        assert cache.context_detail("SB-2", lambda: {"n": 2}) == {"n": 2}
+
+        # Rebuilt without SB-2: later changes to it no longer touch SB-1
+        cache.store("SB-1", {}, depends_on=["SB-1"])
+        cache.invalidate("SB-2")
+        assert cache.is_fresh("SB-1")
+
+
+# =============================================================================
+# ORCHESTRATOR
+# =============================================================================
+
+@pytest.fixture
+def board(orch):
+    """Root with two children; child A cites child B."""
+    root = orch.create_root_context(task_description="root")
+    a = orch.spawn_sidebar(root, "a")
+    b = orch.spawn_sidebar(root, "b")
+    orch.add_cross_ref(a, b, ref_type="cites")
+    return orch, root, a, b
+
+
+def _uncached(orch, context_id, **kwargs):
+    orch.invalidate_yarn_renders()
+    return orch.render_yarn_board(context_id, **kwargs)
+
+
+def _ids(result):
+    return {p["id"] for p in result["points"] + result["cushion"]}
+
+
+class TestOrchestratorRenders:
+
+    @pytest.mark.parametrize("expanded", [False, True])
+    def test_cached_render_matches_uncached(self, board, expanded):
+        orch, root, a, b = board
+        orch.update_point_position(a, f"context:{a}", x=10, y=20)
+
+        for context_id in (root, a, b):
+            cached = orch.render_yarn_board(context_id, expanded=expanded)
+            cached_again = orch.render_yarn_board(context_id, expanded=expanded)
+            fresh = _uncached(orch, context_id, expanded=expanded)
+            for key in ("points", "connections", "cushion", "cushion_count"):
+                assert cached[key] == cached_again[key] == fresh[key]
+
+    def test_fresh_board_builds_no_details(self, board):
+        orch, root, a, b = board
+        orch.render_yarn_board(root, expanded=True)
+        before = orch.stats()["yarn_renders"]["detail_builds"]
+
+        orch.render_yarn_board(root, expanded=True)
+        orch.resume_context(root)  # Only root's detail needs rebuilding
+        orch.render_yarn_board(root, expanded=True)
+
+        assert orch.stats()["yarn_renders"]["detail_builds"] == before + 1
+
+    def test_status_change_reaches_boards_showing_it(self, board):
+        orch, root, a, b = board
+        v_root = orch.render_yarn_board(root)["version"]
+        v_a = orch.render_yarn_board(a)["version"]
+
+        orch.pause_context(b)
+
+        # b is a child on root's board and a ref target on a's
+        for context_id, since in ((root, v_root), (a, v_a)):
+            changes = orch.get_yarn_board_changes(context_id, since, expanded=True)
+            assert changes["full"] is False
+            assert [p["id"] for p in changes["cushion"]] == [f"context:{b}"]
+            assert changes["cushion"][0]["detail"]["status"] == "paused"
+            assert changes["connections"] == []
+
+    def test_move_point_between_cushion_and_board(self, board):
+        orch, root, a, b = board
+        version = orch.render_yarn_board(root)["version"]
+
+        orch.update_point_position(root, f"context:{a}", x=5, y=6)
+        changes = orch.get_yarn_board_changes(root, version)
+
+        assert changes["points"] == [{"id": f"context:{a}", "label": a, "type": "context",
+                                      "color": orch.YARN_TYPE_COLORS["context"], "x": 5, "y": 6}]
+        assert changes["cushion"] == [] and changes["connections"] == []
+
+    def test_new_and_removed_items(self, board):
+        orch, root, a, b = board
+        version = orch.render_yarn_board(a)["version"]
+
+        orch.revoke_cross_ref(a, b, reason="wrong")
+        changes = orch.get_yarn_board_changes(a, version)
+
+        crossref = f"crossref:{min(a, b)}:{max(a, b)}"
+        assert set(changes["removed_points"]) == {crossref, f"context:{b}"}
+        assert {(c["from_id"], c["to_id"]) for c in changes["removed_connections"]} == {
+            (f"context:{a}", crossref), (crossref, f"context:{b}")}
+
+        # Points that stay are only resent if their own render changed
+        assert all(p["id"] == f"context:{a}" for p in changes["cushion"])
+
+        version = changes["version"]
+        child = orch.spawn_sidebar(a, "c")
+        changes = orch.get_yarn_board_changes(a, version)
+        assert f"context:{child}" in _ids(changes)
+        assert [(c["from_id"], c["to_id"]) for c in changes["connections"]] == [
+            (f"context:{a}", f"context:{child}")]
+
+    def test_unknown_version_gets_full_render(self, board):
+        orch, root, a, b = board
+        version = orch.render_yarn_board(root)["version"]
+        epoch, number = version.split(":")
+
+        other_process = f"{YarnRenderCache().epoch}:{number}"
+        for since in (f"{epoch}:{int(number) + 100}", f"{epoch}:-1", other_process, "", "junk"):
+            changes = orch.get_yarn_board_changes(root, since)
+            assert changes["full"] is True
+            assert _ids(changes) == _ids(orch.render_yarn_board(root))
+
+        orch.invalidate_yarn_renders()  # e.g. a reload
+        assert orch.get_yarn_board_changes(root, version)["full"] is True
+
+    def test_changes_for_missing_context(self, orch):
+        assert orch.get_yarn_board_changes("SB-404", "")["success"] is False
+
+
+# =============================================================================
+# PERFORMANCE BENCHMARK
+# =============================================================================
+
+@pytest.mark.slow
+@pytest.mark.parametrize("children", [100, 1_000])
+def test_large_board_refresh_benchmark(orch, children):
+    """
+    A board with many children, one of which changes between refreshes.
+
+    An uncached render rebuilds every point's detail; with the cache only
+    the changed child's detail is rebuilt, and the changes payload is the
+    one point.
+    """
+    root = orch.create_root_context(task_description="root")
+    ids = [orch.spawn_sidebar(root, f"child {n}") for n in range(children)]
+    version = orch.render_yarn_board(root, expanded=True)["version"]
+
+    rounds = 20
+    start = time.perf_counter()
+    for n in range(rounds):
+        orch.invalidate_yarn_renders()
+        orch.render_yarn_board(root, expanded=True)
+    uncached_ms = (time.perf_counter() - start) * 1000 / rounds
+
+    version = orch.render_yarn_board(root, expanded=True)["version"]
+    start = time.perf_counter()
+    for n in range(rounds):
+        child = orch.get_context(ids[n])
+        child.task_description = f"renamed {n}"
+        orch._persist_context(child)
+        changes = orch.get_yarn_board_changes(root, version, expanded=True)
+        version = changes["version"]
+    incremental_ms = (time.perf_counter() - start) * 1000 / rounds
+
+    start = time.perf_counter()
+    for n in range(rounds):
+        orch.render_yarn_board(root, expanded=True)
+    cached_ms = (time.perf_counter() - start) * 1000 / rounds
+
+    print(f"\n    {children:>5} children: uncached render {uncached_ms:.2f}ms,"
+          f" change + diff {incremental_ms:.2f}ms, cached render {cached_ms:.2f}ms")
+
+    assert len(changes["cushion"]) == 1 and changes["full"] is False
+    assert cached_ms < uncached_ms